@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# this_file: benchmarks/dedup_memory.py
+"""Resident memory benchmark for ModelCollection.deduplicate().
+
+Each variant loads the same scaled data set in a fresh interpreter and
+reports the RSS growth measured by ``utils.memory.MemoryMonitor``, the live
+heap size from ``tracemalloc`` and the time taken by an ``owned_by`` equality
+filter over the loaded models.
+
+RSS understates the saving: duplicates freed by deduplicate() go back to
+Python's allocator pools, which later allocations reuse, rather than to the OS.
+
+Usage:
+    python benchmarks/dedup_memory.py
+    python benchmarks/dedup_memory.py --models 10000
+"""
+
+import argparse
+import gc
+import json
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+from lite_memory import scale_records
+
+from virginia_clemm_poe.config import DATA_FILE_PATH
+from virginia_clemm_poe.models import ModelCollection
+from virginia_clemm_poe.utils.memory import MemoryMonitor
+
+VARIANTS = ("plain", "dedup")
+FILTER_ROUNDS = 50
+
+
+def load(text: str, variant: str) -> ModelCollection:
+    """Parse the data set, deduplicating for the "dedup" variant."""
+    collection = ModelCollection(**json.loads(text))
+    return collection.deduplicate() if variant == "dedup" else collection
+
+
+def run_variant(variant: str, data_path: Path, count: int) -> dict[str, Any]:
+    """Load the data set in this process and measure it.
+
+    Args:
+        variant: "plain" (parse only) or "dedup" (parse, then deduplicate)
+        data_path: poe_models.json to read
+        count: Number of models to load
+
+    Returns:
+        JSON-serializable measurements
+    """
+    with open(data_path) as f:
+        text = json.dumps(scale_records(json.load(f), count))
+
+    monitor = MemoryMonitor()
+    gc.collect()
+    before_mb = monitor.get_memory_usage_mb()
+
+    start = time.perf_counter()
+    collection = load(text, variant)
+    load_seconds = time.perf_counter() - start
+
+    gc.collect()
+    after_mb = monitor.get_memory_usage_mb()
+
+    owner = collection.data[0].owned_by
+    start = time.perf_counter()
+    for _ in range(FILTER_ROUNDS):
+        matched = [model for model in collection.data if model.owned_by == owner]
+    filter_seconds = (time.perf_counter() - start) / FILTER_ROUNDS
+    distinct_architectures = len({id(model.architecture) for model in collection.data})
+
+    del collection
+    gc.collect()
+    tracemalloc.start()
+    collection = load(text, variant)
+    gc.collect()
+    live_bytes, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "variant": variant,
+        "models": len(collection.data),
+        "rss_growth_mb": round(after_mb - before_mb, 2),
+        "rss_mb_per_1k_models": round((after_mb - before_mb) * 1000 / count, 2),
+        "live_mb": round(live_bytes / 1024 / 1024, 2),
+        "load_ms": round(load_seconds * 1000, 1),
+        "owned_by_filter_us": round(filter_seconds * 1e6, 1),
+        "matched": len(matched),
+        "distinct_architectures": distinct_architectures,
+    }
+
+
+def main() -> int:
+    """Run each variant in a fresh interpreter and print JSON results."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--models", type=int, default=5000, help="Number of models to load")
+    parser.add_argument("--data", type=Path, default=DATA_FILE_PATH, help="poe_models.json to read")
+    parser.add_argument("--variant", choices=VARIANTS, help=argparse.SUPPRESS)  # Child process mode
+    args = parser.parse_args()
+
+    if args.variant:
+        print(json.dumps(run_variant(args.variant, args.data, args.models)))
+        return 0
+
+    results = []
+    for variant in VARIANTS:
+        cmd = [sys.executable, __file__, "--variant", variant, "--models", str(args.models), "--data", str(args.data)]
+        output = subprocess.run(cmd, capture_output=True, text=True, check=True).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+
+    plain, dedup = results
+    saved = plain["rss_growth_mb"] - dedup["rss_growth_mb"]
+    live_saved = plain["live_mb"] - dedup["live_mb"]
+    print(
+        json.dumps(
+            {
+                "results": results,
+                "rss_saved_mb": round(saved, 2),
+                "rss_saved_percent": round(saved / plain["rss_growth_mb"] * 100, 1) if plain["rss_growth_mb"] else None,
+                "live_saved_mb": round(live_saved, 2),
+                "live_saved_percent": round(live_saved / plain["live_mb"] * 100, 1) if plain["live_mb"] else None,
+            },
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
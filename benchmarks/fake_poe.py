@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# this_file: benchmarks/fake_poe.py
+"""Local stand-in for the Poe site and API, for offline benchmarks.
+
+Serves, from an in-memory model list:
+
+    GET /v1/models     API-shaped model list (scraped fields stripped) with an
+                       ETag, answering 304 to a matching If-None-Match
+    GET /<model id>    Bot page using the class names the scraper looks for:
+                       initial points cost, creator handle, description and
+                       disclaimer, plus an action bar whose Rates button opens
+                       a ``role="dialog"`` pricing table
+
+Pages are rendered from the models' recorded pricing and bot info, so a
+scrape of the fake site reproduces the data file. ``latency`` adds a fixed
+delay per response to approximate network round trips.
+
+Usage:
+    python benchmarks/fake_poe.py --port 8999      # serve the bundled data file
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import sys
+import threading
+import time
+import urllib.parse
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+from virginia_clemm_poe.config import DATA_FILE_PATH
+from virginia_clemm_poe.models import PricingDetails
+
+# Fields the API returns; the rest of a data file record is scraped
+API_FIELDS = ("id", "object", "created", "owned_by", "permission", "root", "parent", "architecture")
+
+# Website labels of the pricing table rows, by PricingDetails field name
+PRICING_LABELS = {name: field.alias or name for name, field in PricingDetails.model_fields.items()}
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html><head><title>{title}</title></head>
+<body>
+<div class="BotInfoCardHeader_initialPointsCost__oIIcI"><span>{initial_points_cost}</span></div>
+<div class="BotInfoCardHeader_operatedBy__G5WAP">
+<a class="UserHandle_creatorHandle__aNMAK" href="/{creator}">{creator}</a>
+</div>
+<div class="BotDescriptionDisclaimerSection_text__sIeXQ"><span>{description}</span></div>
+<p class="BotDescriptionDisclaimerSection_disclaimerText__yEe8h">{disclaimer}</p>
+<div class="BotInfoCardActionBar_actionBar__5_Gnq">{rates_button}</div>
+<template id="rates"><div role="dialog" class="Modal_modalContent__YYC8E"><table>{rows}</table></div></template>
+<script>
+function openRates() {{
+  document.body.appendChild(document.getElementById("rates").content.cloneNode(true));
+}}
+document.addEventListener("keydown", (event) => {{
+  if (event.key === "Escape") document.querySelectorAll("[role=dialog]").forEach((el) => el.remove());
+}});
+</script>
+</body></html>
+"""
+
+
+def render_bot_page(record: dict[str, Any]) -> str:
+    """Render a bot page for one data file record.
+
+    Args:
+        record: Model record in the poe_models.json format
+
+    Returns:
+        HTML page the scraper can extract the record's pricing and bot info from
+    """
+    bot_info = record.get("bot_info") or {}
+    details = (record.get("pricing") or {}).get("details") or {}
+    rows = "".join(
+        f"<tr><td>{html.escape(PRICING_LABELS.get(name, name))}</td><td>{html.escape(str(value))}</td></tr>"
+        for name, value in details.items()
+        if value is not None and name != "initial_points_cost"
+    )
+    rates_button = '<button onclick="openRates()"><span>Rates</span></button>' if rows else ""
+    return PAGE_TEMPLATE.format(
+        title=html.escape(record["id"]),
+        initial_points_cost=html.escape(details.get("initial_points_cost") or ""),
+        creator=html.escape(bot_info.get("creator") or ""),
+        description=html.escape(bot_info.get("description") or ""),
+        disclaimer=html.escape(bot_info.get("description_extra") or ""),
+        rates_button=rates_button,
+        rows=rows,
+    )
+
+
+class FakePoeServer(ThreadingHTTPServer):
+    """Threaded HTTP server answering like api.poe.com and poe.com."""
+
+    daemon_threads = True
+
+    def __init__(self, data: dict[str, Any], host: str = "127.0.0.1", port: int = 0, latency: float = 0.0):
+        """Bind the server and pre-render its responses.
+
+        Args:
+            data: poe_models.json content to serve
+            host: Interface to bind
+            port: TCP port (0 picks a free port)
+            latency: Seconds to wait before each response
+        """
+        super().__init__((host, port), FakePoeHandler)
+        self.latency = latency
+        self.records = {record["id"]: record for record in data["data"]}
+        api_data = {"object": data.get("object", "list"), "data": [_api_record(r) for r in data["data"]]}
+        self.models_body = json.dumps(api_data).encode()
+        self.models_etag = f'"{hashlib.sha256(self.models_body).hexdigest()[:32]}"'
+        self.request_counts: dict[str, int] = {"models": 0, "not_modified": 0, "pages": 0}
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def api_url(self) -> str:
+        """URL to use in place of POE_API_URL."""
+        return f"{self.url}/v1/models"
+
+    @property
+    def page_url_template(self) -> str:
+        """URL template to use in place of POE_BASE_URL."""
+        return f"{self.url}/{{id}}"
+
+    def __enter__(self) -> "FakePoeServer":
+        """Serve in a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Stop serving and release the socket."""
+        self.shutdown()
+        self.server_close()
+
+
+class FakePoeHandler(BaseHTTPRequestHandler):
+    """Request handler for FakePoeServer."""
+
+    server: FakePoeServer
+    protocol_version = "HTTP/1.1"  # Keep-alive, like the real site
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Silence per-request logging."""
+
+    def _send(self, status: HTTPStatus, body: bytes, content_type: str, headers: dict[str, str] | None = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        """Serve the model list or a bot page."""
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        path = urllib.parse.unquote(urllib.parse.urlsplit(self.path).path)
+        if path == "/v1/models":
+            self.server.request_counts["models"] += 1
+            if self.headers.get("If-None-Match") == self.server.models_etag:
+                self.server.request_counts["not_modified"] += 1
+                self._send(HTTPStatus.NOT_MODIFIED, b"", "application/json", {"ETag": self.server.models_etag})
+                return
+            self._send(HTTPStatus.OK, self.server.models_body, "application/json", {"ETag": self.server.models_etag})
+            return
+
+        record = self.server.records.get(path.lstrip("/"))
+        if record is None:
+            self._send(HTTPStatus.NOT_FOUND, b"Not found", "text/plain")
+            return
+        self.server.request_counts["pages"] += 1
+        self._send(HTTPStatus.OK, render_bot_page(record).encode(), "text/html; charset=utf-8")
+
+
+def _api_record(record: dict[str, Any]) -> dict[str, Any]:
+    """Strip the scraped fields from a data file record."""
+    return {name: record[name] for name in API_FIELDS if name in record}
+
+
+def main() -> int:
+    """Serve the fake site until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8999, help="TCP port to bind")
+    parser.add_argument("--data", type=Path, default=DATA_FILE_PATH, help="poe_models.json to serve")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds to delay each response")
+    args = parser.parse_args()
+
+    with open(args.data) as f:
+        server = FakePoeServer(json.load(f), port=args.port, latency=args.latency)
+    print(f"Serving {len(server.records)} models: API at {server.api_url}, pages at {server.page_url_template}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
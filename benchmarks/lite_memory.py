@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# this_file: benchmarks/lite_memory.py
+"""Memory benchmark: Pydantic PoeModel collection vs. the slotted lite view.
+
+Builds both representations from the same JSON text and measures the memory
+each one retains with ``tracemalloc`` once the parsed JSON has been released.
+The data set is repeated with unique IDs until it reaches ``--models``
+entries, and results are reported per 1,000 models as JSON.
+
+Usage:
+    python benchmarks/lite_memory.py
+    python benchmarks/lite_memory.py --models 5000 --data path/to/poe_models.json
+"""
+
+import argparse
+import copy
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from virginia_clemm_poe.config import DATA_FILE_PATH
+from virginia_clemm_poe.lite import LiteCollection
+from virginia_clemm_poe.models import ModelCollection
+
+
+def scale_records(data: dict[str, Any], count: int) -> dict[str, Any]:
+    """Repeat the data file's records with unique IDs until there are ``count``.
+
+    Args:
+        data: Parsed poe_models.json content
+        count: Number of records wanted
+
+    Returns:
+        New data dict with ``count`` records
+    """
+    records = data.get("data", [])
+    if not records:
+        raise SystemExit("Data file has no models; run 'virginia-clemm-poe update' or pass --data")
+
+    scaled = []
+    for i in range(count):
+        record = copy.deepcopy(records[i % len(records)])
+        if i >= len(records):
+            record["id"] = f"{record['id']}-{i // len(records)}"
+        scaled.append(record)
+    return {**data, "data": scaled}
+
+
+def measure(build: Callable[[], Any]) -> tuple[int, float, Any]:
+    """Measure memory retained by the object ``build`` returns.
+
+    Returns:
+        Tuple of (retained bytes, build seconds, built object)
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    retained, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return retained, elapsed, result
+
+
+def benchmark(data: dict[str, Any], count: int) -> dict[str, Any]:
+    """Build both representations and compare their footprint.
+
+    Args:
+        data: Parsed poe_models.json content
+        count: Number of models to build
+
+    Returns:
+        JSON-serializable results
+    """
+    text = json.dumps(scale_records(data, count))
+    per_k = 1000 / count
+
+    full_bytes, full_seconds, full = measure(lambda: ModelCollection(**json.loads(text)).build_indexes())
+    lite_bytes, lite_seconds, lite = measure(lambda: LiteCollection.from_json_data(json.loads(text)))
+    assert len(full.data) == len(lite) == count
+
+    return {
+        "models": count,
+        "pydantic": {
+            "kib_per_1k_models": round(full_bytes * per_k / 1024, 1),
+            "load_ms_per_1k_models": round(full_seconds * per_k * 1000, 1),
+        },
+        "lite": {
+            "kib_per_1k_models": round(lite_bytes * per_k / 1024, 1),
+            "load_ms_per_1k_models": round(lite_seconds * per_k * 1000, 1),
+        },
+        "memory_ratio": round(full_bytes / lite_bytes, 1) if lite_bytes else None,
+    }
+
+
+def main() -> int:
+    """Run the memory benchmark and print JSON results."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--models", type=int, default=1000, help="Number of models to build")
+    parser.add_argument("--data", type=Path, default=DATA_FILE_PATH, help="poe_models.json to read")
+    args = parser.parse_args()
+
+    with open(args.data) as f:
+        data = json.load(f)
+
+    print(json.dumps(benchmark(data, args.models), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
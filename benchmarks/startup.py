@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# this_file: benchmarks/startup.py
+"""Cold-start benchmark for the virginia-clemm-poe CLI.
+
+Runs each subcommand in a fresh interpreter with ``python -X importtime`` and
+reports the median wall time, the total import time and which heavy optional
+dependencies (playwright, httpx, bs4, psutil) were loaded. Results are JSON so
+runs can be compared across commits.
+
+Usage:
+    python benchmarks/startup.py                      # print JSON results
+    python benchmarks/startup.py --runs 10 -o now.json
+    python benchmarks/startup.py --compare before.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+# Subcommands that can run offline without side effects
+SUBCOMMANDS: dict[str, list[str]] = {
+    "import": [],
+    "help": ["--help"],
+    "search": ["search", "claude"],
+    "list": ["list"],
+    "cache": ["cache", "--stats"],
+}
+
+# Modules that only browser scraping, balance checks or updates should need
+HEAVY_MODULES = ("playwright", "playwrightauthor", "httpx", "bs4", "psutil")
+
+
+def parse_importtime(stderr: str) -> tuple[dict[str, int], set[str]]:
+    """Parse ``-X importtime`` output.
+
+    Args:
+        stderr: Captured standard error of the benchmarked process
+
+    Returns:
+        Tuple of (cumulative microseconds per top-level import, root package
+        names of every module imported at any depth)
+    """
+    totals: dict[str, int] = {}
+    loaded: set[str] = set()
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or line.count("|") != 2:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if not cumulative.strip().isdigit():
+            continue  # Header line
+        package = name.strip().split(".")[0]
+        loaded.add(package)
+        # Nested imports are indented further; only top-level entries are summed to avoid double counting
+        if len(name) - len(name.lstrip()) == 1:
+            totals[package] = totals.get(package, 0) + int(cumulative)
+    return totals, loaded
+
+
+def run_once(args: list[str]) -> tuple[float, dict[str, int], set[str]]:
+    """Run one subcommand in a fresh interpreter.
+
+    Args:
+        args: CLI arguments (empty to only import the CLI module)
+
+    Returns:
+        Tuple of (wall time in milliseconds, import times per top-level package,
+        root packages loaded)
+    """
+    if args:
+        cmd = [sys.executable, "-X", "importtime", "-m", "virginia_clemm_poe", *args]
+    else:
+        cmd = [sys.executable, "-X", "importtime", "-c", "import virginia_clemm_poe.__main__"]
+
+    env = {**os.environ, "PAGER": "cat"}
+    start = time.perf_counter()
+    result = subprocess.run(cmd, capture_output=True, text=True, env=env, check=False)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    return elapsed_ms, *parse_importtime(result.stderr)
+
+
+def benchmark(subcommands: dict[str, list[str]], runs: int) -> dict[str, Any]:
+    """Benchmark cold start for each subcommand.
+
+    Args:
+        subcommands: Mapping of label to CLI arguments
+        runs: Number of fresh-interpreter runs per subcommand
+
+    Returns:
+        JSON-serializable results keyed by subcommand label
+    """
+    results: dict[str, Any] = {}
+    for label, args in subcommands.items():
+        wall_times: list[float] = []
+        imports: dict[str, int] = {}
+        loaded: set[str] = set()
+        for _ in range(runs):
+            elapsed_ms, imports, loaded = run_once(args)
+            wall_times.append(elapsed_ms)
+
+        results[label] = {
+            "args": args,
+            "wall_ms_median": round(statistics.median(wall_times), 1),
+            "wall_ms_min": round(min(wall_times), 1),
+            "import_ms_total": round(sum(imports.values()) / 1000, 1),
+            "heavy_modules": [name for name in HEAVY_MODULES if name in loaded],
+            "top_imports_ms": {
+                name: round(us / 1000, 1) for name, us in sorted(imports.items(), key=lambda item: -item[1])[:10]
+            },
+        }
+    return results
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any]) -> str:
+    """Format median wall-time deltas against a previous run.
+
+    Args:
+        current: Results of this run
+        baseline: Results loaded from an earlier JSON file
+
+    Returns:
+        Human-readable comparison table
+    """
+    lines = [f"{'subcommand':<12} {'before':>9} {'after':>9} {'delta':>8}"]
+    for label, result in current.items():
+        before = baseline.get("results", baseline).get(label, {}).get("wall_ms_median")
+        after = result["wall_ms_median"]
+        if before is None:
+            lines.append(f"{label:<12} {'-':>9} {after:>7.1f}ms {'-':>8}")
+        else:
+            delta = (after - before) / before * 100 if before else 0.0
+            lines.append(f"{label:<12} {before:>7.1f}ms {after:>7.1f}ms {delta:>+7.1f}%")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    """Run the startup benchmark and emit JSON results."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Fresh-interpreter runs per subcommand")
+    parser.add_argument("--only", nargs="*", choices=sorted(SUBCOMMANDS), help="Subset of subcommands to run")
+    parser.add_argument("-o", "--output", type=Path, help="Write JSON results to this file")
+    parser.add_argument("--compare", type=Path, help="Previous JSON results to compare against")
+    options = parser.parse_args()
+
+    selected = {label: SUBCOMMANDS[label] for label in options.only} if options.only else SUBCOMMANDS
+    report = {
+        "python": sys.version.split()[0],
+        "runs": options.runs,
+        "results": benchmark(selected, options.runs),
+    }
+
+    text = json.dumps(report, indent=2)
+    if options.output:
+        options.output.write_text(text + "\n")
+    print(text)
+
+    if options.compare:
+        print(compare(report["results"], json.loads(options.compare.read_text())), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
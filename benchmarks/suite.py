@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+# this_file: benchmarks/suite.py
+"""Offline benchmark suite for the public API, the updater and the caches.
+
+Everything runs against local data and the stand-in Poe server in
+``fake_poe.py``, so results do not depend on the network or on Poe:
+
+    load        api.load_models() cold (parse the data file) and warm (cached)
+    queries     get_model_by_id / search_models / filter_models at several
+                catalog sizes (the bundled data set repeated with unique IDs)
+    api_sync    ModelUpdater.sync_models() against the fake /v1/models: first
+                download and the conditional (304) revalidation
+    scrape      Bot page scraping sweep through the browser pool at several
+                concurrency levels; skipped when Chrome is not available
+    cache       Cache.get/set and @cached hit throughput
+
+Catalog sizes are built by repeating the bundled data set with unique IDs, or
+with ``--catalog synthetic`` generated by ``synthetic_catalog.py``.
+
+Results are JSON. Timings are medians over repeated calls; keys ending in
+``_ms``/``_us`` are lower-is-better and ``_per_sec`` higher-is-better, which
+``--compare`` uses to flag regressions against an earlier run.
+
+Usage:
+    python benchmarks/suite.py -o before.json
+    python benchmarks/suite.py --only load queries --sizes 250 5000
+    python benchmarks/suite.py --only queries --catalog synthetic --sizes 1000 10000 100000
+    python benchmarks/suite.py --compare before.json --fail-on-regression 20
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from contextlib import ExitStack
+from functools import partial
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from fake_poe import FakePoeServer
+from lite_memory import scale_records
+from synthetic_catalog import generate_catalog
+
+from virginia_clemm_poe import api
+from virginia_clemm_poe.config import DATA_FILE_PATH
+from virginia_clemm_poe.utils.cache import Cache, cached
+from virginia_clemm_poe.utils.http_cache import ValidatorStore
+from virginia_clemm_poe.utils.metrics import get_metrics_registry
+
+BENCHMARKS = ("load", "queries", "api_sync", "scrape", "cache")
+DEFAULT_SIZES = (250, 5_000, 50_000)
+DEFAULT_CONCURRENCY = (1, 2, 4)
+
+# Builds a catalog of the requested size in the poe_models.json format
+CatalogFactory = Callable[[int], dict[str, Any]]
+
+
+def time_call(fn: Callable[[], Any], repeat: int) -> float:
+    """Run ``fn`` repeatedly and return the median duration in seconds."""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations)
+
+
+def write_data(catalog: CatalogFactory, directory: Path, count: int) -> Path:
+    """Write a data file with ``count`` models and return its path."""
+    path = directory / f"poe_models_{count}.json"
+    with path.open("w") as f:
+        json.dump(catalog(count), f)
+    return path
+
+
+def bench_load(data_path: Path, repeat: int) -> dict[str, Any]:
+    """Measure api.load_models() cold and warm on one data file."""
+    with patch.object(api, "DATA_FILE_PATH", data_path):
+
+        def cold() -> None:
+            api._collection = None
+            api.load_models()
+
+        cold_seconds = time_call(cold, repeat)
+        warm_seconds = time_call(api.load_models, repeat * 100)
+        count = len(api.load_models().data)
+    api._collection = None
+    return {"models": count, "cold_ms": round(cold_seconds * 1000, 2), "warm_us": round(warm_seconds * 1e6, 3)}
+
+
+def bench_queries(catalog: CatalogFactory, sizes: list[int], directory: Path, repeat: int) -> dict[str, Any]:
+    """Measure load and lookups at each catalog size."""
+    results: dict[str, Any] = {}
+    for size in sizes:
+        data_path = write_data(catalog, directory, size)
+        result = bench_load(data_path, max(repeat // 10, 1) if size > 5_000 else repeat)
+
+        with patch.object(api, "DATA_FILE_PATH", data_path):
+            models = api.get_all_models()
+            ids = [model.id for model in random.Random(0).sample(models, min(len(models), 100))]
+            owner = models[0].owned_by
+
+            def by_id(ids: list[str] = ids) -> None:
+                for model_id in ids:
+                    api.get_model_by_id(model_id)
+
+            result["get_by_id_us"] = round(time_call(by_id, repeat) / len(ids) * 1e6, 3)
+            result["search_ms"] = round(time_call(lambda: api.search_models("claude"), repeat) * 1000, 3)
+            result["filter_owned_by_ms"] = round(
+                time_call(lambda owner=owner: api.filter_models({"owned_by": owner}), repeat) * 1000, 3
+            )
+            search_lite = time_call(lambda: api.search_models("claude", lite=True), repeat)
+            result["search_lite_ms"] = round(search_lite * 1000, 3)
+        api._collection = None
+        api._lite_collection = None
+        results[str(size)] = result
+    return results
+
+
+async def _sync_once(server: FakePoeServer, data_path: Path, store: ValidatorStore) -> tuple[float, int]:
+    """Run one API-only sync against the fake server and save the result."""
+    from virginia_clemm_poe.updater import ModelUpdater
+
+    updater = ModelUpdater("benchmark-key")
+    start = time.perf_counter()
+    collection = await updater.sync_models(update_info=False, update_pricing=False)
+    elapsed = time.perf_counter() - start
+    with data_path.open("w") as f:
+        json.dump(collection.model_dump(mode="json"), f)
+    store.commit(server.api_url)
+    return elapsed, len(collection.data)
+
+
+def bench_api_sync(catalog: CatalogFactory, sizes: list[int], directory: Path, repeat: int) -> dict[str, Any]:
+    """Measure the updater's model list sync against the fake API."""
+    from virginia_clemm_poe.utils.http import close_http_clients
+
+    results: dict[str, Any] = {}
+    for size in sizes:
+        store = ValidatorStore(directory / f"http_{size}")
+        data_path = directory / f"sync_{size}.json"
+        with FakePoeServer(catalog(size)) as server, ExitStack() as stack:
+            stack.enter_context(patch("virginia_clemm_poe.updater.POE_API_URL", server.api_url))
+            stack.enter_context(patch("virginia_clemm_poe.updater.DATA_FILE_PATH", data_path))
+            stack.enter_context(patch("virginia_clemm_poe.updater.get_validator_store", return_value=store))
+
+            async def run(
+                server: FakePoeServer = server, data_path: Path = data_path, store: ValidatorStore = store
+            ) -> tuple[float, list[float], int]:
+                first, count = await _sync_once(server, data_path, store)
+                revalidations = [(await _sync_once(server, data_path, store))[0] for _ in range(repeat)]
+                await close_http_clients()
+                return first, revalidations, count
+
+            first, revalidations, count = asyncio.run(run())
+            results[str(size)] = {
+                "models": count,
+                "first_sync_ms": round(first * 1000, 2),
+                "revalidate_ms": round(statistics.median(revalidations) * 1000, 2),
+                "not_modified_responses": server.request_counts["not_modified"],
+            }
+    return results
+
+
+async def _scrape_sweep(model_ids: list[str], concurrency: int) -> dict[str, Any]:
+    """Scrape every model page with ``concurrency`` pooled pages in flight."""
+    from virginia_clemm_poe.browser_pool import close_global_pool, get_global_pool
+    from virginia_clemm_poe.updater import ModelUpdater
+
+    updater = ModelUpdater("benchmark-key")
+    metrics = get_metrics_registry()
+    metrics.reset()
+    queue: asyncio.Queue[str] = asyncio.Queue()
+    for model_id in model_ids:
+        queue.put_nowait(model_id)
+    errors = 0
+
+    pool = await get_global_pool(max_size=concurrency)
+
+    async def worker() -> None:
+        nonlocal errors
+        while not queue.empty():
+            model_id = queue.get_nowait()
+            async with pool.acquire_page(reuse_session=False) as page:
+                _, _, error = await updater._scrape_model_info_uncached(model_id, page)
+            errors += error is not None
+
+    try:
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    finally:
+        await close_global_pool()
+
+    histograms = metrics.snapshot()["histograms"]
+    return {
+        "models": len(model_ids),
+        "models_per_sec": round(len(model_ids) / elapsed, 3),
+        "errors": errors,
+        "phase_p50_ms": {
+            name: round(summary["p50"] * 1000, 1) for name, summary in histograms.items() if summary["count"]
+        },
+    }
+
+
+def bench_scrape(data: dict[str, Any], levels: list[int], limit: int) -> dict[str, Any]:
+    """Run the scraping sweep at each concurrency level."""
+    records = [record for record in data["data"] if record.get("pricing")][:limit]
+    model_ids = [record["id"] for record in records]
+    results: dict[str, Any] = {}
+    with (
+        FakePoeServer({**data, "data": records}) as server,
+        patch("virginia_clemm_poe.updater.POE_BASE_URL", server.page_url_template),
+    ):
+        for concurrency in levels:
+            try:
+                results[str(concurrency)] = asyncio.run(_scrape_sweep(model_ids, concurrency))
+            except Exception as e:
+                # No Chrome in this environment (run 'virginia-clemm-poe setup')
+                return {"skipped": f"{type(e).__name__}: {e}" if str(e) else type(e).__name__}
+    return results
+
+
+def bench_cache(operations: int) -> dict[str, Any]:
+    """Measure in-memory cache throughput."""
+
+    async def run() -> dict[str, Any]:
+        cache = Cache(max_size=operations)
+        keys = [f"key-{i}" for i in range(operations)]
+
+        start = time.perf_counter()
+        for key in keys:
+            await cache.set(key, key)
+        set_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for key in keys:
+            await cache.get(key)
+        get_seconds = time.perf_counter() - start
+
+        @cached(cache=cache, ttl=600, key_prefix="bench")
+        async def lookup(value: int) -> int:
+            return value
+
+        await lookup(1)
+        start = time.perf_counter()
+        for _ in range(operations):
+            await lookup(1)
+        hit_seconds = time.perf_counter() - start
+
+        return {
+            "set_per_sec": round(operations / set_seconds),
+            "get_per_sec": round(operations / get_seconds),
+            "cached_hit_per_sec": round(operations / hit_seconds),
+        }
+
+    return asyncio.run(run())
+
+
+def git_commit() -> str | None:
+    """Get the current commit hash, if running from a git checkout."""
+    result = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=False, cwd=Path(__file__).parent
+    )
+    return result.stdout.strip() or None
+
+
+def flatten(results: dict[str, Any], prefix: str = "") -> dict[str, float]:
+    """Flatten nested results into ``a.b.c`` keys for numeric timing values."""
+    flat: dict[str, float] = {}
+    for key, value in results.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{name}."))
+        elif isinstance(value, int | float) and name.endswith(("_ms", "_us", "_per_sec")):
+            flat[name] = float(value)
+    return flat
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], threshold: float) -> tuple[str, list[str]]:
+    """Compare two result sets.
+
+    Args:
+        current: Results of this run
+        baseline: Results loaded from an earlier JSON file
+        threshold: Percent change counted as a regression
+
+    Returns:
+        Tuple of (comparison table, names of regressed metrics)
+    """
+    before = flatten(baseline.get("results", baseline))
+    after = flatten(current)
+    width = max((len(name) for name in after), default=10)
+    lines = [f"{'metric':<{width}} {'before':>12} {'after':>12} {'delta':>8}"]
+    regressions = []
+    for name, value in after.items():
+        if name not in before:
+            continue
+        old = before[name]
+        delta = (value - old) / old * 100 if old else 0.0
+        worse = -delta if name.endswith("_per_sec") else delta
+        flag = ""
+        if worse > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        lines.append(f"{name:<{width}} {old:>12.3f} {value:>12.3f} {delta:>+7.1f}%{flag}")
+    return "\n".join(lines), regressions
+
+
+def main() -> int:
+    """Run the selected benchmarks and emit JSON results."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", nargs="*", choices=BENCHMARKS, help="Subset of benchmarks to run")
+    parser.add_argument("--sizes", nargs="*", type=int, default=list(DEFAULT_SIZES), help="Catalog sizes")
+    parser.add_argument("--concurrency", nargs="*", type=int, default=list(DEFAULT_CONCURRENCY), help="Scrape levels")
+    parser.add_argument("--scrape-models", type=int, default=30, help="Model pages per scrape sweep")
+    parser.add_argument("--repeat", type=int, default=20, help="Repetitions per timed call")
+    parser.add_argument("--data", type=Path, default=DATA_FILE_PATH, help="poe_models.json to scale")
+    parser.add_argument("--catalog", choices=("scaled", "synthetic"), default="scaled", help="How sizes are built")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for synthetic catalogs")
+    parser.add_argument("-o", "--output", type=Path, help="Write JSON results to this file")
+    parser.add_argument("--compare", type=Path, help="Previous JSON results to compare against")
+    parser.add_argument("--fail-on-regression", type=float, metavar="PERCENT", help="Exit 1 if any metric is worse")
+    options = parser.parse_args()
+
+    from loguru import logger
+
+    logger.remove()  # Keep benchmark output to the JSON report
+
+    with options.data.open() as f:
+        data = json.load(f)
+    selected = options.only or BENCHMARKS
+    scaled: CatalogFactory = partial(scale_records, data)
+    catalog: CatalogFactory = partial(generate_catalog, seed=options.seed) if options.catalog == "synthetic" else scaled
+    results: dict[str, Any] = {}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        if "load" in selected:
+            results["load"] = bench_load(write_data(scaled, directory, len(data["data"])), options.repeat)
+        if "queries" in selected:
+            results["queries"] = bench_queries(catalog, options.sizes, directory, options.repeat)
+        if "api_sync" in selected:
+            results["api_sync"] = bench_api_sync(catalog, options.sizes[:2], directory, options.repeat)
+        if "scrape" in selected:
+            results["scrape"] = bench_scrape(data, options.concurrency, options.scrape_models)
+        if "cache" in selected:
+            results["cache"] = bench_cache(50_000)
+
+    report = {
+        "python": sys.version.split()[0],
+        "commit": git_commit(),
+        "catalog": options.catalog,
+        "repeat": options.repeat,
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if options.output:
+        options.output.write_text(text + "\n")
+    print(text)
+
+    if options.compare:
+        table, regressions = compare(results, json.loads(options.compare.read_text()), options.fail_on_regression or 0)
+        print(table, file=sys.stderr)
+        if options.fail_on_regression is not None and regressions:
+            print(f"{len(regressions)} metric(s) regressed by more than {options.fail_on_regression}%", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
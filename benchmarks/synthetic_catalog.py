@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+# this_file: benchmarks/synthetic_catalog.py
+"""Synthetic model catalogs for scaling tests.
+
+The bundled data file holds ~300 models; this generator produces realistic
+``ModelCollection`` files of any size so loading, indexing and search can be
+stress-tested at the catalog sizes of the third-party bot ecosystem.
+
+Records mirror the shapes seen in the real data:
+
+- Pricing follows the observed mix of shapes: flat per-message costs, image
+  and video output, token-priced input/output with cache discounts,
+  multimodal inputs, character-priced text, per-message bots and rare exotic
+  tables. Those exotic tables use website labels kept as ``extra`` keys,
+  list values and free-text notes.
+- Modalities follow the real distribution (mostly text->text).
+- Most bots are owned by "poe"; the rest are spread over a long tail of
+  owners. Creator handles repeat across bots.
+- Descriptions have a long-tailed length, with some thousands of characters
+  long, plus the usual "Powered by ..." disclaimer.
+- A few percent carry a pricing error or have never been scraped.
+
+Output is deterministic for a given ``--seed``.
+
+Usage:
+    python benchmarks/synthetic_catalog.py --sizes 1000 10000 100000 --out-dir catalogs
+    python benchmarks/synthetic_catalog.py --sizes 5000 --validate
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from collections.abc import Callable, Iterator
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+
+# Fixed reference time so a seed always produces the same file
+REFERENCE_TIME = datetime(2025, 9, 20, 12, 0, 0)
+
+WORDS = [
+    "assistant",
+    "model",
+    "reasoning",
+    "creative",
+    "writing",
+    "code",
+    "image",
+    "video",
+    "audio",
+    "fast",
+    "accurate",
+    "multilingual",
+    "research",
+    "analysis",
+    "context",
+    "tokens",
+    "vision",
+    "translation",
+    "summarization",
+    "chat",
+    "expert",
+    "helpful",
+    "open",
+    "weights",
+    "latest",
+    "fine-tuned",
+    "instruction",
+    "following",
+    "tools",
+    "search",
+    "documents",
+    "math",
+    "science",
+    "story",
+    "character",
+    "roleplay",
+    "design",
+    "photo",
+    "realistic",
+    "style",
+    "music",
+    "voice",
+    "speech",
+    "agent",
+    "workflow",
+    "planning",
+    "long",
+    "memory",
+    "reliable",
+    "private",
+]
+
+NAME_PARTS = [
+    "Nova",
+    "Echo",
+    "Atlas",
+    "Quill",
+    "Pixel",
+    "Sage",
+    "Lumen",
+    "Orbit",
+    "Vega",
+    "Cipher",
+    "Muse",
+    "Forge",
+    "Prism",
+    "Drift",
+    "Spark",
+    "Helix",
+    "Aurora",
+    "Nimbus",
+    "Vertex",
+    "Ember",
+    "Zephyr",
+    "Rune",
+    "Tidal",
+    "Comet",
+    "Iris",
+    "Onyx",
+    "Pulse",
+    "Flux",
+    "Halo",
+    "Kite",
+]
+
+MODEL_FAMILIES = ("GPT", "Claude", "Gemini", "Llama", "Mistral", "Qwen", "DeepSeek", "Flux", "Kling", "Veo")
+
+# (weight, input modalities, output modalities, modality) as in the real data
+MODALITIES = (
+    (78, ["text"], ["text"], "text->text"),
+    (12, ["text"], ["image"], "text->image"),
+    (7, ["text"], ["video"], "text->video"),
+    (2, ["text"], ["audio"], "text->audio"),
+    (1, ["text", "image"], ["image", "video"], "text,image->image,video"),
+)
+
+
+def _points(rng: random.Random, low: int, high: int) -> int:
+    """Draw a points amount with a long tail towards ``high``."""
+    return min(int(low * (high / low) ** (rng.random() ** 2)), high)
+
+
+def _flat_message(rng: random.Random) -> dict[str, Any]:
+    cost = _points(rng, 1, 5_000)
+    return {"total_cost": f"{cost} points/message", "initial_points_cost": f"{cost} points"}
+
+
+def _image_output(rng: random.Random) -> dict[str, Any]:
+    cost = _points(rng, 20, 3_000)
+    unit = rng.choice(("message", "message", "megapixel", "image"))
+    return {"image_output": f"{cost} points / {unit}", "initial_points_cost": f"{cost} points"}
+
+
+def _video_output(rng: random.Random) -> dict[str, Any]:
+    cost = _points(rng, 500, 20_000)
+    unit = rng.choice(("second", "message"))
+    return {"video_output": f"{cost} points / {unit}", "initial_points_cost": f"{cost}+ points"}
+
+
+def _token_priced(rng: random.Random) -> dict[str, Any]:
+    input_cost = _points(rng, 1, 1_000)
+    details = {
+        "Input": f"{input_cost} points/1k tokens",
+        "Output (text)": f"{input_cost * rng.choice((2, 3, 4, 5, 8))} points/1k tokens",
+        "initial_points_cost": f"{input_cost + rng.randint(1, 50)}+ points",
+    }
+    if rng.random() < 0.8:
+        details["Cache discount"] = f"{rng.choice((50, 75, 90))}% discount oncached chat"
+    return details
+
+
+def _multimodal_input(rng: random.Random) -> dict[str, Any]:
+    input_cost = _points(rng, 10, 1_000)
+    details = {
+        "input_text": f"{input_cost} points / 1k tokens",
+        "input_image": rng.choice((f"{input_cost * 2} points / 1k token", f"{rng.randint(1, 100)} points / image")),
+        "Output (text)": f"{input_cost * 4} points/1k tokens",
+        "initial_points_cost": f"{input_cost}+ points",
+    }
+    if rng.random() < 0.4:
+        details["Input (video)"] = rng.choice(("1000 points / file", f"{rng.randint(1, 10)} points/second"))
+    if rng.random() < 0.3:
+        details["Cache discount"] = f"{rng.choice((50, 75, 90))}% discount oncached chat"
+    return details
+
+
+def _per_message(rng: random.Random) -> dict[str, Any]:
+    cost = _points(rng, 10, 1_000)
+    return {"per_message": f"{cost} points", "initial_points_cost": f"{cost} points"}
+
+
+def _character_priced(rng: random.Random) -> dict[str, Any]:
+    return {
+        "text_input": rng.choice(
+            (f"{_points(rng, 100, 2_000)} points / 1k characters", "1 point per 5 characters", "2 point / character")
+        ),
+        "initial_points_cost": f"{_points(rng, 10, 500)}+ points",
+    }
+
+
+def _exotic(rng: random.Random) -> dict[str, Any]:
+    """Rare tables: custom labels, list values and free-text notes."""
+    details: dict[str, Any] = {"initial_points_cost": f"{_points(rng, 10, 3_000)} points"}
+    label = rng.choice(
+        (
+            "Base Cost",
+            "Message Cost",
+            "Per Search",
+            "File Processing",
+            "Document Processing",
+            "Research analysis",
+            "Transcription",
+            "Audio Output",
+            "HD Output",
+        )
+    )
+    unit = rng.choice(("message", "file", "document", "research", "1000 characters"))
+    details[label] = f"{_points(rng, 10, 5_000)} points / {unit}"
+    roll = rng.random()
+    if roll < 0.3:
+        details[f"{rng.choice(MODEL_FAMILIES)} + {rng.choice(MODEL_FAMILIES)}"] = [
+            str(_points(rng, 100, 3_000)),
+            str(_points(rng, 1_000, 15_000)),
+        ]
+    elif roll < 0.5:
+        details["Output (image)"] = "Based on output image quality and resolution (see table below)"
+    elif roll < 0.6:
+        details[f"{rng.choice(('720p', '768p', '1080p'))}-{rng.randint(4, 10)}s video"] = (
+            f"{_points(rng, 1_000, 20_000)} credits per video"
+        )
+    return details
+
+
+# (weight, builder) approximating the shape frequencies of the real data
+PRICING_SHAPES: tuple[tuple[int, Callable[[random.Random], dict[str, Any]]], ...] = (
+    (40, _flat_message),
+    (10, _image_output),
+    (7, _video_output),
+    (13, _token_priced),
+    (8, _multimodal_input),
+    (4, _per_message),
+    (3, _character_priced),
+    (15, _exotic),
+)
+
+
+def _weighted(rng: random.Random, choices: tuple[tuple[Any, ...], ...]) -> tuple[Any, ...]:
+    return rng.choices(choices, weights=[choice[0] for choice in choices])[0]
+
+
+def _description(rng: random.Random) -> str:
+    """A description whose length is long-tailed (median ~60 words, tail in the thousands of characters)."""
+    words = max(int(rng.lognormvariate(4.1, 0.8)), 5)
+    sentences = []
+    remaining = words
+    while remaining > 0:
+        length = min(rng.randint(6, 18), remaining)
+        sentence = " ".join(rng.choice(WORDS) for _ in range(length))
+        sentences.append(sentence.capitalize() + ".")
+        remaining -= length
+    return " ".join(sentences)
+
+
+def generate_records(count: int, seed: int = 0) -> Iterator[dict[str, Any]]:
+    """Generate model records in the poe_models.json format.
+
+    Args:
+        count: Number of records
+        seed: Random seed; the same seed gives the same records
+
+    Yields:
+        One record dict per model, with unique IDs
+    """
+    rng = random.Random(seed)
+    owners = ["poe"] + [f"{part.lower()}-labs" for part in NAME_PARTS]
+    creators = [
+        f"@{rng.choice(NAME_PARTS).lower()}{rng.choice(WORDS).replace('-', '')}{i}" for i in range(max(count // 20, 10))
+    ]
+    created_start = int((REFERENCE_TIME - timedelta(days=800)).timestamp() * 1000)
+    created_end = int(REFERENCE_TIME.timestamp() * 1000)
+
+    for index in range(count):
+        family = rng.choice(MODEL_FAMILIES)
+        model_id = f"{rng.choice(NAME_PARTS)}-{family}-{rng.choice(WORDS).capitalize()}-{index}"
+        _, input_modalities, output_modalities, modality = _weighted(rng, MODALITIES)
+        record: dict[str, Any] = {
+            "id": model_id,
+            "object": "model",
+            "created": rng.randint(created_start, created_end),
+            "owned_by": "poe" if rng.random() < 0.7 else rng.choice(owners),
+            "permission": [],
+            "root": model_id,
+            "parent": None,
+            "architecture": {
+                "input_modalities": list(input_modalities),
+                "output_modalities": list(output_modalities),
+                "modality": modality,
+            },
+            "pricing": None,
+            "pricing_error": None,
+            "bot_info": None,
+        }
+
+        roll = rng.random()
+        if roll < 0.03:
+            yield record  # Never scraped
+            continue
+        if roll < 0.05:
+            record["pricing_error"] = rng.choice(("No pricing table found in dialog", "No Rates button found"))
+        else:
+            checked_at = REFERENCE_TIME - timedelta(seconds=rng.randint(0, 30 * 86400))
+            _, build = _weighted(rng, PRICING_SHAPES)
+            record["pricing"] = {"checked_at": checked_at.isoformat(sep=" "), "details": build(rng)}
+
+        creator = rng.choice(creators)
+        record["bot_info"] = {
+            "creator": creator,
+            "description": _description(rng),
+            "description_extra": f"Powered by a server managed by {creator}. Learn more",
+        }
+        yield record
+
+
+def generate_catalog(count: int, seed: int = 0) -> dict[str, Any]:
+    """Generate a whole catalog in memory.
+
+    Args:
+        count: Number of models
+        seed: Random seed
+
+    Returns:
+        Data dict in the poe_models.json format
+    """
+    return {"object": "list", "data": list(generate_records(count, seed))}
+
+
+def write_catalog(path: Path, count: int, seed: int = 0) -> int:
+    """Stream a catalog to a JSON file without building it in memory.
+
+    Args:
+        path: Destination file
+        count: Number of models
+        seed: Random seed
+
+    Returns:
+        Size of the written file in bytes
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        f.write('{"object": "list", "data": [')
+        for index, record in enumerate(generate_records(count, seed)):
+            f.write(",\n" if index else "\n")
+            json.dump(record, f, ensure_ascii=False)
+        f.write("\n]}\n")
+    return path.stat().st_size
+
+
+def main() -> int:
+    """Write one synthetic catalog per requested size."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", nargs="*", type=int, default=list(DEFAULT_SIZES), help="Models per catalog")
+    parser.add_argument("--out-dir", type=Path, default=Path("catalogs"), help="Directory for the JSON files")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--validate", action="store_true", help="Load each file as a ModelCollection afterwards")
+    args = parser.parse_args()
+
+    results = []
+    for size in args.sizes:
+        path = args.out_dir / f"synthetic_{size}.json"
+        start = time.perf_counter()
+        size_bytes = write_catalog(path, size, args.seed)
+        result: dict[str, Any] = {
+            "path": str(path),
+            "models": size,
+            "mb": round(size_bytes / 1024 / 1024, 2),
+            "write_s": round(time.perf_counter() - start, 2),
+        }
+        if args.validate:
+            from virginia_clemm_poe.models import ModelCollection
+
+            start = time.perf_counter()
+            with open(path) as f:
+                collection = ModelCollection(**json.load(f))
+            result["validate_s"] = round(time.perf_counter() - start, 2)
+            result["with_pricing"] = sum(1 for model in collection.data if model.has_pricing())
+        results.append(result)
+
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,22 +3,61 @@
 """CLI entry point for Virginia Clemm Poe."""
 
 import asyncio
+import importlib
 import os
 import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import fire
 from rich.console import Console
+from rich.markup import escape
 from rich.table import Table
 
 from . import api
-from .browser_manager import BrowserManager
-from .config import DATA_FILE_PATH, DEFAULT_DEBUG_PORT
-from .poe_session import PoeSessionManager
-from .updater import ModelUpdater
+from .config import (
+    BALANCE_POLL_INITIAL_SECONDS,
+    DATA_FILE_PATH,
+    DEFAULT_DEBUG_PORT,
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_REQUESTS_PER_SECOND,
+    SERVER_HOST,
+    SERVER_PORT,
+)
+from .models import PoeModel
 from .utils.logger import configure_logger, log_operation, log_user_action
+from .utils.metrics import MetricsRegistry, get_metrics_registry
+
+if TYPE_CHECKING:
+    from .updater import ModelUpdater
 
 console = Console()
 
+# Heavy collaborators (playwright, httpx, bs4, psutil) are imported on first use so
+# commands that only read the local JSON data, like `search` and `list`, start fast.
+_LAZY_ATTRIBUTES = {
+    "BrowserManager": ".browser_manager",
+    "ModelUpdater": ".updater",
+    "PoeSessionManager": ".poe_session",
+    "close_http_clients": ".utils.http",
+    "configure_rate_limiter": ".utils.rate_limit",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import deferred module attributes on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __package__), name)
+    globals()[name] = value
+    return value
+
+
+def _lazy(name: str) -> Any:
+    """Resolve a deferred attribute, honouring values already set on the module (e.g. by tests)."""
+    return globals()[name] if name in globals() else __getattr__(name)
+
 
 class Cli:
     """Virginia Clemm Poe - Poe.com model data management CLI.
@@ -129,7 +168,7 @@ class Cli:
         console.print("[bold blue]Setting up browser for Virginia Clemm Poe...[/bold blue]")
 
         async def run_setup() -> None:
-            success = await BrowserManager.setup_chrome()
+            success = await _lazy("BrowserManager").setup_chrome()
             if success:
                 console.print("[green]✓ Chrome is available![/green]")
                 console.print("\n[bold]You're all set![/bold]")
@@ -218,9 +257,9 @@ class Cli:
             console.print("[green]✓ POE_API_KEY is set[/green]")
             # Validate API key
             try:
-                import httpx
+                from .utils.http import get_sync_client
 
-                response = httpx.get(
+                response = get_sync_client().get(
                     "https://api.poe.com/bot/list", headers={"Authorization": f"Bearer {api_key}"}, timeout=5
                 )
                 if response.status_code == 200:
@@ -257,9 +296,9 @@ class Cli:
         # 4. Check network
         console.print("\n[bold]Network Connectivity:[/bold]")
         try:
-            import httpx
+            from .utils.http import get_sync_client
 
-            response = httpx.get("https://poe.com", timeout=5, follow_redirects=True)
+            response = get_sync_client().get("https://poe.com", timeout=5, follow_redirects=True)
             if 200 <= response.status_code < 400:
                 console.print("[green]✓ Can reach poe.com[/green]")
             else:
@@ -409,9 +448,8 @@ class Cli:
             console.print("[bold blue]Clearing all caches...[/bold blue]\n")
 
             # Import here to avoid circular imports
-            import asyncio
-
             from .utils.cache import get_api_cache, get_global_cache, get_scraping_cache
+            from .utils.http_cache import get_validator_store
 
             async def clear_all_caches():
                 # Clear all cache instances
@@ -425,6 +463,9 @@ class Cli:
                     await cache.clear()
                     console.print(f"[green]✓ Cleared {name} cache[/green]")
 
+                get_validator_store().clear()
+                console.print("[green]✓ Cleared HTTP validators[/green]")
+
             asyncio.run(clear_all_caches())
             console.print("\n[green]All caches cleared successfully![/green]")
             return
@@ -433,12 +474,11 @@ class Cli:
             console.print("[bold blue]Cache Statistics[/bold blue]\n")
 
             # Import here to avoid circular imports
-            import asyncio
-
             from .utils.cache import get_all_cache_stats
 
             async def show_cache_stats():
                 stats = await get_all_cache_stats()
+                self._display_connection_stats()
 
                 if not stats:
                     console.print("[yellow]No cache statistics available[/yellow]")
@@ -482,6 +522,23 @@ class Cli:
 
             asyncio.run(show_cache_stats())
 
+    def _display_connection_stats(self) -> None:
+        """Print request and connection reuse counts per host, if any requests were made."""
+        from .utils.http import get_connection_stats
+
+        connection_stats = get_connection_stats()
+        if not connection_stats:
+            return
+
+        console.print("[bold]HTTP Connections:[/bold]")
+        for host, host_stats in connection_stats.items():
+            console.print(
+                f"  {host}: {host_stats['requests']} requests, "
+                f"{host_stats['new_connections']} new connections, "
+                f"{host_stats['reuse_rate_percent']:.1f}% reused"
+            )
+        console.print()
+
     def _validate_api_key(self, api_key: str | None) -> str:
         """Validate and return API key.
 
@@ -556,6 +613,16 @@ class Cli:
         force: bool = False,
         debug_port: int = DEFAULT_DEBUG_PORT,
         verbose: bool = False,
+        *,
+        diff_out: str | None = None,
+        metrics_out: str | None = None,
+        metrics_port: int | None = None,
+        metrics_textfile: str | None = None,
+        memory_profile: bool = False,
+        trace_out: str | None = None,
+        rate_limit: float = RATE_LIMIT_REQUESTS_PER_SECOND,
+        rate_burst: int = RATE_LIMIT_BURST,
+        shared_rate_limit: bool = False,
     ) -> None:
         """Fetch latest model data from Poe - run weekly or when new models appear.
 
@@ -587,6 +654,27 @@ class Cli:
                        conflicts occur with other browser automation tools.
             verbose: Enable detailed logging for troubleshooting browser automation,
                     API calls, and data processing. Useful for debugging update failures.
+            diff_out: Write the run's change set (added/removed models, changed pricing and
+                     bot info with old and new values) to this JSON file.
+            metrics_out: Write the per-phase timing report (navigation, sleeps, selector
+                        fallbacks, Rates dialog, page acquire/close) to this JSON file instead
+                        of update_metrics.json in the cache directory.
+            metrics_port: Serve OpenMetrics (pool, cache, memory, crash and phase metrics) at
+                         http://127.0.0.1:<port>/metrics while the update runs.
+            metrics_textfile: Keep this .prom file refreshed with the same metrics, for the
+                             node_exporter textfile collector.
+            memory_profile: Trace allocations with tracemalloc and report the growth per scraped
+                           model and the top allocation sites. Slows the run down; use it to
+                           diagnose memory growth.
+            trace_out: Record every scrape phase (model, duration, outcome, worker) and write
+                      the run's trace to this file: NDJSON for .ndjson/.jsonl, otherwise
+                      Chrome trace JSON for chrome://tracing or ui.perfetto.dev.
+            rate_limit: Requests per second allowed to each Poe host (page navigations and
+                       API calls), after an initial burst of --rate-burst requests.
+            rate_burst: Requests a Poe host may receive back-to-back.
+            shared_rate_limit: Share the rate limit with other virginia-clemm-poe processes
+                              through lock files in the cache directory, so parallel cron
+                              jobs stay within one budget.
 
         Raises:
             SystemExit: If API key is missing or invalid, or if browser setup fails.
@@ -610,6 +698,24 @@ class Cli:
 
             # Force refresh all data
             virginia-clemm-poe update --force
+
+            # Save what changed for downstream cache invalidation
+            virginia-clemm-poe update --diff-out changes.json
+
+            # Keep the timing breakdown of this run
+            virginia-clemm-poe update --metrics-out timings.json
+
+            # Let Prometheus scrape pool and cache health during the run
+            virginia-clemm-poe update --metrics-port 9464
+
+            # Find out which allocations grow while scraping
+            virginia-clemm-poe update --memory-profile
+
+            # See where each model's time went, worker by worker
+            virginia-clemm-poe update --trace-out update-trace.json
+
+            # Go easy on Poe while other jobs are running
+            virginia-clemm-poe update --rate-limit 0.5 --shared-rate-limit
             ```
 
             Troubleshooting:
@@ -665,11 +771,192 @@ class Cli:
         self._display_update_status(all, update_info, update_pricing)
 
         # Run update
-        async def run_update() -> None:
-            updater = ModelUpdater(api_key, debug_port=debug_port, verbose=verbose)
+        metrics = get_metrics_registry()
+        metrics.reset()
+        _lazy("configure_rate_limiter")(rate_limit, rate_burst, shared=shared_rate_limit)
+        if memory_profile:
+            from .utils.memory import enable_allocation_profiling
+
+            enable_allocation_profiling()
+        if trace_out:
+            from .utils.trace import enable_tracing
+
+            enable_tracing()
+
+        updater = _lazy("ModelUpdater")(api_key, debug_port=debug_port, verbose=verbose)
+        try:
+            asyncio.run(
+                self._run_update(
+                    updater,
+                    force=force,
+                    update_info=update_info,
+                    update_pricing=update_pricing,
+                    diff_out=diff_out,
+                    metrics_port=metrics_port,
+                    metrics_textfile=metrics_textfile,
+                )
+            )
+        finally:
+            # Report timings for failed runs too; that is when they matter most
+            self._report_run(metrics, metrics_out=metrics_out, memory_profile=memory_profile, trace_out=trace_out)
+
+    async def _run_update(
+        self,
+        updater: "ModelUpdater",
+        *,
+        force: bool,
+        update_info: bool,
+        update_pricing: bool,
+        diff_out: str | None,
+        metrics_port: int | None,
+        metrics_textfile: str | None,
+    ) -> None:
+        """Run the update, serving or exporting live metrics while it runs.
+
+        Args:
+            updater: ModelUpdater to run
+            force: Update all models even if they already have data
+            update_info: Scrape bot info
+            update_pricing: Scrape pricing
+            diff_out: Write the run's change set to this JSON file
+            metrics_port: Serve OpenMetrics on this port during the run
+            metrics_textfile: Keep this .prom file refreshed during the run
+        """
+        exporter = None
+        textfile_task = None
+        textfile_path = Path(metrics_textfile) if metrics_textfile else None
+        if metrics_port is not None or textfile_path is not None:
+            from .openmetrics import MetricsExporter, run_textfile_writer, write_textfile
+
+            if metrics_port is not None:
+                exporter = MetricsExporter(port=metrics_port)
+                await exporter.start()
+                console.print(f"[dim]Serving metrics at {exporter.url}[/dim]")
+            if textfile_path is not None:
+                textfile_task = asyncio.create_task(run_textfile_writer(textfile_path))
+        try:
             await updater.update_all(force=force, update_info=update_info, update_pricing=update_pricing)
+            if diff_out and updater.last_change_set is not None:
+                from .history import write_change_set
+
+                write_change_set(updater.last_change_set, Path(diff_out))
+                console.print(f"[green]✓ Wrote change set to {diff_out}[/green]")
+        finally:
+            if textfile_task is not None and textfile_path is not None:
+                textfile_task.cancel()
+                # Leave the final state behind for the collector
+                try:
+                    await write_textfile(textfile_path)
+                except OSError as e:
+                    console.print(f"[yellow]Could not write metrics textfile: {e}[/yellow]")
+            if exporter is not None:
+                await exporter.stop()
+            await _lazy("close_http_clients")()
+
+    def _report_run(
+        self, metrics: MetricsRegistry, *, metrics_out: str | None, memory_profile: bool, trace_out: str | None
+    ) -> None:
+        """Show and write the timing, allocation and trace reports of an update run.
+
+        Args:
+            metrics: Registry holding the run's phase timings
+            metrics_out: Timing report destination (default: cache directory)
+            memory_profile: Whether allocation profiling was enabled for the run
+            trace_out: Trace destination, if tracing was enabled for the run
+        """
+        if not metrics.is_empty():
+            self._display_metrics_summary(metrics.snapshot())
+            self._write_metrics(metrics, metrics_out)
+        if memory_profile:
+            from .utils.memory import disable_allocation_profiling
+
+            self._display_allocation_profile(disable_allocation_profiling())
+        if trace_out:
+            from .utils.trace import disable_tracing
+
+            recorder = disable_tracing()
+            if recorder is not None:
+                recorder.write(Path(trace_out))
+                console.print(f"[green]✓ Wrote {len(recorder)} trace spans to {trace_out}[/green]")
+
+    def _display_allocation_profile(self, reports: list[dict[str, Any]]) -> None:
+        """Print allocation growth per profiled operation and its top allocation sites.
+
+        Args:
+            reports: Reports from the allocation profiler
+        """
+        if not reports:
+            console.print("[yellow]No memory-managed operations were profiled[/yellow]")
+            return
+
+        for report in reports:
+            per_model = report["growth_per_operation_bytes"]
+            table = Table(
+                title=f"Allocation growth in {report['operation']}: {report['growth_bytes'] / 1024:+.1f} KB"
+                + (f", {per_model / 1024:+.1f} KB per model" if per_model is not None else "")
+            )
+            table.add_column("Allocation site", style="cyan", overflow="fold")
+            table.add_column("Growth (KB)", justify="right", style="green")
+            table.add_column("Blocks", justify="right")
+            table.add_column("Size (KB)", justify="right")
+            for site in report["top_sites"]:
+                table.add_row(
+                    site["site"],
+                    f"{site['size_diff_bytes'] / 1024:+.1f}",
+                    f"{site['count_diff']:+d}",
+                    f"{site['size_bytes'] / 1024:.1f}",
+                )
+            console.print(table)
 
-        asyncio.run(run_update())
+    def _display_metrics_summary(self, snapshot: dict[str, Any]) -> None:
+        """Print per-phase latency histograms and counters from a metrics snapshot.
+
+        Args:
+            snapshot: Output of ``MetricsRegistry.snapshot()``
+        """
+        histograms = snapshot["histograms"]
+        if histograms:
+            table = Table(title="Update timing by phase")
+            table.add_column("Phase", style="cyan", no_wrap=True)
+            table.add_column("Count", justify="right")
+            table.add_column("Total (s)", justify="right", style="green")
+            for column in ("Mean", "p50", "p95", "p99", "Max"):
+                table.add_column(f"{column} (ms)", justify="right")
+            for name, summary in histograms.items():
+                table.add_row(
+                    name,
+                    str(summary["count"]),
+                    f"{summary['total']:.2f}",
+                    *(f"{summary[key] * 1000:.0f}" for key in ("mean", "p50", "p95", "p99", "max")),
+                )
+            console.print(table)
+
+        counters = snapshot["counters"]
+        if counters:
+            table = Table(title="Update counters")
+            table.add_column("Counter", style="cyan")
+            table.add_column("Value", justify="right", style="green")
+            for name, value in counters.items():
+                table.add_row(name, str(value))
+            console.print(table)
+
+    def _write_metrics(self, metrics: MetricsRegistry, metrics_out: str | None) -> None:
+        """Write the run's metrics report as JSON.
+
+        Args:
+            metrics: MetricsRegistry holding the run's measurements
+            metrics_out: Destination file; defaults to the platform cache directory
+        """
+        from .config import METRICS_FILE_NAME
+        from .utils.paths import get_cache_dir
+
+        path = Path(metrics_out) if metrics_out else get_cache_dir() / METRICS_FILE_NAME
+        try:
+            metrics.write_json(path)
+        except OSError as e:
+            console.print(f"[yellow]Could not write metrics report to {path}: {e}[/yellow]")
+            return
+        console.print(f"[dim]Timing report written to {path}[/dim]")
 
     def _validate_data_exists(self) -> bool:
         """Check if model data file exists.
@@ -682,9 +969,25 @@ class Cli:
             return False
         return True
 
-    def _perform_search(self, query: str) -> list:
+    def _query_server(self, path: str, params: dict[str, Any] | None = None) -> Any | None:
+        """Query a running `serve` instance, if any.
+
+        Args:
+            path: Endpoint path, e.g. "/search"
+            params: Optional query parameters
+
+        Returns:
+            Decoded JSON response, or None to fall back to the local data file
+        """
+        from .server import query_running_server
+
+        return query_running_server(path, params)
+
+    def _perform_search(self, query: str) -> list[PoeModel]:
         """Search for models matching the query.
 
+        Uses a running query server when available, otherwise the local data file.
+
         Args:
             query: Search term
 
@@ -692,7 +995,12 @@ class Cli:
             List of matching models
         """
         with log_operation("model_search", {"query": query}) as ctx:
-            models = api.search_models(query)
+            response = self._query_server("/search", {"q": query})
+            if response is not None:
+                models = [PoeModel.model_validate(data) for data in response["data"]]
+                ctx["served_by"] = "server"
+            else:
+                models = api.search_models(query)
             ctx["results_count"] = len(models)
 
         if not models:
@@ -726,7 +1034,7 @@ class Cli:
 
         return table
 
-    def _format_pricing_info(self, model) -> tuple[str, str]:
+    def _format_pricing_info(self, model: PoeModel) -> tuple[str, str]:
         """Format pricing information for display.
 
         Args:
@@ -737,7 +1045,7 @@ class Cli:
         """
         if model.pricing:
             primary_cost = model.get_primary_cost()
-            pricing_info = primary_cost if primary_cost else "[dim]No cost info[/dim]"
+            pricing_info = primary_cost or "[dim]No cost info[/dim]"
 
             # Include initial points cost if available
             if model.pricing.details.initial_points_cost:
@@ -749,7 +1057,7 @@ class Cli:
             return f"[red]Error: {model.pricing_error}[/red]", "-"
         return "[dim]Not checked[/dim]", "-"
 
-    def _add_model_row(self, table: Table, model, show_pricing: bool, show_bot_info: bool) -> None:
+    def _add_model_row(self, table: Table, model: PoeModel, show_pricing: bool, show_bot_info: bool) -> None:
         """Add a single model row to the table.
 
         Args:
@@ -775,7 +1083,7 @@ class Cli:
 
         table.add_row(*[str(x) for x in row])
 
-    def _display_single_model_bot_info(self, model) -> None:
+    def _display_single_model_bot_info(self, model: PoeModel) -> None:
         """Display detailed bot info for a single model result.
 
         Args:
@@ -938,6 +1246,8 @@ class Cli:
         - Getting a quick count of available models
         - Identifying models that need updating
 
+        Uses a running `serve` instance when available.
+
         Args:
             with_pricing: Only show models with pricing information
             limit: Limit number of results
@@ -949,10 +1259,28 @@ class Cli:
             console.print("[yellow]No model data found. Run 'virginia-clemm-poe update' first.[/yellow]")
             return
 
-        models = api.get_models_with_pricing() if with_pricing else api.get_all_models()
+        summary = self._query_server("/health")
+        response = None
+        if summary is not None:
+            params: dict[str, Any] = {"has_pricing": "true"} if with_pricing else {}
+            if limit:
+                params["limit"] = limit
+            response = self._query_server("/models", params)
+
+        if summary is not None and response is not None:
+            models = [PoeModel.model_validate(data) for data in response["data"]]
+            total_count = summary["models"]
+            count_with_pricing = summary["with_pricing"]
+            need_update = summary["need_update"]
+        else:
+            models = api.get_models_with_pricing() if with_pricing else api.get_all_models()
+            if limit:
+                models = models[:limit]
 
-        if limit:
-            models = models[:limit]
+            all_models = api.get_all_models()
+            total_count = len(all_models)
+            count_with_pricing = len([m for m in all_models if m.has_pricing()])
+            need_update = len([m for m in all_models if m.needs_pricing_update()])
 
         # Create summary table
         table = Table(title="Poe Models Summary")
@@ -960,11 +1288,7 @@ class Cli:
         table.add_column("With Pricing", style="green")
         table.add_column("Need Update", style="yellow")
 
-        all_models = api.get_all_models()
-        count_with_pricing = len([m for m in all_models if m.has_pricing()])
-        need_update = len([m for m in all_models if m.needs_pricing_update()])
-
-        table.add_row(str(len(all_models)), str(count_with_pricing), str(need_update))
+        table.add_row(str(total_count), str(count_with_pricing), str(need_update))
         console.print(table)
 
         if models:
@@ -973,8 +1297,223 @@ class Cli:
                 status = "✓" if model.has_pricing() else "✗"
                 console.print(f"{status} {model.id}")
 
+    def export(
+        self,
+        format: str = "csv",
+        output: str | None = None,
+        source: str | None = None,
+        with_pricing: bool = False,
+        verbose: bool = False,
+    ) -> None:
+        """Export the model dataset as a flat, typed table for analytics.
+
+        Each model becomes one row with pricing and bot info flattened into
+        columns, including normalized numeric pricing (points per 1k tokens, per
+        message and for the primary cost). Rows are streamed to the output, so
+        large historical snapshots export without loading them whole.
+
+        Args:
+            format: csv, ndjson, arrow or parquet (arrow/parquet need the 'export' extra)
+            output: Output file (default: poe_models.<ext> in the current directory;
+                --output=- writes csv/ndjson to stdout)
+            source: Export a saved snapshot file instead of the current dataset
+            with_pricing: Only export models with pricing information
+            verbose: Enable verbose logging
+
+        Examples:
+            ```bash
+            virginia-clemm-poe export --format parquet
+            virginia-clemm-poe export --format csv --output=- | head
+            virginia-clemm-poe export --format ndjson --source snapshots/2025-08-01.json
+            ```
+        """
+        configure_logger(verbose)
+        log_user_action("export", command=f"export --format={format}", verbose=verbose)
+
+        from .export import EXPORT_EXTENSIONS, EXPORT_FORMATS, export_models, iter_models_from_file
+
+        if format not in EXPORT_FORMATS:
+            console.print(f"[red]✗ Unknown format '{format}'. Choose one of: {', '.join(EXPORT_FORMATS)}[/red]")
+            sys.exit(1)
+
+        if source:
+            source_path = Path(source)
+            if not source_path.exists():
+                console.print(f"[red]✗ Snapshot not found: {source_path}[/red]")
+                sys.exit(1)
+            models = iter_models_from_file(source_path)
+        else:
+            if not DATA_FILE_PATH.exists():
+                console.print("[yellow]No model data found. Run 'virginia-clemm-poe update' first.[/yellow]")
+                return
+            models = iter(api.get_all_models())
+
+        if with_pricing:
+            models = (model for model in models if model.has_pricing())
+
+        output_path = None if output == "-" else Path(output or f"poe_models{EXPORT_EXTENSIONS[format]}")
+
+        try:
+            count = export_models(models, output_path, format)
+        except (ImportError, ValueError) as e:
+            console.print(f"[red]✗ {escape(str(e))}[/red]")
+            sys.exit(1)
+
+        if output_path is not None:
+            console.print(f"[green]✓ Exported {count} models to {output_path}[/green]")
+
+    def history(
+        self,
+        model: str | None = None,
+        *,
+        at: str | None = None,
+        since: str | None = None,
+        field: str | None = None,
+        limit: int = 50,
+        record: str | None = None,
+        verbose: bool = False,
+    ) -> None:
+        """Show how pricing and bot info changed across updates.
+
+        Every `update` appends the fields that changed to a local history
+        database. Without options this lists the most recent changes.
+
+        Args:
+            model: Only show this model (with --at: its fields at that time)
+            at: Point in time (ISO date/time, UTC) for --model
+            since: Only show changes recorded at or after this ISO date/time
+            field: Only show this field, or a prefix such as "pricing."
+            limit: Maximum number of changes to show
+            record: Record a saved data file (e.g. an old git revision) as a run;
+                --at sets its time, otherwise the file's modification time is used
+            verbose: Enable verbose logging
+
+        Examples:
+            ```bash
+            virginia-clemm-poe history --since 2025-08-01
+            virginia-clemm-poe history --model Claude-3-Opus --field pricing.
+            virginia-clemm-poe history --model Claude-3-Opus --at 2025-06-01
+            virginia-clemm-poe history --record old_poe_models.json --at 2025-05-01
+            ```
+        """
+        configure_logger(verbose)
+
+        from datetime import UTC, datetime
+
+        from .history import get_pricing_history
+
+        try:
+            at_time = datetime.fromisoformat(at) if at else None
+            since_time = datetime.fromisoformat(since) if since else None
+        except ValueError as e:
+            console.print(f"[red]✗ Invalid date: {e}[/red]")
+            sys.exit(1)
+
+        history = get_pricing_history()
+
+        if record:
+            from .export import iter_models_from_file
+
+            record_path = Path(record)
+            if not record_path.exists():
+                console.print(f"[red]✗ Data file not found: {record_path}[/red]")
+                sys.exit(1)
+            recorded_at = at_time or datetime.fromtimestamp(record_path.stat().st_mtime, UTC)
+            try:
+                recorded = history.record_snapshot(iter_models_from_file(record_path), recorded_at)
+            except ValueError as e:
+                console.print(f"[red]✗ {e}[/red]")
+                console.print("  Record older snapshots first, in chronological order")
+                sys.exit(1)
+            console.print(f"[green]✓ Recorded {recorded} changes from {record_path}[/green]")
+            return
+
+        if model and at_time:
+            fields = history.fields_at(model, at_time)
+            if not fields:
+                console.print(f"[yellow]No recorded data for {model} at {at}[/yellow]")
+                return
+            table = Table(title=f"{model} at {at}")
+            table.add_column("Field", style="cyan")
+            table.add_column("Value", style="green")
+            for name, value in sorted(fields.items()):
+                table.add_row(name, value)
+            console.print(table)
+            return
+
+        changes = history.changes_since(since_time, model_id=model, field=field)
+        if not changes:
+            console.print("[yellow]No recorded changes. History is recorded by 'virginia-clemm-poe update'.[/yellow]")
+            return
+
+        shown = changes[-limit:] if limit else changes
+        table = Table(title=f"Pricing history ({len(shown)} of {len(changes)} changes)")
+        table.add_column("Recorded", style="dim", no_wrap=True)
+        table.add_column("Model", style="cyan")
+        table.add_column("Field")
+        table.add_column("Previous", style="red")
+        table.add_column("Value", style="green")
+        for change in shown:
+            table.add_row(
+                change["recorded_at"][:19].replace("T", " "),
+                change["model_id"],
+                change["field"],
+                change["previous"] or "-",
+                change["value"] or "-",
+            )
+        console.print(table)
+
+    def serve(self, host: str = SERVER_HOST, port: int = SERVER_PORT, verbose: bool = False) -> None:
+        """Run a resident query server that keeps model data loaded in memory.
+
+        Answers search, model lookup, filter and cost queries over local HTTP with
+        JSON responses, and reloads automatically when the data file changes. While
+        it runs, `search` and `list` route through it instead of re-reading the file.
+
+        Args:
+            host: Interface to bind (loopback by default; the server has no authentication)
+            port: TCP port to listen on
+            verbose: Enable verbose logging, including one line per request
+
+        Examples:
+            ```bash
+            virginia-clemm-poe serve &
+            curl 'http://127.0.0.1:8765/search?q=claude'
+            curl 'http://127.0.0.1:8765/models?owned_by=anthropic&max_points=100'
+            curl 'http://127.0.0.1:8765/models/Claude-3-Opus'
+            curl 'http://127.0.0.1:8765/cost?model=Claude-3-Opus&input_tokens=2000&output_tokens=500'
+            ```
+        """
+        configure_logger(verbose)
+        log_user_action("serve", command=f"serve --host={host} --port={port}", verbose=verbose)
+
+        from .server import ModelQueryServer
+
+        if not DATA_FILE_PATH.exists():
+            console.print("[yellow]No model data found yet; the server will load it after 'update'.[/yellow]")
+
+        try:
+            server = ModelQueryServer(host, port)
+        except OSError as e:
+            console.print(f"[red]✗ Cannot listen on {host}:{port}: {e}[/red]")
+            sys.exit(1)
+
+        console.print(f"[green]Serving {len(api.get_all_models())} models at {server.url}[/green] (Ctrl+C to stop)")
+        try:
+            server.serve()
+        except KeyboardInterrupt:
+            console.print("\n[yellow]Query server stopped[/yellow]")
+
     def balance(
-        self, login: bool = False, refresh: bool = False, no_browser: bool = False, verbose: bool = False
+        self,
+        login: bool = False,
+        refresh: bool = False,
+        no_browser: bool = False,
+        verbose: bool = False,
+        *,
+        watch: bool = False,
+        interval: float = BALANCE_POLL_INITIAL_SECONDS,
+        shared_rate_limit: bool = False,
     ) -> None:
         """Check Poe account balance and compute points - monitor your usage.
 
@@ -994,6 +1533,11 @@ class Cli:
             refresh: Force refresh balance data, ignoring the 5-minute cache.
             no_browser: Disable automatic browser launch for scraping when API fails.
             verbose: Enable detailed logging for troubleshooting authentication.
+            watch: Keep running and print the balance whenever it changes. Polls via the
+                  cheapest working API method on an adaptive interval (no browser).
+            interval: Initial polling interval in seconds for --watch.
+            shared_rate_limit: Count balance queries against the rate limit shared with
+                              other virginia-clemm-poe processes (see update --shared-rate-limit).
 
         Examples:
             Check balance (if already logged in):
@@ -1016,6 +1560,11 @@ class Cli:
             virginia-clemm-poe balance --no-browser
             ```
 
+            Watch balance changes while you work:
+            ```bash
+            virginia-clemm-poe balance --watch --interval 120
+            ```
+
             Troubleshoot authentication:
             ```bash
             virginia-clemm-poe balance --verbose
@@ -1033,11 +1582,17 @@ class Cli:
             Balance data is cached for 5 minutes to reduce API calls.
         """
         configure_logger(verbose)
+        if shared_rate_limit:
+            _lazy("configure_rate_limiter")(shared=True)
 
         console.print("[bold blue]Poe Account Balance[/bold blue]\n")
 
+        if watch:
+            self._watch_balance(interval)
+            return
+
         async def run_balance() -> None:
-            session_manager = PoeSessionManager()
+            session_manager = _lazy("PoeSessionManager")()
 
             # Check if we need to login
             if login or not session_manager.has_valid_cookies():
@@ -1073,42 +1628,102 @@ class Cli:
                     console.print(f"[red]✗ Failed to get balance: {e}[/red]")
                     return
 
-            # Display balance information
-            console.print("[bold]Account Information:[/bold]")
+            self._display_balance(balance_info)
 
-            # Compute points
-            points = balance_info.get("compute_points_available")
-            if points is not None:
-                console.print(f"[green]Compute Points:[/green] {points:,}")
-            else:
-                console.print("[green]Compute Points:[/green] Unknown")
-
-            # Daily points
-            daily = balance_info.get("daily_compute_points_available")
-            if daily is not None:
-                console.print(f"[blue]Daily Points:[/blue] {daily:,}")
-
-            # Subscription status
-            subscription = balance_info.get("subscription", {})
-            if subscription.get("isActive"):
-                console.print("[green]Subscription:[/green] Active ✓")
-                if subscription.get("expiresAt"):
-                    console.print(f"  Expires: {subscription['expiresAt']}")
+        async def run_balance_and_close() -> None:
+            try:
+                await run_balance()
+            finally:
+                await _lazy("close_http_clients")()
+
+        asyncio.run(run_balance_and_close())
+
+    def _display_balance(self, balance_info: dict[str, Any]) -> None:
+        """Print the account balance, subscription and message point details.
+
+        Args:
+            balance_info: Balance data from get_account_balance()
+        """
+        console.print("[bold]Account Information:[/bold]")
+
+        # Compute points
+        points = balance_info.get("compute_points_available")
+        if points is not None:
+            console.print(f"[green]Compute Points:[/green] {points:,}")
+        else:
+            console.print("[green]Compute Points:[/green] Unknown")
+
+        # Daily points
+        daily = balance_info.get("daily_compute_points_available")
+        if daily is not None:
+            console.print(f"[blue]Daily Points:[/blue] {daily:,}")
+
+        # Subscription status
+        subscription = balance_info.get("subscription", {})
+        if subscription.get("isActive"):
+            console.print("[green]Subscription:[/green] Active ✓")
+            if subscription.get("expiresAt"):
+                console.print(f"  Expires: {subscription['expiresAt']}")
+        else:
+            console.print("[yellow]Subscription:[/yellow] Not active")
+
+        # Message point info
+        msg_info = balance_info.get("message_point_info", {})
+        if msg_info:
+            if "messagePointBalance" in msg_info and msg_info["messagePointBalance"] is not None:
+                console.print(f"[cyan]Message Points:[/cyan] {msg_info['messagePointBalance']:,}")
+            if "monthlyQuota" in msg_info and msg_info["monthlyQuota"] is not None:
+                console.print(f"[cyan]Monthly Quota:[/cyan] {msg_info['monthlyQuota']:,}")
+
+        # Timestamp
+        console.print(f"\n[dim]Last updated: {balance_info.get('timestamp', 'Unknown')}[/dim]")
+
+    def _watch_balance(self, interval: float) -> None:
+        """Poll the balance until interrupted, printing each change.
+
+        Args:
+            interval: Initial polling interval in seconds
+        """
+        from datetime import datetime
+
+        from .balance_monitor import BalanceMonitor
+        from .exceptions import AuthenticationError
+
+        session_manager = api.get_session_manager()
+        if not session_manager.has_valid_cookies():
+            console.print("[yellow]No valid session found. Please login first.[/yellow]")
+            console.print("Use: virginia-clemm-poe balance --login")
+            return
+
+        monitor = BalanceMonitor(session_manager, initial_interval=interval)
+
+        def show_change(current: dict[str, Any], previous: dict[str, Any] | None) -> None:
+            stamp = datetime.now().strftime("%H:%M:%S")
+            points = current["compute_points_available"]
+            previous_points = previous.get("compute_points_available") if previous else None
+            if previous_points is None:
+                console.print(f"[dim]{stamp}[/dim] [green]Compute Points:[/green] {points:,}")
             else:
-                console.print("[yellow]Subscription:[/yellow] Not active")
+                console.print(
+                    f"[dim]{stamp}[/dim] [green]Compute Points:[/green] {points:,} ({points - previous_points:+,})"
+                )
 
-            # Message point info
-            msg_info = balance_info.get("message_point_info", {})
-            if msg_info:
-                if "messagePointBalance" in msg_info and msg_info["messagePointBalance"] is not None:
-                    console.print(f"[cyan]Message Points:[/cyan] {msg_info['messagePointBalance']:,}")
-                if "monthlyQuota" in msg_info and msg_info["monthlyQuota"] is not None:
-                    console.print(f"[cyan]Monthly Quota:[/cyan] {msg_info['monthlyQuota']:,}")
+        monitor.subscribe(show_change)
+        console.print("[dim]Watching balance, press Ctrl+C to stop...[/dim]\n")
 
-            # Timestamp
-            console.print(f"\n[dim]Last updated: {balance_info.get('timestamp', 'Unknown')}[/dim]")
+        async def run_watch() -> None:
+            try:
+                await monitor.run()
+            except AuthenticationError as e:
+                console.print(f"[red]✗ {e}[/red]")
+                console.print("Use: virginia-clemm-poe balance --login")
+            finally:
+                await _lazy("close_http_clients")()
 
-        asyncio.run(run_balance())
+        try:
+            asyncio.run(run_watch())
+        except KeyboardInterrupt:
+            console.print("\n[dim]Stopped watching balance[/dim]")
 
     def login(self, verbose: bool = False) -> None:
         """Login to Poe interactively - authenticate for balance checking.
@@ -1182,7 +1797,7 @@ class Cli:
 
         console.print("[bold blue]Poe Logout[/bold blue]\n")
 
-        session_manager = PoeSessionManager()
+        session_manager = _lazy("PoeSessionManager")()
 
         if session_manager.has_valid_cookies():
             session_manager.clear_cookies()
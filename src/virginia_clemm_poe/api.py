@@ -4,19 +4,40 @@
 
 import asyncio
 import json
+import threading
+from typing import TYPE_CHECKING, Any, Literal, overload
 
 from loguru import logger
 
 from .config import DATA_FILE_PATH
 from .exceptions import AuthenticationError
 from .models import ModelCollection, PoeModel
-from .poe_session import PoeSessionManager
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import pyarrow
+
+    # Deferred: the session manager pulls in httpx and is only needed for balance/cookie calls
+    from .balance_monitor import BalanceMonitor
+    from .lite import LiteCollection, LiteModel
+    from .poe_session import PoeSessionManager
+    from .types import ModelFilterCriteria
+    from .utils.file_watch import FileWatcher
+
+# The published collection is an immutable snapshot: it is never mutated after
+# publication, only replaced. Readers take the reference without locking; loaders
+# serialize on _load_lock and bump _generation each time they publish.
 _collection: ModelCollection | None = None
-_session_manager: PoeSessionManager | None = None
+_load_lock = threading.Lock()
+_generation = 0
+_lite_collection: "LiteCollection | None" = None  # Built on first lite=True call per snapshot
+_session_manager: "PoeSessionManager | None" = None
+_balance_monitor: "BalanceMonitor | None" = None
+_watcher: "FileWatcher | None" = None
 
 
-def get_session_manager() -> PoeSessionManager:
+def get_session_manager() -> "PoeSessionManager":
     """Get or create the global session manager instance.
 
     Returns:
@@ -24,10 +45,38 @@ def get_session_manager() -> PoeSessionManager:
     """
     global _session_manager
     if _session_manager is None:
+        from .poe_session import PoeSessionManager
+
         _session_manager = PoeSessionManager()
     return _session_manager
 
 
+def get_balance_monitor() -> "BalanceMonitor":
+    """Get or create the global balance monitor.
+
+    The monitor shares the global session manager, so it reuses the stored
+    cookies and the remembered working balance method. Call ``start()`` (or use
+    it as an async context manager) to begin polling in the background.
+
+    Returns:
+        BalanceMonitor: Singleton monitor with an in-memory hot balance value
+
+    Example:
+        ```python
+        monitor = get_balance_monitor()
+        monitor.subscribe(lambda new, old: print(new["compute_points_available"]))
+        async with monitor:
+            await asyncio.sleep(600)
+        ```
+    """
+    global _balance_monitor
+    if _balance_monitor is None:
+        from .balance_monitor import BalanceMonitor
+
+        _balance_monitor = BalanceMonitor(get_session_manager())
+    return _balance_monitor
+
+
 def load_models(force_reload: bool = False) -> ModelCollection:
     """Load model collection from the data file with intelligent caching.
 
@@ -53,10 +102,13 @@ def load_models(force_reload: bool = False) -> ModelCollection:
             - Returns empty collection if data file doesn't exist (not an error).
 
     Performance:
-        - First call: ~50-200ms (file I/O + JSON parsing for ~240 models)
-        - Cached calls: <1ms (in-memory access)
+        - First call: ~5ms for ~300 models, ~130ms for 5,000 (file I/O + JSON
+          parsing; measured by ``benchmarks/suite.py``)
+        - Cached calls: <1µs (in-memory access)
         - Memory usage: ~2-5MB for typical dataset
         - Cache persists until force_reload=True or process restart
+        - Thread-safe: cached calls take no lock; concurrent first calls wait for
+          a single loader instead of each parsing the file
 
     Error Scenarios:
         - Missing data file: Returns empty collection, logs helpful guidance
@@ -96,28 +148,110 @@ def load_models(force_reload: bool = False) -> ModelCollection:
             print(f"Data loading failed: {e}")
         ```
     """
-    global _collection
+    collection = _collection  # Lock-free snapshot read
+    if collection is not None and not force_reload:
+        return collection
+
+    requested_generation = _generation
+    with _load_lock:
+        # Double-checked: another thread may have loaded while we waited. A forced
+        # reload is satisfied by any snapshot published after it was requested.
+        if _collection is not None and (not force_reload or _generation != requested_generation):
+            return _collection
+
+        if not DATA_FILE_PATH.exists():
+            logger.warning(f"Data file not found: {DATA_FILE_PATH}")
+            logger.info("Run 'virginia-clemm-poe update' to fetch model data")
+            return ModelCollection(data=[])
 
-    if _collection is not None and not force_reload:
-        return _collection
+        try:
+            collection = _read_collection()
+        except Exception as e:
+            logger.error(f"Failed to load models: {e}")
+            return ModelCollection(data=[])
 
-    if not DATA_FILE_PATH.exists():
-        logger.warning(f"Data file not found: {DATA_FILE_PATH}")
-        logger.info("Run 'virginia-clemm-poe update' to fetch model data")
-        return ModelCollection(data=[])
+        _publish(collection)
+        logger.debug(f"Loaded {len(collection.data)} models")
+        return collection
+
+
+def _publish(collection: ModelCollection) -> None:
+    """Publish a new collection snapshot. Callers must hold _load_lock."""
+    global _collection, _generation, _lite_collection
+
+    _collection = collection
+    _lite_collection = None
+    _generation += 1
+
+
+def _read_collection() -> ModelCollection:
+    """Parse the data file into a deduplicated, fully indexed collection.
+
+    Raises:
+        OSError, JSONDecodeError, ValidationError: If the file cannot be read or parsed
+    """
+    with open(DATA_FILE_PATH) as f:
+        collection_data = json.load(f)
+    return ModelCollection(**collection_data).deduplicate().build_indexes()
 
-    try:
-        with open(DATA_FILE_PATH) as f:
-            collection_data = json.load(f)
-        _collection = ModelCollection(**collection_data)
-        logger.debug(f"Loaded {len(_collection.data)} models")
-        return _collection
-    except Exception as e:
-        logger.error(f"Failed to load models: {e}")
-        return ModelCollection(data=[])
 
+def load_lite_models(force_reload: bool = False) -> "LiteCollection":
+    """Load the compact, read-only view of the model collection.
 
-def get_all_models() -> list[PoeModel]:
+    If the full collection is loaded, the lite view is derived from that same
+    snapshot. Otherwise it is built straight from the data file without
+    Pydantic validation and holds one slotted LiteModel per model, so it is
+    much smaller than the full collection. It is dropped whenever a new full
+    collection is published (reload or auto-reload) and rebuilt from that
+    snapshot on the next call, so both views always describe the same data.
+
+    Args:
+        force_reload: If True, re-reads the data file
+
+    Returns:
+        LiteCollection with every model; empty if the data file is missing or invalid
+    """
+    global _lite_collection
+
+    from .lite import LiteCollection
+
+    lite = _lite_collection  # Lock-free snapshot read
+    if lite is not None and not force_reload:
+        return lite
+
+    with _load_lock:
+        if _lite_collection is not None and not force_reload:
+            return _lite_collection
+
+        if not DATA_FILE_PATH.exists():
+            logger.warning(f"Data file not found: {DATA_FILE_PATH}")
+            return LiteCollection(())
+
+        collection = _collection
+        try:
+            if collection is not None and force_reload:
+                # Reload the full collection too, keeping both views on one snapshot
+                collection = _read_collection()
+                _publish(collection)
+            if collection is not None:
+                lite = LiteCollection.from_models(collection.data)
+            else:
+                with DATA_FILE_PATH.open() as f:
+                    lite = LiteCollection.from_json_data(json.load(f))
+        except Exception as e:
+            logger.error(f"Failed to load lite models: {e}")
+            return LiteCollection(())
+
+        _lite_collection = lite
+        logger.debug(f"Loaded {len(lite)} lite models")
+        return lite
+
+
+@overload
+def get_all_models(lite: Literal[False] = False) -> list[PoeModel]: ...
+@overload
+def get_all_models(lite: Literal[True]) -> list["LiteModel"]: ...
+def get_all_models(lite: bool = False) -> list[PoeModel] | list["LiteModel"]:
     """Get all available Poe models from the dataset.
 
     Retrieves the complete list of models, including those with and without
@@ -125,6 +259,10 @@ def get_all_models() -> list[PoeModel]:
     dataset without any filtering, making it ideal for bulk operations, analytics,
     or when you need to implement custom filtering logic.
 
+    Args:
+        lite: If True, return compact read-only LiteModel views instead
+            (see virginia_clemm_poe.lite); much smaller for bulk scans
+
     Returns:
         list[PoeModel]: Complete list of models with full metadata.
             Each PoeModel includes:
@@ -147,7 +285,7 @@ def get_all_models() -> list[PoeModel]:
     Performance:
         - Time complexity: O(1) after initial load (cached)
         - Memory usage: ~2MB for typical dataset
-        - First call: ~50ms (loads from disk)
+        - First call: ~5ms for ~300 models (loads from disk)
         - Subsequent calls: <1ms (from cache)
 
     Error Scenarios:
@@ -186,11 +324,17 @@ def get_all_models() -> list[PoeModel]:
         - Order matches the original API response
         - Used by CLI list command and other filtering functions
     """
+    if lite:
+        return list(load_lite_models())
     collection = load_models()
     return collection.data
 
 
-def get_model_by_id(model_id: str) -> PoeModel | None:
+@overload
+def get_model_by_id(model_id: str, lite: Literal[False] = False) -> PoeModel | None: ...
+@overload
+def get_model_by_id(model_id: str, lite: Literal[True]) -> "LiteModel | None": ...
+def get_model_by_id(model_id: str, lite: bool = False) -> "PoeModel | LiteModel | None":
     """Get a specific model by its unique identifier with exact matching.
 
     Performs fast, case-sensitive exact match lookup for a model using its ID.
@@ -200,6 +344,7 @@ def get_model_by_id(model_id: str) -> PoeModel | None:
     Args:
         model_id: The exact model ID to search for (case-sensitive).
                  Examples: "Claude-3-Opus", "GPT-4", "claude-3-5-sonnet-20241022"
+        lite: If True, return a compact read-only LiteModel view instead
 
     Returns:
         PoeModel | None: The matching model with full metadata, or None if not found.
@@ -266,11 +411,17 @@ def get_model_by_id(model_id: str) -> PoeModel | None:
             model = results[0] if results else None
         ```
     """
+    if lite:
+        return load_lite_models().get_by_id(model_id)
     collection = load_models()
     return collection.get_by_id(model_id)
 
 
-def search_models(query: str) -> list[PoeModel]:
+@overload
+def search_models(query: str, lite: Literal[False] = False) -> list[PoeModel]: ...
+@overload
+def search_models(query: str, lite: Literal[True]) -> list["LiteModel"]: ...
+def search_models(query: str, lite: bool = False) -> list[PoeModel] | list["LiteModel"]:
     """Search models by ID or name using case-insensitive matching.
 
     Performs a flexible search across model IDs and root names,
@@ -281,6 +432,7 @@ def search_models(query: str) -> list[PoeModel]:
     Args:
         query: Search term to match against model names (case-insensitive).
                Empty or whitespace-only queries return empty list.
+        lite: If True, return compact read-only LiteModel views instead
 
     Returns:
         list[PoeModel]: Matching models sorted by ID, each containing:
@@ -324,17 +476,26 @@ def search_models(query: str) -> list[PoeModel]:
             print("No models found. Try broader search terms.")
         ```
     """
+    if lite:
+        return load_lite_models().search(query)
     collection = load_models()
     return collection.search(query)
 
 
-def get_models_with_pricing() -> list[PoeModel]:
+@overload
+def get_models_with_pricing(lite: Literal[False] = False) -> list[PoeModel]: ...
+@overload
+def get_models_with_pricing(lite: Literal[True]) -> list["LiteModel"]: ...
+def get_models_with_pricing(lite: bool = False) -> list[PoeModel] | list["LiteModel"]:
     """Get all models that have valid pricing information.
 
     Filters the complete model dataset to return only models that have
     successfully scraped pricing data. Essential for cost analysis, budget
     planning, and comparing model economics across different providers.
 
+    Args:
+        lite: If True, return compact read-only LiteModel views instead
+
     Returns:
         list[PoeModel]: Models with valid pricing data, sorted by ID.
             Each model guaranteed to have:
@@ -389,6 +550,8 @@ def get_models_with_pricing() -> list[PoeModel]:
         print(f"Pricing coverage: {coverage:.1f}%")
         ```
     """
+    if lite:
+        return [m for m in load_lite_models() if m.has_pricing()]
     collection = load_models()
     return [m for m in collection.data if m.has_pricing()]
 
@@ -466,6 +629,112 @@ def get_models_needing_update() -> list[PoeModel]:
     return [m for m in collection.data if m.needs_pricing_update()]
 
 
+def _primary_cost_points(model: PoeModel) -> float | None:
+    """Get the numeric points value of a model's primary cost, if parseable."""
+    from .points_ledger import parse_points_cost
+
+    parsed = parse_points_cost(model.get_primary_cost())
+    return parsed[0] if parsed else None
+
+
+def filter_models(criteria: "ModelFilterCriteria | dict[str, Any]") -> list[PoeModel]:
+    """Filter models by structured criteria.
+
+    All given criteria must match. String criteria are case-insensitive:
+    ``id`` must match exactly, ``name`` is a substring of the ID or root name
+    (like search_models), and ``owned_by`` must match exactly. ``min_points``
+    and ``max_points`` compare the numeric part of the primary cost, so models
+    without a parseable cost are excluded when either bound is given.
+
+    Args:
+        criteria: Filter criteria, e.g. ``{"owned_by": "anthropic", "max_points": 100}``.
+            Supported keys: id, name, owned_by, has_pricing, has_bot_info,
+            needs_update, min_points, max_points, created_after, created_before.
+
+    Returns:
+        list[PoeModel]: Matching models in dataset order
+
+    Raises:
+        ModelDataError: If criteria contain unknown fields or wrong types
+
+    Example:
+        ```python
+        cheap_anthropic = filter_models({"owned_by": "anthropic", "max_points": 100})
+        ```
+    """
+    from .type_guards import validate_model_filter_criteria
+
+    checked = validate_model_filter_criteria(criteria)
+    model_id = checked.get("id", "").lower()
+    name = checked.get("name", "").lower()
+    owned_by = checked.get("owned_by", "").lower()
+    owner_matches: dict[str, bool] = {}  # Owners are interned, so this is one lower() per distinct owner
+    min_points = checked.get("min_points")
+    max_points = checked.get("max_points")
+
+    def matches(model: PoeModel) -> bool:
+        if model_id and model.id.lower() != model_id:
+            return False
+        if name and name not in model.id.lower() and name not in model.root.lower():
+            return False
+        if owned_by:
+            owner_match = owner_matches.get(model.owned_by)
+            if owner_match is None:
+                owner_match = owner_matches[model.owned_by] = model.owned_by.lower() == owned_by
+            if not owner_match:
+                return False
+        if "has_pricing" in checked and model.has_pricing() != checked["has_pricing"]:
+            return False
+        if "has_bot_info" in checked and (model.bot_info is not None) != checked["has_bot_info"]:
+            return False
+        if "needs_update" in checked and model.needs_pricing_update() != checked["needs_update"]:
+            return False
+        if "created_after" in checked and model.created <= checked["created_after"]:
+            return False
+        if "created_before" in checked and model.created >= checked["created_before"]:
+            return False
+        if min_points is not None or max_points is not None:
+            points = _primary_cost_points(model)
+            if points is None:
+                return False
+            if min_points is not None and points < min_points:
+                return False
+            if max_points is not None and points > max_points:
+                return False
+        return True
+
+    return [m for m in load_models().data if matches(m)]
+
+
+def to_table(models: "Iterable[PoeModel] | None" = None) -> "pyarrow.Table":
+    """Flatten models into a typed Arrow table for analytics.
+
+    Each row is one model with nested pricing and bot info flattened into
+    columns, plus normalized numeric pricing (``primary_cost_points``,
+    ``input_points_per_1k``, ``output_points_per_1k``, ``message_points``).
+    See virginia_clemm_poe.export for the full column list.
+
+    Args:
+        models: Models to include (defaults to all loaded models), e.g. the
+            result of filter_models() or export.iter_models_from_file()
+
+    Returns:
+        pyarrow.Table; use ``.to_pandas()`` for a DataFrame
+
+    Raises:
+        ImportError: If the optional pyarrow package is not installed
+
+    Examples:
+        ```python
+        df = to_table().to_pandas()
+        df.groupby("owned_by")["primary_cost_points"].median()
+        ```
+    """
+    from .export import to_table as build_table
+
+    return build_table(load_models().data if models is None else models)
+
+
 def reload_models() -> ModelCollection:
     """Force reload models from disk, bypassing cache.
 
@@ -484,7 +753,7 @@ def reload_models() -> ModelCollection:
     Performance:
         - Time complexity: O(n) where n is file size
         - Memory usage: ~2MB for typical dataset
-        - Execution time: ~50ms (disk I/O dependent)
+        - Execution time: ~5ms for ~300 models (disk I/O dependent)
         - Cache impact: Invalidates and replaces global cache
 
     Error Scenarios:
@@ -497,6 +766,7 @@ def reload_models() -> ModelCollection:
 
     See Also:
         - load_models(): Standard cached loading (preferred for performance)
+        - start_auto_reload(): Reload automatically when the data file changes
         - get_all_models(): Uses cached data for speed
         - ModelUpdater.update_all(): Updates and saves model data
 
@@ -512,21 +782,8 @@ def reload_models() -> ModelCollection:
         fresh_collection = reload_models()
         print(f"Loaded {len(fresh_collection.data)} models")
 
-        # Scenario 2: Monitoring for external changes
-        import time
-        from pathlib import Path
-
-        data_file = Path("path/to/poe_models.json")
-        last_modified = data_file.stat().st_mtime
-
-        while True:
-            current_modified = data_file.stat().st_mtime
-            if current_modified > last_modified:
-                print("Data file changed, reloading...")
-                collection = reload_models()
-                print(f"Reloaded {len(collection.data)} models")
-                last_modified = current_modified
-            time.sleep(60)  # Check every minute
+        # Scenario 2: Long-running services should let a watcher do this
+        start_auto_reload()  # Reloads in the background whenever the file changes
 
         # Scenario 3: Testing data integrity
         original = get_all_models()
@@ -540,19 +797,83 @@ def reload_models() -> ModelCollection:
         - Bypasses global cache completely
         - Equivalent to load_models(force_reload=True)
         - All subsequent calls use the new cached data
-        - Thread-safe (uses locking internally)
+        - Thread-safe: one loader runs at a time and readers never block
         - Required after external file modifications
     """
     return load_models(force_reload=True)
 
 
+def _swap_in_fresh_collection() -> None:
+    """Rebuild the collection from disk and publish it (watcher callback).
+
+    The new collection and its indexes are built completely, outside the lock,
+    before the single reference assignment, so readers see either the old or
+    the new data and concurrent load_models() calls are not held up by the
+    parse. A failed parse raises, leaving the current collection in place.
+    """
+    collection = _read_collection()
+    with _load_lock:
+        _publish(collection)
+    logger.info(f"Data file changed, reloaded {len(collection.data)} models")
+
+
+def start_auto_reload(poll_interval: float | None = None, use_native: bool = True) -> "FileWatcher":
+    """Reload the model collection in the background whenever the data file changes.
+
+    Opt-in for long-running processes (servers, notebooks, daemons). A daemon
+    thread watches the data file using OS notifications when the optional
+    ``watchfiles`` package is installed, and mtime/size polling otherwise.
+    It picks up writes from ``ModelUpdater.update_all`` (which replaces the file
+    atomically) or any other writer, rebuilds the collection and its indexes off
+    the calling threads, and swaps it in with one reference assignment. Readers
+    never block and never see a partially loaded collection; if the file cannot
+    be parsed, the current data is kept and the change is retried.
+
+    Args:
+        poll_interval: Seconds between checks when polling (defaults to AUTO_RELOAD_POLL_SECONDS)
+        use_native: Use OS file notifications when available
+
+    Returns:
+        FileWatcher: The running watcher (calling again returns the same one)
+
+    Example:
+        ```python
+        start_auto_reload()
+        # ... later, get_model_by_id() etc. return fresh data after each update
+        stop_auto_reload()
+        ```
+    """
+    global _watcher
+
+    from .utils.file_watch import FileWatcher
+
+    if _watcher is not None and _watcher.is_running:
+        return _watcher
+
+    load_models()
+    kwargs = {} if poll_interval is None else {"poll_interval": poll_interval}
+    _watcher = FileWatcher(DATA_FILE_PATH, _swap_in_fresh_collection, use_native=use_native, **kwargs)
+    _watcher.start()
+    logger.info(f"Auto-reloading models from {DATA_FILE_PATH} ({_watcher.backend})")
+    return _watcher
+
+
+def stop_auto_reload() -> None:
+    """Stop the background watcher started by start_auto_reload()."""
+    global _watcher
+
+    if _watcher is not None:
+        _watcher.stop()
+        _watcher = None
+
+
 async def get_account_balance(
     use_api_key: bool = False,
     api_key: str | None = None,
     use_browser: bool = True,
     use_cache: bool = True,
     force_refresh: bool = False,
-) -> dict:
+) -> dict[str, Any]:
     """Get Poe account balance and compute points information.
 
     Retrieves the current account's compute points balance, subscription status,
@@ -609,8 +930,8 @@ async def get_account_balance(
         use_api_key=use_api_key, api_key=api_key, use_cache=use_cache, force_refresh=force_refresh
     )
 
-    # If we got no data and browser is allowed, try with browser
-    if use_browser and result.get("compute_points_available") is None:
+    # If we got no data and browser is allowed, try with browser unless scraping failed recently
+    if use_browser and result.get("compute_points_available") is None and not session_manager.is_tier_dead("browser"):
         logger.info("API returned no balance data, launching browser for scraping...")
 
         # Import here to avoid circular dependency
@@ -0,0 +1,251 @@
+# this_file: src/virginia_clemm_poe/balance_monitor.py
+
+"""Long-running account balance monitor for Virginia Clemm Poe.
+
+BalanceMonitor polls the Poe account balance through the cheapest working
+cookie-based method (PoeSessionManager remembers which fallback tier last
+worked and skips tiers that recently failed), keeps the latest value in memory
+and notifies subscribers when it changes. The polling interval adapts to
+activity: it tightens while the balance is moving and backs off while it is
+idle or requests are failing, which keeps the request rate low.
+"""
+
+import asyncio
+import contextlib
+import inspect
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from loguru import logger
+
+from .config import (
+    BALANCE_POLL_BACKOFF_MULTIPLIER,
+    BALANCE_POLL_INITIAL_SECONDS,
+    BALANCE_POLL_MAX_SECONDS,
+    BALANCE_POLL_MIN_SECONDS,
+)
+from .exceptions import AuthenticationError
+from .poe_session import PoeSessionManager
+
+BalanceCallback = Callable[[dict[str, Any], dict[str, Any] | None], Awaitable[None] | None]
+
+# Fields whose change counts as a balance change
+_TRACKED_FIELDS = ("compute_points_available", "daily_compute_points_available")
+
+
+def _balance_changed(previous: dict[str, Any] | None, current: dict[str, Any]) -> bool:
+    """Check whether the tracked balance fields differ between two readings."""
+    if previous is None:
+        return True
+    if any(previous.get(field) != current.get(field) for field in _TRACKED_FIELDS):
+        return True
+    return bool(previous.get("subscription", {}).get("isActive")) != bool(
+        current.get("subscription", {}).get("isActive")
+    )
+
+
+class BalanceMonitor:
+    """Polls the account balance on an adaptive interval and publishes changes.
+
+    Example:
+        ```python
+        async with BalanceMonitor(session_manager) as monitor:
+            monitor.subscribe(lambda new, old: print(new["compute_points_available"]))
+            await asyncio.sleep(3600)
+        ```
+    """
+
+    def __init__(
+        self,
+        session_manager: PoeSessionManager | None = None,
+        initial_interval: float = BALANCE_POLL_INITIAL_SECONDS,
+        min_interval: float = BALANCE_POLL_MIN_SECONDS,
+        max_interval: float = BALANCE_POLL_MAX_SECONDS,
+    ):
+        """Initialize the monitor.
+
+        Args:
+            session_manager: Session manager holding the Poe cookies
+            initial_interval: Seconds between the first polls
+            min_interval: Shortest interval, used while the balance is changing
+            max_interval: Longest interval, reached while idle or failing
+        """
+        self.session_manager = session_manager or PoeSessionManager()
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = max(min_interval, min(initial_interval, max_interval))
+        self.latest: dict[str, Any] | None = None
+        self.last_updated: float | None = None
+        self.consecutive_failures = 0
+        self.poll_count = 0
+        self.stopped_by: AuthenticationError | None = None  # Why the background task ended on its own
+        self._subscribers: list[BalanceCallback] = []
+        self._task: asyncio.Task[None] | None = None
+        self._stop_event = asyncio.Event()
+
+    @property
+    def age_seconds(self) -> float | None:
+        """Seconds since the in-memory balance was last refreshed, or None."""
+        if self.last_updated is None:
+            return None
+        return time.monotonic() - self.last_updated
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background polling task is active."""
+        return self._task is not None and not self._task.done()
+
+    def subscribe(self, callback: BalanceCallback) -> Callable[[], None]:
+        """Register a callback for balance changes.
+
+        Callbacks receive ``(current, previous)`` and may be sync or async.
+
+        Args:
+            callback: Function called whenever the balance changes
+
+        Returns:
+            Function that removes the subscription
+        """
+        self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    async def _publish(self, current: dict[str, Any], previous: dict[str, Any] | None) -> None:
+        for callback in list(self._subscribers):
+            try:
+                result = callback(current, previous)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.warning(f"Balance subscriber {callback!r} failed: {e}")
+
+    def _back_off(self) -> None:
+        self.interval = min(self.max_interval, self.interval * BALANCE_POLL_BACKOFF_MULTIPLIER)
+
+    async def poll_once(self) -> dict[str, Any] | None:
+        """Fetch the balance once and update the interval and subscribers.
+
+        Returns:
+            The fresh balance, or None if this poll failed
+
+        Raises:
+            AuthenticationError: If no usable session is available
+        """
+        self.poll_count += 1
+        try:
+            result = await self.session_manager.get_account_balance(use_cache=False, force_refresh=True)
+        except AuthenticationError:
+            raise
+        except Exception as e:
+            result = {"error": str(e)}
+
+        if result.get("compute_points_available") is None:
+            self.consecutive_failures += 1
+            # Failing requests back off twice as fast to stay clear of rate limits
+            self._back_off()
+            self._back_off()
+            error = result.get("error", "no balance data")
+            logger.warning(
+                f"Balance poll failed ({self.consecutive_failures} in a row): {error}; "
+                f"next poll in {self.interval:.0f}s"
+            )
+            return None
+
+        self.consecutive_failures = 0
+        previous = self.latest
+        self.latest = result
+        self.last_updated = time.monotonic()
+
+        if _balance_changed(previous, result):
+            if previous is not None:
+                # Balance is moving: watch closely
+                self.interval = self.min_interval
+            await self._publish(result, previous)
+        else:
+            self._back_off()
+
+        logger.debug(
+            f"Balance poll via '{self.session_manager.last_working_tier}': "
+            f"{result.get('compute_points_available')} points, next poll in {self.interval:.0f}s"
+        )
+        return result
+
+    async def get_balance(self, max_age: float | None = None) -> dict[str, Any] | None:
+        """Get the in-memory balance, polling only if it is missing or stale.
+
+        Args:
+            max_age: Maximum acceptable age in seconds (defaults to the current interval)
+
+        Returns:
+            The latest known balance, or None if none could be fetched
+        """
+        limit = self.interval if max_age is None else max_age
+        age = self.age_seconds
+        if self.latest is None or age is None or age > limit:
+            await self.poll_once()
+        return self.latest
+
+    async def run(self, max_polls: int | None = None) -> None:
+        """Poll until stopped (or until ``max_polls`` polls have run).
+
+        Args:
+            max_polls: Optional limit on the number of polls
+        """
+        self._stop_event.clear()
+        polls = 0
+        while not self._stop_event.is_set():
+            await self.poll_once()
+            polls += 1
+            if max_polls is not None and polls >= max_polls:
+                break
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._stop_event.wait(), timeout=self.interval)
+
+    async def _run_in_background(self) -> None:
+        """Run the polling loop, stopping with a logged error if the session is unusable."""
+        try:
+            await self.run()
+        except AuthenticationError as e:
+            # Polling cannot recover without a new login, so stop instead of retrying
+            self.stopped_by = e
+            logger.error(f"Stopped balance monitor: {e}")
+
+    def start(self) -> asyncio.Task[None]:
+        """Start polling in a background task.
+
+        The task ends on its own if polling raises AuthenticationError; the
+        error is logged and kept in ``stopped_by``.
+
+        Returns:
+            The polling task
+        """
+        if not self.is_running:
+            self.stopped_by = None
+            self._task = asyncio.create_task(self._run_in_background())
+            logger.info(f"Started balance monitor (interval: {self.interval:.0f}s)")
+        assert self._task is not None
+        return self._task
+
+    async def stop(self) -> None:
+        """Stop the background polling task."""
+        self._stop_event.set()
+        if self._task is not None:
+            try:
+                await self._task
+            finally:
+                self._task = None
+            logger.info("Stopped balance monitor")
+
+    async def __aenter__(self) -> "BalanceMonitor":
+        """Start polling when entering the context."""
+        self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Stop polling when leaving the context."""
+        await self.stop()
@@ -6,14 +6,18 @@ session reuse capabilities and Chrome for Testing support for reliable automatio
 """
 
 import contextlib
+from typing import TYPE_CHECKING
 
 from loguru import logger
-from playwright.async_api import Browser as PlaywrightBrowser, Page
-from playwrightauthor import AsyncBrowser
 
 from .config import DEFAULT_DEBUG_PORT
 from .exceptions import BrowserManagerError
 
+if TYPE_CHECKING:
+    # playwrightauthor imports playwright; load both only when a browser is requested
+    from playwright.async_api import Browser as PlaywrightBrowser, Page
+    from playwrightauthor import AsyncBrowser
+
 
 class BrowserManager:
     """Manages browser lifecycle using playwrightauthor with session reuse.
@@ -37,7 +41,7 @@ class BrowserManager:
         self._browser: PlaywrightBrowser | None = None
         self._browser_ctx: AsyncBrowser | None = None
 
-    async def get_browser(self) -> PlaywrightBrowser:
+    async def get_browser(self) -> "PlaywrightBrowser":
         """Gets a browser instance using playwrightauthor.
 
         This method connects to Chrome for Testing, either launching a new instance
@@ -51,6 +55,8 @@ class BrowserManager:
         """
         if self._browser is None or not self._browser.is_connected():
             try:
+                from playwrightauthor import AsyncBrowser
+
                 # Use playwrightauthor AsyncBrowser with session reuse
                 self._browser_ctx = AsyncBrowser(verbose=self.verbose)
                 self._browser = await self._browser_ctx.__aenter__()
@@ -62,7 +68,7 @@ class BrowserManager:
                 raise BrowserManagerError(f"Failed to get browser: {e}") from e
         return self._browser
 
-    async def get_page(self) -> Page:
+    async def get_page(self) -> "Page":
         """Gets a page using playwrightauthor's session reuse feature.
 
         This method leverages the browser's get_page() method which reuses
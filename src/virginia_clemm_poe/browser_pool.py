@@ -13,13 +13,14 @@ import time
 from collections import deque
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager, suppress
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from loguru import logger
-from playwright.async_api import Browser, BrowserContext, Dialog, Page
 
 from .browser_manager import BrowserManager
 from .config import (
+    BROWSER_MEMORY_CAP_MB,
+    BROWSER_MEMORY_CHECK_INTERVAL_SECONDS,
     BROWSER_OPERATION_TIMEOUT_SECONDS,
     DEFAULT_DEBUG_PORT,
     PAGE_ELEMENT_TIMEOUT_MS,
@@ -32,33 +33,166 @@ from .utils.crash_recovery import (
 from .utils.logger import log_performance_metric
 from .utils.memory import (
     MemoryManagedOperation,
+    find_browser_process_ids,
     get_global_memory_monitor,
+    get_process_tree_rss_mb,
 )
+from .utils.metrics import get_metrics_registry
 from .utils.timeout import (
     GracefulTimeout,
     with_timeout,
 )
 
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, Dialog, Page
+
+
+class BrowserMemory:
+    """Last memory measurement of one browser process tree.
+
+    Every connection attached to the same browser shares one record, so the
+    tree is measured and capped once per browser instead of once per connection.
+    """
+
+    def __init__(self, browser_pid: int):
+        """Initialize an unmeasured record.
+
+        Args:
+            browser_pid: Process ID of the browser's main process
+        """
+        self.browser_pid = browser_pid
+        self.memory_by_pid: dict[int, float] = {}
+        self.measured_at: float | None = None
+        self.peak_mb = 0.0
+        # Connections created up to this time are recycled after the cap was exceeded
+        self.recycle_before: float | None = None
+
+    @property
+    def memory_mb(self) -> float | None:
+        """RSS of the process tree at the last measurement, if any."""
+        if self.measured_at is None:
+            return None
+        return sum(self.memory_by_pid.values())
+
+    def check_due(self, interval_seconds: float = BROWSER_MEMORY_CHECK_INTERVAL_SECONDS) -> bool:
+        """Check whether the last measurement is older than the interval."""
+        return self.measured_at is None or time.time() - self.measured_at >= interval_seconds
+
+    async def measure(self, pids: list[int]) -> float:
+        """Measure the RSS of the given processes and record it.
+
+        RSS counts shared pages in every process, so the total is an upper bound.
+
+        Args:
+            pids: The browser process and its renderers and helpers
+
+        Returns:
+            Total RSS in megabytes
+        """
+        self.memory_by_pid = await asyncio.to_thread(get_process_tree_rss_mb, pids)
+        self.measured_at = time.time()
+        memory_mb = sum(self.memory_by_pid.values())
+        self.peak_mb = max(self.peak_mb, memory_mb)
+        return memory_mb
+
 
 class BrowserConnection:
     """Represents a pooled browser connection with usage tracking and session reuse support."""
 
-    def __init__(self, browser: Browser, context: BrowserContext, manager: BrowserManager):
+    def __init__(
+        self, browser: "Browser", context: "BrowserContext", manager: BrowserManager, owns_context: bool = False
+    ):
         """Initialize a browser connection.
 
         Args:
             browser: The browser instance
             context: The browser context
             manager: The browser manager that created this connection
+            owns_context: Whether the context was created for this connection. The
+                browser's default context is shared by every connection to it and
+                is never closed by one of them.
         """
         self.browser = browser
         self.context = context
         self.manager = manager
+        self.owns_context = owns_context
+        self._pages: list[Page] = []  # Pages this connection opened in a shared context
         self.created_at = time.time()
         self.last_used = time.time()
         self.use_count = 0
         self.is_healthy = True
         self.supports_session_reuse = hasattr(browser, "get_page")
+        self.browser_memory: BrowserMemory | None = None
+
+    @property
+    def memory_mb(self) -> float | None:
+        """RSS of the browser process tree at the last measurement, if any."""
+        return self.browser_memory.memory_mb if self.browser_memory else None
+
+    @property
+    def memory_by_pid(self) -> dict[int, float]:
+        """RSS by process ID of the browser process tree at the last measurement."""
+        return self.browser_memory.memory_by_pid if self.browser_memory else {}
+
+    @property
+    def peak_memory_mb(self) -> float:
+        """Highest measured RSS of the browser process tree."""
+        return self.browser_memory.peak_mb if self.browser_memory else 0.0
+
+    async def browser_process_ids(self) -> list[int]:
+        """Get the process IDs of the browser, its renderers and helper processes.
+
+        Asks the browser over CDP and falls back to searching for the process
+        started with this connection's debugging port.
+
+        Returns:
+            Process IDs with the browser's main process first, or an empty list
+        """
+        try:
+            session = await self.browser.new_browser_cdp_session()
+            try:
+                info = await session.send("SystemInfo.getProcessInfo")
+            finally:
+                await session.detach()
+            processes = sorted(info.get("processInfo", []), key=lambda process: process.get("type") != "browser")
+            return [process["id"] for process in processes]
+        except Exception as e:
+            logger.debug(f"CDP process info unavailable for connection {id(self)}: {e}")
+            return await asyncio.to_thread(find_browser_process_ids, self.manager.debug_port)
+
+    async def attach_browser_memory(self, browsers: dict[int, BrowserMemory]) -> tuple[BrowserMemory, list[int]] | None:
+        """Find the memory record of this connection's browser, creating it if needed.
+
+        Args:
+            browsers: Records by browser process ID, shared by all connections of a pool
+
+        Returns:
+            Tuple of (record, current process IDs), or None if no browser process was found
+        """
+        pids = await self.browser_process_ids()
+        if not pids:
+            return None
+        self.browser_memory = browsers.setdefault(pids[0], BrowserMemory(pids[0]))
+        return self.browser_memory, pids
+
+    async def measure_memory(self) -> float | None:
+        """Measure the RSS of this connection's browser process tree.
+
+        Connections attached to the same browser report the same tree.
+
+        Returns:
+            Total RSS in megabytes, or None if no browser process was found
+        """
+        browsers = {self.browser_memory.browser_pid: self.browser_memory} if self.browser_memory else {}
+        attached = await self.attach_browser_memory(browsers)
+        if attached is None:
+            return None
+        memory, pids = attached
+        return await memory.measure(pids)
+
+    def memory_check_due(self, interval_seconds: float = BROWSER_MEMORY_CHECK_INTERVAL_SECONDS) -> bool:
+        """Check whether the browser's last memory measurement is older than the interval."""
+        return self.browser_memory is None or self.browser_memory.check_due(interval_seconds)
 
     def mark_used(self) -> None:
         """Mark this connection as recently used."""
@@ -73,7 +207,7 @@ class BrowserConnection:
         """Get the time since this connection was last used."""
         return time.time() - self.last_used
 
-    async def get_page(self, reuse_session: bool = True) -> Page:
+    async def get_page(self, reuse_session: bool = True) -> "Page":
         """Get a page from this connection, optionally reusing existing sessions.
 
         Args:
@@ -88,7 +222,11 @@ class BrowserConnection:
             return await self.browser.get_page()
         # Create a new page the traditional way
         logger.debug("Creating new page without session reuse")
-        return await self.context.new_page()
+        page = await self.context.new_page()
+        if not self.owns_context:
+            self._pages = [open_page for open_page in self._pages if not open_page.is_closed()]
+            self._pages.append(page)
+        return page
 
     async def health_check(self) -> bool:
         """Check if the connection is still healthy using multi-layer validation with crash detection.
@@ -152,7 +290,12 @@ class BrowserConnection:
             return False
 
     async def close(self) -> None:
-        """Close this connection and clean up resources gracefully."""
+        """Close this connection and clean up resources gracefully.
+
+        An owned context is closed with all its pages. In the shared default
+        context only the pages this connection opened are closed, so other
+        connections to the same browser keep working.
+        """
         try:
             # Mark as unhealthy to prevent reuse
             self.is_healthy = False
@@ -161,11 +304,11 @@ class BrowserConnection:
             if self.context:
                 try:
                     # Get all pages and close them gracefully
-                    pages = self.context.pages
+                    pages = self.context.pages if self.owns_context else self._pages
                     for page in pages:
                         try:
                             # Add dialog handler to suppress errors
-                            async def handle_dialog(dialog: Dialog) -> None:
+                            async def handle_dialog(dialog: "Dialog") -> None:
                                 await dialog.dismiss()
 
                             page.on("dialog", handle_dialog)
@@ -177,7 +320,13 @@ class BrowserConnection:
 
                     # Small delay before context close
                     await asyncio.sleep(0.5)
-                    await self.context.close()
+                    if self.owns_context:
+                        await self.context.close()
+                    else:
+                        for page in pages:
+                            with suppress(Exception):
+                                await page.close()
+                        self._pages = []
                 except Exception as e:
                     logger.debug(f"Error closing context: {e}")
 
@@ -203,6 +352,8 @@ class BrowserPool:
         debug_port: int = DEFAULT_DEBUG_PORT,
         verbose: bool = False,
         reuse_sessions: bool = True,
+        *,
+        max_browser_memory_mb: float = BROWSER_MEMORY_CAP_MB,
     ):
         """Initialize the browser pool.
 
@@ -213,6 +364,9 @@ class BrowserPool:
             debug_port: Port for Chrome DevTools Protocol
             verbose: Enable verbose logging
             reuse_sessions: Enable session reuse for maintaining authentication state
+            max_browser_memory_mb: RSS of a browser process tree above which every
+                connection attached to that browser is recycled instead of returned
+                to the pool
         """
         self.max_size = max_size
         self.max_age_seconds = max_age_seconds
@@ -220,6 +374,7 @@ class BrowserPool:
         self.debug_port = debug_port
         self.verbose = verbose
         self.reuse_sessions = reuse_sessions
+        self.max_browser_memory_mb = max_browser_memory_mb
 
         self._pool: deque[BrowserConnection] = deque()
         self._active_connections: set[BrowserConnection] = set()
@@ -230,6 +385,8 @@ class BrowserPool:
         self._crash_recovery = get_global_crash_recovery()
         self._connections_created = 0
         self._connection_failures = 0
+        self._memory_recycles = 0
+        self._browser_memory: dict[int, BrowserMemory] = {}
 
     async def start(self) -> None:
         """Start the pool and its cleanup task."""
@@ -298,15 +455,62 @@ class BrowserPool:
                 # Check health
                 if not await conn.health_check():
                     to_remove.append(conn)
+                    continue
+
+                if await self._exceeds_memory_cap(conn):
+                    to_remove.append(conn)
 
             # Remove stale connections
             for conn in to_remove:
                 self._pool.remove(conn)
                 asyncio.create_task(conn.close())
 
+            # Forget browsers no connection is attached to any more
+            attached = {
+                conn.browser_memory.browser_pid
+                for conn in (*self._pool, *self._active_connections)
+                if conn.browser_memory is not None
+            }
+            for browser_pid in set(self._browser_memory) - attached:
+                del self._browser_memory[browser_pid]
+
             if to_remove:
                 logger.debug(f"Cleaned up {len(to_remove)} stale connections")
 
+    async def _exceeds_memory_cap(self, connection: BrowserConnection) -> bool:
+        """Check whether a connection belongs to a browser over the memory cap.
+
+        The browser's process tree is measured at most once per check interval,
+        however many connections are attached to it. When it exceeds the cap,
+        every connection created before that measurement is recycled, which
+        closes their pages; replacements are not judged until the next
+        measurement shows whether memory came down.
+
+        Args:
+            connection: Connection to check
+
+        Returns:
+            True if the connection should be recycled
+        """
+        memory = connection.browser_memory
+        if memory is None or memory.check_due():
+            attached = await connection.attach_browser_memory(self._browser_memory)
+            if attached is None:
+                return False
+            memory, pids = attached
+            if memory.check_due():
+                memory_mb = await memory.measure(pids)
+                if memory_mb > self.max_browser_memory_mb:
+                    memory.recycle_before = memory.measured_at
+                    self._memory_recycles += 1
+                    get_metrics_registry().increment("pool.memory_recycle")
+                    logger.warning(
+                        f"Browser {memory.browser_pid} uses {memory_mb:.0f}MB across {len(pids)} processes, "
+                        f"over the {self.max_browser_memory_mb:.0f}MB cap; recycling its connections"
+                    )
+
+        return memory.recycle_before is not None and connection.created_at <= memory.recycle_before
+
     async def _create_connection(self) -> BrowserConnection:
         """Create a new browser connection with memory monitoring and crash recovery.
 
@@ -328,12 +532,14 @@ class BrowserPool:
                 )
                 try:
                     browser = await manager.get_browser()
-                    context = browser.contexts[0] if browser.contexts else await browser.new_context()
+                    # The default context holds the login session and is shared by every connection
+                    owns_context = not browser.contexts
+                    context = await browser.new_context() if owns_context else browser.contexts[0]
 
                     if not context:
                         raise BrowserManagerError("No browser context available")
 
-                    connection = BrowserConnection(browser, context, manager)
+                    connection = BrowserConnection(browser, context, manager, owns_context=owns_context)
 
                     # Log performance metric
                     creation_time = time.time() - start_time
@@ -422,19 +628,24 @@ class BrowserPool:
 
         return connection
 
-    async def _create_page_from_connection(self, connection: BrowserConnection) -> Page:
+    async def _create_page_from_connection(
+        self, connection: BrowserConnection, reuse_session: bool | None = None
+    ) -> "Page":
         """Create a new page from a connection with proper timeouts.
 
         Args:
             connection: Browser connection to use
+            reuse_session: Reuse an existing page (defaults to the pool's setting)
 
         Returns:
             Configured page instance
         """
         connection.mark_used()
+        if reuse_session is None:
+            reuse_session = self.reuse_sessions
 
         # Create page with timeout, using session reuse if enabled
-        page = await with_timeout(connection.get_page(reuse_session=self.reuse_sessions), 15.0, "page_acquisition")
+        page = await with_timeout(connection.get_page(reuse_session=reuse_session), 15.0, "page_acquisition")
 
         # Set timeouts on the page
         page.set_default_timeout(PAGE_ELEMENT_TIMEOUT_MS)
@@ -442,7 +653,7 @@ class BrowserPool:
 
         return page
 
-    async def _close_page_safely(self, page: Page | None) -> None:
+    async def _close_page_safely(self, page: "Page | None") -> None:
         """Safely close a page with timeout and graceful cleanup.
 
         Args:
@@ -451,7 +662,7 @@ class BrowserPool:
         if page:
             try:
                 # Add dialog handler to suppress any dialogs during close
-                async def handle_dialog(dialog: Dialog) -> None:
+                async def handle_dialog(dialog: "Dialog") -> None:
                     await dialog.dismiss()
 
                 page.on("dialog", handle_dialog)
@@ -479,11 +690,21 @@ class BrowserPool:
         if not connection:
             return
 
+        # Measure outside the lock; the CDP round trip must not block other acquisitions
+        over_memory_cap = not self._closed and connection.is_healthy and await self._exceeds_memory_cap(connection)
+
         async with self._lock:
             self._active_connections.discard(connection)
 
-            # Check if connection is still healthy and young enough
-            if not self._closed and connection.is_healthy and connection.age_seconds() < self.max_age_seconds:
+            # Check if connection is still healthy, young enough, within the memory cap and
+            # still fits after a resize
+            if (
+                not self._closed
+                and connection.is_healthy
+                and not over_memory_cap
+                and connection.age_seconds() < self.max_age_seconds
+                and len(self._pool) + len(self._active_connections) < self.max_size
+            ):
                 self._pool.append(connection)
                 logger.debug(f"Returned connection to pool (pool_size={len(self._pool)})")
             else:
@@ -491,7 +712,28 @@ class BrowserPool:
                 asyncio.create_task(connection.close())
                 logger.debug("Closed connection instead of returning to pool")
 
-    async def get_reusable_page(self) -> Page:
+    async def resize(self, max_size: int) -> None:
+        """Change the maximum number of connections while the pool is running.
+
+        Surplus idle connections are closed right away; surplus active ones
+        are closed when they are released.
+
+        Args:
+            max_size: New maximum number of connections
+        """
+        async with self._lock:
+            if max_size == self.max_size:
+                return
+            logger.debug(f"Resizing browser pool {self.max_size} → {max_size}")
+            self.max_size = max_size
+            surplus = []
+            while self._pool and len(self._pool) + len(self._active_connections) > max_size:
+                surplus.append(self._pool.pop())
+
+        for conn in surplus:
+            asyncio.create_task(conn.close())
+
+    async def get_reusable_page(self) -> "Page":
         """Get a page using session reuse for maintaining authentication.
 
         This method is optimized for the pre-authorized sessions workflow where
@@ -551,13 +793,18 @@ class BrowserPool:
             raise BrowserManagerError(f"Failed to get page with session reuse: {e}") from e
 
     @asynccontextmanager
-    async def acquire_page(self) -> AsyncIterator[Page]:
+    async def acquire_page(self, reuse_session: bool | None = None) -> AsyncIterator["Page"]:
         """Acquire a page from the pool with comprehensive timeout handling.
 
         This context manager handles getting a connection from the pool,
         creating a new page, and returning the connection to the pool.
         All operations are protected by timeouts to prevent hanging.
 
+        Args:
+            reuse_session: Reuse an existing page instead of opening one in the
+                browser's logged-in context (defaults to the pool's setting).
+                Concurrent callers need False, since a reused page is shared.
+
         Yields:
             A new page instance
 
@@ -581,6 +828,7 @@ class BrowserPool:
         connection: BrowserConnection | None = None
         page: Page | None = None
         acquired_from_pool = False
+        metrics = get_metrics_registry()
 
         async def cleanup_resources() -> None:
             """Clean up resources on failure."""
@@ -590,7 +838,7 @@ class BrowserPool:
             if page:
                 try:
                     # Add dialog handler
-                    async def handle_dialog(dialog: Dialog) -> None:
+                    async def handle_dialog(dialog: "Dialog") -> None:
                         await dialog.dismiss()
 
                     page.on("dialog", handle_dialog)
@@ -623,11 +871,13 @@ class BrowserPool:
                 cleanup_resources,
             ):
                 # Get or create connection
-                connection, acquired_from_pool = await self._get_connection_from_pool()
-                connection = await self._ensure_connection(connection)
+                with metrics.time("pool.acquire"):
+                    connection, acquired_from_pool = await self._get_connection_from_pool()
+                    connection = await self._ensure_connection(connection)
 
-                # Create page from connection
-                page = await self._create_page_from_connection(connection)
+                    # Create page from connection
+                    page = await self._create_page_from_connection(connection, reuse_session)
+                metrics.increment("pool.connection_reused" if acquired_from_pool else "pool.connection_created")
 
                 # Log performance metric
                 log_performance_metric(
@@ -645,10 +895,13 @@ class BrowserPool:
 
         finally:
             # Clean up page
-            await self._close_page_safely(page)
+            if page is not None:
+                with metrics.time("pool.page_close"):
+                    await self._close_page_safely(page)
 
             # Return connection to pool or close it
-            await self._return_or_close_connection(connection)
+            with metrics.time("pool.release"):
+                await self._return_or_close_connection(connection)
 
     async def get_stats(self) -> dict[str, Any]:
         """Get pool statistics.
@@ -660,6 +913,11 @@ class BrowserPool:
             pool_connections = list(self._pool)
             active_connections = list(self._active_connections)
 
+        # Connections attached to the same browser share processes; count each once
+        browser_memory_by_pid: dict[int, float] = {}
+        for conn in pool_connections + active_connections:
+            browser_memory_by_pid.update(conn.memory_by_pid)
+
         return {
             "pool_size": len(pool_connections),
             "active_connections": len(active_connections),
@@ -669,6 +927,10 @@ class BrowserPool:
             "connections_created": self._connections_created,
             "connection_failures": self._connection_failures,
             "memory_usage_mb": self._memory_monitor.get_memory_usage_mb(),
+            "browser_memory_mb": sum(browser_memory_by_pid.values()),
+            "browser_processes": len(browser_memory_by_pid),
+            "max_browser_memory_mb": self.max_browser_memory_mb,
+            "memory_recycles": self._memory_recycles,
             "crash_recovery_stats": self._crash_recovery.get_crash_stats(),
             "pool_connections": [
                 {
@@ -676,11 +938,19 @@ class BrowserPool:
                     "idle_seconds": conn.idle_seconds(),
                     "use_count": conn.use_count,
                     "is_healthy": conn.is_healthy,
+                    "memory_mb": conn.memory_mb,
+                    "peak_memory_mb": conn.peak_memory_mb,
                 }
                 for conn in pool_connections
             ],
             "active_connection_details": [
-                {"age_seconds": conn.age_seconds(), "use_count": conn.use_count, "is_healthy": conn.is_healthy}
+                {
+                    "age_seconds": conn.age_seconds(),
+                    "use_count": conn.use_count,
+                    "is_healthy": conn.is_healthy,
+                    "memory_mb": conn.memory_mb,
+                    "peak_memory_mb": conn.peak_memory_mb,
+                }
                 for conn in active_connections
             ],
         }
@@ -712,6 +982,17 @@ async def get_global_pool(
     return _global_pool
 
 
+def get_running_pool() -> BrowserPool | None:
+    """Get the global browser pool if one is open, without starting it.
+
+    Returns:
+        The open global pool, or None
+    """
+    if _global_pool is None or _global_pool._closed:
+        return None
+    return _global_pool
+
+
 async def close_global_pool() -> None:
     """Close the global browser pool."""
     global _global_pool
@@ -26,6 +26,14 @@ PAUSE_SECONDS = 2.0
 EXPANSION_WAIT_SECONDS = 0.5  # Wait time after clicking "View more" button
 DIALOG_WAIT_SECONDS = 1.0  # Wait time for modal dialog to appear
 MODAL_CLOSE_WAIT_SECONDS = 0.5  # Wait time after closing modal
+CLOUDFLARE_CHALLENGE_TITLES = ("Just a moment...", "Attention Required! | Cloudflare")  # Challenge page titles
+
+# Scraping concurrency configuration
+SCRAPE_CONCURRENCY_INITIAL = 3  # Concurrent scraping workers at the start of an update
+SCRAPE_CONCURRENCY_MIN = 1  # Workers kept even while throttled
+SCRAPE_CONCURRENCY_MAX = 8  # Upper bound for workers and browser pool connections
+SCRAPE_LATENCY_TARGET_SECONDS = 20.0  # Median per-model scrape time above which concurrency drops
+SCRAPE_TIMEOUT_RATE_LIMIT = 0.2  # Fraction of timed-out models per round above which concurrency drops
 
 # Network configuration
 API_TIMEOUT_SECONDS = 5.0  # Timeout for API health checks
@@ -33,6 +41,12 @@ NETWORK_TIMEOUT_SECONDS = 5.0  # Timeout for network connectivity checks
 HTTP_REQUEST_TIMEOUT_SECONDS = 30.0  # Timeout for HTTP requests
 HTTP_CONNECT_TIMEOUT_SECONDS = 10.0  # Timeout for HTTP connection establishment
 
+# Shared HTTP client configuration
+HTTP2_ENABLED = True  # Negotiate HTTP/2 when the optional h2 package is installed
+HTTP_MAX_CONNECTIONS = 20  # Maximum concurrent connections in the shared pool
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 10  # Idle connections kept open for reuse
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 30.0  # Idle time before a kept-alive connection is dropped
+
 # Browser timeout configuration
 BROWSER_CONNECT_TIMEOUT_SECONDS = 30.0  # Timeout for browser connection
 BROWSER_LAUNCH_TIMEOUT_SECONDS = 60.0  # Timeout for browser launch
@@ -40,7 +54,64 @@ PAGE_NAVIGATION_TIMEOUT_MS = 45_000  # Extended timeout for page navigation
 PAGE_ELEMENT_TIMEOUT_MS = 15_000  # Timeout for finding page elements
 BROWSER_OPERATION_TIMEOUT_SECONDS = 120.0  # Global timeout for browser operations
 
+# Browser memory configuration
+BROWSER_MEMORY_CAP_MB = 1024  # Recycle a pooled connection whose browser process tree exceeds this RSS
+BROWSER_MEMORY_CHECK_INTERVAL_SECONDS = 15.0  # Minimum time between RSS measurements of one connection
+
 # Retry configuration
 MAX_RETRIES = 3  # Maximum number of retries for failed operations
 RETRY_DELAY_SECONDS = 2.0  # Base delay between retries
 EXPONENTIAL_BACKOFF_MULTIPLIER = 2.0  # Multiplier for exponential backoff
+RETRY_MAX_DELAY_SECONDS = 60.0  # Upper bound for a single retry delay
+
+# Circuit breaker configuration
+CIRCUIT_FAILURE_THRESHOLD = 5  # Consecutive failures of one class that open its circuit
+CIRCUIT_WINDOW_SECONDS = 60.0  # Failures older than this do not count towards the threshold
+CIRCUIT_COOLDOWN_SECONDS = 10.0  # Base time an open circuit waits before a half-open probe
+CIRCUIT_MAX_COOLDOWN_SECONDS = 300.0  # Upper bound for the jittered cooldown
+CIRCUIT_MAX_TRIPS = 3  # Failed probes after which callers fail fast instead of waiting
+
+# Rate limiting configuration
+RATE_LIMIT_REQUESTS_PER_SECOND = 1.0  # Sustained requests per second to each Poe host
+RATE_LIMIT_BURST = 4  # Requests a Poe host may receive back-to-back before the rate applies
+RATE_LIMITED_HOSTS = ("poe.com", "api.poe.com")  # Hosts whose requests go through the rate limiter
+
+# Balance monitoring configuration
+BALANCE_TIER_RETRY_SECONDS = 900.0  # How long a failed balance method is skipped before retrying it
+BALANCE_POLL_INITIAL_SECONDS = 60.0  # First polling interval for the balance monitor
+BALANCE_POLL_MIN_SECONDS = 30.0  # Fastest polling interval (while the balance is changing)
+BALANCE_POLL_MAX_SECONDS = 900.0  # Slowest polling interval (idle or repeated failures)
+BALANCE_POLL_BACKOFF_MULTIPLIER = 1.5  # Interval growth per unchanged poll
+
+# Points ledger configuration
+LEDGER_FILE_NAME = "points_ledger.json"  # Stored in the platform data directory
+LEDGER_RECONCILE_INTERVAL_SECONDS = 3600.0  # Refresh the authoritative balance at least hourly
+LEDGER_LOW_BALANCE_POINTS = 1000.0  # Reconcile early once the estimate drops below this
+LEDGER_SAVE_EVERY_RECORDS = 20  # Write-behind: persist after this many recorded charges
+
+# Query server configuration
+SERVER_HOST = "127.0.0.1"  # Bind to loopback only; the server has no authentication
+SERVER_PORT = 8765  # Default port for `virginia-clemm-poe serve`
+SERVER_STATE_FILE_NAME = "server.json"  # Running-server address, stored in the platform cache directory
+SERVER_CLIENT_TIMEOUT_SECONDS = 2.0  # CLI falls back to local data if the server is slower than this
+
+# Data file auto-reload configuration
+AUTO_RELOAD_POLL_SECONDS = 1.0  # Polling interval when OS file notifications are unavailable
+
+# Columnar export configuration
+EXPORT_BATCH_ROWS = 10_000  # Rows per Arrow record batch / Parquet row group when streaming exports
+
+# Pricing history configuration
+HISTORY_DB_FILE_NAME = "pricing_history.sqlite3"  # Append-only change log, stored in the platform data directory
+
+# Run metrics configuration
+METRICS_MAX_SAMPLES = 10_000  # Samples kept per latency histogram for percentile estimates
+METRICS_FILE_NAME = "update_metrics.json"  # Last update's per-phase timing report, in the platform cache directory
+
+# Trace configuration
+TRACE_BUFFER_EVENTS = 200_000  # Spans kept by the trace recorder; the oldest are dropped beyond this
+
+# OpenMetrics exporter configuration
+METRICS_EXPORTER_HOST = "127.0.0.1"  # Bind to loopback only; put a reverse proxy in front for remote scraping
+METRICS_EXPORTER_PORT = 9464  # Default MetricsExporter port (`update --metrics_port`)
+METRICS_TEXTFILE_INTERVAL_SECONDS = 15.0  # Refresh interval for node_exporter textfile output
@@ -108,3 +108,23 @@ class NetworkError(VirginiaPoeError):
     This includes connection timeouts, DNS failures, or other
     network connectivity issues.
     """
+
+
+class CircuitOpenError(VirginiaPoeError):
+    """Exception raised when a circuit breaker rejects an operation.
+
+    The failure class named in the error has failed persistently, so calls
+    fail fast instead of retrying until the circuit's cooldown ends.
+    """
+
+    def __init__(self, message: str, failure_class: str, retry_after: float):
+        """Initialize the error.
+
+        Args:
+            message: Error message
+            failure_class: Failure class whose circuit is open
+            retry_after: Seconds until the circuit admits a probe
+        """
+        super().__init__(message)
+        self.failure_class = failure_class
+        self.retry_after = retry_after
@@ -0,0 +1,329 @@
+# this_file: src/virginia_clemm_poe/export.py
+
+"""Columnar export of the model dataset for analytics.
+
+Models are flattened into one typed row per model: top-level fields,
+modalities, every PricingDetails field as a ``pricing_*`` column, the bot
+info and normalized numeric pricing (points per 1k tokens, per message and
+for the primary cost). Rows are produced as plain tuples in ``COLUMNS`` order
+and written as they stream, in batches for Arrow and Parquet, so exporting a
+large historical snapshot never holds more than one batch in memory.
+
+CSV and NDJSON need only the standard library; Arrow and Parquet need the
+optional ``pyarrow`` package (``pip install virginia-clemm-poe[export]``).
+
+Example:
+    ```python
+    from virginia_clemm_poe import api
+
+    table = api.to_table()
+    df = table.to_pandas()
+    ```
+"""
+
+import csv
+import json
+import sys
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
+
+from loguru import logger
+
+from .config import EXPORT_BATCH_ROWS
+from .models import PoeModel, PricingDetails
+from .points_ledger import estimate_request_points, parse_points_cost, points_per_1k_tokens
+from .utils.json_stream import JsonArrayStream
+
+if TYPE_CHECKING:
+    import pyarrow
+
+EXPORT_FORMATS = ("csv", "ndjson", "arrow", "parquet")
+
+# Default file extension per format
+EXPORT_EXTENSIONS = {"csv": ".csv", "ndjson": ".ndjson", "arrow": ".arrow", "parquet": ".parquet"}
+
+_PRICING_FIELDS = tuple(PricingDetails.model_fields)
+
+# (column name, type) in row order; types name the Arrow type of each column
+COLUMNS: tuple[tuple[str, str], ...] = (
+    ("id", "string"),
+    ("created", "int64"),
+    ("owned_by", "string"),
+    ("root", "string"),
+    ("parent", "string"),
+    ("input_modalities", "list<string>"),
+    ("output_modalities", "list<string>"),
+    ("modality", "string"),
+    ("has_pricing", "bool"),
+    ("pricing_checked_at", "timestamp"),
+    ("primary_cost", "string"),
+    ("primary_cost_points", "float64"),
+    ("primary_cost_unit", "string"),
+    ("input_points_per_1k", "float64"),
+    ("output_points_per_1k", "float64"),
+    ("message_points", "float64"),
+    *((f"pricing_{name}", "string") for name in _PRICING_FIELDS),
+    ("pricing_extra", "string"),  # JSON object of pricing labels without a dedicated field
+    ("pricing_error", "string"),
+    ("bot_creator", "string"),
+    ("bot_description", "string"),
+    ("bot_description_extra", "string"),
+)
+
+COLUMN_NAMES = tuple(name for name, _ in COLUMNS)
+
+
+def model_row(model: PoeModel) -> tuple[Any, ...]:
+    """Flatten one model into a row in ``COLUMNS`` order.
+
+    Args:
+        model: Model to flatten
+
+    Returns:
+        Tuple of column values (None for missing values)
+    """
+    architecture = model.architecture
+    pricing = model.pricing
+    bot_info = model.bot_info
+
+    if pricing is not None:
+        details = pricing.details
+        primary_cost = model.get_primary_cost()
+        primary = parse_points_cost(primary_cost)
+        input_per_1k, output_per_1k = points_per_1k_tokens(details)
+        pricing_values = tuple(getattr(details, name) for name in _PRICING_FIELDS)
+        extra = details.model_extra
+        pricing_extra = json.dumps(extra, ensure_ascii=False) if extra else None
+        message_points = estimate_request_points(details)
+    else:
+        primary_cost = primary = input_per_1k = output_per_1k = pricing_extra = message_points = None
+        pricing_values = (None,) * len(_PRICING_FIELDS)
+
+    return (
+        model.id,
+        model.created,
+        model.owned_by,
+        model.root,
+        model.parent,
+        architecture.input_modalities,
+        architecture.output_modalities,
+        architecture.modality,
+        model.has_pricing(),
+        pricing.checked_at if pricing is not None else None,
+        primary_cost,
+        primary[0] if primary else None,
+        primary[1] if primary else None,
+        input_per_1k,
+        output_per_1k,
+        message_points,
+        *pricing_values,
+        pricing_extra,
+        model.pricing_error,
+        bot_info.creator if bot_info else None,
+        bot_info.description if bot_info else None,
+        bot_info.description_extra if bot_info else None,
+    )
+
+
+def iter_rows(models: Iterable[PoeModel]) -> Iterator[tuple[Any, ...]]:
+    """Lazily flatten models into rows.
+
+    Args:
+        models: Models to flatten (any iterable, consumed once)
+
+    Yields:
+        One row tuple per model, in ``COLUMNS`` order
+    """
+    for model in models:
+        yield model_row(model)
+
+
+def iter_models_from_file(path: Path) -> Iterator[PoeModel]:
+    """Stream models from a data file or saved snapshot without loading it whole.
+
+    Args:
+        path: File in the poe_models.json format
+
+    Yields:
+        Validated PoeModel instances, one raw record in memory at a time
+    """
+    for record in JsonArrayStream.from_path(path, "data"):
+        yield PoeModel.model_validate(record)
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize non-JSON row values (timestamps) for NDJSON output."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _text_value(value: Any) -> Any:
+    """Convert a row value for CSV output."""
+    if isinstance(value, list):
+        return ",".join(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def write_csv(rows: Iterable[tuple[Any, ...]], stream: IO[str]) -> int:
+    """Write rows as CSV with a header line.
+
+    Modality lists are joined with commas; missing values are empty cells.
+
+    Args:
+        rows: Row tuples in ``COLUMNS`` order
+        stream: Text stream to write to
+
+    Returns:
+        Number of rows written
+    """
+    writer = csv.writer(stream)
+    writer.writerow(COLUMN_NAMES)
+    count = 0
+    for row in rows:
+        writer.writerow([_text_value(value) for value in row])
+        count += 1
+    return count
+
+
+def write_ndjson(rows: Iterable[tuple[Any, ...]], stream: IO[str]) -> int:
+    """Write rows as newline-delimited JSON objects.
+
+    Args:
+        rows: Row tuples in ``COLUMNS`` order
+        stream: Text stream to write to
+
+    Returns:
+        Number of rows written
+    """
+    count = 0
+    for row in rows:
+        stream.write(json.dumps(dict(zip(COLUMN_NAMES, row, strict=True)), default=_json_default, ensure_ascii=False))
+        stream.write("\n")
+        count += 1
+    return count
+
+
+def _require_pyarrow() -> Any:
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("Arrow and Parquet export need pyarrow: pip install 'virginia-clemm-poe[export]'") from None
+    return pyarrow
+
+
+def arrow_schema() -> "pyarrow.Schema":
+    """Build the Arrow schema for exported rows.
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    pa = _require_pyarrow()
+    types = {
+        "string": pa.string(),
+        "int64": pa.int64(),
+        "float64": pa.float64(),
+        "bool": pa.bool_(),
+        "timestamp": pa.timestamp("us"),
+        "list<string>": pa.list_(pa.string()),
+    }
+    return pa.schema([(name, types[kind]) for name, kind in COLUMNS])
+
+
+def iter_record_batches(
+    rows: Iterable[tuple[Any, ...]], batch_rows: int = EXPORT_BATCH_ROWS
+) -> Iterator["pyarrow.RecordBatch"]:
+    """Group rows into Arrow record batches.
+
+    Args:
+        rows: Row tuples in ``COLUMNS`` order
+        batch_rows: Maximum rows per batch
+
+    Yields:
+        RecordBatch instances following ``arrow_schema()``
+    """
+    pa = _require_pyarrow()
+    schema = arrow_schema()
+    iterator = iter(rows)
+    while batch := list(islice(iterator, batch_rows)):
+        columns = zip(*batch, strict=True)
+        arrays = [pa.array(values, type=field.type) for values, field in zip(columns, schema, strict=True)]
+        yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def to_table(models: Iterable[PoeModel], batch_rows: int = EXPORT_BATCH_ROWS) -> "pyarrow.Table":
+    """Flatten models into an Arrow table.
+
+    Args:
+        models: Models to include
+        batch_rows: Rows per record batch
+
+    Returns:
+        pyarrow.Table with one row per model (``table.to_pandas()`` for a DataFrame)
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    pa = _require_pyarrow()
+    return pa.Table.from_batches(iter_record_batches(iter_rows(models), batch_rows), schema=arrow_schema())
+
+
+def export_models(
+    models: Iterable[PoeModel],
+    output: Path | None,
+    format: str,
+    batch_rows: int = EXPORT_BATCH_ROWS,
+) -> int:
+    """Stream models to a file in a columnar or line-oriented format.
+
+    Args:
+        models: Models to export (consumed lazily)
+        output: Destination file; None writes CSV/NDJSON to stdout
+        format: One of ``EXPORT_FORMATS``
+        batch_rows: Rows per Arrow record batch / Parquet row group
+
+    Returns:
+        Number of rows written
+
+    Raises:
+        ValueError: If the format is unknown, or binary output has no file
+        ImportError: If an Arrow-based format is requested without pyarrow
+    """
+    if format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format {format!r}; choose one of {', '.join(EXPORT_FORMATS)}")
+
+    rows = iter_rows(models)
+
+    if format in ("csv", "ndjson"):
+        write = write_csv if format == "csv" else write_ndjson
+        if output is None:
+            return write(rows, sys.stdout)
+        with output.open("w", newline="" if format == "csv" else None, encoding="utf-8") as f:
+            return write(rows, f)
+
+    if output is None:
+        raise ValueError(f"{format} export needs an output file")
+
+    pa = _require_pyarrow()
+    schema = arrow_schema()
+    count = 0
+    if format == "parquet":
+        import pyarrow.parquet as pq
+
+        with pq.ParquetWriter(output, schema) as writer:
+            for batch in iter_record_batches(rows, batch_rows):
+                writer.write_batch(batch)
+                count += batch.num_rows
+    else:
+        with pa.OSFile(str(output), "wb") as sink, pa.ipc.new_file(sink, schema) as writer:
+            for batch in iter_record_batches(rows, batch_rows):
+                writer.write_batch(batch)
+                count += batch.num_rows
+
+    logger.debug(f"Wrote {count} rows to {output} ({format})")
+    return count
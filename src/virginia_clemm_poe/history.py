@@ -0,0 +1,417 @@
+# this_file: src/virginia_clemm_poe/history.py
+
+"""Append-only pricing and bot info history for Virginia Clemm Poe.
+
+``update`` overwrites poe_models.json, so earlier prices are lost. The history
+store keeps them in a small SQLite database under the platform data directory.
+Each update records one run, plus one row for every tracked field whose value
+changed since the previous run. Tracked fields are the pricing details, the
+pricing error and the bot info. Unchanged values are never stored again, so
+thousands of runs stay small.
+
+Point-in-time and "changes since" queries go through indexes on
+(model, field, run) and on the run time, and never rebuild a full snapshot.
+
+Example:
+    ```python
+    history = get_pricing_history()
+    history.value_at("Claude-3-Opus", "pricing.input_text", datetime(2025, 6, 1))
+    history.changes_since(datetime(2025, 8, 1))
+    ```
+"""
+
+import json
+import sqlite3
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import closing, contextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from .config import HISTORY_DB_FILE_NAME
+from .models import PoeModel
+from .types import ChangeSet, FieldChange, HistoryChange
+from .utils.paths import get_data_dir
+
+_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    recorded_at TEXT NOT NULL,
+    model_count INTEGER NOT NULL,
+    change_count INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_recorded_at ON runs (recorded_at);
+
+CREATE TABLE IF NOT EXISTS changes (
+    model_id TEXT NOT NULL,
+    field TEXT NOT NULL,
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    previous TEXT,
+    value TEXT,
+    PRIMARY KEY (model_id, field, run_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS changes_run ON changes (run_id);
+
+-- Latest non-null value per tracked field, so a run is diffed without replaying history
+CREATE TABLE IF NOT EXISTS current (
+    model_id TEXT NOT NULL,
+    field TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (model_id, field)
+) WITHOUT ROWID;
+"""
+
+# One row of the changes table: (model_id, field, run_id, previous, value)
+_ChangeRow = tuple[str, str, int, str | None, str | None]
+
+_BOT_INFO_FIELDS = ("creator", "description", "description_extra")
+
+
+def tracked_fields(model: PoeModel) -> dict[str, str]:
+    """Get the history-tracked field values of a model.
+
+    Pricing details are keyed ``pricing.<field>`` (extra website labels keep
+    their label), bot info ``bot_info.<field>``. The scrape timestamp is not
+    tracked since it changes on every run.
+
+    Args:
+        model: Model to read
+
+    Returns:
+        Mapping of field name to value, without missing values
+    """
+    fields: dict[str, str] = {}
+    if model.pricing is not None:
+        for name, value in model.pricing.details.model_dump(exclude_none=True).items():
+            fields[f"pricing.{name}"] = str(value)
+    if model.pricing_error:
+        fields["pricing_error"] = model.pricing_error
+    if model.bot_info is not None:
+        for name in _BOT_INFO_FIELDS:
+            value = getattr(model.bot_info, name)
+            if value:
+                fields[f"bot_info.{name}"] = value
+    return fields
+
+
+def field_changes(old: Mapping[str, str], new: Mapping[str, str]) -> dict[str, FieldChange]:
+    """Compare two tracked-field mappings of the same model.
+
+    Args:
+        old: Fields before
+        new: Fields after
+
+    Returns:
+        Changed fields in name order, with their old and new values
+    """
+    return {
+        field: FieldChange(old=old.get(field), new=new.get(field))
+        for field in sorted(old.keys() | new.keys())
+        if old.get(field) != new.get(field)
+    }
+
+
+def compute_change_set(
+    previous: Mapping[str, Mapping[str, str]], models: Iterable[PoeModel], generated_at: datetime | None = None
+) -> ChangeSet:
+    """Diff the tracked fields of the previous data against the new models.
+
+    One pass over ``models`` with dict lookups, so the cost is O(n) in the
+    number of models.
+
+    Args:
+        previous: Tracked fields per model ID before the update
+            (``{model.id: tracked_fields(model)}``)
+        models: Models after the update
+        generated_at: Time to stamp on the change set (defaults to now)
+
+    Returns:
+        ChangeSet with added, removed and changed models
+    """
+    remaining = dict(previous)
+    added: list[str] = []
+    added_ids: set[str] = set()
+    changed: dict[str, dict[str, FieldChange]] = {}
+
+    for model in models:
+        old = remaining.pop(model.id, None)
+        if old is None:
+            if model.id not in previous and model.id not in added_ids:
+                added_ids.add(model.id)
+                added.append(model.id)
+            continue
+        diff = field_changes(old, tracked_fields(model))
+        if diff:
+            changed[model.id] = diff
+
+    removed = sorted(remaining)
+    return ChangeSet(
+        generated_at=_timestamp(generated_at or datetime.now(UTC)),
+        added=added,
+        removed=removed,
+        changed=changed,
+        affected=sorted({*added, *removed, *changed}),
+    )
+
+
+def write_change_set(change_set: ChangeSet, path: Path) -> None:
+    """Write a change set as JSON, atomically.
+
+    Args:
+        change_set: Change set to write
+        path: Destination file
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with tmp_path.open("w") as f:
+        json.dump(change_set, f, indent=2, ensure_ascii=False)
+    tmp_path.replace(path)
+
+
+def _timestamp(moment: datetime) -> str:
+    """Format a datetime as fixed-width UTC text that sorts chronologically.
+
+    Naive datetimes are taken to be UTC.
+    """
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    return moment.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+class PricingHistory:
+    """SQLite-backed change log of model pricing and bot info.
+
+    Example:
+        ```python
+        history = PricingHistory()
+        history.record_snapshot(collection.data)
+        history.fields_at("GPT-4o", datetime(2025, 7, 1))
+        ```
+    """
+
+    def __init__(self, path: Path | None = None):
+        """Initialize the store, creating the database if needed.
+
+        Args:
+            path: Database file (defaults to <data dir>/pricing_history.sqlite3)
+        """
+        self.path = path or get_data_dir() / HISTORY_DB_FILE_NAME
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection and commit (or roll back) when the block exits."""
+        with closing(sqlite3.connect(self.path)) as conn, conn:
+            yield conn
+
+    def record_snapshot(self, models: Iterable[PoeModel], recorded_at: datetime | None = None) -> int:
+        """Record one run, storing only fields that changed since the previous run.
+
+        Fields that disappear (a model lost its pricing or was removed) are
+        recorded as changes to None.
+
+        Args:
+            models: Every model in the dataset at this point in time
+            recorded_at: Time of the snapshot (defaults to now); must not be
+                earlier than the latest recorded run
+
+        Returns:
+            Number of field changes recorded
+
+        Raises:
+            ValueError: If ``recorded_at`` is earlier than the latest run
+        """
+        stamp = _timestamp(recorded_at or datetime.now(UTC))
+
+        with self._connect() as conn:
+            latest = conn.execute("SELECT MAX(recorded_at) FROM runs").fetchone()[0]
+            if latest is not None and stamp < latest:
+                raise ValueError(f"Snapshot time {stamp} is earlier than the latest recorded run ({latest})")
+
+            current: dict[tuple[str, str], str | None] = {
+                (model_id, field): value for model_id, field, value in conn.execute("SELECT * FROM current")
+            }
+            run_id = conn.execute(
+                "INSERT INTO runs (recorded_at, model_count, change_count) VALUES (?, 0, 0)", (stamp,)
+            ).lastrowid
+            assert run_id is not None  # Always set after an INSERT
+
+            changes: list[_ChangeRow] = []
+            seen_ids: set[str] = set()
+            for model in models:
+                if model.id in seen_ids:
+                    continue  # First occurrence wins, as in ModelCollection.get_by_id
+                seen_ids.add(model.id)
+                for field, value in tracked_fields(model).items():
+                    previous = current.pop((model.id, field), None)
+                    if previous != value:
+                        changes.append((model.id, field, run_id, previous, value))
+            # Whatever is left in current was not seen in this snapshot
+            changes.extend((model_id, field, run_id, previous, None) for (model_id, field), previous in current.items())
+
+            conn.executemany("INSERT INTO changes VALUES (?, ?, ?, ?, ?)", changes)
+            conn.executemany(
+                "INSERT OR REPLACE INTO current VALUES (?, ?, ?)",
+                [(model_id, field, value) for model_id, field, _, _, value in changes if value is not None],
+            )
+            conn.executemany(
+                "DELETE FROM current WHERE model_id = ? AND field = ?",
+                [(model_id, field) for model_id, field, _, _, value in changes if value is None],
+            )
+            conn.execute(
+                "UPDATE runs SET model_count = ?, change_count = ? WHERE id = ?", (len(seen_ids), len(changes), run_id)
+            )
+
+        logger.debug(f"Recorded history run {run_id}: {len(seen_ids)} models, {len(changes)} changes")
+        return len(changes)
+
+    @staticmethod
+    def _run_at(conn: sqlite3.Connection, at: datetime) -> int | None:
+        """Get the id of the latest run recorded at or before ``at``."""
+        row = conn.execute(
+            "SELECT id FROM runs WHERE recorded_at <= ? ORDER BY recorded_at DESC, id DESC LIMIT 1", (_timestamp(at),)
+        ).fetchone()
+        return row[0] if row else None
+
+    def value_at(self, model_id: str, field: str, at: datetime) -> str | None:
+        """Get the value a tracked field had at a point in time.
+
+        Args:
+            model_id: Model ID
+            field: Tracked field, e.g. "pricing.input_text" or "bot_info.creator"
+            at: Point in time (naive datetimes are UTC)
+
+        Returns:
+            The value, or None if the field had no value then (or no run precedes ``at``)
+        """
+        with self._connect() as conn:
+            run_id = self._run_at(conn, at)
+            if run_id is None:
+                return None
+            row = conn.execute(
+                "SELECT value FROM changes WHERE model_id = ? AND field = ? AND run_id <= ? "
+                "ORDER BY run_id DESC LIMIT 1",
+                (model_id, field, run_id),
+            ).fetchone()
+        return row[0] if row else None
+
+    def fields_at(self, model_id: str, at: datetime) -> dict[str, str]:
+        """Get all tracked fields of a model at a point in time.
+
+        Args:
+            model_id: Model ID
+            at: Point in time (naive datetimes are UTC)
+
+        Returns:
+            Mapping of field name to value (empty if the model was unknown then)
+        """
+        with self._connect() as conn:
+            run_id = self._run_at(conn, at)
+            if run_id is None:
+                return {}
+            # SQLite returns the bare value column from the row holding MAX(run_id)
+            rows = conn.execute(
+                "SELECT field, value, MAX(run_id) FROM changes WHERE model_id = ? AND run_id <= ? GROUP BY field",
+                (model_id, run_id),
+            ).fetchall()
+        return {field: value for field, value, _ in rows if value is not None}
+
+    def changes_since(
+        self,
+        since: datetime | None = None,
+        model_id: str | None = None,
+        field: str | None = None,
+        limit: int | None = None,
+    ) -> list[HistoryChange]:
+        """List recorded changes, oldest first.
+
+        Args:
+            since: Only changes recorded at or after this time
+            model_id: Only changes of this model
+            field: Only changes of this field, or of all fields under a prefix
+                ending in "." (e.g. "pricing.")
+            limit: Maximum number of changes to return
+
+        Returns:
+            List of HistoryChange records
+        """
+        conditions: list[str] = []
+        params: list[Any] = []
+        if since is not None:
+            # Runs are recorded in time order, so this is a range scan on changes_run
+            conditions.append("changes.run_id >= (SELECT MIN(id) FROM runs WHERE recorded_at >= ?)")
+            params.append(_timestamp(since))
+        if model_id is not None:
+            conditions.append("changes.model_id = ?")
+            params.append(model_id)
+        if field is not None:
+            if field.endswith("."):
+                conditions.append("changes.field >= ? AND changes.field < ?")
+                params.extend((field, field[:-1] + "/"))  # "/" sorts right after "."
+            else:
+                conditions.append("changes.field = ?")
+                params.append(field)
+
+        query = (
+            "SELECT runs.recorded_at, changes.model_id, changes.field, changes.previous, changes.value "
+            "FROM changes JOIN runs ON runs.id = changes.run_id"
+        )
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY changes.run_id, changes.model_id, changes.field"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [
+            HistoryChange(recorded_at=recorded_at, model_id=model, field=name, previous=previous, value=value)
+            for recorded_at, model, name, previous, value in rows
+        ]
+
+    def runs(self, limit: int | None = None) -> list[dict[str, Any]]:
+        """List recorded runs, newest first.
+
+        Args:
+            limit: Maximum number of runs to return
+
+        Returns:
+            Dicts with id, recorded_at, model_count and change_count
+        """
+        query = "SELECT id, recorded_at, model_count, change_count FROM runs ORDER BY id DESC"
+        params: tuple[Any, ...] = ()
+        if limit is not None:
+            query += " LIMIT ?"
+            params = (limit,)
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [
+            {"id": run_id, "recorded_at": recorded_at, "model_count": models, "change_count": changes}
+            for run_id, recorded_at, models, changes in rows
+        ]
+
+
+_pricing_history: PricingHistory | None = None
+
+
+def get_pricing_history() -> PricingHistory:
+    """Get or create the global pricing history store.
+
+    Returns:
+        The global PricingHistory instance
+    """
+    global _pricing_history
+
+    if _pricing_history is None:
+        _pricing_history = PricingHistory()
+        logger.debug(f"Initialized pricing history at {_pricing_history.path}")
+
+    return _pricing_history
@@ -0,0 +1,263 @@
+# this_file: src/virginia_clemm_poe/lite.py
+
+"""Compact read-only model view for bulk queries.
+
+A PoeModel is a Pydantic object with nested Architecture, Pricing,
+PricingDetails (plus its extra-fields dict) and BotInfo instances. Most bulk
+callers only read a handful of fields. LiteModel keeps those fields in one
+slotted, immutable object, built straight from the JSON data without Pydantic
+validation. Repeated strings (owners, modalities, creators) are interned and
+modality tuples are shared between models.
+
+Use it through the API with ``lite=True``:
+
+```python
+for model in api.get_all_models(lite=True):
+    print(model.id, model.owned_by, model.get_primary_cost())
+```
+"""
+
+import sys
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from .models import PoeModel, PricingDetails
+
+# Pricing fields in the order PoeModel.get_primary_cost() prefers them
+_PRIMARY_COST_FIELDS = (
+    "input_text",
+    "total_cost",
+    "per_message",
+    "image_output",
+    "video_output",
+    "text_input",
+    "finetuning",
+)
+
+# (field name, website alias) pairs; the data file may use either spelling
+_PRICING_KEYS = tuple((name, field.alias or name) for name, field in PricingDetails.model_fields.items())
+_KNOWN_PRICING_KEYS = frozenset(key for pair in _PRICING_KEYS for key in pair)
+
+
+def _detail(details: dict[str, Any], name: str) -> Any:
+    value = details.get(name)
+    if value is None:
+        alias = PricingDetails.model_fields[name].alias
+        if alias:
+            value = details.get(alias)
+    return value
+
+
+def primary_cost_from_details(details: dict[str, Any]) -> str | None:
+    """Pick the primary cost from raw pricing details, like PoeModel.get_primary_cost().
+
+    Args:
+        details: ``pricing.details`` mapping from the data file
+
+    Returns:
+        Primary cost string, or None if no pricing field has a value
+    """
+    for name in _PRIMARY_COST_FIELDS:
+        value = _detail(details, name)
+        if value:
+            return str(value)
+    for name, _alias in _PRICING_KEYS:
+        value = _detail(details, name)
+        if value and isinstance(value, str):
+            return value
+    for key, value in details.items():
+        if key not in _KNOWN_PRICING_KEYS and value and isinstance(value, str):
+            return value
+    return None
+
+
+def _timestamp(value: datetime | str | None) -> str | None:
+    """Format a timestamp the same way whether it comes from JSON or a PoeModel."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value).isoformat()
+        except ValueError:
+            return value
+    return value.isoformat()
+
+
+class _Interner:
+    """Deduplicates strings and modality tuples while building a collection."""
+
+    __slots__ = ("_tuples",)
+
+    def __init__(self) -> None:
+        self._tuples: dict[tuple[str, ...], tuple[str, ...]] = {}
+
+    def text(self, value: str) -> str:
+        return sys.intern(value)
+
+    def optional(self, value: str | None) -> str | None:
+        return sys.intern(value) if value is not None else None
+
+    def modalities(self, values: list[str] | tuple[str, ...]) -> tuple[str, ...]:
+        key = tuple(sys.intern(value) for value in values)
+        return self._tuples.setdefault(key, key)
+
+
+@dataclass(frozen=True, slots=True)
+class LiteModel:
+    """Read-only, slotted summary of a Poe model.
+
+    Mirrors the PoeModel fields bulk queries use most; pricing is reduced to
+    the primary cost string and bot info to the creator. Use
+    ``api.get_model_by_id(model.id)`` for the full record.
+    """
+
+    id: str
+    created: int
+    owned_by: str
+    root: str
+    parent: str | None
+    input_modalities: tuple[str, ...]
+    output_modalities: tuple[str, ...]
+    modality: str
+    primary_cost: str | None
+    initial_points_cost: str | None
+    pricing_checked_at: str | None
+    pricing_error: str | None
+    creator: str | None
+
+    def has_pricing(self) -> bool:
+        """Check if the model has pricing information (see PoeModel.has_pricing)."""
+        return self.pricing_checked_at is not None
+
+    def needs_pricing_update(self) -> bool:
+        """Check if pricing is missing or failed (see PoeModel.needs_pricing_update)."""
+        return self.pricing_checked_at is None or self.pricing_error is not None
+
+    def get_primary_cost(self) -> str | None:
+        """Get the primary cost string (see PoeModel.get_primary_cost)."""
+        return self.primary_cost
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], interner: _Interner | None = None) -> "LiteModel":
+        """Build a LiteModel from one raw model record of the data file.
+
+        Args:
+            data: Model record as stored in poe_models.json
+            interner: Shared interner for string/tuple deduplication
+
+        Returns:
+            A new LiteModel
+        """
+        interner = interner or _Interner()
+        architecture = data.get("architecture") or {}
+        pricing = data.get("pricing")
+        details = pricing.get("details", {}) if pricing else {}
+        bot_info = data.get("bot_info") or {}
+
+        return cls(
+            id=data["id"],
+            created=data["created"],
+            owned_by=interner.text(data["owned_by"]),
+            root=data["root"],
+            parent=data.get("parent"),
+            input_modalities=interner.modalities(architecture.get("input_modalities", ())),
+            output_modalities=interner.modalities(architecture.get("output_modalities", ())),
+            modality=interner.text(architecture.get("modality", "")),
+            primary_cost=interner.optional(primary_cost_from_details(details)) if pricing else None,
+            initial_points_cost=interner.optional(details.get("initial_points_cost")),
+            pricing_checked_at=_timestamp(pricing.get("checked_at")) if pricing else None,
+            pricing_error=data.get("pricing_error"),
+            creator=interner.optional(bot_info.get("creator")),
+        )
+
+    @classmethod
+    def from_model(cls, model: PoeModel, interner: _Interner | None = None) -> "LiteModel":
+        """Build a LiteModel from a full PoeModel.
+
+        Args:
+            model: Validated model
+            interner: Shared interner for string/tuple deduplication
+
+        Returns:
+            A new LiteModel
+        """
+        interner = interner or _Interner()
+        pricing = model.pricing
+        return cls(
+            id=model.id,
+            created=model.created,
+            owned_by=interner.text(model.owned_by),
+            root=model.root,
+            parent=model.parent,
+            input_modalities=interner.modalities(model.architecture.input_modalities),
+            output_modalities=interner.modalities(model.architecture.output_modalities),
+            modality=interner.text(model.architecture.modality),
+            primary_cost=interner.optional(model.get_primary_cost()),
+            initial_points_cost=interner.optional(pricing.details.initial_points_cost) if pricing else None,
+            pricing_checked_at=_timestamp(pricing.checked_at) if pricing else None,
+            pricing_error=model.pricing_error,
+            creator=interner.optional(model.bot_info.creator) if model.bot_info else None,
+        )
+
+
+class LiteCollection:
+    """Immutable collection of LiteModel records with an id index."""
+
+    __slots__ = ("_by_id", "models")
+
+    def __init__(self, models: tuple[LiteModel, ...]):
+        """Initialize the collection.
+
+        Args:
+            models: Models in data file order
+        """
+        self.models = models
+        by_id: dict[str, LiteModel] = {}
+        for model in models:
+            by_id.setdefault(model.id, model)
+        self._by_id = by_id
+
+    @classmethod
+    def from_json_data(cls, data: dict[str, Any]) -> "LiteCollection":
+        """Build a collection from the parsed data file, without Pydantic validation.
+
+        Args:
+            data: Parsed poe_models.json content
+
+        Returns:
+            A new LiteCollection
+        """
+        interner = _Interner()
+        return cls(tuple(LiteModel.from_dict(record, interner) for record in data.get("data", [])))
+
+    @classmethod
+    def from_models(cls, models: Iterable[PoeModel]) -> "LiteCollection":
+        """Build a collection from already validated models.
+
+        Args:
+            models: Full models, e.g. ``ModelCollection.data``
+
+        Returns:
+            A new LiteCollection
+        """
+        interner = _Interner()
+        return cls(tuple(LiteModel.from_model(model, interner) for model in models))
+
+    def __len__(self) -> int:
+        """Number of models in the collection."""
+        return len(self.models)
+
+    def __iter__(self) -> Iterator[LiteModel]:
+        """Iterate over the models in data file order."""
+        return iter(self.models)
+
+    def get_by_id(self, model_id: str) -> LiteModel | None:
+        """Get a model by its exact ID in O(1)."""
+        return self._by_id.get(model_id)
+
+    def search(self, query: str) -> list[LiteModel]:
+        """Search by case-insensitive substring of ID or root (see ModelCollection.search)."""
+        query_lower = query.lower()
+        return [model for model in self.models if query_lower in model.id.lower() or query_lower in model.root.lower()]
@@ -2,10 +2,11 @@
 
 """Pydantic models for Virginia Clemm Poe."""
 
+import sys
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class Architecture(BaseModel):
@@ -285,6 +286,63 @@ class ModelCollection(BaseModel):
     object: str = "list"
     data: list[PoeModel]
 
+    _id_index: dict[str, PoeModel] | None = PrivateAttr(default=None)
+
+    def build_indexes(self) -> "ModelCollection":
+        """Build lookup indexes over the current ``data``.
+
+        Indexes reflect ``data`` at build time; rebuild them after mutating the
+        list. api.load_models() builds them for every collection it publishes.
+
+        Returns:
+            The collection itself, for chaining
+        """
+        index: dict[str, PoeModel] = {}
+        for model in self.data:
+            index.setdefault(model.id, model)  # First occurrence wins, as in a linear scan
+        self._id_index = index
+        return self
+
+    def deduplicate(self) -> "ModelCollection":
+        """Intern repeated strings and share identical Architecture instances.
+
+        After parsing, every model holds its own copy of values that repeat
+        across the dataset (owners, modalities, creators, "Powered by ..."
+        disclaimers). Interning them keeps one copy each, and interned strings
+        compare by identity first, which makes equality filters cheaper.
+
+        Models with equal architectures end up sharing one Architecture
+        object, so treat ``model.architecture`` as read-only afterwards (replace
+        it rather than mutating it).
+
+        Returns:
+            The collection itself, for chaining
+        """
+        intern = sys.intern
+        architectures: dict[tuple[tuple[str, ...], tuple[str, ...], str], Architecture] = {}
+
+        for model in self.data:
+            model.owned_by = intern(model.owned_by)
+
+            arch = model.architecture
+            key = (tuple(arch.input_modalities), tuple(arch.output_modalities), arch.modality)
+            shared = architectures.get(key)
+            if shared is None:
+                arch.input_modalities = [intern(value) for value in arch.input_modalities]
+                arch.output_modalities = [intern(value) for value in arch.output_modalities]
+                arch.modality = intern(arch.modality)
+                shared = architectures[key] = arch
+            model.architecture = shared
+
+            bot_info = model.bot_info
+            if bot_info is not None:
+                if bot_info.creator is not None:
+                    bot_info.creator = intern(bot_info.creator)
+                if bot_info.description_extra is not None:
+                    bot_info.description_extra = intern(bot_info.description_extra)
+
+        return self
+
     def get_by_id(self, model_id: str) -> PoeModel | None:
         """Get a specific model by its unique identifier.
 
@@ -295,8 +353,11 @@ class ModelCollection(BaseModel):
             The matching PoeModel or None if not found
 
         Note:
-            Used by api.get_model_by_id() for direct model access.
+            Used by api.get_model_by_id() for direct model access. O(1) once
+            build_indexes() has run, a linear scan otherwise.
         """
+        if self._id_index is not None:
+            return self._id_index.get(model_id)
         return next((model for model in self.data if model.id == model_id), None)
 
     def search(self, query: str) -> list[PoeModel]:
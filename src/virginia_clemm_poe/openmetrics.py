@@ -0,0 +1,324 @@
+# this_file: src/virginia_clemm_poe/openmetrics.py
+
+"""OpenMetrics exporter for long-running scraping processes.
+
+The browser pool, caches, crash recovery and memory monitor keep their own
+statistics dictionaries, and the run metrics registry keeps per-phase
+latencies. This module renders all of them in the OpenMetrics text format so
+Prometheus (or any compatible scraper) can alert on scraping degradation:
+shrinking pools, connection failures, falling cache hit rates, growing RSS
+or crash bursts.
+
+Two ways to publish:
+    MetricsExporter       Local HTTP endpoint (``GET /metrics``) served from
+                          the running event loop, so pool statistics are
+                          read under the pool's own lock.
+    write_textfile()      One-shot file for node_exporter's textfile
+                          collector; ``run_textfile_writer()`` refreshes it
+                          periodically.
+
+The browser pool is only reported if this process already uses it; the
+exporter never imports playwright on its own.
+
+Example:
+    ```python
+    exporter = MetricsExporter(port=9464)
+    await exporter.start()
+    try:
+        await updater.update_all()
+    finally:
+        await exporter.stop()
+    ```
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from .config import METRICS_EXPORTER_HOST, METRICS_EXPORTER_PORT, METRICS_TEXTFILE_INTERVAL_SECONDS
+from .utils.metrics import PERCENTILES, get_metrics_registry
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+METRIC_PREFIX = "virginia_clemm_poe"
+
+
+class MetricFamily:
+    """One OpenMetrics metric family with its labelled samples."""
+
+    def __init__(self, name: str, kind: str, help_text: str, unit: str | None = None):
+        """Initialize an empty metric family.
+
+        Args:
+            name: Family name without the package prefix (e.g. "cache_hits")
+            kind: OpenMetrics type: "gauge", "counter" or "summary"
+            help_text: Description shown in the HELP line
+            unit: Optional unit, which must also end the family name
+        """
+        self.name = f"{METRIC_PREFIX}_{name}"
+        self.kind = kind
+        self.help_text = help_text
+        self.unit = unit
+        self.samples: list[tuple[str, dict[str, str], float]] = []
+
+    def add(self, value: float, labels: dict[str, str] | None = None, suffix: str = "") -> None:
+        """Add a sample.
+
+        Args:
+            value: Sample value
+            labels: Optional label set
+            suffix: Sample name suffix; counters default to "_total"
+        """
+        if self.kind == "counter" and not suffix:
+            suffix = "_total"
+        self.samples.append((suffix, labels or {}, value))
+
+    def render(self) -> str:
+        """Render the family as OpenMetrics text lines."""
+        lines = [f"# TYPE {self.name} {self.kind}"]
+        if self.unit:
+            lines.append(f"# UNIT {self.name} {self.unit}")
+        lines.append(f"# HELP {self.name} {_escape(self.help_text)}")
+        for suffix, labels, value in self.samples:
+            label_text = ",".join(f'{key}="{_escape(str(val))}"' for key, val in sorted(labels.items()))
+            label_set = f"{{{label_text}}}" if label_text else ""
+            lines.append(f"{self.name}{suffix}{label_set} {_format_value(value)}")
+        return "\n".join(lines)
+
+
+def _escape(text: str) -> str:
+    """Escape backslashes, quotes and newlines for HELP text and label values."""
+    return text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value, keeping integers free of a trailing '.0'."""
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+async def _collect_pool_metrics() -> list[MetricFamily]:
+    """Collect browser pool gauges and counters, if a pool is running here."""
+    browser_pool = sys.modules.get(f"{__package__}.browser_pool")
+    pool = browser_pool.get_running_pool() if browser_pool else None
+    if pool is None:
+        return []
+
+    stats = await pool.get_stats()
+    connections = MetricFamily("browser_pool_connections", "gauge", "Browser connections by state")
+    connections.add(stats["pool_size"], {"state": "idle"})
+    connections.add(stats["active_connections"], {"state": "active"})
+    max_size = MetricFamily("browser_pool_max_size", "gauge", "Configured maximum number of pooled connections")
+    max_size.add(stats["max_size"])
+    created = MetricFamily("browser_pool_connections_created", "counter", "Browser connections created")
+    created.add(stats["connections_created"])
+    failures = MetricFamily("browser_pool_connection_failures", "counter", "Failed browser connection attempts")
+    failures.add(stats["connection_failures"])
+    browser_memory = MetricFamily(
+        "browser_resident_memory_bytes", "gauge", "Resident set size of the pooled browsers' processes", "bytes"
+    )
+    browser_memory.add(round(stats["browser_memory_mb"] * 1024 * 1024))
+    recycles = MetricFamily(
+        "browser_pool_memory_recycles", "counter", "Connections recycled for exceeding the browser memory cap"
+    )
+    recycles.add(stats["memory_recycles"])
+    return [connections, max_size, created, failures, browser_memory, recycles]
+
+
+def _collect_cache_metrics() -> list[MetricFamily]:
+    """Collect hit, miss, eviction and size metrics for each cache."""
+    from .utils.cache import get_cache_instances
+
+    requests = MetricFamily("cache_requests", "counter", "Cache lookups by result")
+    evictions = MetricFamily("cache_evictions", "counter", "Entries evicted to respect the cache size limit")
+    expired = MetricFamily("cache_expired_removals", "counter", "Entries removed after their TTL expired")
+    hit_ratio = MetricFamily("cache_hit_ratio", "gauge", "Fraction of lookups served from the cache")
+    entries = MetricFamily("cache_entries", "gauge", "Entries currently cached")
+
+    for name, cache in get_cache_instances().items():
+        stats = cache.get_stats()
+        labels = {"cache": name}
+        requests.add(stats["hits"], {**labels, "result": "hit"})
+        requests.add(stats["misses"], {**labels, "result": "miss"})
+        evictions.add(stats["evictions"], labels)
+        expired.add(stats["expired_removals"], labels)
+        hit_ratio.add(stats["hit_rate_percent"] / 100, labels)
+        entries.add(stats["size"], labels)
+
+    return [requests, evictions, expired, hit_ratio, entries]
+
+
+def _collect_process_metrics() -> list[MetricFamily]:
+    """Collect memory and crash metrics for this process."""
+    from .utils.crash_recovery import CrashType, get_global_crash_recovery
+    from .utils.memory import get_global_memory_monitor
+
+    rss = MetricFamily("process_resident_memory_bytes", "gauge", "Resident set size of this process", "bytes")
+    rss.add(round(get_global_memory_monitor().get_memory_usage_mb() * 1024 * 1024))
+
+    crash_stats = get_global_crash_recovery().get_crash_stats()
+    crashes = MetricFamily("browser_crashes", "counter", "Browser crashes seen by crash recovery, by type")
+    crash_types = crash_stats.get("crash_types", {})
+    # Export every type, including zeros, so rate() alerts have a series from the start
+    for crash_type in CrashType:
+        crashes.add(crash_types.get(crash_type.value, 0), {"type": crash_type.value})
+    recent = MetricFamily("browser_recent_crashes", "gauge", "Browser crashes in the last hour")
+    recent.add(crash_stats.get("recent_crashes", 0))
+    circuits = MetricFamily("circuit_open", "gauge", "Whether the circuit for a failure class is open or half-open")
+    for failure_class, circuit in crash_stats.get("circuits", {}).items():
+        circuits.add(circuit["state"] != "closed", {"failure_class": failure_class})
+    return [rss, crashes, recent, circuits]
+
+
+def _collect_run_metrics() -> list[MetricFamily]:
+    """Collect run counters and phase latency summaries from the metrics registry."""
+    snapshot = get_metrics_registry().snapshot()
+
+    events = MetricFamily("run_events", "counter", "Run counters such as selector fallbacks and scrape outcomes")
+    for name, value in snapshot["counters"].items():
+        events.add(value, {"event": name})
+
+    phases = MetricFamily("phase_duration_seconds", "summary", "Duration of scrape and pool phases", "seconds")
+    for name, summary in snapshot["histograms"].items():
+        labels = {"phase": name}
+        if summary["count"]:
+            for percent in PERCENTILES:
+                phases.add(summary[f"p{percent}"], {**labels, "quantile": str(percent / 100)})
+        phases.add(summary["total"], labels, "_sum")
+        phases.add(summary["count"], labels, "_count")
+
+    return [events, phases]
+
+
+async def collect_metric_families() -> list[MetricFamily]:
+    """Gather every metric family from the running process.
+
+    Returns:
+        Metric families for the pool, caches, memory, crashes and run phases
+    """
+    families = await _collect_pool_metrics()
+    families.extend(_collect_cache_metrics())
+    families.extend(_collect_process_metrics())
+    families.extend(_collect_run_metrics())
+    return families
+
+
+async def render_metrics() -> str:
+    """Render all metrics as an OpenMetrics text exposition.
+
+    Returns:
+        Exposition text ending with the mandatory ``# EOF`` line
+    """
+    families = await collect_metric_families()
+    return "".join(f"{family.render()}\n" for family in families) + "# EOF\n"
+
+
+async def write_textfile(path: Path) -> None:
+    """Write the current metrics for node_exporter's textfile collector.
+
+    The file is replaced atomically so the collector never reads a partial
+    exposition.
+
+    Args:
+        path: Destination ``.prom`` file
+    """
+    text = await render_metrics()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        Path(tmp_name).replace(path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+async def run_textfile_writer(path: Path, interval: float = METRICS_TEXTFILE_INTERVAL_SECONDS) -> None:
+    """Refresh a textfile-collector file until cancelled.
+
+    Args:
+        path: Destination ``.prom`` file
+        interval: Seconds between refreshes
+    """
+    while True:
+        try:
+            await write_textfile(path)
+        except Exception as e:
+            logger.warning(f"Failed to write metrics textfile {path}: {e}")
+        await asyncio.sleep(interval)
+
+
+class MetricsExporter:
+    """Local HTTP endpoint serving ``GET /metrics`` from the current event loop."""
+
+    def __init__(self, host: str = METRICS_EXPORTER_HOST, port: int = METRICS_EXPORTER_PORT):
+        """Initialize the exporter.
+
+        Args:
+            host: Interface to bind (loopback by default)
+            port: TCP port to bind (0 picks a free port)
+        """
+        self.host = host
+        self.port = port
+        self._server: asyncio.Server | None = None
+
+    @property
+    def url(self) -> str:
+        """URL of the metrics endpoint."""
+        return f"http://{self.host}:{self.port}/metrics"
+
+    async def start(self) -> None:
+        """Start listening; the bound port is stored in ``self.port``."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"Serving OpenMetrics at {self.url}")
+
+    async def stop(self) -> None:
+        """Stop listening and close the server."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "MetricsExporter":
+        """Start the exporter as an async context manager."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Stop the exporter on context exit."""
+        await self.stop()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Answer one HTTP request and close the connection."""
+        try:
+            request_line = (await reader.readline()).decode("latin-1").split()
+            # Drain headers; the request has no body
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+
+            if len(request_line) < 2 or request_line[0] != "GET":
+                status, content_type, body = "405 Method Not Allowed", "text/plain", b"Only GET is supported\n"
+            elif request_line[1].split("?")[0] != "/metrics":
+                status, content_type, body = "404 Not Found", "text/plain", b"Metrics are served at /metrics\n"
+            else:
+                status, content_type, body = "200 OK", CONTENT_TYPE, (await render_metrics()).encode()
+
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode()
+                + body
+            )
+            await writer.drain()
+        except Exception as e:
+            logger.warning(f"Metrics request failed: {e}")
+        finally:
+            writer.close()
@@ -3,18 +3,27 @@
 """Poe session management with cookie extraction and balance checking."""
 
 import json
+import time
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 import httpx
 from loguru import logger
-from playwright.async_api import Browser, BrowserContext, Page
 
+from .config import BALANCE_TIER_RETRY_SECONDS
 from .exceptions import APIError, AuthenticationError
+from .utils.circuit_breaker import get_global_circuit_breaker
+from .utils.crash_recovery import HTTP_FAILURE_CLASSES
+from .utils.http import get_async_client
 from .utils.paths import get_data_dir
+from .utils.rate_limit import get_global_rate_limiter
 from .utils.timeout import with_retries
 
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, Page
+
 
 class PoeSessionManager:
     """Manages Poe session cookies and account balance checking."""
@@ -34,6 +43,10 @@ class PoeSessionManager:
         self.cookies: dict[str, Any] = {}
         self._load_cookies()
         self._balance_cache: dict[str, Any] | None = None
+        # Fallback tier memory: last method that returned a balance, and
+        # methods that recently failed (name -> monotonic time of failure)
+        self.last_working_tier: str | None = None
+        self._dead_tiers: dict[str, float] = {}
         self._load_balance_cache()
 
     def _load_cookies(self) -> None:
@@ -67,6 +80,9 @@ class PoeSessionManager:
                 with open(self.balance_cache_path) as f:
                     cache_data = json.load(f)
 
+                # The working tier stays useful even when the balance itself expired
+                self.last_working_tier = cache_data.get("tier")
+
                 # Check if cache is expired
                 cached_at = cache_data.get("cached_at")
                 if cached_at:
@@ -84,14 +100,18 @@ class PoeSessionManager:
     def _save_balance_cache(self, balance_data: dict[str, Any]) -> None:
         """Save balance data to cache."""
         try:
-            cache_data = {"balance": balance_data, "cached_at": datetime.utcnow().isoformat()}
+            cache_data = {
+                "balance": balance_data,
+                "cached_at": datetime.utcnow().isoformat(),
+                "tier": self.last_working_tier,
+            }
             with open(self.balance_cache_path, "w") as f:
                 json.dump(cache_data, f, indent=2)
             logger.debug(f"Saved balance cache to {self.balance_cache_path}")
         except Exception as e:
             logger.error(f"Failed to save balance cache: {e}")
 
-    async def extract_cookies_from_browser(self, context: BrowserContext) -> dict[str, str]:
+    async def extract_cookies_from_browser(self, context: "BrowserContext") -> dict[str, str]:
         """Extract Poe session cookies from browser context.
 
         Args:
@@ -159,7 +179,7 @@ class PoeSessionManager:
             logger.error(f"Failed to extract cookies: {e}")
             raise
 
-    async def login_with_browser(self, browser: Browser) -> dict[str, str]:
+    async def login_with_browser(self, browser: "Browser") -> dict[str, str]:
         """Open Poe login page and wait for user to log in.
 
         Args:
@@ -190,7 +210,7 @@ class PoeSessionManager:
         finally:
             await context.close()
 
-    async def extract_from_existing_playwright_session(self, page: Page) -> dict[str, str]:
+    async def extract_from_existing_playwright_session(self, page: "Page") -> dict[str, str]:
         """Extract cookies from an existing PlaywrightAuthor browser session.
 
         Args:
@@ -214,7 +234,7 @@ class PoeSessionManager:
         self,
         use_api_key: bool = False,
         api_key: str | None = None,
-        page: Page | None = None,
+        page: "Page | None" = None,
         use_cache: bool = True,
         force_refresh: bool = False,
     ) -> dict[str, Any]:
@@ -242,7 +262,7 @@ class PoeSessionManager:
             logger.info("Using cached balance data")
             return self._balance_cache
 
-        errors = []  # Collect errors for debugging
+        errors: list[str] = []  # Collect errors for debugging
 
         # Try API key method first if requested
         if use_api_key and api_key:
@@ -273,18 +293,9 @@ class PoeSessionManager:
 
         # If we have a page, try scraping as last resort
         if page:
-            logger.info("Falling back to browser scraping for balance...")
-            try:
-                from .balance_scraper import get_balance_with_browser
-
-                result = await get_balance_with_browser(page)
-                if result.get("compute_points_available") is not None:
-                    self._save_balance_cache(result)
-                    logger.info("Successfully got balance via browser scraping")
-                return result
-            except Exception as e:
-                errors.append(f"Browser scraping: {e}")
-                logger.error(f"Browser scraping failed: {e}")
+            scraped = await self._get_balance_via_browser(page, errors)
+            if scraped is not None:
+                return scraped
 
         # If all methods failed, provide helpful error
         if not self.cookies and not api_key:
@@ -299,20 +310,107 @@ class PoeSessionManager:
             "timestamp": datetime.utcnow().isoformat(),
         }
 
+    async def _get_balance_via_browser(self, page: "Page", errors: list[str]) -> dict[str, Any] | None:
+        """Scrape the balance unless browser scraping failed recently.
+
+        Args:
+            page: Authenticated Playwright page
+            errors: Error list extended with the reason scraping gave no result
+
+        Returns:
+            Scraped balance data, or None if scraping was skipped or failed
+        """
+        if self.is_tier_dead("browser"):
+            errors.append("Browser scraping: skipped after a recent failure")
+            logger.debug("Skipping browser scraping for balance, it failed recently")
+            return None
+
+        logger.info("Falling back to browser scraping for balance...")
+        try:
+            from .balance_scraper import get_balance_with_browser
+
+            result = await get_balance_with_browser(page)
+        except Exception as e:
+            self._mark_tier_dead("browser", e)
+            errors.append(f"Browser scraping: {e}")
+            logger.error(f"Browser scraping failed: {e}")
+            return None
+
+        if result.get("compute_points_available") is not None:
+            self._mark_tier_working("browser")
+            self._save_balance_cache(result)
+            logger.info("Successfully got balance via browser scraping")
+        return result
+
+    def _mark_tier_working(self, tier: str) -> None:
+        """Remember a balance method that just succeeded."""
+        self.last_working_tier = tier
+        self._dead_tiers.pop(tier, None)
+
+    def _mark_tier_dead(self, tier: str, error: Exception) -> None:
+        """Skip a failing balance method until BALANCE_TIER_RETRY_SECONDS have passed."""
+        self._dead_tiers[tier] = time.monotonic()
+        if self.last_working_tier == tier:
+            self.last_working_tier = None
+        logger.debug(f"Balance method '{tier}' failed, skipping it for {BALANCE_TIER_RETRY_SECONDS:.0f}s: {error}")
+
+    def is_tier_dead(self, tier: str) -> bool:
+        """Check whether a balance method failed recently and should be skipped.
+
+        Args:
+            tier: Balance method name ("graphql", "direct_api" or "browser")
+
+        Returns:
+            True if the method failed within the retry window
+        """
+        failed_at = self._dead_tiers.get(tier)
+        if failed_at is None:
+            return False
+        if time.monotonic() - failed_at >= BALANCE_TIER_RETRY_SECONDS:
+            del self._dead_tiers[tier]
+            return False
+        return True
+
+    def _cookie_tiers(self) -> list[tuple[str, Callable[[], Awaitable[dict[str, Any]]]]]:
+        """Get cookie-based balance methods in the order they should be tried.
+
+        GraphQL (needs the m-b cookie) comes before the direct API, the last
+        working method is moved to the front and recently failed methods are
+        skipped. If every method is marked dead, all are tried again.
+        """
+        tiers: list[tuple[str, Callable[[], Awaitable[dict[str, Any]]]]] = []
+        if "m-b" in self.cookies:
+            tiers.append(("graphql", self._get_balance_via_graphql))
+        tiers.append(("direct_api", self._get_balance_via_direct_api))
+
+        tiers.sort(key=lambda tier: tier[0] != self.last_working_tier)
+        alive = [tier for tier in tiers if not self.is_tier_dead(tier[0])]
+        return alive or tiers
+
     async def _get_balance_via_cookies(self) -> dict[str, Any]:
-        """Get balance using session cookies (internal API)."""
+        """Get balance using session cookies (internal API).
+
+        Tries the cheapest working method first and remembers the outcome, so
+        repeated calls (e.g. from BalanceMonitor) skip known-dead methods.
+        """
         if not self.cookies:
             raise AuthenticationError("No cookies available")
 
-        # Try GraphQL method first if we have m-b cookie
-        if "m-b" in self.cookies:
+        last_error: Exception | None = None
+        for tier, method in self._cookie_tiers():
             try:
-                return await self._get_balance_via_graphql()
+                result = await method()
             except Exception as e:
-                logger.debug(f"GraphQL method failed, falling back to direct API: {e}")
+                self._mark_tier_dead(tier, e)
+                last_error = e
+                logger.debug(f"Balance method '{tier}' failed, trying next method: {e}")
+                continue
 
-        # Fall back to direct API method
-        return await self._get_balance_via_direct_api()
+            self._mark_tier_working(tier)
+            return result
+
+        assert last_error is not None
+        raise last_error
 
     async def _get_balance_via_graphql(self) -> dict[str, Any]:
         """Get balance using GraphQL query (most reliable method)."""
@@ -355,46 +453,52 @@ class PoeSessionManager:
 
         payload = {"query": SETTINGS_QUERY, "variables": {}}
 
-        async with httpx.AsyncClient() as client:
-            try:
-                # Use retry logic for transient failures
-                async def make_request():
-                    response = await client.post(graphql_url, json=payload, headers=headers, timeout=15)
-                    response.raise_for_status()
-                    return response
-
-                response = await with_retries(
-                    make_request, max_retries=3, base_delay=1.0, operation_name="graphql_balance_query"
-                )
-
-                data = response.json()
-
-                # Extract data from GraphQL response
-                viewer_data = data.get("data", {}).get("viewer", {})
-                message_info = viewer_data.get("messagePointInfo", {})
-                subscription = viewer_data.get("subscription", {})
-
-                result = {
-                    "compute_points_available": message_info.get("messagePointBalance"),
-                    "monthly_quota": message_info.get("monthlyQuota"),
-                    "subscription": subscription,
-                    "message_point_info": message_info,
-                    "timestamp": datetime.utcnow().isoformat(),
-                }
+        client = get_async_client()
+        try:
+            # Use retry logic for transient failures
+            async def make_request():
+                await get_global_rate_limiter().acquire(graphql_url)
+                response = await client.post(graphql_url, json=payload, headers=headers, timeout=15)
+                response.raise_for_status()
+                return response
+
+            response = await with_retries(
+                make_request,
+                max_retries=3,
+                base_delay=1.0,
+                operation_name="graphql_balance_query",
+                circuit_breaker=get_global_circuit_breaker(),
+                circuit_classes=HTTP_FAILURE_CLASSES,
+            )
 
-                # Log balance info
-                points = result.get("compute_points_available")
-                if points is not None:
-                    logger.info(f"Account balance (via GraphQL): {points:,} compute points")
+            data = response.json()
 
-                return result
+            # Extract data from GraphQL response
+            viewer_data = data.get("data", {}).get("viewer", {})
+            message_info = viewer_data.get("messagePointInfo", {})
+            subscription = viewer_data.get("subscription", {})
 
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 401:
-                    raise AuthenticationError("GraphQL: Cookies expired or invalid")
-                raise APIError(f"GraphQL request failed: {e}")
-            except Exception as e:
-                raise APIError(f"GraphQL error: {e}")
+            result = {
+                "compute_points_available": message_info.get("messagePointBalance"),
+                "monthly_quota": message_info.get("monthlyQuota"),
+                "subscription": subscription,
+                "message_point_info": message_info,
+                "timestamp": datetime.utcnow().isoformat(),
+            }
+
+            # Log balance info
+            points = result.get("compute_points_available")
+            if points is not None:
+                logger.info(f"Account balance (via GraphQL): {points:,} compute points")
+
+            return result
+
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 401:
+                raise AuthenticationError("GraphQL: Cookies expired or invalid")
+            raise APIError(f"GraphQL request failed: {e}")
+        except Exception as e:
+            raise APIError(f"GraphQL error: {e}")
 
     async def _get_balance_via_direct_api(self) -> dict[str, Any]:
         """Get balance using direct API endpoint (fallback method)."""
@@ -415,53 +519,59 @@ class PoeSessionManager:
             "Sec-Fetch-Site": "cross-site",
         }
 
-        async with httpx.AsyncClient() as client:
-            try:
-                # Use retry logic for transient failures
-                async def make_request():
-                    response = await client.get(self.POE_SETTINGS_URL, headers=headers, timeout=15)
-                    response.raise_for_status()
-                    return response
-
-                response = await with_retries(
-                    make_request, max_retries=3, base_delay=1.0, operation_name="direct_api_balance"
-                )
-
-                data = response.json()
-
-                # Extract relevant information
-                result = {
-                    "compute_points_available": data.get("computePointsAvailable"),
-                    "daily_compute_points_available": data.get("dailyComputePointsAvailable"),
-                    "subscription": data.get("subscription", {}),
-                    "message_point_info": data.get("messagePointInfo", {}),
-                    "timestamp": datetime.utcnow().isoformat(),
-                }
+        client = get_async_client()
+        try:
+            # Use retry logic for transient failures
+            async def make_request():
+                await get_global_rate_limiter().acquire(self.POE_SETTINGS_URL)
+                response = await client.get(self.POE_SETTINGS_URL, headers=headers, timeout=15)
+                response.raise_for_status()
+                return response
+
+            response = await with_retries(
+                make_request,
+                max_retries=3,
+                base_delay=1.0,
+                operation_name="direct_api_balance",
+                circuit_breaker=get_global_circuit_breaker(),
+                circuit_classes=HTTP_FAILURE_CLASSES,
+            )
 
-                # Log balance info
-                points = result.get("compute_points_available", 0)
-                daily = result.get("daily_compute_points_available")
-                sub_active = result.get("subscription", {}).get("isActive", False)
+            data = response.json()
 
-                # Handle None values in formatting
-                if points is not None:
-                    logger.info(f"Account balance: {points:,} compute points")
-                else:
-                    logger.info("Account balance: Unknown")
+            # Extract relevant information
+            result = {
+                "compute_points_available": data.get("computePointsAvailable"),
+                "daily_compute_points_available": data.get("dailyComputePointsAvailable"),
+                "subscription": data.get("subscription", {}),
+                "message_point_info": data.get("messagePointInfo", {}),
+                "timestamp": datetime.utcnow().isoformat(),
+            }
 
-                if daily is not None:
-                    logger.info(f"Daily points: {daily:,}")
+            # Log balance info
+            points = result.get("compute_points_available", 0)
+            daily = result.get("daily_compute_points_available")
+            sub_active = result.get("subscription", {}).get("isActive", False)
 
-                logger.info(f"Subscription active: {sub_active}")
+            # Handle None values in formatting
+            if points is not None:
+                logger.info(f"Account balance: {points:,} compute points")
+            else:
+                logger.info("Account balance: Unknown")
 
-                return result
+            if daily is not None:
+                logger.info(f"Daily points: {daily:,}")
 
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 401:
-                    raise AuthenticationError("Cookies expired or invalid. Please login again.")
-                raise APIError(f"Failed to get account settings: {e}")
-            except Exception as e:
-                raise APIError(f"Error fetching account balance: {e}")
+            logger.info(f"Subscription active: {sub_active}")
+
+            return result
+
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 401:
+                raise AuthenticationError("Cookies expired or invalid. Please login again.")
+            raise APIError(f"Failed to get account settings: {e}")
+        except Exception as e:
+            raise APIError(f"Error fetching account balance: {e}")
 
     async def _get_balance_via_api(self, api_key: str) -> dict[str, Any]:
         """Get basic balance info using API key (limited information)."""
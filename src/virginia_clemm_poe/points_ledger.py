@@ -0,0 +1,397 @@
+# this_file: src/virginia_clemm_poe/points_ledger.py
+
+"""Local compute-points ledger for Virginia Clemm Poe.
+
+Poe reports the exact point cost of each completion, but the account balance
+can only be read through session cookies or a browser. The ledger keeps a
+running estimate between authoritative refreshes: callers record points spent
+per request (or let the ledger price a request from scraped PricingDetails),
+budget checks read the in-memory estimate in O(1) without touching the network,
+and a real balance fetch is only needed periodically or when the estimate
+approaches zero.
+"""
+
+import atexit
+import json
+import re
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from .config import (
+    LEDGER_FILE_NAME,
+    LEDGER_LOW_BALANCE_POINTS,
+    LEDGER_RECONCILE_INTERVAL_SECONDS,
+    LEDGER_SAVE_EVERY_RECORDS,
+)
+from .models import PoeModel, PricingDetails
+from .utils.paths import get_data_dir
+
+if TYPE_CHECKING:
+    from .poe_session import PoeSessionManager
+
+_POINTS_RE = re.compile(
+    r"([\d][\d,]*(?:\.\d+)?)\s*\+?\s*points?\b(?:\s*/\s*(1k tokens|message|second|image))?", re.IGNORECASE
+)
+
+
+def parse_points_cost(text: str | None) -> tuple[float, str] | None:
+    """Parse a scraped pricing string into an amount and unit.
+
+    Handles the formats found on Poe.com, e.g. "200 points", "7+ points"
+    (treated as the lower bound), "92 points/1k tokens", "1,334 points / message".
+
+    Args:
+        text: Pricing string from PricingDetails
+
+    Returns:
+        Tuple of (points, unit) where unit is "1k tokens", "message", "second",
+        "image" or "request" when no unit is given; None if not parseable
+    """
+    if not text:
+        return None
+    match = _POINTS_RE.search(text)
+    if not match:
+        return None
+    amount = float(match.group(1).replace(",", ""))
+    unit = (match.group(2) or "request").lower()
+    return amount, unit
+
+
+def _first_rate(*texts: Any) -> tuple[float, str] | None:
+    """Parse the first pricing string that yields a points amount."""
+    for text in texts:
+        parsed = parse_points_cost(text) if isinstance(text, str) else None
+        if parsed:
+            return parsed
+    return None
+
+
+def points_per_1k_tokens(pricing: PricingDetails) -> tuple[float | None, float | None]:
+    """Get the normalized token rates from scraped pricing.
+
+    Args:
+        pricing: Scraped pricing details for the model
+
+    Returns:
+        Tuple of (input, output) points per 1k tokens; each is None when the
+        model does not price that direction per token
+    """
+    extra = pricing.model_extra or {}
+    input_rate = _first_rate(pricing.input_text, pricing.text_input, extra.get("Input"))
+    output_rate = _first_rate(extra.get("Output (text)"), pricing.bot_message)
+    return (
+        input_rate[0] if input_rate and input_rate[1] == "1k tokens" else None,
+        output_rate[0] if output_rate and output_rate[1] == "1k tokens" else None,
+    )
+
+
+def estimate_request_points(pricing: PricingDetails, input_tokens: int = 0, output_tokens: int = 0) -> float | None:
+    """Estimate the point cost of one request from scraped pricing.
+
+    Token-based rates ("points/1k tokens") are used when token counts are
+    given; otherwise the per-message cost is used.
+
+    Args:
+        pricing: Scraped pricing details for the model
+        input_tokens: Prompt tokens sent
+        output_tokens: Completion tokens received
+
+    Returns:
+        Estimated points, or None if the pricing cannot be interpreted
+    """
+    if input_tokens or output_tokens:
+        input_per_1k, output_per_1k = points_per_1k_tokens(pricing)
+        if input_per_1k is not None or output_per_1k is not None:
+            return input_tokens / 1000 * (input_per_1k or 0.0) + output_tokens / 1000 * (output_per_1k or 0.0)
+
+    extra = pricing.model_extra or {}
+    message_rate = _first_rate(
+        pricing.total_cost,
+        pricing.per_message,
+        extra.get("Message Cost"),
+        pricing.image_output,
+        pricing.initial_points_cost,
+    )
+    if message_rate and message_rate[1] in ("message", "request", "image"):
+        return message_rate[0]
+    return None
+
+
+class PointsLedger:
+    """Running compute-points balance estimate between authoritative refreshes.
+
+    The estimate is ``baseline - spent`` where ``baseline`` is the last balance
+    fetched from Poe. Recording a charge and checking a budget are O(1) and
+    never block on the network; ``reconcile()`` fetches a real balance only when
+    the baseline is stale or the estimate is running low.
+
+    Example:
+        ```python
+        ledger = get_points_ledger()
+        await ledger.reconcile()
+        if ledger.can_afford(500):
+            ...  # make the request
+            ledger.record(usage_points, model_id="Claude-3-Opus")
+        ```
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        session_manager: "PoeSessionManager | None" = None,
+        reconcile_interval: float = LEDGER_RECONCILE_INTERVAL_SECONDS,
+        low_balance_threshold: float = LEDGER_LOW_BALANCE_POINTS,
+        save_every: int = LEDGER_SAVE_EVERY_RECORDS,
+    ):
+        """Initialize the ledger and load persisted state.
+
+        Args:
+            path: Ledger file (defaults to <data dir>/points_ledger.json)
+            session_manager: Session manager used for authoritative refreshes
+            reconcile_interval: Maximum baseline age in seconds before reconciling
+            low_balance_threshold: Estimate below which reconciliation is due
+            save_every: Persist after this many recorded charges (write-behind)
+        """
+        self.path = path or get_data_dir() / LEDGER_FILE_NAME
+        self._session_manager = session_manager
+        self.reconcile_interval = reconcile_interval
+        self.low_balance_threshold = low_balance_threshold
+        self.save_every = save_every
+
+        self.baseline: float | None = None
+        self.baseline_at: float | None = None  # Unix time of the authoritative fetch
+        self.spent = 0.0
+        self.request_count = 0
+        self.spent_by_model: dict[str, float] = {}
+        self._unsaved_records = 0
+        self.load()
+
+    @property
+    def session_manager(self) -> "PoeSessionManager":
+        """Session manager for authoritative balance fetches (created lazily)."""
+        if self._session_manager is None:
+            from .poe_session import PoeSessionManager
+
+            self._session_manager = PoeSessionManager()
+        return self._session_manager
+
+    @property
+    def estimated_balance(self) -> float | None:
+        """Current balance estimate, or None before the first authoritative fetch."""
+        if self.baseline is None:
+            return None
+        return self.baseline - self.spent
+
+    @property
+    def baseline_age_seconds(self) -> float | None:
+        """Seconds since the last authoritative balance, or None."""
+        if self.baseline_at is None:
+            return None
+        return max(0.0, time.time() - self.baseline_at)
+
+    def can_afford(self, points: float) -> bool:
+        """Check whether the estimated balance covers a cost.
+
+        Without a baseline the ledger cannot say no, so this returns True.
+
+        Args:
+            points: Expected cost of the next request
+
+        Returns:
+            True if the estimate is unknown or at least ``points``
+        """
+        estimate = self.estimated_balance
+        return estimate is None or estimate >= points
+
+    def needs_reconcile(self) -> bool:
+        """Check whether an authoritative refresh is due.
+
+        Returns:
+            True if there is no baseline, it is older than the reconcile interval,
+            or the estimate has dropped below the low-balance threshold
+        """
+        estimate = self.estimated_balance
+        age = self.baseline_age_seconds
+        if estimate is None or age is None:
+            return True
+        return age >= self.reconcile_interval or estimate <= self.low_balance_threshold
+
+    def record(self, points: float, model_id: str | None = None) -> float | None:
+        """Record points spent by one request.
+
+        Args:
+            points: Points charged (e.g. from the completion response)
+            model_id: Optional model the points were spent on
+
+        Returns:
+            The new estimated balance
+        """
+        self.spent += points
+        self.request_count += 1
+        if model_id:
+            self.spent_by_model[model_id] = self.spent_by_model.get(model_id, 0.0) + points
+
+        self._unsaved_records += 1
+        if self._unsaved_records >= self.save_every:
+            self.save()
+
+        return self.estimated_balance
+
+    def record_usage(self, model: PoeModel, input_tokens: int = 0, output_tokens: int = 0) -> float | None:
+        """Record a request priced from the model's scraped pricing.
+
+        Use this when the exact charge is not available.
+
+        Args:
+            model: Model the request was sent to
+            input_tokens: Prompt tokens sent
+            output_tokens: Completion tokens received
+
+        Returns:
+            Estimated points charged, or None if the model has no usable pricing
+        """
+        if not model.pricing:
+            return None
+        points = estimate_request_points(model.pricing.details, input_tokens, output_tokens)
+        if points is None:
+            logger.debug(f"Cannot estimate points for {model.id} from pricing")
+            return None
+        self.record(points, model_id=model.id)
+        return points
+
+    def record_insufficient_credits(self) -> None:
+        """Record a 402 insufficient_credits response: the balance is exhausted."""
+        self.set_balance(0)
+
+    def set_balance(self, points: float, fetched_at: float | None = None) -> None:
+        """Reset the ledger to an authoritative balance.
+
+        Args:
+            points: Balance reported by Poe
+            fetched_at: Unix time of the fetch (defaults to now)
+        """
+        estimate = self.estimated_balance
+        if estimate is not None:
+            logger.debug(f"Ledger drift at reconcile: estimated {estimate:,.0f}, actual {points:,.0f}")
+
+        self.baseline = float(points)
+        self.baseline_at = fetched_at if fetched_at is not None else time.time()
+        self.spent = 0.0
+        self.spent_by_model.clear()
+        self.save()
+
+    def on_balance(self, current: dict[str, Any], previous: dict[str, Any] | None = None) -> None:
+        """Reset the ledger from a BalanceMonitor update.
+
+        Matches the monitor's subscriber signature, so the ledger can be
+        reconciled with ``monitor.subscribe(ledger.on_balance)``.
+
+        Args:
+            current: Balance the monitor just fetched
+            previous: Balance from the monitor's previous poll (unused)
+        """
+        points = current.get("compute_points_available")
+        if points is None:
+            logger.debug("Balance update carried no compute points, keeping estimate")
+            return
+        self.set_balance(points)
+
+    async def reconcile(self, force: bool = False) -> float | None:
+        """Fetch the real balance if due and reset the estimate to it.
+
+        Args:
+            force: Fetch even if the baseline is fresh and the estimate is healthy
+
+        Returns:
+            The estimated balance after reconciliation
+        """
+        if not force and not self.needs_reconcile():
+            return self.estimated_balance
+
+        try:
+            balance = await self.session_manager.get_account_balance(use_cache=False, force_refresh=True)
+        except Exception as e:
+            logger.warning(f"Ledger reconcile failed, keeping estimate: {e}")
+            return self.estimated_balance
+
+        points = balance.get("compute_points_available")
+        if points is None:
+            logger.warning("Ledger reconcile returned no balance, keeping estimate")
+            return self.estimated_balance
+
+        self.set_balance(points)
+        logger.info(f"Reconciled points ledger: {points:,} compute points")
+        return self.estimated_balance
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get a JSON-serializable snapshot of the ledger."""
+        return {
+            "baseline": self.baseline,
+            "baseline_at": datetime.fromtimestamp(self.baseline_at, UTC).isoformat() if self.baseline_at else None,
+            "spent": self.spent,
+            "estimated_balance": self.estimated_balance,
+            "request_count": self.request_count,
+            "spent_by_model": dict(self.spent_by_model),
+        }
+
+    def load(self) -> None:
+        """Load persisted ledger state, if any."""
+        if not self.path.exists():
+            return
+        try:
+            with self.path.open() as f:
+                data = json.load(f)
+            self.baseline = data.get("baseline")
+            baseline_at = data.get("baseline_at")
+            self.baseline_at = datetime.fromisoformat(baseline_at).timestamp() if baseline_at else None
+            self.spent = float(data.get("spent", 0.0))
+            self.request_count = int(data.get("request_count", 0))
+            self.spent_by_model = {k: float(v) for k, v in data.get("spent_by_model", {}).items()}
+        except Exception as e:
+            logger.warning(f"Failed to load points ledger from {self.path}: {e}")
+
+    def save(self) -> None:
+        """Persist ledger state atomically."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".json.tmp")
+            with tmp_path.open("w") as f:
+                json.dump(self.to_dict(), f, indent=2)
+            tmp_path.replace(self.path)
+            self._unsaved_records = 0
+        except Exception as e:
+            logger.error(f"Failed to save points ledger: {e}")
+
+    def flush(self) -> None:
+        """Persist any charges recorded since the last save."""
+        if self._unsaved_records:
+            self.save()
+
+
+_points_ledger: PointsLedger | None = None
+
+
+def get_points_ledger() -> PointsLedger:
+    """Get or create the global points ledger.
+
+    The ledger shares the API's session manager for reconciliation, and
+    pending charges are flushed to disk at interpreter exit. To reconcile from
+    a running BalanceMonitor instead, subscribe ``ledger.on_balance`` to it.
+
+    Returns:
+        The global PointsLedger instance
+    """
+    global _points_ledger
+
+    if _points_ledger is None:
+        from .api import get_session_manager
+
+        _points_ledger = PointsLedger(session_manager=get_session_manager())
+        atexit.register(_points_ledger.flush)
+        logger.debug(f"Initialized points ledger at {_points_ledger.path}")
+
+    return _points_ledger
@@ -0,0 +1,336 @@
+# this_file: src/virginia_clemm_poe/server.py
+
+"""Resident JSON query server for Virginia Clemm Poe.
+
+Scripts that shell out to the CLI pay for interpreter start-up, package
+imports and parsing ``poe_models.json`` on every call. ``virginia-clemm-poe
+serve`` keeps the ModelCollection loaded in one process and answers lookups
+over local HTTP with JSON responses, reloading the data when the file changes.
+
+Endpoints (all GET):
+    /health                       Server status and model counts
+    /search?q=claude              api.search_models
+    /models                       All models, or api.filter_models when filter
+                                  parameters are given (owned_by, has_pricing, ...)
+    /models/<id>                  api.get_model_by_id (404 if unknown)
+    /cost?model=<id>&input_tokens=N&output_tokens=N
+                                  Estimated points for one request
+
+While running, the server records its address in a state file so the CLI can
+route ``search`` and ``list`` to it automatically (see ``find_running_server``).
+"""
+
+import json
+import os
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from . import api
+from .config import (
+    AUTO_RELOAD_POLL_SECONDS,
+    SERVER_CLIENT_TIMEOUT_SECONDS,
+    SERVER_HOST,
+    SERVER_PORT,
+    SERVER_STATE_FILE_NAME,
+)
+from .exceptions import ModelDataError
+from .models import PoeModel
+from .utils.paths import get_cache_dir
+
+# The server only listens on loopback, so client requests must bypass HTTP(S)_PROXY
+_LOCAL_OPENER = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+
+# Query parameters accepted by /models and their types
+_FILTER_PARAMS: dict[str, type] = {
+    "id": str,
+    "name": str,
+    "owned_by": str,
+    "has_pricing": bool,
+    "has_bot_info": bool,
+    "needs_update": bool,
+    "min_points": float,
+    "max_points": float,
+    "created_after": int,
+    "created_before": int,
+}
+
+
+def get_server_state_path() -> Path:
+    """Get the path of the running-server state file.
+
+    Returns:
+        Path to server.json in the platform cache directory
+    """
+    return get_cache_dir() / SERVER_STATE_FILE_NAME
+
+
+def _parse_param(name: str, raw: str, kind: type) -> Any:
+    """Convert a query string value to the type expected by filter_models."""
+    if kind is bool:
+        lowered = raw.lower()
+        if lowered in ("1", "true", "yes"):
+            return True
+        if lowered in ("0", "false", "no"):
+            return False
+        raise ValueError(f"{name} must be true or false, got {raw!r}")
+    try:
+        return kind(raw)
+    except ValueError:
+        raise ValueError(f"{name} must be {kind.__name__}, got {raw!r}") from None
+
+
+def _dump_models(models: list[PoeModel]) -> list[dict[str, Any]]:
+    return [model.model_dump(mode="json") for model in models]
+
+
+class ModelQueryServer(ThreadingHTTPServer):
+    """Threaded HTTP server that keeps the model collection loaded.
+
+    While serving, api.start_auto_reload() swaps in a fresh collection in the
+    background whenever the data file changes, so requests never wait on a reload.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        host: str = SERVER_HOST,
+        port: int = SERVER_PORT,
+        reload_poll_interval: float = AUTO_RELOAD_POLL_SECONDS,
+    ):
+        """Bind the server and load the model collection.
+
+        Args:
+            host: Interface to bind (loopback by default)
+            port: TCP port to bind (0 picks a free port)
+            reload_poll_interval: Seconds between data file checks when polling
+        """
+        super().__init__((host, port), ModelQueryHandler)
+        self.reload_poll_interval = reload_poll_interval
+        self.started_at = time.time()
+        self.request_count = 0
+        api.load_models()
+
+    @property
+    def url(self) -> str:
+        """Base URL the server is listening on."""
+        host, port = self.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode()
+        return f"http://{host}:{port}"
+
+    def write_state_file(self) -> Path:
+        """Record the server address so CLI clients can find it.
+
+        Returns:
+            Path of the written state file
+        """
+        path = get_server_state_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".json.tmp")
+        with tmp_path.open("w") as f:
+            json.dump({"url": self.url, "pid": os.getpid(), "started_at": self.started_at}, f)
+        tmp_path.replace(path)
+        return path
+
+    def remove_state_file(self) -> None:
+        """Remove the state file if it still belongs to this process."""
+        path = get_server_state_path()
+        try:
+            with path.open() as f:
+                state = json.load(f)
+            if state.get("pid") == os.getpid():
+                path.unlink()
+        except (OSError, json.JSONDecodeError):
+            pass
+
+    def serve(self) -> None:
+        """Serve until interrupted, keeping the state file up to date."""
+        api.start_auto_reload(poll_interval=self.reload_poll_interval)
+        self.write_state_file()
+        logger.info(f"Serving {len(api.get_all_models())} models at {self.url}")
+        try:
+            self.serve_forever()
+        finally:
+            self.remove_state_file()
+            api.stop_auto_reload()
+            self.server_close()
+
+
+class ModelQueryHandler(BaseHTTPRequestHandler):
+    """Request handler mapping GET endpoints onto the public API."""
+
+    server: ModelQueryServer
+    server_version = "VirginiaClemmPoe"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Route access logs through loguru at debug level."""
+        logger.debug(f"{self.address_string()} {format % args}")
+
+    def _send_json(self, payload: Any, status: HTTPStatus = HTTPStatus.OK) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status: HTTPStatus, message: str) -> None:
+        self._send_json({"error": message}, status)
+
+    def do_GET(self) -> None:
+        """Dispatch a GET request to the matching endpoint."""
+        self.server.request_count += 1
+
+        url = urllib.parse.urlsplit(self.path)
+        params = {key: values[-1] for key, values in urllib.parse.parse_qs(url.query).items()}
+        path = url.path.rstrip("/") or "/"
+
+        try:
+            if path == "/health":
+                self._handle_health()
+            elif path == "/search":
+                self._handle_search(params)
+            elif path == "/models":
+                self._handle_models(params)
+            elif path.startswith("/models/"):
+                self._handle_model(urllib.parse.unquote(path[len("/models/") :]))
+            elif path == "/cost":
+                self._handle_cost(params)
+            else:
+                self._send_error(HTTPStatus.NOT_FOUND, f"Unknown endpoint: {path}")
+        except (ValueError, ModelDataError) as e:
+            self._send_error(HTTPStatus.BAD_REQUEST, str(e))
+        except Exception as e:
+            logger.exception(f"Query server error for {self.path}")
+            self._send_error(HTTPStatus.INTERNAL_SERVER_ERROR, str(e))
+
+    def _handle_health(self) -> None:
+        models = api.get_all_models()
+        self._send_json(
+            {
+                "status": "ok",
+                "models": len(models),
+                "with_pricing": sum(1 for m in models if m.has_pricing()),
+                "need_update": sum(1 for m in models if m.needs_pricing_update()),
+                "requests": self.server.request_count,
+                "uptime_seconds": round(time.time() - self.server.started_at, 1),
+            }
+        )
+
+    def _handle_search(self, params: dict[str, str]) -> None:
+        query = params.get("q", "")
+        if not query:
+            raise ValueError("Missing query parameter 'q'")
+        self._send_json({"data": _dump_models(api.search_models(query))})
+
+    def _handle_models(self, params: dict[str, str]) -> None:
+        criteria = {
+            name: _parse_param(name, raw, _FILTER_PARAMS[name])
+            for name, raw in params.items()
+            if name in _FILTER_PARAMS
+        }
+        models = api.filter_models(criteria) if criteria else api.get_all_models()
+        if "limit" in params:
+            models = models[: _parse_param("limit", params["limit"], int)]
+        self._send_json({"data": _dump_models(models)})
+
+    def _handle_model(self, model_id: str) -> None:
+        model = api.get_model_by_id(model_id)
+        if model is None:
+            self._send_error(HTTPStatus.NOT_FOUND, f"Model not found: {model_id}")
+            return
+        self._send_json(model.model_dump(mode="json"))
+
+    def _handle_cost(self, params: dict[str, str]) -> None:
+        from .points_ledger import estimate_request_points
+
+        model_id = params.get("model", "")
+        model = api.get_model_by_id(model_id)
+        if model is None:
+            self._send_error(HTTPStatus.NOT_FOUND, f"Model not found: {model_id}")
+            return
+
+        input_tokens = _parse_param("input_tokens", params.get("input_tokens", "0"), int)
+        output_tokens = _parse_param("output_tokens", params.get("output_tokens", "0"), int)
+        points = estimate_request_points(model.pricing.details, input_tokens, output_tokens) if model.pricing else None
+        self._send_json(
+            {"model": model.id, "input_tokens": input_tokens, "output_tokens": output_tokens, "points": points}
+        )
+
+
+def find_running_server() -> str | None:
+    """Find the URL of a running query server from its state file.
+
+    Returns:
+        Base URL of the server, or None if none is recorded or its process is gone
+    """
+    path = get_server_state_path()
+    try:
+        with path.open() as f:
+            state = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    pid = state.get("pid")
+    if os.name == "posix" and isinstance(pid, int):
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            logger.debug(f"Removing stale query server state file (pid {pid} is gone)")
+            path.unlink(missing_ok=True)
+            return None
+        except PermissionError:
+            pass  # Process exists but belongs to another user
+    url = state.get("url")
+    return url if isinstance(url, str) else None
+
+
+def query_server(
+    url: str, path: str, params: dict[str, Any] | None = None, timeout: float = SERVER_CLIENT_TIMEOUT_SECONDS
+) -> Any | None:
+    """Query a running server.
+
+    Uses urllib so the CLI client path does not import httpx, with proxies
+    disabled so the loopback request never leaves the machine.
+
+    Args:
+        url: Server base URL
+        path: Endpoint path, e.g. "/search"
+        params: Optional query parameters
+        timeout: Seconds to wait for the response
+
+    Returns:
+        Decoded JSON response, or None if the server is unreachable or errored
+    """
+    query = f"?{urllib.parse.urlencode(params)}" if params else ""
+    try:
+        with _LOCAL_OPENER.open(f"{url}{path}{query}", timeout=timeout) as response:
+            return json.load(response)
+    except (urllib.error.URLError, OSError, json.JSONDecodeError) as e:
+        logger.debug(f"Query server at {url} unavailable: {e}")
+        return None
+
+
+def query_running_server(path: str, params: dict[str, Any] | None = None) -> Any | None:
+    """Query the running server, if there is one.
+
+    Args:
+        path: Endpoint path, e.g. "/search"
+        params: Optional query parameters
+
+    Returns:
+        Decoded JSON response, or None to signal that the caller should use local data
+    """
+    url = find_running_server()
+    if url is None:
+        return None
+    return query_server(url, path, params)
@@ -9,10 +9,64 @@ type mismatches early and provide clear error messages.
 from typing import Any, TypeGuard
 
 from loguru import logger
+from pydantic import TypeAdapter, ValidationError
 
 from .exceptions import APIError, ModelDataError
 from .types import ModelFilterCriteria, PoeApiModelData, PoeApiResponse
 
+# Compiled validators, built once at import. They are run in strict mode to
+# mirror plain isinstance checks (no "1" -> 1 coercion); only pass/fail and
+# error locations are used, callers keep the original records untouched.
+_MODEL_ADAPTER: TypeAdapter[PoeApiModelData] = TypeAdapter(PoeApiModelData)
+_MODEL_LIST_ADAPTER: TypeAdapter[list[PoeApiModelData]] = TypeAdapter(list[PoeApiModelData])
+
+# Maximum number of per-record validation errors included in log messages
+MAX_LOGGED_VALIDATION_ERRORS = 10
+
+
+def _format_error(error: Any, skip_index: bool = False) -> str:
+    """Format a pydantic error entry as 'field: message'."""
+    loc = error["loc"][1:] if skip_index else error["loc"]
+    field = ".".join(str(part) for part in loc) or "record"
+    return f"{field}: {error['msg']}"
+
+
+def get_poe_api_model_errors(value: Any) -> list[str]:
+    """Collect validation errors for a single model record.
+
+    Args:
+        value: The value to check
+
+    Returns:
+        List of 'field: message' strings; empty if the record is valid
+    """
+    try:
+        _MODEL_ADAPTER.validate_python(value, strict=True)
+    except ValidationError as e:
+        return [_format_error(error) for error in e.errors()]
+    return []
+
+
+def find_invalid_poe_api_models(models: list[Any]) -> dict[int, list[str]]:
+    """Validate a whole list of model records in a single compiled pass.
+
+    Args:
+        models: Raw model records from the API ``data`` array
+
+    Returns:
+        Mapping of failing index to its 'field: message' errors; empty if all are valid
+    """
+    try:
+        _MODEL_LIST_ADAPTER.validate_python(models, strict=True)
+    except ValidationError as e:
+        invalid: dict[int, list[str]] = {}
+        for error in e.errors():
+            index = error["loc"][0]
+            if isinstance(index, int):
+                invalid.setdefault(index, []).append(_format_error(error, skip_index=True))
+        return invalid
+    return {}
+
 
 def is_poe_api_model_data(value: Any) -> TypeGuard[PoeApiModelData]:
     """Type guard to validate individual model data from Poe API.
@@ -29,25 +83,7 @@ def is_poe_api_model_data(value: Any) -> TypeGuard[PoeApiModelData]:
         ...     # Safe to use as PoeApiModelData
         ...     model_id = data["id"]
     """
-    if not isinstance(value, dict):
-        return False
-
-    # Check required fields
-    required_fields = {"id", "object", "created", "owned_by", "permission", "root", "architecture"}
-    if not all(field in value for field in required_fields):
-        return False
-
-    # Validate field types
-    return (
-        isinstance(value.get("id"), str)
-        and value.get("object") == "model"
-        and isinstance(value.get("created"), int)
-        and isinstance(value.get("owned_by"), str)
-        and isinstance(value.get("permission"), list)
-        and isinstance(value.get("root"), str)
-        and isinstance(value.get("architecture"), dict)
-        and (value.get("parent") is None or isinstance(value.get("parent"), str))
-    )
+    return not get_poe_api_model_errors(value)
 
 
 def is_poe_api_response(value: Any) -> TypeGuard[PoeApiResponse]:
@@ -76,9 +112,8 @@ def is_poe_api_response(value: Any) -> TypeGuard[PoeApiResponse]:
     if not isinstance(data, list):
         return False
 
-    # Validate each model in the data (optional but recommended)
-    # This ensures all models in the response are valid
-    return all(is_poe_api_model_data(model) for model in data)
+    # Validate every model in one native pass
+    return not find_invalid_poe_api_models(data)
 
 
 def is_model_filter_criteria(value: Any) -> TypeGuard[ModelFilterCriteria]:
@@ -111,6 +146,8 @@ def is_model_filter_criteria(value: Any) -> TypeGuard[ModelFilterCriteria]:
             and not isinstance(value_item, bool)
             or key == "has_bot_info"
             and not isinstance(value_item, bool)
+            or key == "needs_update"
+            and not isinstance(value_item, bool)
             or key in ["min_points", "max_points"]
             and not isinstance(value_item, int | float)
             or key in ["created_after", "created_before"]
@@ -122,6 +159,7 @@ def is_model_filter_criteria(value: Any) -> TypeGuard[ModelFilterCriteria]:
                 "owned_by",
                 "has_pricing",
                 "has_bot_info",
+                "needs_update",
                 "min_points",
                 "max_points",
                 "created_after",
@@ -133,14 +171,34 @@ def is_model_filter_criteria(value: Any) -> TypeGuard[ModelFilterCriteria]:
     return True
 
 
+def log_invalid_poe_api_models(invalid: dict[int, list[str]], total: int) -> None:
+    """Log a summary of skipped model records.
+
+    Args:
+        invalid: Mapping of failing index to error messages
+        total: Total number of records checked
+    """
+    indices = sorted(invalid)
+    logger.warning(f"Skipping {len(indices)} of {total} invalid model records at indices: {indices}")
+    for index in indices[:MAX_LOGGED_VALIDATION_ERRORS]:
+        logger.warning(f"  index {index}: {'; '.join(invalid[index])}")
+    if len(indices) > MAX_LOGGED_VALIDATION_ERRORS:
+        logger.warning(f"  ... and {len(indices) - MAX_LOGGED_VALIDATION_ERRORS} more")
+
+
 def validate_poe_api_response(response: Any) -> PoeApiResponse:
     """Validate and return a Poe API response with proper error handling.
 
+    The whole ``data`` array is validated in one compiled pass. Invalid model
+    records are reported by index and dropped, so a few malformed entries do
+    not abort an update; only a broken envelope or a response in which every
+    record is invalid raises.
+
     Args:
         response: The response data to validate
 
     Returns:
-        The validated PoeApiResponse
+        The validated PoeApiResponse, without any invalid model records
 
     Raises:
         APIError: If the response doesn't match expected structure
@@ -150,37 +208,36 @@ def validate_poe_api_response(response: Any) -> PoeApiResponse:
         >>> validated = validate_poe_api_response(raw_response)
         >>> # Now safe to use validated["data"]
     """
-    if not is_poe_api_response(response):
-        # Log detailed validation failure
+    if not isinstance(response, dict):
         logger.error(f"Invalid API response structure: {type(response)}")
+        raise APIError("API response is not a dictionary. Expected format: {'object': 'list', 'data': [...]}")
 
-        # Provide helpful error message
-        if not isinstance(response, dict):
-            raise APIError("API response is not a dictionary. Expected format: {'object': 'list', 'data': [...]}")
-
-        if response.get("object") != "list":
-            raise APIError(f"API response has incorrect 'object' field: {response.get('object')}. Expected 'list'.")
+    if response.get("object") != "list":
+        raise APIError(f"API response has incorrect 'object' field: {response.get('object')}. Expected 'list'.")
 
-        if "data" not in response:
-            raise APIError("API response missing 'data' field. Expected format: {'object': 'list', 'data': [...]}")
+    if "data" not in response:
+        raise APIError("API response missing 'data' field. Expected format: {'object': 'list', 'data': [...]}")
 
-        # If we get here, the data field has issues
-        data = response.get("data", [])
-        if not isinstance(data, list):
-            raise APIError(f"API response 'data' field is not a list: {type(data)}. Expected list of model objects.")
+    data = response["data"]
+    if not isinstance(data, list):
+        raise APIError(f"API response 'data' field is not a list: {type(data)}. Expected list of model objects.")
 
-        # Check for invalid models in data
-        for i, model in enumerate(data[:5]):  # Check first 5 for performance
-            if not is_poe_api_model_data(model):
-                logger.error(f"Invalid model at index {i}: {model}")
-                raise APIError(
-                    f"API response contains invalid model data at index {i}. "
-                    "Model must have fields: id, object, created, owned_by, permission, root, architecture."
-                )
+    invalid = find_invalid_poe_api_models(data)
+    if not invalid:
+        return response  # type: ignore[return-value]
 
-        raise APIError("API response validation failed for unknown reason")
+    if len(invalid) == len(data):
+        first = min(invalid)
+        logger.error(f"All {len(data)} model records are invalid; first at index {first}: {invalid[first]}")
+        raise APIError(
+            f"API response contains invalid model data at index {first} "
+            f"({len(invalid)} invalid records in total). "
+            "Model must have fields: id, object, created, owned_by, permission, root, architecture."
+        )
 
-    return response
+    log_invalid_poe_api_models(invalid, len(data))
+    valid_data = [model for index, model in enumerate(data) if index not in invalid]
+    return {**response, "data": valid_data}  # type: ignore[typeddict-item]
 
 
 def validate_model_filter_criteria(criteria: Any) -> ModelFilterCriteria:
@@ -211,6 +268,7 @@ def validate_model_filter_criteria(criteria: Any) -> ModelFilterCriteria:
             "owned_by",
             "has_pricing",
             "has_bot_info",
+            "needs_update",
             "min_points",
             "max_points",
             "created_after",
@@ -231,6 +289,8 @@ def validate_model_filter_criteria(criteria: Any) -> ModelFilterCriteria:
                 and not isinstance(value, bool)
                 or key == "has_bot_info"
                 and not isinstance(value, bool)
+                or key == "needs_update"
+                and not isinstance(value, bool)
             ):
                 type_errors.append(f"{key} must be boolean, got {type(value).__name__}")
             elif key in ["min_points", "max_points"] and not isinstance(value, int | float):
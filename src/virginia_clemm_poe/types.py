@@ -25,7 +25,7 @@ class PoeApiModelData(TypedDict):
     owned_by: str
     permission: list[Any]
     root: str
-    parent: NotRequired[str]
+    parent: NotRequired[str | None]
     architecture: dict[str, Any]
 
 
@@ -50,9 +50,14 @@ class ModelFilterCriteria(TypedDict, total=False):
     All fields are optional to allow flexible filtering.
     """
 
+    id: str
+    name: str
     has_pricing: bool
+    has_bot_info: bool
     needs_update: bool
     owned_by: str
+    min_points: float
+    max_points: float
     input_modalities: list[str]
     output_modalities: list[str]
     created_after: int
@@ -106,6 +111,56 @@ class ScrapingResult(TypedDict):
     duration_seconds: float
 
 
+class HttpValidators(TypedDict, total=False):
+    """HTTP cache validators persisted for conditional requests.
+
+    Stored next to the last response body so later runs can send
+    If-None-Match / If-Modified-Since and detect unchanged payloads.
+    """
+
+    url: str
+    etag: str | None
+    last_modified: str | None
+    sha256: str
+    stored_at: str
+
+
+class HistoryChange(TypedDict):
+    """One recorded change of a tracked model field in the pricing history.
+
+    ``previous`` and ``value`` are None when the field was absent (e.g. a
+    model that was added, lost its pricing or was removed).
+    """
+
+    recorded_at: str
+    model_id: str
+    field: str
+    previous: str | None
+    value: str | None
+
+
+class FieldChange(TypedDict):
+    """Old and new value of one tracked field (None when absent)."""
+
+    old: str | None
+    new: str | None
+
+
+class ChangeSet(TypedDict):
+    """Differences between the model data before and after one update.
+
+    ``changed`` maps model IDs to their changed tracked fields (see
+    history.tracked_fields); ``affected`` lists every added, removed or
+    changed model so caches can invalidate just those entries.
+    """
+
+    generated_at: str
+    added: list[str]
+    removed: list[str]
+    changed: dict[str, dict[str, FieldChange]]
+    affected: list[str]
+
+
 # Logging and Context Types
 
 
@@ -168,6 +223,20 @@ class PerformanceMetric(TypedDict):
     context: dict[str, Any]
 
 
+class TraceEvent(TypedDict):
+    """One timed span recorded by the trace recorder.
+
+    Written one per line by the NDJSON trace output.
+    """
+
+    ts: float  # Unix time at which the span started
+    duration_ms: float
+    phase: str
+    model_id: str | None
+    outcome: str  # "ok", an error type or an HTTP status code
+    lane: int  # Worker task that ran the span
+
+
 # CLI and User Interface Types
 
 
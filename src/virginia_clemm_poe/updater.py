@@ -3,19 +3,22 @@
 """Model updater for Virginia Clemm Poe."""
 
 import asyncio
+import hashlib
 import json
 import re
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
 from datetime import datetime
-from typing import Any
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import httpx
-from bs4 import BeautifulSoup, Tag
 from loguru import logger
-from playwright.async_api import Page
 from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
 
-from .browser_pool import BrowserPool, get_global_pool
 from .config import (
+    CLOUDFLARE_CHALLENGE_TITLES,
     DATA_FILE_PATH,
     DEFAULT_DEBUG_PORT,
     DIALOG_WAIT_SECONDS,
@@ -26,15 +29,44 @@ from .config import (
     PAUSE_SECONDS,
     POE_API_URL,
     POE_BASE_URL,
+    SCRAPE_CONCURRENCY_INITIAL,
     TABLE_TIMEOUT_MS,
 )
+from .exceptions import APIError, CircuitOpenError, RateLimitError
+from .history import compute_change_set, field_changes, get_pricing_history, tracked_fields
 from .models import BotInfo, ModelCollection, PoeModel, Pricing, PricingDetails
 from .poe_session import PoeSessionManager
-from .type_guards import validate_poe_api_response
-from .types import PoeApiResponse
+from .type_guards import get_poe_api_model_errors, log_invalid_poe_api_models
+from .types import ChangeSet, PoeApiModelData, PoeApiResponse
 from .utils.cache import cached, get_api_cache, get_scraping_cache
+from .utils.circuit_breaker import get_global_circuit_breaker
+from .utils.concurrency import (
+    OUTCOME_ERROR,
+    OUTCOME_SUCCESS,
+    OUTCOME_THROTTLED,
+    OUTCOME_TIMEOUT,
+    AdaptiveConcurrency,
+)
+from .utils.http import get_async_client
+from .utils.http_cache import build_conditional_headers, get_validator_store
+from .utils.json_stream import JsonArrayStream
 from .utils.logger import log_api_request, log_browser_operation, log_performance_metric
-from .utils.memory import MemoryManagedOperation
+from .utils.metrics import get_metrics_registry
+from .utils.rate_limit import get_global_rate_limiter
+
+if TYPE_CHECKING:
+    # Browser, scraping and memory-monitoring dependencies are imported on first use,
+    # so API-only syncs never load playwright, bs4 or psutil
+    from playwright.async_api import Page
+
+    from .browser_pool import BrowserPool
+    from .utils.memory import MemoryManagedOperation
+
+
+def _is_timeout_error(error: str) -> bool:
+    """Check whether a scrape error message reports a timeout."""
+    error = error.lower()
+    return "timed out" in error or "timeout" in error
 
 
 class ModelUpdater:
@@ -51,59 +83,194 @@ class ModelUpdater:
         self.debug_port = debug_port
         self.verbose = verbose
         self.session_manager = session_manager or PoeSessionManager()
+        self.last_change_set: ChangeSet | None = None  # Set by each sync_models() run
         # Browser manager is no longer needed - using pool instead
 
         if verbose:
             logger.remove()
             logger.add(lambda msg: print(msg), level="DEBUG")
 
-    @cached(cache=get_api_cache(), ttl=600, key_prefix="poe_api_models")
-    async def fetch_models_from_api(self) -> PoeApiResponse:
-        """Fetch models from Poe API with structured logging and performance tracking.
+    async def _request_models_body(self, conditional: bool = True) -> tuple[Path, bool]:
+        """Download the raw model list to disk, revalidating against stored HTTP validators.
+
+        Sends If-None-Match / If-Modified-Since from the last committed response.
+        A 304 answer is served from the stored body; a 200 answer is streamed to a
+        pending file while being hashed, and reported as unchanged when its SHA-256
+        matches the stored hash. New validators are staged and only persisted by
+        ``update_all`` after the data file is saved.
+
+        Args:
+            conditional: Send conditional headers based on stored validators
 
         Returns:
-            Validated PoeApiResponse containing model data
+            Tuple of (path_to_response_body, unchanged)
 
         Raises:
-            APIError: If the API response is invalid or doesn't match expected structure
             httpx.HTTPStatusError: If the API request fails
         """
+        store = get_validator_store()
+        stored = store.load(POE_API_URL) if conditional else None
+
         headers = {"Authorization": f"Bearer {self.api_key}"}
+        headers.update(build_conditional_headers(stored))
 
-        async with httpx.AsyncClient(timeout=HTTP_REQUEST_TIMEOUT_SECONDS) as client:
-            with log_api_request("GET", POE_API_URL, headers) as ctx:
-                try:
-                    response = await client.get(POE_API_URL, headers=headers)
+        await get_global_rate_limiter().acquire(POE_API_URL)
+        client = get_async_client()
+        metrics = get_metrics_registry()
+        with log_api_request("GET", POE_API_URL, headers) as ctx, metrics.time("api.models_request"):
+            try:
+                async with client.stream(
+                    "GET", POE_API_URL, headers=headers, timeout=HTTP_REQUEST_TIMEOUT_SECONDS
+                ) as response:
+                    ctx["status_code"] = response.status_code
+
+                    if response.status_code == 304:
+                        body_path = store.body_path(POE_API_URL) if stored else None
+                        if body_path is None:
+                            logger.warning("Got 304 without a stored response body, refetching unconditionally")
+                            return await self._request_models_body(conditional=False)
+
+                        ctx["not_modified"] = True
+                        metrics.increment("api.models_not_modified")
+                        log_performance_metric("api_models_not_modified", 1, "count", {"endpoint": "models"})
+                        logger.info("Poe API model list not modified since last update")
+                        return body_path, True
+
+                    if response.is_error:
+                        await response.aread()
                     response.raise_for_status()
 
-                    # Add response context
-                    ctx["status_code"] = response.status_code
-                    ctx["response_size"] = len(response.content)
+                    # Stream the body to disk while hashing, never holding it all in memory
+                    hasher = hashlib.sha256()
+                    response_size = 0
+                    pending_path = store.pending_body_path(POE_API_URL)
+                    with pending_path.open("wb") as f:
+                        async for chunk in response.aiter_bytes():
+                            hasher.update(chunk)
+                            f.write(chunk)
+                            response_size += len(chunk)
+                    ctx["response_size"] = response_size
+
+                sha256 = hasher.hexdigest()
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+                unchanged = stored is not None and stored.get("sha256") == sha256
+                ctx["unchanged"] = unchanged
+
+                if unchanged:
+                    metrics.increment("api.models_unchanged")
+                    logger.info("Poe API model list unchanged (same content hash)")
+                    stored_path = store.body_path(POE_API_URL)
+                    if stored_path and stored.get("etag") == etag and stored.get("last_modified") == last_modified:  # type: ignore[union-attr]
+                        pending_path.unlink(missing_ok=True)
+                        return stored_path, True
+
+                # Keep validators fresh even when only the headers changed
+                store.stage(POE_API_URL, etag, last_modified, sha256, pending_path)
+                return pending_path, unchanged
+
+            except httpx.HTTPStatusError as e:
+                ctx["status_code"] = e.response.status_code
+                ctx["error_detail"] = e.response.text if e.response else "No response"
+                logger.error(f"API request failed with status {e.response.status_code}: {e.response.text[:200]}")
+                raise
+            except Exception as e:
+                ctx["error_type"] = type(e).__name__
+                logger.error(f"Failed to fetch models from API: {e}")
+                raise
 
-                    # Parse and validate the response
-                    raw_data = response.json()
-                    validated_data = validate_poe_api_response(raw_data)
+    def _iter_api_records(
+        self, stream: JsonArrayStream, invalid_ids: set[str] | None = None
+    ) -> Iterator[PoeApiModelData]:
+        """Validate streamed API records.
 
-                    model_count = len(validated_data["data"])
-                    ctx["models_fetched"] = model_count
+        Records are checked with the compiled model validator as they are
+        decoded, so only one raw record is alive at a time. Invalid records are
+        skipped and reported together by index once the stream is exhausted.
 
-                    # Log performance metric
-                    log_performance_metric(
-                        "api_models_fetched", model_count, "count", {"endpoint": "models", "api_version": "v1"}
-                    )
+        Args:
+            stream: Stream over the ``data`` array of a /v1/models response
+            invalid_ids: Set that collects the IDs of skipped records that have one,
+                so callers can keep the stored entries for those models
 
-                    logger.info(f"Successfully fetched and validated {model_count} models from Poe API")
-                    return validated_data
+        Yields:
+            Valid API records in API order
 
-                except httpx.HTTPStatusError as e:
-                    ctx["status_code"] = e.response.status_code
-                    ctx["error_detail"] = e.response.text if e.response else "No response"
-                    logger.error(f"API request failed with status {e.response.status_code}: {e.response.text[:200]}")
-                    raise
-                except Exception as e:
-                    ctx["error_type"] = type(e).__name__
-                    logger.error(f"Failed to fetch models from API: {e}")
-                    raise
+        Raises:
+            APIError: If the response envelope is invalid or every record is invalid
+        """
+        count = 0
+        invalid: dict[int, list[str]] = {}
+        for index, record in enumerate(stream):
+            errors = get_poe_api_model_errors(record)
+            if errors:
+                invalid[index] = errors
+                if invalid_ids is not None and isinstance(record, dict) and isinstance(record.get("id"), str):
+                    invalid_ids.add(record["id"])
+                continue
+            count += 1
+            yield record
+
+        if not stream.found_array:
+            raise APIError("API response missing 'data' field. Expected format: {'object': 'list', 'data': [...]}")
+        if stream.meta.get("object") != "list":
+            raise APIError(f"API response has incorrect 'object' field: {stream.meta.get('object')}. Expected 'list'.")
+        if invalid:
+            if count == 0:
+                first = min(invalid)
+                raise APIError(
+                    f"API response contains invalid model data at index {first} "
+                    f"({len(invalid)} invalid records in total). "
+                    "Model must have fields: id, object, created, owned_by, permission, root, architecture."
+                )
+            log_invalid_poe_api_models(invalid, count + len(invalid))
+
+        log_performance_metric("api_models_fetched", count, "count", {"endpoint": "models", "api_version": "v1"})
+        logger.info(f"Fetched and validated {count} models from Poe API")
+
+    def _iter_api_models(self, stream: JsonArrayStream, invalid_ids: set[str] | None = None) -> Iterator[PoeModel]:
+        """Validate and convert streamed API records into PoeModel instances.
+
+        Args:
+            stream: Stream over the ``data`` array of a /v1/models response
+            invalid_ids: Set that collects the IDs of skipped records that have one
+
+        Yields:
+            PoeModel instances in API order
+
+        Raises:
+            APIError: If the response envelope is invalid or every record is invalid
+        """
+        for record in self._iter_api_records(stream, invalid_ids):
+            yield PoeModel.model_validate(record)
+
+    @cached(cache=get_api_cache(), ttl=600, key_prefix="poe_api_models")
+    async def fetch_models_from_api(self) -> PoeApiResponse:
+        """Fetch models from Poe API with structured logging and performance tracking.
+
+        Uses a conditional request, so an unchanged model list is served from
+        the locally stored response body. The body is stream-parsed from disk
+        and validated record by record, so only the valid records are held in
+        memory, never the raw response text. Nothing is saved to the data file
+        here, so validators staged by the request are discarded rather than
+        persisted.
+
+        Returns:
+            Validated PoeApiResponse containing model data
+
+        Raises:
+            APIError: If the API response is invalid or doesn't match expected structure
+            httpx.HTTPStatusError: If the API request fails
+        """
+        with get_metrics_registry().time("api.fetch_models"):
+            body_path, _ = await self._request_models_body()
+            try:
+                stream = JsonArrayStream.from_path(body_path, "data")
+                records = list(self._iter_api_records(stream))
+            finally:
+                get_validator_store().discard(POE_API_URL)
+
+        return PoeApiResponse(object="list", data=records)
 
     def parse_pricing_table(self, html: str) -> dict[str, Any | None]:
         """Parse pricing table HTML into structured data for model cost analysis.
@@ -139,6 +306,8 @@ class ModelUpdater:
             This parser is specifically designed for Poe.com pricing tables and
             may not work correctly with arbitrary HTML table structures.
         """
+        from bs4 import BeautifulSoup, Tag
+
         soup = BeautifulSoup(html, "html.parser")
         table = soup.find("table")
         if table is None:
@@ -166,7 +335,7 @@ class ModelUpdater:
         return data
 
     async def scrape_model_info(
-        self, model_id: str, page: Page
+        self, model_id: str, page: "Page"
     ) -> tuple[dict[str, Any] | None, BotInfo | None, str | None]:
         """Scrape model information with caching support."""
         # Check cache first
@@ -175,6 +344,7 @@ class ModelUpdater:
 
         cached_result = await cache.get(cache_key)
         if cached_result is not None:
+            get_metrics_registry().increment("scrape.cache_hit")
             logger.debug(f"Using cached scraping result for {model_id}")
             return cached_result
 
@@ -189,7 +359,7 @@ class ModelUpdater:
         return result
 
     async def _extract_with_fallback_selectors(
-        self, page: Page, selectors: list[str], validate_fn=None, debug_name: str = "element"
+        self, page: "Page", selectors: list[str], validate_fn=None, debug_name: str = "element"
     ) -> str | None:
         """Extract text content using a list of fallback selectors.
 
@@ -202,20 +372,26 @@ class ModelUpdater:
         Returns:
             Extracted text or None if not found
         """
-        for selector in selectors:
-            try:
-                elem = await page.query_selector(selector)
-                if elem:
-                    text = await elem.text_content()
-                    if text and text.strip() and (validate_fn is None or validate_fn(text)):
-                        logger.debug(f"Found {debug_name} with selector '{selector}': {text.strip()[:50]}...")
-                        return text.strip()
-            except Exception as e:
-                logger.debug(f"{debug_name} selector '{selector}' failed: {e}")
-                continue
+        metrics = get_metrics_registry()
+        key = debug_name.replace(" ", "_")
+        with metrics.time("scrape.selectors"):
+            for index, selector in enumerate(selectors):
+                try:
+                    elem = await page.query_selector(selector)
+                    if elem:
+                        text = await elem.text_content()
+                        if text and text.strip() and (validate_fn is None or validate_fn(text)):
+                            logger.debug(f"Found {debug_name} with selector '{selector}': {text.strip()[:50]}...")
+                            # Anything past the first selector means the page markup drifted
+                            metrics.increment(f"selector.{key}.{'primary' if index == 0 else 'fallback'}")
+                            return text.strip()
+                except Exception as e:
+                    logger.debug(f"{debug_name} selector '{selector}' failed: {e}")
+                    continue
+        metrics.increment(f"selector.{key}.miss")
         return None
 
-    async def _extract_initial_points_cost(self, page: Page) -> str | None:
+    async def _extract_initial_points_cost(self, page: "Page") -> str | None:
         """Extract initial points cost from the page."""
         selectors = [
             ".BotInfoCardHeader_initialPointsCost__oIIcI span",
@@ -230,7 +406,7 @@ class ModelUpdater:
 
         return await self._extract_with_fallback_selectors(page, selectors, validate_points, "initial points cost")
 
-    async def _extract_bot_creator(self, page: Page) -> str | None:
+    async def _extract_bot_creator(self, page: "Page") -> str | None:
         """Extract bot creator handle from the page."""
         selectors = [
             ".UserHandle_creatorHandle__aNMAK",
@@ -241,7 +417,7 @@ class ModelUpdater:
         ]
         return await self._extract_with_fallback_selectors(page, selectors, debug_name="creator")
 
-    async def _expand_description(self, page: Page) -> None:
+    async def _expand_description(self, page: "Page") -> None:
         """Click 'View more' button to expand description if present."""
         selectors = [
             ".BotDescriptionDisclaimerSection_expander__DkmQX",
@@ -256,12 +432,13 @@ class ModelUpdater:
                 if elem:
                     logger.debug(f"Found 'View more' button with selector '{selector}', clicking...")
                     await elem.click()
-                    await asyncio.sleep(EXPANSION_WAIT_SECONDS)
+                    with get_metrics_registry().time("scrape.sleep"):
+                        await asyncio.sleep(EXPANSION_WAIT_SECONDS)
                     break
             except Exception as e:
                 logger.debug(f"View more selector '{selector}' failed: {e}")
 
-    async def _extract_bot_description(self, page: Page) -> str | None:
+    async def _extract_bot_description(self, page: "Page") -> str | None:
         """Extract bot description from the page."""
         selectors = [
             ".BotDescriptionDisclaimerSection_text__sIeXQ span",
@@ -276,7 +453,7 @@ class ModelUpdater:
 
         return await self._extract_with_fallback_selectors(page, selectors, validate_description, "description")
 
-    async def _extract_bot_disclaimer(self, page: Page) -> str | None:
+    async def _extract_bot_disclaimer(self, page: "Page") -> str | None:
         """Extract bot disclaimer text from the page."""
         selectors = [
             ".BotDescriptionDisclaimerSection_disclaimerText__yEe8h",
@@ -291,7 +468,7 @@ class ModelUpdater:
 
         return await self._extract_with_fallback_selectors(page, selectors, validate_disclaimer, "disclaimer")
 
-    async def _extract_bot_info(self, page: Page) -> BotInfo:
+    async def _extract_bot_info(self, page: "Page") -> BotInfo:
         """Extract all bot information from the page."""
         bot_info = BotInfo()
 
@@ -307,7 +484,7 @@ class ModelUpdater:
 
         return bot_info
 
-    async def _extract_pricing_table(self, page: Page, model_id: str) -> tuple[dict[str, Any] | None, str | None]:
+    async def _extract_pricing_table(self, page: "Page", model_id: str) -> tuple[dict[str, Any] | None, str | None]:
         """Extract pricing information from the rates dialog.
 
         Returns:
@@ -333,8 +510,10 @@ class ModelUpdater:
         await rates_button.click()
 
         # Wait for dialog
+        metrics = get_metrics_registry()
         await page.wait_for_selector("div[role='dialog']", timeout=TABLE_TIMEOUT_MS)
-        await asyncio.sleep(DIALOG_WAIT_SECONDS)
+        with metrics.time("scrape.sleep"):
+            await asyncio.sleep(DIALOG_WAIT_SECONDS)
 
         # Extract table HTML
         table_html = await self._find_pricing_table_html(page)
@@ -348,13 +527,14 @@ class ModelUpdater:
         # Close modal
         try:
             await page.keyboard.press("Escape")
-            await asyncio.sleep(MODAL_CLOSE_WAIT_SECONDS)
+            with metrics.time("scrape.sleep"):
+                await asyncio.sleep(MODAL_CLOSE_WAIT_SECONDS)
         except Exception:
             pass
 
         return pricing, None
 
-    async def _find_pricing_table_html(self, page: Page) -> str | None:
+    async def _find_pricing_table_html(self, page: "Page") -> str | None:
         """Find and extract pricing table HTML from the dialog."""
         selectors = [
             "div[role='dialog'] table",
@@ -364,8 +544,10 @@ class ModelUpdater:
             "table",
         ]
 
+        metrics = get_metrics_registry()
+
         # Try CSS selectors first
-        for selector in selectors:
+        for index, selector in enumerate(selectors):
             try:
                 dialog = await page.query_selector("div[role='dialog']")
                 if dialog:
@@ -373,6 +555,7 @@ class ModelUpdater:
                     if table_element:
                         table_html = await table_element.inner_html()
                         logger.debug(f"Found table with selector: {selector}")
+                        metrics.increment(f"selector.pricing_table.{'primary' if index == 0 else 'fallback'}")
                         return (
                             f"<table>{table_html}</table>"
                             if not table_html.strip().startswith("<table")
@@ -388,14 +571,16 @@ class ModelUpdater:
                 table_match = re.search(r"<table[^>]*>.*?</table>", dialog_html, re.DOTALL)
                 if table_match:
                     logger.debug("Found table using regex extraction")
+                    metrics.increment("selector.pricing_table.regex")
                     return table_match.group(0)
         except Exception as e:
             logger.debug(f"Regex extraction failed: {e}")
 
+        metrics.increment("selector.pricing_table.miss")
         return None
 
     async def _scrape_model_info_uncached(
-        self, model_id: str, page: Page
+        self, model_id: str, page: "Page"
     ) -> tuple[dict[str, Any] | None, BotInfo | None, str | None]:
         """Scrape pricing and bot info data for a single model with comprehensive error handling.
 
@@ -441,27 +626,40 @@ class ModelUpdater:
         Note:
             This function implements a "best effort" strategy - it attempts to collect
             as much information as possible even if some extraction steps fail.
+            Each phase is timed into the metrics registry (``scrape.rate_limit``,
+            ``scrape.goto``, ``scrape.sleep``, ``scrape.initial_points``,
+            ``scrape.bot_info``, ``scrape.rates_dialog`` and ``scrape.total``);
+            the bot info and Rates dialog phases include their own fixed sleeps.
         """
         url = POE_BASE_URL.format(id=model_id)
+        metrics = get_metrics_registry()
 
-        with log_browser_operation("scrape_model", model_id, self.debug_port) as ctx:
+        with log_browser_operation("scrape_model", model_id, self.debug_port) as ctx, metrics.time("scrape.total"):
             ctx["url"] = url
 
             try:
                 # Navigate to page
                 logger.debug(f"Navigating to {url}")
-                await page.goto(url, wait_until="networkidle", timeout=PAGE_NAVIGATION_TIMEOUT_MS)
-                await asyncio.sleep(PAUSE_SECONDS)
+                with metrics.time("scrape.rate_limit"):
+                    await get_global_rate_limiter().acquire(url)
+                with metrics.time("scrape.goto"):
+                    response = await page.goto(url, wait_until="networkidle", timeout=PAGE_NAVIGATION_TIMEOUT_MS)
+                await self._check_throttled(response, page)
+                with metrics.time("scrape.sleep"):
+                    await asyncio.sleep(PAUSE_SECONDS)
                 ctx["page_loaded"] = True
 
                 # Extract initial points cost
-                initial_points_cost = await self._extract_initial_points_cost(page)
+                with metrics.time("scrape.initial_points"):
+                    initial_points_cost = await self._extract_initial_points_cost(page)
 
                 # Extract bot info
-                bot_info = await self._extract_bot_info(page)
+                with metrics.time("scrape.bot_info"):
+                    bot_info = await self._extract_bot_info(page)
 
                 # Extract pricing from rates dialog
-                pricing, error_msg = await self._extract_pricing_table(page, model_id)
+                with metrics.time("scrape.rates_dialog"):
+                    pricing, error_msg = await self._extract_pricing_table(page, model_id)
 
                 if error_msg and not bot_info.creator and not bot_info.description:
                     # If we couldn't get pricing and have no bot info, return error
@@ -482,80 +680,134 @@ class ModelUpdater:
 
                 ctx["scraped_fields"] = scraped_fields
                 ctx["success"] = True
+                metrics.increment("scrape.success")
+                get_global_circuit_breaker().record_success()
 
                 logger.debug(f"Successfully scraped {model_id}: {', '.join(scraped_fields)}")
                 return pricing, bot_info, error_msg
 
+            except RateLimitError as e:
+                ctx["error_type"] = "throttled"
+                metrics.increment("scrape.throttled")
+                self._record_scrape_failure(e)
+                logger.warning(f"Throttled while scraping {model_id}: {e}")
+                raise
             except TimeoutError as e:
                 ctx["error_type"] = "timeout"
+                metrics.increment("scrape.timeout")
+                self._record_scrape_failure(e)
                 ctx["timeout_ms"] = PAGE_NAVIGATION_TIMEOUT_MS
                 logger.error(f"Timeout while scraping {model_id} after {PAGE_NAVIGATION_TIMEOUT_MS / 1000:.1f}s: {e}")
                 return None, BotInfo(), f"Operation timed out after {PAGE_NAVIGATION_TIMEOUT_MS / 1000:.1f}s"
             except Exception as e:
                 ctx["error_type"] = type(e).__name__
                 ctx["error_message"] = str(e)
+                metrics.increment("scrape.error")
+                self._record_scrape_failure(e)
                 logger.error(f"Error while scraping {model_id}: {e}")
                 return None, BotInfo(), f"Error: {str(e)}"
 
-    def _load_existing_collection(self, force: bool) -> ModelCollection | None:
-        """Load existing model collection from disk if available.
+    @staticmethod
+    async def _check_throttled(response: Any, page: "Page") -> None:
+        """Raise RateLimitError if Poe answered with HTTP 429 or a Cloudflare challenge.
 
         Args:
-            force: If True, skip loading existing data
+            response: Navigation response from ``page.goto`` (None for same-document navigations)
+            page: The navigated page
+
+        Raises:
+            RateLimitError: If the page load was throttled
+        """
+        if response is not None:
+            if response.status == 429:
+                raise RateLimitError(f"HTTP 429 for {response.url}")
+            if response.headers.get("cf-mitigated") == "challenge":
+                raise RateLimitError(f"Cloudflare challenge for {response.url}")
+        if await page.title() in CLOUDFLARE_CHALLENGE_TITLES:
+            raise RateLimitError(f"Cloudflare challenge page at {page.url}")
+
+    @staticmethod
+    def _record_scrape_failure(error: Exception) -> None:
+        """Report a failed scrape to the shared circuit breaker, keyed by crash type."""
+        from .utils.crash_recovery import CrashDetector
+
+        crash_type = CrashDetector.detect_crash_type(error, "scrape_model")
+        if CrashDetector.is_recoverable(crash_type):
+            get_global_circuit_breaker().record_failure(crash_type.value)
+        else:
+            get_global_circuit_breaker().release_probes()
+
+    def _load_existing_collection(self) -> ModelCollection | None:
+        """Load existing model collection from disk if available.
 
         Returns:
-            Existing ModelCollection or None if not available/force=True
+            Existing ModelCollection or None if not available
         """
-        if not DATA_FILE_PATH.exists() or force:
+        if not DATA_FILE_PATH.exists():
             return None
 
         try:
-            with open(DATA_FILE_PATH) as f:
+            with DATA_FILE_PATH.open() as f:
                 collection_data = json.load(f)
-            collection = ModelCollection(**collection_data)
+            collection = ModelCollection(**collection_data).deduplicate()
             logger.info(f"Loaded {len(collection.data)} existing models")
             return collection
         except Exception as e:
             logger.warning(f"Failed to load existing data: {e}")
             return None
 
-    async def _fetch_and_parse_api_models(self) -> tuple[dict[str, Any], list[PoeModel]]:
-        """Fetch models from API and parse them into PoeModel instances.
+    async def _fetch_and_parse_api_models(
+        self, existing_collection: ModelCollection | None = None
+    ) -> tuple[JsonArrayStream, Iterator[PoeModel], set[str]] | None:
+        """Fetch models from API and stream them as PoeModel instances.
+
+        The response is parsed incrementally from disk; models are produced
+        lazily as the returned iterator is consumed (e.g. by ``_merge_models``).
+
+        Args:
+            existing_collection: Current on-disk collection. When given and the
+                API reports the model list unchanged, parsing is skipped.
 
         Returns:
-            Tuple of (raw_api_data, parsed_models)
+            Tuple of (stream, models, invalid_ids) where ``stream.meta`` holds the
+            top-level response fields and ``invalid_ids`` the IDs of skipped
+            invalid records once ``models`` is exhausted, or None if the model
+            list is unchanged and the existing collection can be reused as-is
         """
         logger.info("Fetching models from API...")
-        api_data = await self.fetch_models_from_api()
-        api_models = []
-
-        for model_dict in api_data["data"]:
-            # Ensure architecture is properly typed
-            model_data: dict[str, Any] = dict(model_dict)
-            if "architecture" in model_data and isinstance(model_data["architecture"], dict):
-                from .models import Architecture
-
-                model_data["architecture"] = Architecture(**model_data["architecture"])
-            api_models.append(PoeModel(**model_data))
+        body_path, unchanged = await self._request_models_body(conditional=existing_collection is not None)
+        if unchanged and existing_collection is not None:
+            return None
 
-        logger.info(f"Fetched {len(api_models)} models from API")
-        return api_data, api_models
+        stream = JsonArrayStream.from_path(body_path, "data")
+        invalid_ids: set[str] = set()
+        return stream, self._iter_api_models(stream, invalid_ids), invalid_ids
 
-    def _merge_models(self, api_models: list[PoeModel], existing_collection: ModelCollection | None) -> list[PoeModel]:
+    def _merge_models(
+        self,
+        api_models: Iterable[PoeModel],
+        existing_collection: ModelCollection | None,
+        invalid_ids: set[str] | None = None,
+        stored_collection: ModelCollection | None = None,
+    ) -> list[PoeModel]:
         """Merge API models with existing data, preserving scraped information.
 
+        A model whose API record failed validation is not treated as removed:
+        its stored entry is kept unchanged.
+
         Args:
-            api_models: Fresh models from API
-            existing_collection: Existing collection with scraped data
+            api_models: Fresh models from API (any iterable, consumed once)
+            existing_collection: Existing collection whose scraped data is preserved
+            invalid_ids: IDs of skipped invalid API records, complete once
+                ``api_models`` is exhausted
+            stored_collection: On-disk collection to keep entries with invalid
+                records from (default: ``existing_collection``)
 
         Returns:
             Merged list of models sorted by ID
         """
-        if not existing_collection:
-            return sorted(api_models, key=lambda x: x.id)
-
-        # Create lookup for existing models
-        existing_lookup = {model.id: model for model in existing_collection.data}
+        stored_collection = stored_collection or existing_collection
+        existing_lookup = {model.id: model for model in existing_collection.data} if existing_collection else {}
         api_model_ids = set()
         merged_models = []
 
@@ -575,6 +827,13 @@ class ModelUpdater:
 
             merged_models.append(api_model)
 
+        # A transiently malformed record must not erase a model's stored data
+        stored_lookup = {model.id: model for model in stored_collection.data} if stored_collection else {}
+        for kept_id in sorted((invalid_ids or set()) & (stored_lookup.keys() - api_model_ids)):
+            logger.warning(f"Keeping stored data for {kept_id}, its API record is invalid")
+            merged_models.append(stored_lookup[kept_id])
+            api_model_ids.add(kept_id)
+
         # Log removed models
         removed_ids = set(existing_lookup.keys()) - api_model_ids
         for removed_id in removed_ids:
@@ -615,7 +874,9 @@ class ModelUpdater:
 
         return models_to_update
 
-    async def _update_model_data(self, model: PoeModel, page: Page, update_info: bool, update_pricing: bool) -> None:
+    async def _update_model_data(
+        self, model: PoeModel, page: "Page", update_info: bool, update_pricing: bool
+    ) -> str | None:
         """Update a single model's pricing and/or bot info.
 
         Args:
@@ -623,8 +884,15 @@ class ModelUpdater:
             page: Browser page to use for scraping
             update_info: Whether to update bot info
             update_pricing: Whether to update pricing
+
+        Returns:
+            The scrape error message, or None if scraping succeeded
+
+        Raises:
+            RateLimitError: If Poe throttled the page load; the model is unchanged
         """
         pricing_data, bot_info, error = await self.scrape_model_info(model.id, page)
+        previous_fields = tracked_fields(model)
 
         # Update pricing if requested
         if update_pricing:
@@ -645,15 +913,25 @@ class ModelUpdater:
             else:
                 logger.warning(f"✗ No bot info found for {model.id}")
 
+        for field, change in field_changes(previous_fields, tracked_fields(model)).items():
+            logger.info(f"  {model.id} {field}: {change['old'] or '-'} → {change['new'] or '-'}")
+
+        return error
+
     async def _update_models_with_progress(
         self,
         models_to_update: list[PoeModel],
         update_info: bool,
         update_pricing: bool,
-        memory_monitor: MemoryManagedOperation,
-        pool: BrowserPool,
+        memory_monitor: "MemoryManagedOperation",
+        pool: "BrowserPool",
     ) -> None:
-        """Update models with progress tracking and memory management.
+        """Update models with concurrent workers, progress tracking and memory management.
+
+        The number of workers running at once, and the pool size with it, is
+        adjusted during the run by an ``AdaptiveConcurrency`` controller fed
+        with each model's latency and outcome. Models that get throttled are
+        left unchanged.
 
         Args:
             models_to_update: List of models to update
@@ -662,35 +940,93 @@ class ModelUpdater:
             memory_monitor: Memory management context
             pool: Browser connection pool
         """
+        controller = AdaptiveConcurrency(initial=pool.max_size)
+        pending = deque(models_to_update)
+        breaker = get_global_circuit_breaker()
+        metrics = get_metrics_registry()
+        models_processed = 0
+        stopped = False
+
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
+            TextColumn("workers {task.fields[workers]}/{task.fields[target]}"),
             TimeElapsedColumn(),
         ) as progress:
-            task = progress.add_task("Updating models...", total=len(models_to_update))
-            models_processed = 0
-
-            for model in models_to_update:
-                progress.update(task, description=f"Updating {model.id}...")
-
-                # Use browser pool for each model
-                async with pool.acquire_page() as page:
-                    await self._update_model_data(model, page, update_info, update_pricing)
-
-                # Track progress and memory usage
-                models_processed += 1
-                memory_monitor.increment_operation_count()
-
-                # Periodic memory monitoring (every 10 models)
-                if models_processed % 10 == 0:
-                    memory_monitor.log_memory_status(f"processed_{models_processed}_models")
+            task = progress.add_task(
+                "Updating models...", total=len(models_to_update), workers=0, target=controller.limit
+            )
 
-                    # Force cleanup if memory is getting high
-                    if memory_monitor.should_run_cleanup():
-                        logger.info(f"Running memory cleanup after processing {models_processed} models")
-                        await memory_monitor.cleanup_memory()
+            def show_concurrency() -> None:
+                progress.update(task, workers=controller.in_flight, target=controller.limit)
+
+            async def worker() -> None:
+                nonlocal models_processed, stopped
+
+                while pending and not stopped:
+                    await controller.acquire()
+                    if not pending or stopped:
+                        await controller.cancel()
+                        return
+                    model = pending.popleft()
+                    progress.update(task, description=f"Updating {model.id}...")
+                    show_concurrency()
+
+                    # Pause every worker while a circuit is open; stop once it keeps tripping
+                    try:
+                        await breaker.guard(f"update_{model.id}")
+                    except CircuitOpenError as e:
+                        if not stopped:
+                            stopped = True
+                            logger.error(
+                                f"Stopping update, {len(models_to_update) - models_processed} models "
+                                f"left unchanged: {e}"
+                            )
+                        await controller.cancel()
+                        return
+
+                    # Keep one pooled browser connection per allowed worker
+                    await pool.resize(controller.limit)
+                    start = time.monotonic()
+                    outcome = OUTCOME_SUCCESS
+                    try:
+                        with metrics.time("update.model"):
+                            # Concurrent workers each need their own page in the logged-in context
+                            async with pool.acquire_page(reuse_session=False) as page:
+                                error = await self._update_model_data(model, page, update_info, update_pricing)
+                        if error is not None:
+                            outcome = OUTCOME_TIMEOUT if _is_timeout_error(error) else OUTCOME_ERROR
+                    except RateLimitError as e:
+                        outcome = OUTCOME_THROTTLED
+                        logger.warning(f"Throttled while scraping {model.id}, leaving it unchanged: {e}")
+                    finally:
+                        await controller.release(time.monotonic() - start, outcome)
+                        show_concurrency()
+
+                    # Track progress and memory usage
+                    models_processed += 1
+                    memory_monitor.increment_operation_count()
+
+                    # Periodic memory monitoring (every 10 models)
+                    if models_processed % 10 == 0:
+                        memory_monitor.log_memory_status(f"processed_{models_processed}_models")
+
+                        # Force cleanup if memory is getting high
+                        if memory_monitor.should_run_cleanup():
+                            logger.info(f"Running memory cleanup after processing {models_processed} models")
+                            await memory_monitor.cleanup_memory()
+
+                    progress.advance(task)
+
+            workers = [asyncio.create_task(worker()) for _ in range(controller.maximum)]
+            try:
+                await asyncio.gather(*workers)
+            finally:
+                for task_ in workers:
+                    task_.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
 
-                progress.advance(task)
+        logger.info(f"Scraping concurrency: {controller.get_stats()}")
 
     async def sync_models(
         self, force: bool = False, update_info: bool = True, update_pricing: bool = True
@@ -699,8 +1035,9 @@ class ModelUpdater:
 
         This method coordinates the entire model synchronization process:
         1. Loads existing data if available
-        2. Fetches fresh models from API
-        3. Merges API data with existing scraped data
+        2. Fetches fresh models from API (conditional request)
+        3. Merges API data with existing scraped data, skipped when the
+           API reports the model list unchanged
         4. Updates models that need new pricing/bot info
 
         Args:
@@ -708,35 +1045,55 @@ class ModelUpdater:
             update_info: Update bot info (creator, description)
             update_pricing: Update pricing information
 
+        The differences against the previous data file are left in
+        ``last_change_set``.
+
         Returns:
             Updated ModelCollection with all models
         """
-        # Load existing data
-        existing_collection = self._load_existing_collection(force)
+        # Load existing data; with force it only serves as the change set baseline
+        stored_collection = existing_collection = self._load_existing_collection()
+        previous_fields = (
+            {model.id: tracked_fields(model) for model in existing_collection.data} if existing_collection else {}
+        )
+        if force:
+            existing_collection = None
 
         # Fetch fresh models from API
-        api_data, api_models = await self._fetch_and_parse_api_models()
+        parsed = await self._fetch_and_parse_api_models(existing_collection)
 
-        # Merge with existing data
-        merged_models = self._merge_models(api_models, existing_collection)
+        if parsed is None and existing_collection is not None:
+            # Model list unchanged: reuse existing data without parsing or merging
+            logger.info("Skipping model merge, API model list is unchanged")
+            collection = existing_collection
+        else:
+            assert parsed is not None
+            stream, api_models, invalid_ids = parsed
 
-        # Create collection
-        collection = ModelCollection(object=api_data["object"], data=merged_models)
+            # Merge streamed models with existing data
+            merged_models = self._merge_models(api_models, existing_collection, invalid_ids, stored_collection)
+
+            # Create collection
+            collection = ModelCollection(object=stream.meta["object"], data=merged_models)
 
         # Determine which models need updates
         models_to_update = self._get_models_to_update(collection, force, update_info, update_pricing)
 
         if not models_to_update:
             logger.info("No models need updates")
+            self._record_change_set(previous_fields, collection)
             return collection
 
         logger.info(f"Found {len(models_to_update)} models to update")
 
+        from .browser_pool import get_global_pool
+        from .utils.memory import MemoryManagedOperation
+
         # Use memory management for the entire update operation
         async with MemoryManagedOperation(f"sync_{len(models_to_update)}_models") as memory_monitor:
             # Get the browser pool for better performance
             pool = await get_global_pool(
-                max_size=3,  # Allow up to 3 concurrent browser connections
+                max_size=SCRAPE_CONCURRENCY_INITIAL,  # Resized during the run with the worker count
                 debug_port=self.debug_port,
                 verbose=self.verbose,
             )
@@ -752,8 +1109,18 @@ class ModelUpdater:
             stats = await pool.get_stats()
             logger.debug(f"Browser pool stats: {stats}")
 
+        self._record_change_set(previous_fields, collection)
         return collection
 
+    def _record_change_set(self, previous_fields: dict[str, dict[str, str]], collection: ModelCollection) -> None:
+        """Diff the synced collection against the previous data and keep the result."""
+        change_set = compute_change_set(previous_fields, collection.data)
+        self.last_change_set = change_set
+        logger.info(
+            f"Changes: {len(change_set['added'])} added, {len(change_set['removed'])} removed, "
+            f"{len(change_set['changed'])} changed"
+        )
+
     async def update_all(self, force: bool = False, update_info: bool = True, update_pricing: bool = True) -> None:
         """Update model data and save to file.
 
@@ -767,12 +1134,24 @@ class ModelUpdater:
         # Ensure data directory exists
         DATA_FILE_PATH.parent.mkdir(parents=True, exist_ok=True)
 
-        # Save to file
-        with open(DATA_FILE_PATH, "w") as f:
+        # Save to file atomically so readers and auto-reload watchers never see a partial write
+        tmp_path = DATA_FILE_PATH.with_suffix(".json.tmp")
+        with tmp_path.open("w") as f:
             json.dump(collection.dict(), f, indent=2, ensure_ascii=False, default=str)
+        tmp_path.replace(DATA_FILE_PATH)
 
         logger.info(f"✓ Saved {len(collection.data)} models to {DATA_FILE_PATH}")
 
+        # Data is safely on disk; persist the validators that describe it
+        get_validator_store().commit(POE_API_URL)
+
+        try:
+            changes = get_pricing_history().record_snapshot(collection.data)
+            logger.info(f"Recorded {changes} pricing/bot info changes in history")
+        except Exception as e:
+            # History is best effort; the data file is already saved
+            logger.warning(f"Failed to record pricing history: {e}")
+
     async def get_account_balance(self) -> dict[str, Any]:
         """Get Poe account balance using stored session cookies.
 
@@ -787,7 +1166,7 @@ class ModelUpdater:
             api_key=self.api_key,
         )
 
-    async def extract_cookies_from_browser(self, page: Page) -> dict[str, str]:
+    async def extract_cookies_from_browser(self, page: "Page") -> dict[str, str]:
         """Extract Poe cookies from an active browser session.
 
         This is designed to work with PlaywrightAuthor's browser session.
@@ -806,6 +1185,8 @@ class ModelUpdater:
         Returns:
             Dictionary of extracted cookies after successful login
         """
+        from .browser_pool import get_global_pool
+
         # Get a browser from the pool for login
         pool = await get_global_pool(max_size=1, debug_port=self.debug_port, verbose=self.verbose)
 
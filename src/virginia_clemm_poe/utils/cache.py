@@ -392,22 +392,23 @@ async def cleanup_all_caches() -> dict[str, int]:
     return results
 
 
-async def get_all_cache_stats() -> dict[str, dict[str, Any]]:
-    """Get statistics for all cache instances.
+def get_cache_instances() -> dict[str, Cache]:
+    """Get the cache instances created so far, without creating new ones.
 
     Returns:
-        Dictionary with stats for each cache
+        Dictionary mapping cache name ("global", "api", "scraping") to its Cache
     """
-    stats = {}
+    caches = {"global": _global_cache, "api": _api_cache, "scraping": _scraping_cache}
+    return {name: cache for name, cache in caches.items() if cache is not None}
 
-    if _global_cache:
-        stats["global"] = _global_cache.get_stats()
 
-    if _api_cache:
-        stats["api"] = _api_cache.get_stats()
+async def get_all_cache_stats() -> dict[str, dict[str, Any]]:
+    """Get statistics for all cache instances.
 
-    if _scraping_cache:
-        stats["scraping"] = _scraping_cache.get_stats()
+    Returns:
+        Dictionary with stats for each cache
+    """
+    stats = {name: cache.get_stats() for name, cache in get_cache_instances().items()}
 
     # Log cache performance metrics
     for cache_name, cache_stats in stats.items():
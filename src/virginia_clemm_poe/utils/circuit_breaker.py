@@ -0,0 +1,280 @@
+# this_file: src/virginia_clemm_poe/utils/circuit_breaker.py
+"""Shared circuit breaker for browser and HTTP failures.
+
+Retries handle a flaky page or request. They make things worse when Poe
+starts rate-limiting or Chrome is wedged: every model then spends its full
+retry budget. The circuit breaker tracks failures by class (the values of
+``CrashType``) across all callers:
+
+    closed      Calls run normally. CIRCUIT_FAILURE_THRESHOLD consecutive
+                failures of one class within CIRCUIT_WINDOW_SECONDS open it.
+    open        ``guard()`` pauses callers until a jittered cooldown has
+                passed. After CIRCUIT_MAX_TRIPS failed probes, callers get
+                ``CircuitOpenError`` immediately instead of waiting.
+    half-open   One caller is let through as a probe. Success closes the
+                circuit; failure reopens it with a longer cooldown.
+
+Only recoverable failures are recorded; an expired cookie or a 4xx answer
+says nothing about Poe's health. Callers can pass the failure classes that
+concern them to ``guard()`` so, for example, a crashed browser does not
+block plain HTTP requests.
+
+Cooldowns grow with decorrelated jitter, so separate processes sharing a
+rate limit do not probe in lockstep.
+
+Example:
+    ```python
+    breaker = get_global_circuit_breaker()
+    await breaker.guard("scrape_model")
+    try:
+        result = await scrape()
+    except Exception as e:
+        crash_type = CrashDetector.detect_crash_type(e)
+        if CrashDetector.is_recoverable(crash_type):
+            breaker.record_failure(crash_type.value)
+        else:
+            breaker.release_probes()
+        raise
+    breaker.record_success()
+    ```
+"""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Collection
+from enum import Enum
+from typing import Any
+
+from loguru import logger
+
+from ..config import (
+    CIRCUIT_COOLDOWN_SECONDS,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_MAX_COOLDOWN_SECONDS,
+    CIRCUIT_MAX_TRIPS,
+    CIRCUIT_WINDOW_SECONDS,
+)
+from ..exceptions import CircuitOpenError
+from .metrics import get_metrics_registry
+from .timeout import decorrelated_jitter
+
+# How often callers waiting on a half-open probe check for its outcome
+PROBE_POLL_SECONDS = 0.1
+
+
+class CircuitState(Enum):
+    """States of a circuit."""
+
+    CLOSED = "closed"  # Calls run normally
+    OPEN = "open"  # Calls wait for the cooldown or fail fast
+    HALF_OPEN = "half_open"  # One probe call is in flight
+
+
+class Circuit:
+    """Failure history and state for one failure class."""
+
+    def __init__(self, failure_class: str):
+        """Initialize a closed circuit.
+
+        Args:
+            failure_class: Failure class this circuit tracks
+        """
+        self.failure_class = failure_class
+        self.state = CircuitState.CLOSED
+        self.failures: deque[float] = deque()
+        self.trips = 0
+        self.cooldown = 0.0
+        self.open_until = 0.0
+        self.probe_started = 0.0
+
+
+class CircuitBreaker:
+    """Circuit breaker keyed by failure class, shared by all workers."""
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        window_seconds: float = CIRCUIT_WINDOW_SECONDS,
+        base_cooldown: float = CIRCUIT_COOLDOWN_SECONDS,
+        max_cooldown: float = CIRCUIT_MAX_COOLDOWN_SECONDS,
+        max_trips: int = CIRCUIT_MAX_TRIPS,
+    ):
+        """Initialize the circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures of one class that open its circuit
+            window_seconds: Failures older than this are forgotten
+            base_cooldown: Base time an open circuit waits before a probe
+            max_cooldown: Upper bound for the jittered cooldown
+            max_trips: Failed probes after which callers fail fast
+        """
+        self.failure_threshold = failure_threshold
+        self.window_seconds = window_seconds
+        self.base_cooldown = base_cooldown
+        self.max_cooldown = max_cooldown
+        self.max_trips = max_trips
+        self._circuits: dict[str, Circuit] = {}
+
+    def _blocking_circuit(self, classes: Collection[str] | None = None) -> Circuit | None:
+        """Get the circuit that blocks calls, preferring the one open longest.
+
+        Args:
+            classes: Failure classes to consider, or None for all of them
+        """
+        blocking = [
+            circuit
+            for circuit in self._circuits.values()
+            if circuit.state is not CircuitState.CLOSED and (classes is None or circuit.failure_class in classes)
+        ]
+        return max(blocking, key=lambda circuit: circuit.open_until, default=None)
+
+    def is_open(self, classes: Collection[str] | None = None) -> bool:
+        """Check whether any circuit is open or half-open.
+
+        Args:
+            classes: Failure classes to consider, or None for all of them
+        """
+        return self._blocking_circuit(classes) is not None
+
+    async def guard(self, operation_name: str = "operation", classes: Collection[str] | None = None) -> None:
+        """Wait until calls are allowed.
+
+        Returns immediately while the relevant circuits are closed. While one
+        is open, waits for its cooldown and then either becomes the half-open
+        probe or waits for the probe's outcome.
+
+        Args:
+            operation_name: Name of the calling operation for logging
+            classes: Failure classes that concern the caller, or None for all of them
+
+        Raises:
+            CircuitOpenError: If the circuit has tripped CIRCUIT_MAX_TRIPS times
+                and is still cooling down
+        """
+        while (circuit := self._blocking_circuit(classes)) is not None:
+            now = time.monotonic()
+
+            if circuit.state is CircuitState.OPEN:
+                if now >= circuit.open_until:
+                    circuit.state = CircuitState.HALF_OPEN
+                    circuit.probe_started = now
+                    logger.info(f"Circuit {circuit.failure_class} half-open, probing with {operation_name}")
+                    return
+                retry_after = circuit.open_until - now
+                if circuit.trips >= self.max_trips:
+                    get_metrics_registry().increment(f"circuit.{circuit.failure_class}.rejected")
+                    raise CircuitOpenError(
+                        f"{operation_name} rejected: {circuit.failure_class} circuit open after "
+                        f"{circuit.trips} trips, retry in {retry_after:.0f}s",
+                        circuit.failure_class,
+                        retry_after,
+                    )
+                await asyncio.sleep(retry_after)
+                continue
+
+            # Half-open: wait for the probe, or replace a probe that never reported back
+            if now - circuit.probe_started >= self.window_seconds:
+                circuit.probe_started = now
+                return
+            await asyncio.sleep(PROBE_POLL_SECONDS)
+
+    def record_failure(self, failure_class: str) -> None:
+        """Record a failed call.
+
+        Args:
+            failure_class: Class of the failure, e.g. ``CrashType.value``
+        """
+        circuit = self._circuits.setdefault(failure_class, Circuit(failure_class))
+        now = time.monotonic()
+
+        if circuit.state is CircuitState.HALF_OPEN:
+            self._open(circuit, now)
+            return
+        if circuit.state is CircuitState.OPEN:
+            # Calls that started before the circuit opened
+            return
+
+        circuit.failures.append(now)
+        while circuit.failures and now - circuit.failures[0] > self.window_seconds:
+            circuit.failures.popleft()
+        if len(circuit.failures) >= self.failure_threshold:
+            self._open(circuit, now)
+
+    def record_success(self) -> None:
+        """Record a successful call, closing half-open circuits and resetting failure counts."""
+        for circuit in self._circuits.values():
+            circuit.failures.clear()
+            if circuit.state is CircuitState.HALF_OPEN:
+                circuit.state = CircuitState.CLOSED
+                circuit.trips = 0
+                circuit.cooldown = 0.0
+                logger.info(f"Circuit {circuit.failure_class} closed after a successful probe")
+
+    def release_probes(self) -> None:
+        """Let a waiting caller probe again after a call ended without a verdict.
+
+        A call that fails with a non-recoverable error says nothing about the
+        circuit it may have been probing. Half-open circuits go back to open
+        with their cooldown already over, instead of making waiters poll until
+        the probe is presumed lost.
+        """
+        now = time.monotonic()
+        for circuit in self._circuits.values():
+            if circuit.state is CircuitState.HALF_OPEN:
+                circuit.state = CircuitState.OPEN
+                circuit.open_until = now
+
+    def _open(self, circuit: Circuit, now: float) -> None:
+        """Open a circuit with a longer, jittered cooldown."""
+        circuit.trips += 1
+        circuit.cooldown = decorrelated_jitter(circuit.cooldown, self.base_cooldown, self.max_cooldown)
+        circuit.open_until = now + circuit.cooldown
+        circuit.state = CircuitState.OPEN
+        circuit.failures.clear()
+        get_metrics_registry().increment(f"circuit.{circuit.failure_class}.opened")
+        logger.warning(
+            f"Circuit {circuit.failure_class} open (trip {circuit.trips}), pausing calls for {circuit.cooldown:.1f}s"
+        )
+
+    def reset(self) -> None:
+        """Close all circuits and forget their history."""
+        self._circuits.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get the state of every circuit that has seen failures.
+
+        Returns:
+            Dictionary mapping failure class to state, trips, recent failures
+            and seconds until an open circuit admits a probe
+        """
+        now = time.monotonic()
+        return {
+            failure_class: {
+                "state": circuit.state.value,
+                "trips": circuit.trips,
+                "recent_failures": len(circuit.failures),
+                "retry_after_seconds": max(circuit.open_until - now, 0.0)
+                if circuit.state is CircuitState.OPEN
+                else 0.0,
+            }
+            for failure_class, circuit in self._circuits.items()
+        }
+
+
+# Global circuit breaker instance
+_global_breaker: CircuitBreaker | None = None
+
+
+def get_global_circuit_breaker() -> CircuitBreaker:
+    """Get or create the global circuit breaker.
+
+    Returns:
+        The global circuit breaker instance
+    """
+    global _global_breaker
+
+    if _global_breaker is None:
+        _global_breaker = CircuitBreaker()
+
+    return _global_breaker
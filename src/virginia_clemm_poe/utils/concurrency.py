@@ -0,0 +1,179 @@
+# this_file: src/virginia_clemm_poe/utils/concurrency.py
+"""Adaptive concurrency control for scraping workers.
+
+A fixed number of workers is either too timid on a fast machine or too
+aggressive while Poe throttles us. ``AdaptiveConcurrency`` adjusts the
+number of workers allowed to run at once with AIMD (additive increase,
+multiplicative decrease), the scheme TCP uses for its congestion window:
+
+    - A throttled response (HTTP 429 or a Cloudflare challenge) halves the
+      limit immediately, at most once per round.
+    - At the end of each round (as many completions as the limit allows),
+      a round without throttling halves the limit if the timeout rate or the
+      median latency exceeds its target, and raises it by one otherwise.
+
+Workers call ``acquire()`` before each unit of work and ``release()`` with its
+latency and outcome afterwards.
+
+Example:
+    ```python
+    controller = AdaptiveConcurrency(initial=3, maximum=8)
+    await controller.acquire()
+    start = time.monotonic()
+    try:
+        outcome = await scrape()
+    finally:
+        await controller.release(time.monotonic() - start, outcome)
+    ```
+"""
+
+import asyncio
+import statistics
+from typing import Any
+
+from loguru import logger
+
+from ..config import (
+    SCRAPE_CONCURRENCY_INITIAL,
+    SCRAPE_CONCURRENCY_MAX,
+    SCRAPE_CONCURRENCY_MIN,
+    SCRAPE_LATENCY_TARGET_SECONDS,
+    SCRAPE_TIMEOUT_RATE_LIMIT,
+)
+from .metrics import get_metrics_registry
+
+# Outcomes reported to release()
+OUTCOME_SUCCESS = "success"
+OUTCOME_TIMEOUT = "timeout"
+OUTCOME_THROTTLED = "throttled"
+OUTCOME_ERROR = "error"
+
+
+class AdaptiveConcurrency:
+    """AIMD limit on concurrently running workers, driven by latency, timeouts and throttling."""
+
+    def __init__(
+        self,
+        initial: int = SCRAPE_CONCURRENCY_INITIAL,
+        minimum: int = SCRAPE_CONCURRENCY_MIN,
+        maximum: int = SCRAPE_CONCURRENCY_MAX,
+        latency_target: float = SCRAPE_LATENCY_TARGET_SECONDS,
+        timeout_rate_limit: float = SCRAPE_TIMEOUT_RATE_LIMIT,
+        decrease_factor: float = 0.5,
+    ):
+        """Initialize the controller.
+
+        Args:
+            initial: Starting limit
+            minimum: Smallest limit
+            maximum: Largest limit
+            latency_target: Median latency per unit of work above which the limit drops
+            timeout_rate_limit: Fraction of timeouts per round above which the limit drops
+            decrease_factor: Factor applied to the limit on a decrease
+        """
+        self.minimum = minimum
+        self.maximum = maximum
+        self.limit = max(minimum, min(initial, maximum))
+        self.latency_target = latency_target
+        self.timeout_rate_limit = timeout_rate_limit
+        self.decrease_factor = decrease_factor
+        self.in_flight = 0
+        self.increases = 0
+        self.decreases = 0
+        self._condition = asyncio.Condition()
+        self._round_completions = 0
+        self._round_latencies: list[float] = []
+        self._round_timeouts = 0
+        self._throttled_this_round = False
+
+    async def acquire(self) -> None:
+        """Wait until fewer than ``limit`` workers are running, then claim a slot."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+
+    async def release(self, latency: float, outcome: str = OUTCOME_SUCCESS) -> None:
+        """Free a slot and feed the unit of work's result to the controller.
+
+        Args:
+            latency: Seconds the unit of work took
+            outcome: One of the ``OUTCOME_*`` constants
+        """
+        async with self._condition:
+            self.in_flight = max(self.in_flight - 1, 0)
+            self._round_completions += 1
+
+            if outcome == OUTCOME_THROTTLED:
+                # Workers started under the old limit may report throttling too; react once per round
+                if not self._throttled_this_round:
+                    self._decrease("throttled")
+                    self._throttled_this_round = True
+            else:
+                self._round_latencies.append(latency)
+                self._round_timeouts += outcome == OUTCOME_TIMEOUT
+
+            if self._round_completions >= self.limit:
+                self._end_round()
+
+            self._condition.notify_all()
+
+    async def cancel(self) -> None:
+        """Free a slot without reporting a result, e.g. when no work was left."""
+        async with self._condition:
+            self.in_flight = max(self.in_flight - 1, 0)
+            self._condition.notify_all()
+
+    def _end_round(self) -> None:
+        """Adjust the limit from the round's throttling, timeout rate and median latency."""
+        timeout_rate = self._round_timeouts / self._round_completions
+        median_latency = statistics.median(self._round_latencies) if self._round_latencies else 0.0
+
+        if self._throttled_this_round:
+            # Already decreased during this round; give the new limit a full round
+            self._start_round()
+        elif timeout_rate > self.timeout_rate_limit:
+            self._decrease(f"timeout rate {timeout_rate:.0%}")
+        elif median_latency > self.latency_target:
+            self._decrease(f"median latency {median_latency:.1f}s")
+        else:
+            self._set_limit(self.limit + 1, "healthy round")
+
+    def _decrease(self, reason: str) -> None:
+        """Cut the limit multiplicatively."""
+        self._set_limit(int(self.limit * self.decrease_factor), reason)
+
+    def _set_limit(self, limit: int, reason: str) -> None:
+        """Clamp and apply a new limit, starting a new round."""
+        limit = max(self.minimum, min(limit, self.maximum))
+        if limit > self.limit:
+            self.increases += 1
+            get_metrics_registry().increment("concurrency.increase")
+            logger.debug(f"Raising concurrency {self.limit} → {limit} ({reason})")
+        elif limit < self.limit:
+            self.decreases += 1
+            get_metrics_registry().increment("concurrency.decrease")
+            logger.info(f"Lowering concurrency {self.limit} → {limit} ({reason})")
+        self.limit = limit
+        self._start_round()
+
+    def _start_round(self) -> None:
+        """Forget the current round's observations."""
+        self._round_completions = 0
+        self._round_latencies = []
+        self._round_timeouts = 0
+        self._throttled_this_round = False
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get the controller state.
+
+        Returns:
+            Dictionary with the running workers, the limit and adjustment counts
+        """
+        return {
+            "in_flight": self.in_flight,
+            "limit": self.limit,
+            "minimum": self.minimum,
+            "maximum": self.maximum,
+            "increases": self.increases,
+            "decreases": self.decreases,
+        }
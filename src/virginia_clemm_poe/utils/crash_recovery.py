@@ -2,8 +2,12 @@
 """Browser crash recovery utilities for Virginia Clemm Poe.
 
 This module provides utilities for detecting and recovering from browser crashes
-with exponential backoff and automatic retry mechanisms. It ensures resilient
+with jittered exponential backoff and automatic retry mechanisms. It ensures resilient
 operation even when browser instances become unresponsive or crash.
+
+Recovery attempts pass through a shared ``CircuitBreaker`` keyed by crash type,
+so sustained failures pause all workers instead of each one spending its full
+retry budget.
 """
 
 import asyncio
@@ -19,9 +23,18 @@ from ..config import (
     EXPONENTIAL_BACKOFF_MULTIPLIER,
     MAX_RETRIES,
     RETRY_DELAY_SECONDS,
+    RETRY_MAX_DELAY_SECONDS,
+)
+from ..exceptions import (
+    AuthenticationError,
+    BrowserManagerError,
+    CDPConnectionError,
+    CircuitOpenError,
+    RateLimitError,
 )
-from ..exceptions import BrowserManagerError, CDPConnectionError
 from ..utils.logger import log_performance_metric
+from .circuit_breaker import CircuitBreaker, get_global_circuit_breaker
+from .timeout import decorrelated_jitter
 
 T = TypeVar("T")
 
@@ -35,9 +48,16 @@ class CrashType(Enum):
     CONTEXT_INVALID = "context_invalid"  # Browser context invalid
     TIMEOUT_ERROR = "timeout_error"  # Operation timed out
     NETWORK_ERROR = "network_error"  # Network connectivity issues
+    RATE_LIMITED = "rate_limited"  # Poe answered HTTP 429
     UNKNOWN_ERROR = "unknown_error"  # Other unidentified errors
 
 
+# Failure classes that also concern plain HTTP requests to Poe; browser crashes do not
+HTTP_FAILURE_CLASSES = frozenset(
+    {CrashType.RATE_LIMITED.value, CrashType.NETWORK_ERROR.value, CrashType.TIMEOUT_ERROR.value}
+)
+
+
 class CrashInfo:
     """Information about a browser crash or failure."""
 
@@ -80,6 +100,11 @@ class CrashDetector:
         """
         error_msg = str(error).lower()
 
+        # Check for rate limiting and client errors, including httpx.HTTPStatusError responses
+        api_crash_type = CrashDetector._detect_api_crash_type(error)
+        if api_crash_type is not None:
+            return api_crash_type
+
         # Check for specific Playwright errors
         if isinstance(error, PlaywrightError):
             if "target closed" in error_msg or "connection closed" in error_msg:
@@ -114,6 +139,26 @@ class CrashDetector:
 
         return CrashType.UNKNOWN_ERROR
 
+    @staticmethod
+    def _detect_api_crash_type(error: Exception) -> CrashType | None:
+        """Classify rate limits and client errors from Poe's answer.
+
+        Rejected credentials and 4xx answers other than 429 will not go away
+        on retry, so they are never counted as a recoverable failure class.
+
+        Args:
+            error: The exception that occurred
+
+        Returns:
+            The detected crash type, or None if the error carries no API answer
+        """
+        status_code = getattr(getattr(error, "response", None), "status_code", None)
+        if isinstance(error, RateLimitError) or status_code == 429:
+            return CrashType.RATE_LIMITED
+        if isinstance(error, AuthenticationError) or (isinstance(status_code, int) and 400 <= status_code < 500):
+            return CrashType.UNKNOWN_ERROR
+        return None
+
     @staticmethod
     def is_recoverable(crash_type: CrashType) -> bool:
         """Check if a crash type is recoverable.
@@ -131,45 +176,48 @@ class CrashDetector:
             CrashType.CONTEXT_INVALID,
             CrashType.TIMEOUT_ERROR,
             CrashType.NETWORK_ERROR,
+            CrashType.RATE_LIMITED,
         }
         return crash_type in recoverable_types
 
 
 class CrashRecovery:
-    """Manages crash recovery with exponential backoff."""
+    """Manages crash recovery with jittered exponential backoff and a circuit breaker."""
 
     def __init__(
         self,
         max_retries: int = MAX_RETRIES,
         base_delay: float = RETRY_DELAY_SECONDS,
         backoff_multiplier: float = EXPONENTIAL_BACKOFF_MULTIPLIER,
-        max_delay: float = 60.0,
+        max_delay: float = RETRY_MAX_DELAY_SECONDS,
+        circuit_breaker: CircuitBreaker | None = None,
     ):
         """Initialize crash recovery manager.
 
         Args:
             max_retries: Maximum number of recovery attempts
             base_delay: Base delay between retries in seconds
-            backoff_multiplier: Multiplier for exponential backoff
+            backoff_multiplier: Growth factor of the decorrelated jitter bound
             max_delay: Maximum delay between retries
+            circuit_breaker: Breaker gating every attempt (None disables it)
         """
         self.max_retries = max_retries
         self.base_delay = base_delay
         self.backoff_multiplier = backoff_multiplier
         self.max_delay = max_delay
+        self.circuit_breaker = circuit_breaker
         self.crash_history: list[CrashInfo] = []
 
-    def get_delay(self, attempt: int) -> float:
-        """Calculate delay for a given attempt with exponential backoff.
+    def get_delay(self, previous_delay: float = 0.0) -> float:
+        """Calculate the next retry delay with decorrelated jitter.
 
         Args:
-            attempt: The attempt number (0-indexed)
+            previous_delay: The previous delay (0 before the first retry)
 
         Returns:
             Delay in seconds
         """
-        delay = self.base_delay * (self.backoff_multiplier**attempt)
-        return min(delay, self.max_delay)
+        return decorrelated_jitter(previous_delay, self.base_delay, self.max_delay, self.backoff_multiplier)
 
     def record_crash(self, crash_info: CrashInfo) -> None:
         """Record a crash in the history.
@@ -198,7 +246,13 @@ class CrashRecovery:
         )
 
     async def _execute_attempt(
-        self, func: Callable[..., Awaitable[T]], attempt: int, operation_name: str, *args: Any, **kwargs: Any
+        self,
+        func: Callable[..., Awaitable[T]],
+        attempt: int,
+        operation_name: str,
+        delay: float,
+        *args: Any,
+        **kwargs: Any,
     ) -> T:
         """Execute a single attempt of the function.
 
@@ -206,6 +260,7 @@ class CrashRecovery:
             func: Function to execute
             attempt: Current attempt number (0-indexed)
             operation_name: Name of the operation
+            delay: Seconds to wait before a retry
             *args: Function arguments
             **kwargs: Function keyword arguments
 
@@ -213,12 +268,17 @@ class CrashRecovery:
             Function result
         """
         if attempt > 0:
-            delay = self.get_delay(attempt - 1)
             logger.info(f"Attempting recovery for {operation_name} (attempt {attempt + 1}) after {delay:.1f}s delay")
             await asyncio.sleep(delay)
 
+        if self.circuit_breaker is not None:
+            await self.circuit_breaker.guard(operation_name)
+
         result = await func(*args, **kwargs)
 
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record_success()
+
         if attempt > 0:
             logger.info(f"Successfully recovered {operation_name} on attempt {attempt + 1}")
             log_performance_metric("browser_recovery_success", attempt + 1, "attempts", {"operation": operation_name})
@@ -246,8 +306,13 @@ class CrashRecovery:
         # Check if this type of crash is recoverable
         if not CrashDetector.is_recoverable(crash_type):
             logger.error(f"Non-recoverable crash in {operation_name}: {crash_info}")
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.release_probes()
             raise exception
 
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record_failure(crash_type.value)
+
         return crash_info
 
     async def _run_cleanup(self, cleanup_func: Callable[[], Awaitable[None]] | None, operation_name: str) -> None:
@@ -264,16 +329,16 @@ class CrashRecovery:
             except Exception as cleanup_error:
                 logger.warning(f"Cleanup failed for {operation_name}: {cleanup_error}")
 
-    def _log_retry_attempt(self, crash_info: CrashInfo, attempt: int, operation_name: str) -> None:
+    def _log_retry_attempt(self, crash_info: CrashInfo, attempt: int, operation_name: str, delay: float) -> None:
         """Log retry attempt with delay information.
 
         Args:
             crash_info: Information about the crash
             attempt: Current attempt number (0-indexed)
             operation_name: Name of the operation
+            delay: Seconds until the next attempt
         """
         if attempt < self.max_retries:
-            delay = self.get_delay(attempt)
             logger.warning(
                 f"Recoverable crash in {operation_name} (attempt {attempt + 1}): {crash_info}. "
                 f"Will retry in {delay:.1f}s"
@@ -289,7 +354,10 @@ class CrashRecovery:
         *args: Any,
         **kwargs: Any,
     ) -> T:
-        """Recover from crashes with exponential backoff.
+        """Recover from crashes with jittered exponential backoff.
+
+        Every attempt first passes the circuit breaker, which pauses it while
+        the circuit is open and fails it fast once the circuit keeps tripping.
 
         Args:
             func: The async function to execute with recovery
@@ -302,14 +370,18 @@ class CrashRecovery:
             Result of the function
 
         Raises:
+            CircuitOpenError: If the circuit breaker fails the operation fast
             The last exception if all recovery attempts fail
         """
         last_exception: Exception | None = None
+        delay = 0.0
 
         for attempt in range(self.max_retries + 1):
             try:
-                return await self._execute_attempt(func, attempt, operation_name, *args, **kwargs)
+                return await self._execute_attempt(func, attempt, operation_name, delay, *args, **kwargs)
 
+            except CircuitOpenError:
+                raise
             except Exception as e:
                 last_exception = e
                 crash_info = self._handle_crash(e, operation_name, attempt)
@@ -318,7 +390,8 @@ class CrashRecovery:
                 await self._run_cleanup(cleanup_func, operation_name)
 
                 # Log retry attempt
-                self._log_retry_attempt(crash_info, attempt, operation_name)
+                delay = self.get_delay(delay)
+                self._log_retry_attempt(crash_info, attempt, operation_name, delay)
 
         # If we get here, all attempts failed
         if last_exception:
@@ -335,8 +408,9 @@ class CrashRecovery:
         Returns:
             Dictionary with crash statistics
         """
+        circuits = self.circuit_breaker.get_stats() if self.circuit_breaker is not None else {}
         if not self.crash_history:
-            return {"total_crashes": 0}
+            return {"total_crashes": 0, "circuits": circuits}
 
         # Count crashes by type
         crash_counts = {}
@@ -353,6 +427,7 @@ class CrashRecovery:
             "recent_crashes": len(recent_crashes),
             "crash_types": crash_counts,
             "last_crash": str(self.crash_history[-1]) if self.crash_history else None,
+            "circuits": circuits,
         }
 
 
@@ -399,12 +474,14 @@ _global_recovery_manager: CrashRecovery | None = None
 def get_global_crash_recovery() -> CrashRecovery:
     """Get or create the global crash recovery manager.
 
+    The global manager shares the global circuit breaker.
+
     Returns:
         The global crash recovery manager instance
     """
     global _global_recovery_manager
 
     if _global_recovery_manager is None:
-        _global_recovery_manager = CrashRecovery()
+        _global_recovery_manager = CrashRecovery(circuit_breaker=get_global_circuit_breaker())
 
     return _global_recovery_manager
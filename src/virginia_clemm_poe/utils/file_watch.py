@@ -0,0 +1,165 @@
+# this_file: src/virginia_clemm_poe/utils/file_watch.py
+"""Background file watcher for hot-reloading data files.
+
+FileWatcher runs a daemon thread that calls a callback when a file changes.
+It uses OS notifications (inotify, FSEvents, ReadDirectoryChangesW) through the
+optional ``watchfiles`` package when it is installed, and otherwise polls the
+file's modification time, size and inode.
+
+Either way, the callback only runs when the file signature actually differs
+from the last successfully handled one. If the callback raises (for example
+because a writer is still halfway through the file), the change is retried on
+the next event or poll.
+"""
+
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+from loguru import logger
+
+from ..config import AUTO_RELOAD_POLL_SECONDS
+
+FileSignature = tuple[int, int, int]
+
+
+def file_signature(path: Path) -> FileSignature | None:
+    """Get a cheap change signature for a file.
+
+    Args:
+        path: File to inspect
+
+    Returns:
+        Tuple of (mtime in ns, size, inode), or None if the file does not exist
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+class FileWatcher:
+    """Calls a function in a background thread whenever a file changes.
+
+    Example:
+        ```python
+        watcher = FileWatcher(DATA_FILE_PATH, reload_models)
+        watcher.start()
+        ...
+        watcher.stop()
+        ```
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        on_change: Callable[[], None],
+        poll_interval: float = AUTO_RELOAD_POLL_SECONDS,
+        use_native: bool = True,
+    ):
+        """Initialize the watcher.
+
+        Args:
+            path: File to watch (it may not exist yet)
+            on_change: Callback run in the watcher thread after each change
+            poll_interval: Seconds between checks in polling mode (also the
+                stop-check timeout for native notifications)
+            use_native: Use watchfiles notifications when the package is installed
+        """
+        self.path = path
+        self.on_change = on_change
+        self.poll_interval = poll_interval
+        self.use_native = use_native
+        self.change_count = 0
+        self._last_signature = file_signature(path)
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.backend = "polling"
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the watcher thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def check(self) -> bool:
+        """Run the callback if the file signature changed since the last handled change.
+
+        Returns:
+            True if the callback ran successfully
+        """
+        signature = file_signature(self.path)
+        if signature is None or signature == self._last_signature:
+            return False
+
+        try:
+            self.on_change()
+        except Exception as e:
+            logger.warning(f"Change handler for {self.path.name} failed, will retry: {e}")
+            return False
+
+        self._last_signature = signature
+        self.change_count += 1
+        return True
+
+    def _run_polling(self) -> None:
+        while not self._stop_event.wait(self.poll_interval):
+            self.check()
+
+    def _run_native(self) -> None:
+        import watchfiles
+
+        for changes in watchfiles.watch(
+            self.path.parent,
+            stop_event=self._stop_event,
+            rust_timeout=int(self.poll_interval * 1000),
+            yield_on_timeout=True,
+        ):
+            if self._stop_event.is_set():
+                return
+            # Timeouts yield an empty set; checking then also covers missed events
+            if not changes or any(Path(changed).name == self.path.name for _, changed in changes):
+                self.check()
+
+    def _select_backend(self) -> str:
+        if not self.use_native or not self.path.parent.is_dir():
+            return "polling"
+        try:
+            import watchfiles  # noqa: F401
+        except ImportError:
+            return "polling"
+        return "watchfiles"
+
+    def _run(self) -> None:
+        try:
+            if self.backend == "watchfiles":
+                try:
+                    self._run_native()
+                    return
+                except Exception as e:
+                    logger.warning(f"File notifications unavailable ({e}), falling back to polling")
+                    self.backend = "polling"
+            self._run_polling()
+        finally:
+            logger.debug(f"Stopped watching {self.path}")
+
+    def start(self) -> None:
+        """Start watching in a daemon thread."""
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self.backend = self._select_backend()
+        self._thread = threading.Thread(target=self._run, name=f"watch-{self.path.name}", daemon=True)
+        self._thread.start()
+        logger.debug(f"Watching {self.path} ({self.backend})")
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        """Stop the watcher thread.
+
+        Args:
+            timeout: Seconds to wait for the thread to finish
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
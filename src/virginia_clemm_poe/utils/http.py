@@ -0,0 +1,201 @@
+# this_file: src/virginia_clemm_poe/utils/http.py
+"""Shared HTTP client registry for Virginia Clemm Poe.
+
+This module provides lazily created, process-wide httpx clients so that every
+call site (Poe API fetches, balance queries, CLI health checks) reuses pooled
+keep-alive connections instead of paying DNS, TCP and TLS setup per request.
+HTTP/2 is negotiated when the optional ``h2`` package is installed.
+"""
+
+import asyncio
+import atexit
+import importlib.util
+from typing import Any
+
+import httpx
+from loguru import logger
+
+from ..config import (
+    HTTP2_ENABLED,
+    HTTP_CONNECT_TIMEOUT_SECONDS,
+    HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    HTTP_REQUEST_TIMEOUT_SECONDS,
+)
+
+
+class ConnectionStats:
+    """Tracks per-host request counts and connection reuse.
+
+    A request that does not trigger a new TCP connection was served over a
+    pooled keep-alive connection, so reuse is derived from the difference.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty per-host counters."""
+        self._hosts: dict[str, dict[str, int]] = {}
+
+    def _host(self, host: str) -> dict[str, int]:
+        return self._hosts.setdefault(host, {"requests": 0, "new_connections": 0})
+
+    def record_request(self, host: str) -> None:
+        """Record an outgoing request to a host."""
+        self._host(host)["requests"] += 1
+
+    def record_new_connection(self, host: str) -> None:
+        """Record that a new TCP connection was opened to a host."""
+        self._host(host)["new_connections"] += 1
+
+    def reset(self) -> None:
+        """Clear all counters."""
+        self._hosts.clear()
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """Get connection reuse statistics per host.
+
+        Returns:
+            Dictionary keyed by host with request, connection and reuse counts
+        """
+        stats: dict[str, dict[str, Any]] = {}
+        for host, counters in self._hosts.items():
+            requests = counters["requests"]
+            reused = max(requests - counters["new_connections"], 0)
+            stats[host] = {
+                "requests": requests,
+                "new_connections": counters["new_connections"],
+                "reused_connections": reused,
+                "reuse_rate_percent": (reused / requests * 100) if requests > 0 else 0,
+            }
+        return stats
+
+
+_connection_stats = ConnectionStats()
+_async_client: httpx.AsyncClient | None = None
+_async_client_loop: asyncio.AbstractEventLoop | None = None
+_sync_client: httpx.Client | None = None
+
+
+def _http2_available() -> bool:
+    """Check whether HTTP/2 can be negotiated (requires the h2 package)."""
+    return HTTP2_ENABLED and importlib.util.find_spec("h2") is not None
+
+
+def _client_options() -> dict[str, Any]:
+    """Build the shared pool, timeout and protocol options."""
+    return {
+        "http2": _http2_available(),
+        "timeout": httpx.Timeout(HTTP_REQUEST_TIMEOUT_SECONDS, connect=HTTP_CONNECT_TIMEOUT_SECONDS),
+        "limits": httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+    }
+
+
+async def _async_request_hook(request: httpx.Request) -> None:
+    """Count the request and attach a tracer that reports new connections."""
+    host = request.url.host
+    _connection_stats.record_request(host)
+
+    async def trace(event_name: str, _info: dict[str, Any]) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            _connection_stats.record_new_connection(host)
+
+    request.extensions["trace"] = trace
+
+
+def _sync_request_hook(request: httpx.Request) -> None:
+    """Synchronous counterpart of _async_request_hook."""
+    host = request.url.host
+    _connection_stats.record_request(host)
+
+    def trace(event_name: str, _info: dict[str, Any]) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            _connection_stats.record_new_connection(host)
+
+    request.extensions["trace"] = trace
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Get or create the shared async HTTP client.
+
+    Async connections are bound to the event loop that opened them, so a new
+    client is created when called from a different loop (e.g. successive
+    ``asyncio.run`` calls in the CLI).
+
+    Returns:
+        The shared httpx.AsyncClient for the current event loop
+    """
+    global _async_client, _async_client_loop
+
+    try:
+        loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    if _async_client is None or _async_client.is_closed or _async_client_loop is not loop:
+        options = _client_options()
+        _async_client = httpx.AsyncClient(event_hooks={"request": [_async_request_hook]}, **options)
+        _async_client_loop = loop
+        logger.debug(f"Initialized shared async HTTP client (http2={options['http2']})")
+
+    return _async_client
+
+
+def get_sync_client() -> httpx.Client:
+    """Get or create the shared synchronous HTTP client.
+
+    Returns:
+        The shared httpx.Client
+    """
+    global _sync_client
+
+    if _sync_client is None or _sync_client.is_closed:
+        options = _client_options()
+        _sync_client = httpx.Client(event_hooks={"request": [_sync_request_hook]}, **options)
+        logger.debug(f"Initialized shared sync HTTP client (http2={options['http2']})")
+
+    return _sync_client
+
+
+def close_sync_client() -> None:
+    """Close the shared synchronous client if it was created."""
+    global _sync_client
+
+    if _sync_client is not None:
+        _sync_client.close()
+        _sync_client = None
+
+
+async def close_http_clients() -> None:
+    """Close all shared HTTP clients and release pooled connections."""
+    global _async_client, _async_client_loop
+
+    if _async_client is not None:
+        try:
+            loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        # A client owned by another (already finished) loop cannot be awaited here
+        if _async_client_loop is loop:
+            await _async_client.aclose()
+        _async_client = None
+        _async_client_loop = None
+
+    close_sync_client()
+    logger.debug("Closed shared HTTP clients")
+
+
+def get_connection_stats() -> dict[str, dict[str, Any]]:
+    """Get per-host connection reuse statistics for the shared clients.
+
+    Returns:
+        Dictionary keyed by host with requests, new/reused connections and reuse rate
+    """
+    return _connection_stats.get_stats()
+
+
+atexit.register(close_sync_client)
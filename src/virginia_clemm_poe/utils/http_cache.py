@@ -0,0 +1,239 @@
+# this_file: src/virginia_clemm_poe/utils/http_cache.py
+"""Persistent HTTP validator store for conditional requests.
+
+This module keeps the ETag, Last-Modified header and content hash of the last
+successful response for a URL on disk, together with the response body. Later
+runs send conditional requests and can skip parsing and validation entirely
+when the server answers 304 Not Modified or returns an identical body.
+
+New entries are staged in memory and only written once the caller has
+successfully consumed the response (e.g. after the model data file is saved),
+so a failed update never leaves validators pointing at unsaved data.
+"""
+
+import hashlib
+import json
+from datetime import UTC, datetime
+from pathlib import Path
+
+from loguru import logger
+
+from ..types import HttpValidators
+from .paths import get_cache_dir
+
+
+def compute_sha256(body: bytes) -> str:
+    """Compute the hex SHA-256 digest of a response body.
+
+    Args:
+        body: Raw response bytes
+
+    Returns:
+        Hex-encoded SHA-256 digest
+    """
+    return hashlib.sha256(body).hexdigest()
+
+
+def build_conditional_headers(validators: HttpValidators | None) -> dict[str, str]:
+    """Build conditional request headers from stored validators.
+
+    Args:
+        validators: Previously stored validators, or None
+
+    Returns:
+        Dictionary with If-None-Match and/or If-Modified-Since headers
+    """
+    headers: dict[str, str] = {}
+    if not validators:
+        return headers
+
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]  # type: ignore[assignment]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]  # type: ignore[assignment]
+    return headers
+
+
+class ValidatorStore:
+    """Disk-backed store of HTTP validators and last response bodies."""
+
+    def __init__(self, directory: Path | None = None):
+        """Initialize the store.
+
+        Args:
+            directory: Storage directory (defaults to <cache dir>/http)
+        """
+        self.directory = directory or get_cache_dir() / "http"
+        self._pending: dict[str, tuple[HttpValidators, bytes | Path]] = {}
+
+    def _key(self, url: str) -> str:
+        return hashlib.sha256(url.encode()).hexdigest()[:16]
+
+    def _meta_path(self, url: str) -> Path:
+        return self.directory / f"{self._key(url)}.json"
+
+    def _body_path(self, url: str) -> Path:
+        return self.directory / f"{self._key(url)}.body"
+
+    def load(self, url: str) -> HttpValidators | None:
+        """Load stored validators for a URL.
+
+        Validators are only returned when the matching body is also present,
+        since a 304 response is useless without it.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            Stored validators or None if nothing usable is cached
+        """
+        meta_path = self._meta_path(url)
+        if not meta_path.exists() or not self._body_path(url).exists():
+            return None
+
+        try:
+            with meta_path.open() as f:
+                validators: HttpValidators = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable HTTP validators for {url}: {e}")
+            return None
+
+        if validators.get("url") != url:
+            return None
+        return validators
+
+    def body_path(self, url: str) -> Path | None:
+        """Get the path of the committed response body for a URL.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            Path to the stored body or None if missing
+        """
+        path = self._body_path(url)
+        return path if path.exists() else None
+
+    def pending_body_path(self, url: str) -> Path:
+        """Get a scratch path for streaming a new response body to disk.
+
+        The file can later be passed to ``stage`` and is moved into place on
+        commit, so large bodies never need to be held in memory.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            Path for the pending body file
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        return self._body_path(url).with_suffix(".body.pending")
+
+    def load_body(self, url: str) -> bytes | None:
+        """Load the stored response body for a URL.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            Stored body bytes or None if missing
+        """
+        try:
+            return self._body_path(url).read_bytes()
+        except OSError:
+            return None
+
+    def stage(self, url: str, etag: str | None, last_modified: str | None, sha256: str, body: bytes | Path) -> None:
+        """Stage new validators and body to be written on commit.
+
+        Args:
+            url: Request URL
+            etag: ETag response header, if any
+            last_modified: Last-Modified response header, if any
+            sha256: Hex digest of the body
+            body: Raw response body, or a file (e.g. from pending_body_path) to move into place
+        """
+        validators: HttpValidators = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "sha256": sha256,
+            "stored_at": datetime.now(UTC).isoformat(),
+        }
+        self._pending[url] = (validators, body)
+
+    def has_pending(self, url: str) -> bool:
+        """Check whether a staged entry is waiting to be committed."""
+        return url in self._pending
+
+    def commit(self, url: str) -> bool:
+        """Persist the staged entry for a URL.
+
+        The body is written before the metadata and both are replaced
+        atomically, so readers never see validators without their body.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            True if an entry was written
+        """
+        pending = self._pending.pop(url, None)
+        if pending is None:
+            return False
+
+        validators, body = pending
+        self.directory.mkdir(parents=True, exist_ok=True)
+        try:
+            body_path = self._body_path(url)
+            if isinstance(body, Path):
+                body.replace(body_path)
+            else:
+                tmp_body = body_path.with_suffix(".body.tmp")
+                tmp_body.write_bytes(body)
+                tmp_body.replace(body_path)
+
+            meta_path = self._meta_path(url)
+            tmp_meta = meta_path.with_suffix(".json.tmp")
+            with tmp_meta.open("w") as f:
+                json.dump(validators, f, indent=2)
+            tmp_meta.replace(meta_path)
+        except OSError as e:
+            logger.warning(f"Failed to persist HTTP validators for {url}: {e}")
+            return False
+
+        logger.debug(f"Stored HTTP validators for {url} (etag={validators.get('etag')})")
+        return True
+
+    def discard(self, url: str) -> None:
+        """Drop a staged entry without writing it."""
+        pending = self._pending.pop(url, None)
+        if pending is not None and isinstance(pending[1], Path):
+            pending[1].unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Remove all stored validators, bodies and staged entries."""
+        self._pending.clear()
+        if not self.directory.exists():
+            return
+        for path in self.directory.iterdir():
+            if path.suffix in (".json", ".body", ".tmp", ".pending"):
+                path.unlink(missing_ok=True)
+
+
+_validator_store: ValidatorStore | None = None
+
+
+def get_validator_store() -> ValidatorStore:
+    """Get or create the global validator store.
+
+    Returns:
+        The global ValidatorStore instance
+    """
+    global _validator_store
+
+    if _validator_store is None:
+        _validator_store = ValidatorStore()
+        logger.debug(f"Initialized HTTP validator store at {_validator_store.directory}")
+
+    return _validator_store
@@ -0,0 +1,162 @@
+# this_file: src/virginia_clemm_poe/utils/json_stream.py
+"""Incremental JSON parsing for large API responses.
+
+This module parses a top-level JSON object chunk by chunk and yields the
+elements of one array member (e.g. ``data`` in the Poe ``/v1/models``
+response) as they are decoded, so only one element is held in memory at a
+time instead of the whole document.
+"""
+
+import codecs
+import json
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+DEFAULT_CHUNK_SIZE = 64 * 1024  # Bytes read per chunk
+_WHITESPACE = " \t\n\r"
+
+
+def iter_file_chunks(path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Read a file in fixed-size binary chunks.
+
+    Args:
+        path: File to read
+        chunk_size: Maximum bytes per chunk
+
+    Yields:
+        Raw byte chunks
+    """
+    with path.open("rb") as f:
+        while chunk := f.read(chunk_size):
+            yield chunk
+
+
+class JsonArrayStream:
+    """Stream the elements of one array member of a top-level JSON object.
+
+    Other top-level members are decoded normally and collected in ``meta``,
+    which is complete once iteration has finished.
+
+    Example:
+        ```python
+        stream = JsonArrayStream(iter_file_chunks(path), "data")
+        for model in stream:
+            process(model)
+        print(stream.meta["object"])
+        ```
+    """
+
+    def __init__(self, chunks: Iterable[bytes], array_key: str):
+        """Initialize the stream.
+
+        Args:
+            chunks: Iterable of raw UTF-8 byte chunks
+            array_key: Name of the top-level member whose elements are yielded
+        """
+        self.array_key = array_key
+        self.meta: dict[str, Any] = {}
+        self.found_array = False
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    @classmethod
+    def from_path(cls, path: Path, array_key: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> "JsonArrayStream":
+        """Create a stream reading from a file.
+
+        Args:
+            path: JSON file to parse
+            array_key: Name of the top-level array member to stream
+            chunk_size: Bytes read per chunk
+
+        Returns:
+            A new JsonArrayStream
+        """
+        return cls(iter_file_chunks(path, chunk_size), array_key)
+
+    def _fill(self) -> bool:
+        """Append the next chunk to the buffer, compacting consumed text."""
+        if self._eof:
+            return False
+        if self._pos:
+            self._buf = self._buf[self._pos :]
+            self._pos = 0
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            self._buf += self._decoder.decode(b"", final=True)
+            self._eof = True
+            return False
+        self._buf += self._decoder.decode(chunk)
+        return True
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character ('' at end of input)."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, chars: str) -> str:
+        char = self._peek()
+        if not char or char not in chars:
+            found = repr(char) if char else "end of input"
+            raise json.JSONDecodeError(f"Expected one of {chars!r}, found {found}", self._buf, self._pos)
+        self._pos += 1
+        return char
+
+    def _decode_value(self) -> Any:
+        """Decode the next complete JSON value, reading more input as needed."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number at the very end of the buffer may continue in the next chunk
+            if end == len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yield array elements as they are decoded.
+
+        Raises:
+            json.JSONDecodeError: If the input is not a well-formed JSON object
+        """
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+
+        while True:
+            key = self._decode_value()
+            if not isinstance(key, str):
+                raise json.JSONDecodeError("Expected object key", self._buf, self._pos)
+            self._expect(":")
+
+            if key == self.array_key and self._peek() == "[":
+                self.found_array = True
+                self._pos += 1
+                if self._peek() == "]":
+                    self._pos += 1
+                else:
+                    while True:
+                        yield self._decode_value()
+                        if self._expect(",]") == "]":
+                            break
+            else:
+                self.meta[key] = self._decode_value()
+
+            if self._expect(",}") == "}":
+                return
@@ -13,6 +13,8 @@ from typing import Any
 
 from loguru import logger
 
+from .trace import trace_span
+
 
 def configure_logger(verbose: bool = False, log_file: str | None = None, format_string: str | None = None) -> None:
     """Configure loguru logger with consistent settings.
@@ -133,7 +135,8 @@ def log_api_request(method: str, url: str, headers: dict[str, str] | None = None
     """Context manager for logging API requests with timing and response info.
 
     Specialized context manager for HTTP API requests that logs request details,
-    response status, timing, and any errors that occur.
+    response status, timing, and any errors that occur. While tracing is enabled
+    the request is also recorded as an ``api.<method>`` span.
 
     Args:
         method: HTTP method (GET, POST, etc.)
@@ -162,7 +165,10 @@ def log_api_request(method: str, url: str, headers: dict[str, str] | None = None
 
     context = {"method": method, "url": url, "headers": safe_headers}
 
-    with log_operation(f"API {method} request", context, "DEBUG") as ctx:
+    with (
+        trace_span(f"api.{method.lower()}", context=context),
+        log_operation(f"API {method} request", context, "DEBUG") as ctx,
+    ):
         yield ctx
 
 
@@ -171,7 +177,9 @@ def log_browser_operation(operation: str, model_id: str | None = None, debug_por
     """Context manager for logging browser operations with model context.
 
     Specialized context manager for browser automation operations that includes
-    model-specific context and browser configuration details.
+    model-specific context and browser configuration details. While tracing is
+    enabled the operation is also recorded as a ``browser.<operation>`` span, and
+    spans recorded inside it are attributed to ``model_id``.
 
     Args:
         operation: Browser operation name (e.g., "scrape_model", "launch_browser")
@@ -195,7 +203,10 @@ def log_browser_operation(operation: str, model_id: str | None = None, debug_por
     if debug_port:
         context["debug_port"] = debug_port
 
-    with log_operation(f"Browser {operation}", context, "DEBUG") as ctx:
+    with (
+        trace_span(f"browser.{operation}", model_id, context),
+        log_operation(f"Browser {operation}", context, "DEBUG") as ctx,
+    ):
         yield ctx
 
 
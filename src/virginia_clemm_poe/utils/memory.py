@@ -4,12 +4,23 @@
 This module provides utilities for monitoring and managing memory usage
 during long-running operations, ensuring steady-state usage stays below
 200MB with automatic cleanup and garbage collection.
+
+Garbage collection is adaptive: routine cleanups only collect the young
+generations, and a full collection runs once allocations have grown by
+FULL_GC_GROWTH_THRESHOLD_MB since the previous one. Growth is measured with
+tracemalloc while it is tracing and with the process RSS otherwise.
+
+For finding what grows, ``enable_allocation_profiling()`` turns on
+tracemalloc and makes every ``MemoryManagedOperation`` snapshot allocations
+on entry and exit, reporting the top allocation sites and the growth per
+counted operation (one scraped model in the updater).
 """
 
 import asyncio
 import gc
 import os
 import time
+import tracemalloc
 from collections.abc import Callable
 from typing import Any
 
@@ -27,6 +38,19 @@ MEMORY_MONITORING_INTERVAL_SECONDS = 30.0
 # Memory cleanup configuration
 GC_COLLECT_THRESHOLD_OPERATIONS = 50  # Run GC after this many operations
 FORCE_GC_MEMORY_THRESHOLD_MB = 160  # Force GC when memory exceeds this
+FULL_GC_GROWTH_THRESHOLD_MB = 16  # Collect all generations only after this much growth since the last full GC
+
+# Allocation profiling configuration
+TRACEMALLOC_FRAMES = 5  # Stack frames recorded per traced allocation
+PROFILE_TOP_SITES = 10  # Allocation sites reported per profiled operation
+
+# Allocations made by tracemalloc and the import machinery are noise in reports
+_SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
 
 
 class MemoryMonitor:
@@ -47,8 +71,12 @@ class MemoryMonitor:
         self.critical_threshold_mb = critical_threshold_mb
         self.process = psutil.Process(os.getpid())
         self.operation_count = 0
+        self.total_operations = 0
         self.last_cleanup_time = time.time()
         self.peak_memory_mb = 0.0
+        self.full_collections = 0
+        self.young_collections = 0
+        self._growth_baseline = self._allocated_bytes()
 
     def get_memory_usage_mb(self) -> float:
         """Get current memory usage in MB.
@@ -68,6 +96,36 @@ class MemoryMonitor:
             logger.warning(f"Failed to get memory usage: {e}")
             return 0.0
 
+    def _allocated_bytes(self) -> tuple[str, int]:
+        """Measure allocated memory for growth tracking.
+
+        Returns:
+            Tuple of the measurement source ("tracemalloc" or "rss") and bytes
+        """
+        if tracemalloc.is_tracing():
+            return "tracemalloc", tracemalloc.get_traced_memory()[0]
+        try:
+            return "rss", self.process.memory_info().rss
+        except Exception as e:
+            logger.warning(f"Failed to get memory usage: {e}")
+            return "rss", 0
+
+    def allocation_growth_mb(self) -> float:
+        """Get allocation growth since the last full garbage collection.
+
+        The baseline restarts when the measurement source changes, i.e. when
+        tracemalloc tracing starts or stops.
+
+        Returns:
+            Growth in megabytes (negative if memory shrank)
+        """
+        source, current = self._allocated_bytes()
+        baseline_source, baseline = self._growth_baseline
+        if source != baseline_source:
+            self._growth_baseline = (source, current)
+            return 0.0
+        return (current - baseline) / 1024 / 1024
+
     def check_memory_usage(self) -> dict[str, Any]:
         """Check current memory usage and return status.
 
@@ -140,6 +198,9 @@ class MemoryMonitor:
     async def cleanup_memory(self, force: bool = False) -> dict[str, Any]:
         """Perform memory cleanup operations.
 
+        Collects generations 0 and 1, or all generations if allocations grew
+        by at least FULL_GC_GROWTH_THRESHOLD_MB since the last full collection.
+
         Args:
             force: Force cleanup regardless of thresholds
 
@@ -155,15 +216,18 @@ class MemoryMonitor:
         cleanup_start = time.time()
 
         try:
-            # Run garbage collection
-            collected_objects = gc.collect()
-
-            # Force garbage collection for all generations
-            for generation in [0, 1, 2]:
-                gc.collect(generation)
+            # Young generations are cheap; a full collection has to pay for itself
+            growth_mb = self.allocation_growth_mb()
+            generation = 2 if growth_mb >= FULL_GC_GROWTH_THRESHOLD_MB else 1
+            collected_objects = gc.collect(generation)
+            if generation == 2:
+                self.full_collections += 1
+                self._growth_baseline = self._allocated_bytes()
+            else:
+                self.young_collections += 1
 
             # Allow async tasks to yield
-            await asyncio.sleep(0.01)
+            await asyncio.sleep(0)
 
             memory_after = self.get_memory_usage_mb()
             cleanup_time = time.time() - cleanup_start
@@ -180,6 +244,8 @@ class MemoryMonitor:
                 "memory_freed_mb": memory_freed,
                 "cleanup_time_seconds": cleanup_time,
                 "objects_collected": collected_objects,
+                "generation": generation,
+                "allocation_growth_mb": growth_mb,
                 "forced": force,
             }
 
@@ -192,11 +258,12 @@ class MemoryMonitor:
                     "cleanup_time_seconds": cleanup_time,
                     "objects_collected": collected_objects,
                     "memory_after_mb": memory_after,
+                    "generation": generation,
                 },
             )
 
             logger.info(
-                f"Memory cleanup completed: freed {memory_freed:.1f}MB, "
+                f"Memory cleanup completed (generation {generation}): freed {memory_freed:.1f}MB, "
                 f"collected {collected_objects} objects in {cleanup_time:.2f}s"
             )
 
@@ -213,6 +280,7 @@ class MemoryMonitor:
     def increment_operation_count(self) -> None:
         """Increment the operation counter."""
         self.operation_count += 1
+        self.total_operations += 1
 
         # Check if we should force garbage collection
         current_mb = self.get_memory_usage_mb()
@@ -245,26 +313,181 @@ class MemoryMonitor:
             )
 
 
+class AllocationProfiler:
+    """Reports allocation growth between tracemalloc snapshots.
+
+    Snapshots exclude allocations made by tracemalloc itself and by the import
+    machinery. Every comparison is kept in ``reports``.
+    """
+
+    def __init__(self, frames: int = TRACEMALLOC_FRAMES, top_sites: int = PROFILE_TOP_SITES):
+        """Initialize the profiler without starting tracemalloc.
+
+        Args:
+            frames: Stack frames recorded per allocation
+            top_sites: Number of allocation sites kept per report
+        """
+        self.frames = frames
+        self.top_sites = top_sites
+        self.reports: list[dict[str, Any]] = []
+        self._started_tracing = False
+
+    def start(self) -> None:
+        """Start tracemalloc unless something else already traces allocations."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_tracing = True
+
+    def stop(self) -> None:
+        """Stop tracemalloc if this profiler started it."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def take_snapshot(self) -> tracemalloc.Snapshot | None:
+        """Take a filtered allocation snapshot.
+
+        Returns:
+            The snapshot, or None if tracemalloc is not tracing
+        """
+        if not tracemalloc.is_tracing():
+            return None
+        return tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+
+    def compare(
+        self,
+        operation_name: str,
+        before: tracemalloc.Snapshot,
+        after: tracemalloc.Snapshot,
+        operations: int = 0,
+    ) -> dict[str, Any]:
+        """Report the allocation growth between two snapshots.
+
+        Args:
+            operation_name: Name of the profiled operation
+            before: Snapshot taken when the operation started
+            after: Snapshot taken when the operation finished
+            operations: Operations counted in between, for the per-operation growth
+
+        Returns:
+            Report with the total growth, growth per operation and the top
+            allocation sites ordered by absolute size change
+        """
+        stats = after.compare_to(before, "lineno")
+        growth_bytes = sum(stat.size_diff for stat in stats)
+        top_sites: list[dict[str, Any]] = [
+            {
+                "site": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                "size_diff_bytes": stat.size_diff,
+                "count_diff": stat.count_diff,
+                "size_bytes": stat.size,
+            }
+            for stat in stats[: self.top_sites]
+        ]
+        report = {
+            "operation": operation_name,
+            "operations": operations,
+            "growth_bytes": growth_bytes,
+            "growth_per_operation_bytes": growth_bytes / operations if operations else None,
+            "top_sites": top_sites,
+        }
+        self.reports.append(report)
+
+        log_performance_metric(
+            "allocation_growth",
+            growth_bytes / 1024,
+            "KB",
+            {"operation": operation_name, "operations": operations},
+        )
+        per_operation = f", {growth_bytes / operations / 1024:+.1f}KB per operation" if operations else ""
+        logger.info(f"{operation_name}: allocations grew {growth_bytes / 1024:+.1f}KB{per_operation}")
+        for site in top_sites[:3]:
+            logger.debug(f"  {site['site']}: {site['size_diff_bytes'] / 1024:+.1f}KB ({site['count_diff']:+d} blocks)")
+
+        return report
+
+
+def get_process_tree_rss_mb(pids: list[int]) -> dict[int, float]:
+    """Measure the resident memory of processes, e.g. a browser and its renderers.
+
+    Processes that exited or cannot be inspected are left out.
+
+    Args:
+        pids: Process IDs to measure
+
+    Returns:
+        RSS in megabytes by process ID
+    """
+    rss_by_pid = {}
+    for pid in pids:
+        try:
+            rss_by_pid[pid] = psutil.Process(pid).memory_info().rss / 1024 / 1024
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            continue
+    return rss_by_pid
+
+
+def find_browser_process_ids(debug_port: int) -> list[int]:
+    """Find a Chrome process tree by its remote debugging port.
+
+    Args:
+        debug_port: The ``--remote-debugging-port`` the browser was started with
+
+    Returns:
+        The browser process followed by all its descendants, or an empty list
+    """
+    flag = f"--remote-debugging-port={debug_port}"
+    for process in psutil.process_iter(["cmdline"]):
+        cmdline = process.info["cmdline"] or []
+        # Child processes inherit some switches but carry a --type=<role> switch
+        if flag in cmdline and not any(arg.startswith("--type=") for arg in cmdline):
+            try:
+                return [process.pid] + [child.pid for child in process.children(recursive=True)]
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                return []
+    return []
+
+
 class MemoryManagedOperation:
-    """Context manager for memory-managed operations."""
+    """Context manager for memory-managed operations.
 
-    def __init__(self, operation_name: str, monitor: MemoryMonitor | None = None, cleanup_on_exit: bool = True):
+    While allocation profiling is enabled, entry and exit are snapshotted and
+    the comparison is left in ``allocation_report``.
+    """
+
+    def __init__(
+        self,
+        operation_name: str,
+        monitor: MemoryMonitor | None = None,
+        cleanup_on_exit: bool = True,
+        profiler: AllocationProfiler | None = None,
+    ):
         """Initialize memory-managed operation.
 
         Args:
             operation_name: Name of the operation
             monitor: Memory monitor to use (creates new one if None)
             cleanup_on_exit: Whether to run cleanup on exit
+            profiler: Allocation profiler to use (the global one if None)
         """
         self.operation_name = operation_name
         self.monitor = monitor or MemoryMonitor()
         self.cleanup_on_exit = cleanup_on_exit
+        self.profiler = profiler
         self.start_memory_mb = 0.0
+        self.allocation_report: dict[str, Any] | None = None
+        self._start_snapshot: tracemalloc.Snapshot | None = None
+        self._start_operations = 0
 
     async def __aenter__(self) -> MemoryMonitor:
         """Enter the memory-managed operation context."""
         self.start_memory_mb = self.monitor.get_memory_usage_mb()
         logger.debug(f"Starting {self.operation_name}, memory usage: {self.start_memory_mb:.1f}MB")
+
+        self.profiler = self.profiler or get_allocation_profiler()
+        if self.profiler is not None:
+            self._start_snapshot = self.profiler.take_snapshot()
+            self._start_operations = self.monitor.total_operations
         return self.monitor
 
     async def __aexit__(self, exc_type: type[Exception] | None, exc_val: Exception | None, exc_tb: Any) -> None:
@@ -276,6 +499,17 @@ class MemoryManagedOperation:
             f"Completed {self.operation_name}, memory usage: {end_memory_mb:.1f}MB (delta: {memory_delta:+.1f}MB)"
         )
 
+        if self.profiler is not None and self._start_snapshot is not None:
+            end_snapshot = self.profiler.take_snapshot()
+            if end_snapshot is not None:
+                self.allocation_report = self.profiler.compare(
+                    self.operation_name,
+                    self._start_snapshot,
+                    end_snapshot,
+                    self.monitor.total_operations - self._start_operations,
+                )
+            self._start_snapshot = None
+
         # Run cleanup if requested or if memory usage is high
         if self.cleanup_on_exit or end_memory_mb > MEMORY_CLEANUP_THRESHOLD_MB:
             await self.monitor.cleanup_memory()
@@ -284,6 +518,9 @@ class MemoryManagedOperation:
 # Global memory monitor instance
 _global_monitor: MemoryMonitor | None = None
 
+# Global allocation profiler, set while profiling is enabled
+_global_profiler: AllocationProfiler | None = None
+
 
 def get_global_memory_monitor() -> MemoryMonitor:
     """Get or create the global memory monitor.
@@ -299,6 +536,55 @@ def get_global_memory_monitor() -> MemoryMonitor:
     return _global_monitor
 
 
+def get_allocation_profiler() -> AllocationProfiler | None:
+    """Get the global allocation profiler.
+
+    Returns:
+        The profiler, or None if allocation profiling is not enabled
+    """
+    return _global_profiler
+
+
+def enable_allocation_profiling(
+    frames: int = TRACEMALLOC_FRAMES, top_sites: int = PROFILE_TOP_SITES
+) -> AllocationProfiler:
+    """Start tracemalloc and profile every memory-managed operation.
+
+    Tracing slows allocation-heavy code noticeably, so this is meant for
+    diagnostic runs.
+
+    Args:
+        frames: Stack frames recorded per allocation
+        top_sites: Number of allocation sites kept per report
+
+    Returns:
+        The global allocation profiler
+    """
+    global _global_profiler
+
+    if _global_profiler is None:
+        _global_profiler = AllocationProfiler(frames, top_sites)
+        _global_profiler.start()
+
+    return _global_profiler
+
+
+def disable_allocation_profiling() -> list[dict[str, Any]]:
+    """Stop allocation profiling.
+
+    Returns:
+        Reports collected while profiling was enabled
+    """
+    global _global_profiler
+
+    if _global_profiler is None:
+        return []
+
+    profiler, _global_profiler = _global_profiler, None
+    profiler.stop()
+    return profiler.reports
+
+
 async def monitor_memory_usage(
     func: Callable[[], Any],
     operation_name: str,
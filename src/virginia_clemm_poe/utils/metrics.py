@@ -0,0 +1,218 @@
+# this_file: src/virginia_clemm_poe/utils/metrics.py
+"""In-process metrics registry with counters and latency histograms.
+
+``log_performance_metric`` and ``log_browser_operation`` only emit log
+lines; this registry aggregates timings so a slow update run can be broken
+down by phase (navigation, fixed sleeps, selector fallbacks, the Rates
+dialog, page acquisition and close, API requests).
+
+Names are dotted phase keys such as ``scrape.goto`` or ``pool.page_close``.
+Histograms keep exact count/total/min/max and a bounded uniform sample
+(reservoir sampling) for the p50/p95/p99 estimates, so memory stays flat
+however long the run.
+
+Example:
+    ```python
+    metrics = get_metrics_registry()
+    with metrics.time("scrape.goto"):
+        await page.goto(url)
+    metrics.increment("selector.creator.fallback")
+    print(metrics.snapshot())
+    ```
+"""
+
+import json
+import math
+import os
+import random
+import tempfile
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from ..config import METRICS_MAX_SAMPLES
+from .trace import get_trace_recorder
+
+PERCENTILES = (50, 95, 99)
+
+
+def _nearest_rank(ordered: list[float], percent: float) -> float:
+    """Pick the nearest-rank percentile from sorted, non-empty values."""
+    rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class Histogram:
+    """Latency histogram with exact totals and sampled percentiles."""
+
+    def __init__(self, max_samples: int = METRICS_MAX_SAMPLES) -> None:
+        """Initialize an empty histogram.
+
+        Args:
+            max_samples: Maximum number of samples kept for percentile estimates
+        """
+        self.max_samples = max_samples
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+        self._samples: list[float] = []
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if len(self._samples) < self.max_samples:
+            self._samples.append(value)
+        else:
+            # Reservoir sampling keeps a uniform sample of all observations
+            index = random.randrange(self.count)
+            if index < self.max_samples:
+                self._samples[index] = value
+
+    def percentile(self, percent: float) -> float | None:
+        """Get a percentile of the observations (nearest rank).
+
+        Args:
+            percent: Percentile between 0 and 100
+
+        Returns:
+            The percentile value, or None if nothing was observed
+        """
+        if not self._samples:
+            return None
+        return _nearest_rank(sorted(self._samples), percent)
+
+    def summary(self) -> dict[str, Any]:
+        """Get count, total, mean, min, max and percentiles."""
+        if not self.count:
+            return {"count": 0, "total": 0.0}
+        ordered = sorted(self._samples)
+        summary: dict[str, Any] = {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count,
+            "min": self.min,
+            "max": self.max,
+        }
+        for percent in PERCENTILES:
+            summary[f"p{percent}"] = _nearest_rank(ordered, percent)
+        return summary
+
+
+class MetricsRegistry:
+    """Named counters and latency histograms for one process."""
+
+    def __init__(self, max_samples: int = METRICS_MAX_SAMPLES) -> None:
+        """Initialize an empty registry.
+
+        Args:
+            max_samples: Sample cap for each histogram
+        """
+        self.max_samples = max_samples
+        self._counters: dict[str, int] = {}
+        self._histograms: dict[str, Histogram] = {}
+
+    def increment(self, name: str, value: int = 1) -> None:
+        """Add to a counter."""
+        self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name: str, seconds: float) -> None:
+        """Record a duration in a histogram."""
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            histogram = self._histograms[name] = Histogram(self.max_samples)
+        histogram.observe(seconds)
+
+    @contextmanager
+    def time(self, name: str) -> Iterator[None]:
+        """Time the enclosed block into a histogram.
+
+        The duration is recorded even if the block raises, so failed
+        navigations still show up in the phase breakdown. While tracing is
+        enabled the block is also recorded as a trace span.
+        """
+        start = time.perf_counter()
+        outcome = "ok"
+        try:
+            yield
+        except BaseException as e:
+            outcome = type(e).__name__
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            self.observe(name, duration)
+            recorder = get_trace_recorder()
+            if recorder is not None:
+                recorder.record(name, start, duration, outcome)
+
+    def counter(self, name: str) -> int:
+        """Get a counter value (0 if never incremented)."""
+        return self._counters.get(name, 0)
+
+    def histogram(self, name: str) -> Histogram | None:
+        """Get a histogram by name, if anything was observed."""
+        return self._histograms.get(name)
+
+    def is_empty(self) -> bool:
+        """Check whether nothing has been recorded."""
+        return not self._counters and not self._histograms
+
+    def reset(self) -> None:
+        """Clear all counters and histograms."""
+        self._counters.clear()
+        self._histograms.clear()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Get all metrics as a JSON-serializable dictionary.
+
+        Returns:
+            Dictionary with ``generated_at``, sorted ``counters`` and
+            ``histograms`` (durations in seconds)
+        """
+        return {
+            "generated_at": datetime.now(UTC).isoformat(),
+            "counters": dict(sorted(self._counters.items())),
+            "histograms": {name: self._histograms[name].summary() for name in sorted(self._histograms)},
+        }
+
+    def write_json(self, path: Path) -> None:
+        """Write a snapshot to a JSON file atomically.
+
+        Args:
+            path: Destination file (parent directories are created)
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(self.snapshot(), f, indent=2)
+            Path(tmp_name).replace(path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        logger.debug(f"Wrote metrics to {path}")
+
+
+_metrics_registry: MetricsRegistry | None = None
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Get or create the global metrics registry.
+
+    Returns:
+        The global MetricsRegistry instance
+    """
+    global _metrics_registry
+
+    if _metrics_registry is None:
+        _metrics_registry = MetricsRegistry()
+
+    return _metrics_registry
@@ -0,0 +1,242 @@
+# this_file: src/virginia_clemm_poe/utils/rate_limit.py
+"""Token-bucket rate limiting for requests to poe.com.
+
+Scraping navigations, balance queries and model list fetches each pace
+themselves with sleeps and retries, but nothing bounds the total request
+rate reaching Poe. ``RateLimiter`` keeps one token bucket per host: a host
+accepts ``burst`` requests back-to-back and then ``requests_per_second``.
+Hosts outside RATE_LIMITED_HOSTS (e.g. a local test server) are not limited.
+
+Each caller reserves a token and sleeps until it is due, so waiting callers
+are served in order. With ``shared=True`` the bucket state lives in a file
+in the cache directory that is updated under an exclusive ``flock``, so
+parallel processes (cron jobs, the query server) share one budget. File
+locking needs ``fcntl``; where it is missing, buckets stay per-process.
+
+Example:
+    ```python
+    limiter = get_global_rate_limiter()
+    await limiter.acquire("https://poe.com/Claude-3-Opus")
+    await page.goto("https://poe.com/Claude-3-Opus")
+    ```
+"""
+
+import asyncio
+import json
+import os
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+from urllib.parse import urlsplit
+
+from loguru import logger
+
+from ..config import RATE_LIMIT_BURST, RATE_LIMIT_REQUESTS_PER_SECOND, RATE_LIMITED_HOSTS
+from .metrics import get_metrics_registry
+from .paths import get_cache_dir
+
+fcntl: ModuleType | None
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+class TokenBucket:
+    """Token bucket for one host, optionally backed by a shared state file."""
+
+    def __init__(self, rate: float, burst: int, state_path: Path | None = None):
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            burst: Bucket capacity
+            state_path: File holding the bucket state shared between processes,
+                or None to keep the state in memory
+        """
+        self.rate = rate
+        self.burst = burst
+        self.state_path = state_path
+        self._tokens = float(burst)
+        self._updated = time.time()
+
+    def _refill(self, tokens: float, updated: float, now: float) -> float:
+        """Add the tokens accrued since ``updated``, up to the capacity."""
+        return min(float(self.burst), tokens + max(now - updated, 0.0) * self.rate)
+
+    def _reserve(self) -> float:
+        """Take a token from the in-memory bucket.
+
+        The balance may go negative; each reservation then waits for its turn.
+
+        Returns:
+            Seconds until the reserved token is available
+        """
+        now = time.time()
+        self._tokens = self._refill(self._tokens, self._updated, now) - 1
+        self._updated = now
+        return max(-self._tokens / self.rate, 0.0)
+
+    def _reserve_shared(self) -> float:
+        """Take a token from the shared bucket under an exclusive file lock.
+
+        Returns:
+            Seconds until the reserved token is available
+        """
+        assert self.state_path is not None and fcntl is not None
+        fd = os.open(self.state_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            now = time.time()
+            raw = os.read(fd, 4096)
+            try:
+                state = json.loads(raw)
+                tokens, updated = float(state["tokens"]), float(state["updated"])
+            except (ValueError, KeyError, TypeError):
+                # New or damaged state file
+                tokens, updated = float(self.burst), now
+
+            tokens = self._refill(tokens, updated, now) - 1
+            os.ftruncate(fd, 0)
+            os.pwrite(fd, json.dumps({"tokens": tokens, "updated": now}).encode(), 0)
+            return max(-tokens / self.rate, 0.0)
+        finally:
+            os.close(fd)  # Also releases the lock
+
+    async def acquire(self) -> float:
+        """Wait until a token is available and consume it.
+
+        Returns:
+            Seconds spent waiting
+        """
+        if self.state_path is not None:
+            wait = await asyncio.to_thread(self._reserve_shared)
+        else:
+            wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+class RateLimiter:
+    """Per-host token buckets for all traffic to Poe."""
+
+    def __init__(
+        self,
+        requests_per_second: float = RATE_LIMIT_REQUESTS_PER_SECOND,
+        burst: int = RATE_LIMIT_BURST,
+        hosts: tuple[str, ...] = RATE_LIMITED_HOSTS,
+        shared: bool = False,
+        state_dir: Path | None = None,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            requests_per_second: Sustained request rate allowed per host
+            burst: Requests a host may receive back-to-back
+            hosts: Hosts to limit; requests to other hosts pass immediately
+            shared: Coordinate the buckets with other processes through lock files
+            state_dir: Directory for the shared state files (default: cache directory)
+        """
+        if requests_per_second <= 0 or burst < 1:
+            raise ValueError("Rate limit needs a positive rate and a burst of at least 1")
+
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.hosts = hosts
+        self.state_dir: Path | None = None
+        if shared:
+            if fcntl is None:
+                logger.warning("File locking is not available on this platform, rate limits are per-process")
+            else:
+                self.state_dir = state_dir or get_cache_dir() / "rate_limits"
+                self.state_dir.mkdir(parents=True, exist_ok=True)
+        self._buckets: dict[str, TokenBucket] = {}
+        self._waits: dict[str, dict[str, float]] = {}
+
+    def _bucket(self, host: str) -> TokenBucket:
+        """Get or create the bucket for a host."""
+        if host not in self._buckets:
+            state_path = self.state_dir / f"{host}.json" if self.state_dir else None
+            self._buckets[host] = TokenBucket(self.requests_per_second, self.burst, state_path)
+        return self._buckets[host]
+
+    async def acquire(self, url: str) -> float:
+        """Wait until a request to the URL's host is allowed.
+
+        Args:
+            url: URL about to be requested
+
+        Returns:
+            Seconds spent waiting (0.0 for hosts that are not limited)
+        """
+        host = urlsplit(url).hostname or ""
+        if host not in self.hosts:
+            return 0.0
+
+        wait = await self._bucket(host).acquire()
+
+        waits = self._waits.setdefault(host, {"requests": 0, "delayed": 0, "wait_seconds": 0.0})
+        waits["requests"] += 1
+        if wait > 0:
+            waits["delayed"] += 1
+            waits["wait_seconds"] += wait
+            metrics = get_metrics_registry()
+            metrics.increment("rate_limit.delayed")
+            metrics.observe("rate_limit.wait", wait)
+            logger.debug(f"Rate limit delayed request to {host} by {wait:.2f}s")
+        return wait
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get the limiter settings and per-host waiting totals.
+
+        Returns:
+            Dictionary with rate, burst, whether state is shared and per-host
+            request, delayed request and wait time counts
+        """
+        return {
+            "requests_per_second": self.requests_per_second,
+            "burst": self.burst,
+            "shared": self.state_dir is not None,
+            "hosts": {host: dict(waits) for host, waits in self._waits.items()},
+        }
+
+
+# Global rate limiter instance
+_global_limiter: RateLimiter | None = None
+
+
+def get_global_rate_limiter() -> RateLimiter:
+    """Get or create the global rate limiter.
+
+    Returns:
+        The global rate limiter instance
+    """
+    global _global_limiter
+
+    if _global_limiter is None:
+        _global_limiter = RateLimiter()
+
+    return _global_limiter
+
+
+def configure_rate_limiter(
+    requests_per_second: float = RATE_LIMIT_REQUESTS_PER_SECOND,
+    burst: int = RATE_LIMIT_BURST,
+    shared: bool = False,
+) -> RateLimiter:
+    """Replace the global rate limiter with one using the given settings.
+
+    Args:
+        requests_per_second: Sustained request rate allowed per host
+        burst: Requests a host may receive back-to-back
+        shared: Coordinate the buckets with other processes through lock files
+
+    Returns:
+        The new global rate limiter
+    """
+    global _global_limiter
+
+    _global_limiter = RateLimiter(requests_per_second, burst, shared=shared)
+    return _global_limiter
@@ -8,9 +8,10 @@ provides proper error handling with exponential backoff.
 
 import asyncio
 import functools
+import random
 import time
-from collections.abc import Awaitable, Callable
-from typing import Any, TypeVar
+from collections.abc import Awaitable, Callable, Collection
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from loguru import logger
 
@@ -18,9 +19,13 @@ from ..config import (
     EXPONENTIAL_BACKOFF_MULTIPLIER,
     MAX_RETRIES,
     RETRY_DELAY_SECONDS,
+    RETRY_MAX_DELAY_SECONDS,
 )
 from ..exceptions import BrowserManagerError, NetworkError
 
+if TYPE_CHECKING:
+    from .circuit_breaker import CircuitBreaker
+
 T = TypeVar("T")
 
 
@@ -66,6 +71,49 @@ async def with_timeout[T](
         raise TimeoutError(error_msg, timeout_seconds, operation_name) from e
 
 
+def decorrelated_jitter(
+    previous_delay: float,
+    base_delay: float,
+    max_delay: float = RETRY_MAX_DELAY_SECONDS,
+    multiplier: float = 3.0,
+) -> float:
+    """Pick the next retry delay using decorrelated jitter.
+
+    Each delay is drawn uniformly between ``base_delay`` and ``multiplier``
+    times the previous delay. Delays grow like exponential backoff, but
+    concurrent retries spread out instead of hitting a recovering service
+    in lockstep.
+
+    Args:
+        previous_delay: The previous delay (0 before the first retry)
+        base_delay: Smallest delay
+        max_delay: Largest delay
+        multiplier: Growth factor of the upper bound
+
+    Returns:
+        Delay in seconds
+    """
+    upper = max(previous_delay, base_delay) * multiplier
+    return min(max_delay, random.uniform(base_delay, upper))
+
+
+def _record_retry_failure(circuit_breaker: "CircuitBreaker", error: Exception, operation_name: str) -> None:
+    """Report a failed attempt to the breaker if it says something about Poe's health.
+
+    Args:
+        circuit_breaker: Breaker gating the retried call
+        error: The exception the attempt raised
+        operation_name: Name of the operation, used for classification
+    """
+    from .crash_recovery import CrashDetector
+
+    crash_type = CrashDetector.detect_crash_type(error, operation_name)
+    if CrashDetector.is_recoverable(crash_type):
+        circuit_breaker.record_failure(crash_type.value)
+    else:
+        circuit_breaker.release_probes()
+
+
 async def with_retries[T](
     func: Callable[..., Awaitable[T]],
     *args: Any,
@@ -74,31 +122,44 @@ async def with_retries[T](
     backoff_multiplier: float = EXPONENTIAL_BACKOFF_MULTIPLIER,
     retryable_exceptions: tuple[type[Exception], ...] = (Exception,),
     operation_name: str = "operation",
+    circuit_breaker: "CircuitBreaker | None" = None,
+    circuit_classes: Collection[str] | None = None,
     **kwargs: Any,
 ) -> T:
-    """Execute a function with retries and exponential backoff.
+    """Execute a function with retries and jittered exponential backoff.
 
     Args:
         func: The async function to execute
         *args: Arguments to pass to the function
         max_retries: Maximum number of retry attempts
         base_delay: Base delay between retries in seconds
-        backoff_multiplier: Multiplier for exponential backoff
+        backoff_multiplier: Growth factor of the decorrelated jitter bound
         retryable_exceptions: Tuple of exception types that should trigger a retry
         operation_name: Name of the operation for logging
+        circuit_breaker: Shared breaker that gates every attempt and is told
+            each attempt's outcome
+        circuit_classes: Failure classes whose open circuits pause the call,
+            or None for all of them
         **kwargs: Keyword arguments to pass to the function
 
     Returns:
         The result of the function
 
     Raises:
+        CircuitOpenError: If the circuit breaker fails the call fast
         The last exception encountered if all retries fail
     """
     last_exception: Exception | None = None
+    delay = 0.0
 
     for attempt in range(max_retries + 1):
+        if circuit_breaker is not None:
+            await circuit_breaker.guard(operation_name, circuit_classes)
+
         try:
             result = await func(*args, **kwargs)
+            if circuit_breaker is not None:
+                circuit_breaker.record_success()
             if attempt > 0:
                 logger.info(f"{operation_name} succeeded on attempt {attempt + 1}")
             return result
@@ -109,10 +170,15 @@ async def with_retries[T](
             # Check if this exception type is retryable
             if not isinstance(e, retryable_exceptions):
                 logger.error(f"{operation_name} failed with non-retryable error: {e}")
+                if circuit_breaker is not None:
+                    circuit_breaker.release_probes()
                 raise
 
+            if circuit_breaker is not None:
+                _record_retry_failure(circuit_breaker, e, operation_name)
+
             if attempt < max_retries:
-                delay = base_delay * (backoff_multiplier**attempt)
+                delay = decorrelated_jitter(delay, base_delay, multiplier=backoff_multiplier)
                 logger.warning(
                     f"{operation_name} attempt {attempt + 1} failed: {e}. Retrying in {delay:.1f} seconds..."
                 )
@@ -0,0 +1,247 @@
+# this_file: src/virginia_clemm_poe/utils/trace.py
+"""Low-overhead trace recording for scrape runs.
+
+The metrics registry keeps latency summaries and loguru keeps messages, but
+neither shows how one run unfolded: which model waited on what, and where
+the concurrent workers overlapped. While tracing is enabled, every timed
+phase (``MetricsRegistry.time`` blocks, ``log_browser_operation`` and
+``log_api_request``) appends one tuple to a bounded ring buffer:
+
+    (start, duration, phase, model_id, outcome, lane)
+
+Nothing is formatted or logged while recording. The model ID comes from the
+enclosing ``log_browser_operation`` and the lane from the asyncio task, so
+concurrent workers show up as separate rows. The buffer is written on
+demand as NDJSON (one ``TraceEvent`` per line) or as Chrome trace JSON for
+chrome://tracing and https://ui.perfetto.dev. When tracing is disabled the
+hooks cost a single global lookup.
+
+Example:
+    ```python
+    enable_tracing()
+    await updater.update_all()
+    disable_tracing().write(Path("update-trace.json"))
+    ```
+"""
+
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from ..config import TRACE_BUFFER_EVENTS
+from ..types import TraceEvent
+
+# File suffixes written as NDJSON; anything else is written as Chrome trace JSON
+NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+
+# Model being processed by the current task, set by log_browser_operation
+_current_model: ContextVar[str | None] = ContextVar("trace_model_id", default=None)
+
+
+def _lane() -> int:
+    """Identify the running asyncio task (0 outside an event loop)."""
+    try:
+        return id(asyncio.current_task())
+    except RuntimeError:
+        return 0
+
+
+class TraceRecorder:
+    """Ring buffer of timed spans."""
+
+    def __init__(self, capacity: int = TRACE_BUFFER_EVENTS):
+        """Initialize an empty recorder.
+
+        Args:
+            capacity: Spans kept; older spans are dropped once it is reached
+        """
+        self.capacity = capacity
+        self.recorded = 0
+        self._events: deque[tuple[float, float, str, str | None, str, int]] = deque(maxlen=capacity)
+        # Anchor perf_counter readings to wall-clock time
+        self._origin_wall = time.time()
+        self._origin_perf = time.perf_counter()
+
+    def __len__(self) -> int:
+        """Number of spans in the buffer."""
+        return len(self._events)
+
+    @property
+    def dropped(self) -> int:
+        """Spans pushed out of the buffer."""
+        return self.recorded - len(self._events)
+
+    def record(
+        self, phase: str, start: float, duration: float, outcome: str = "ok", model_id: str | None = None
+    ) -> None:
+        """Append a span.
+
+        Args:
+            phase: Phase name, e.g. ``scrape.goto``
+            start: ``time.perf_counter()`` reading at the start of the span
+            duration: Span length in seconds
+            outcome: "ok", an error type or an HTTP status code
+            model_id: Model the span belongs to (default: the current model)
+        """
+        self.recorded += 1
+        self._events.append((start, duration, phase, model_id or _current_model.get(), outcome, _lane()))
+
+    def events(self) -> list[TraceEvent]:
+        """Get the buffered spans in recording order.
+
+        Returns:
+            List of TraceEvent dictionaries; lanes are numbered from 1 in
+            order of first appearance
+        """
+        lanes: dict[int, int] = {}
+        offset = self._origin_wall - self._origin_perf
+        return [
+            {
+                "ts": start + offset,
+                "duration_ms": duration * 1000,
+                "phase": phase,
+                "model_id": model_id,
+                "outcome": outcome,
+                "lane": lanes.setdefault(lane, len(lanes) + 1),
+            }
+            for start, duration, phase, model_id, outcome, lane in self._events
+        ]
+
+    def write_ndjson(self, path: Path) -> None:
+        """Write one JSON event per line.
+
+        Args:
+            path: Destination file (parent directories are created)
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w") as f:
+            f.writelines(json.dumps(event) + "\n" for event in self.events())
+
+    def write_chrome_trace(self, path: Path) -> None:
+        """Write the spans in Chrome trace event format.
+
+        Args:
+            path: Destination file (parent directories are created)
+        """
+        pid = os.getpid()
+        trace_events: list[dict[str, Any]] = [
+            {
+                "name": event["phase"],
+                "cat": event["phase"].split(".", 1)[0],
+                "ph": "X",
+                "ts": event["ts"] * 1_000_000,
+                "dur": event["duration_ms"] * 1000,
+                "pid": pid,
+                "tid": event["lane"],
+                "args": {"model_id": event["model_id"], "outcome": event["outcome"]},
+            }
+            for event in self.events()
+        ]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w") as f:
+            json.dump(
+                {"traceEvents": trace_events, "displayTimeUnit": "ms", "otherData": {"dropped_events": self.dropped}},
+                f,
+            )
+
+    def write(self, path: Path) -> None:
+        """Write the trace as NDJSON (``.ndjson``/``.jsonl``) or Chrome trace JSON (any other suffix).
+
+        Args:
+            path: Destination file
+        """
+        if path.suffix in NDJSON_SUFFIXES:
+            self.write_ndjson(path)
+        else:
+            self.write_chrome_trace(path)
+        if self.dropped:
+            logger.warning(f"Trace buffer overflowed, {self.dropped} oldest spans were dropped")
+        logger.debug(f"Wrote {len(self)} trace spans to {path}")
+
+
+# Global trace recorder, present only while tracing is enabled
+_recorder: TraceRecorder | None = None
+
+
+def get_trace_recorder() -> TraceRecorder | None:
+    """Get the active trace recorder.
+
+    Returns:
+        The recorder, or None while tracing is disabled
+    """
+    return _recorder
+
+
+def enable_tracing(capacity: int = TRACE_BUFFER_EVENTS) -> TraceRecorder:
+    """Start recording spans into a new ring buffer.
+
+    Args:
+        capacity: Spans kept before the oldest are dropped
+
+    Returns:
+        The active trace recorder
+    """
+    global _recorder
+
+    _recorder = TraceRecorder(capacity)
+    return _recorder
+
+
+def disable_tracing() -> TraceRecorder | None:
+    """Stop recording spans.
+
+    Returns:
+        The recorder with the spans recorded so far, or None if tracing was not enabled
+    """
+    global _recorder
+
+    recorder, _recorder = _recorder, None
+    return recorder
+
+
+def _outcome(context: dict[str, Any] | None) -> str:
+    """Derive a span outcome from a logging context dictionary."""
+    if context:
+        if "error_type" in context:
+            return str(context["error_type"])
+        if "status_code" in context:
+            return str(context["status_code"])
+    return "ok"
+
+
+@contextmanager
+def trace_span(phase: str, model_id: str | None = None, context: dict[str, Any] | None = None) -> Iterator[None]:
+    """Record the enclosed block as a span while tracing is enabled.
+
+    Args:
+        phase: Phase name, e.g. ``browser.scrape_model``
+        model_id: Model the block works on; nested spans inherit it
+        context: Logging context read at exit for ``error_type`` or
+            ``status_code`` to use as the outcome
+    """
+    recorder = _recorder
+    if recorder is None:
+        yield
+        return
+
+    token = _current_model.set(model_id) if model_id else None
+    start = time.perf_counter()
+    outcome = None
+    try:
+        yield
+    except BaseException as e:
+        outcome = type(e).__name__
+        raise
+    finally:
+        recorder.record(phase, start, time.perf_counter() - start, outcome or _outcome(context), model_id)
+        if token is not None:
+            _current_model.reset(token)
@@ -9,6 +9,20 @@ from typing import Any
 import pytest
 
 from virginia_clemm_poe.models import Architecture, BotInfo, ModelCollection, PoeModel, Pricing, PricingDetails
+from virginia_clemm_poe.utils.circuit_breaker import get_global_circuit_breaker
+from virginia_clemm_poe.utils.rate_limit import configure_rate_limiter
+
+
+@pytest.fixture(autouse=True)
+def reset_circuit_breaker() -> None:
+    """Start every test with closed circuits; failing scrapes in one test must not pause the next."""
+    get_global_circuit_breaker().reset()
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limiter() -> None:
+    """Start every test with full token buckets so earlier requests do not delay it."""
+    configure_rate_limiter()
 
 
 @pytest.fixture
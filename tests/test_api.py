@@ -2,10 +2,15 @@
 """Tests for public API functions."""
 
 import json
+import threading
+import time
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 from virginia_clemm_poe import api
+from virginia_clemm_poe.exceptions import ModelDataError
 from virginia_clemm_poe.models import ModelCollection
 
 
@@ -317,3 +322,85 @@ class TestReloadModels:
         """Test reload_models when no cache exists."""
         # Should not raise any errors even when cache is None
         api.reload_models()
+
+
+class TestFilterModels:
+    """Test filter_models function."""
+
+    def setup_method(self) -> None:
+        """Clear global cache before each test."""
+        api._collection = None
+
+    def test_filter_by_owner_and_pricing(self, mock_data_file: Path) -> None:
+        """All criteria must match; string criteria ignore case."""
+        with patch("virginia_clemm_poe.api.DATA_FILE_PATH", mock_data_file):
+            assert [m.id for m in api.filter_models({"owned_by": "TestOrg", "has_pricing": True})] == ["test-model-1"]
+            assert api.filter_models({"owned_by": "other"}) == []
+            assert api.filter_models({"needs_update": True}) == []
+
+    def test_filter_by_points(self, mock_data_file: Path) -> None:
+        """Point bounds compare the numeric primary cost."""
+        with patch("virginia_clemm_poe.api.DATA_FILE_PATH", mock_data_file):
+            assert len(api.filter_models({"max_points": 10})) == 1
+            assert api.filter_models({"min_points": 11}) == []
+
+    def test_filter_rejects_unknown_fields(self, mock_data_file: Path) -> None:
+        """Unknown criteria raise ModelDataError."""
+        with (
+            patch("virginia_clemm_poe.api.DATA_FILE_PATH", mock_data_file),
+            pytest.raises(ModelDataError, match="Invalid filter fields"),
+        ):
+            api.filter_models({"colour": "blue"})
+
+
+class TestConcurrentLoading:
+    """Test snapshot publication under concurrent callers."""
+
+    def setup_method(self) -> None:
+        """Clear global cache before each test."""
+        api._collection = None
+
+    def _load_concurrently(self, mock_data_file: Path, force_reload: bool) -> tuple[list[ModelCollection], int]:
+        read_count = 0
+        original_read = api._read_collection
+
+        def slow_read() -> ModelCollection:
+            nonlocal read_count
+            read_count += 1
+            time.sleep(0.05)
+            return original_read()
+
+        barrier = threading.Barrier(8)
+        results: list[ModelCollection] = []
+
+        def worker() -> None:
+            barrier.wait()
+            results.append(api.load_models(force_reload=force_reload))
+
+        with (
+            patch("virginia_clemm_poe.api.DATA_FILE_PATH", mock_data_file),
+            patch("virginia_clemm_poe.api._read_collection", side_effect=slow_read),
+        ):
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        return results, read_count
+
+    def test_concurrent_first_calls_parse_once(self, mock_data_file: Path) -> None:
+        """Concurrent first calls share a single load."""
+        results, read_count = self._load_concurrently(mock_data_file, force_reload=False)
+
+        assert read_count == 1
+        assert all(result is results[0] for result in results)
+
+    def test_concurrent_forced_reloads_coalesce(self, mock_data_file: Path) -> None:
+        """Simultaneous forced reloads are satisfied by one fresh snapshot."""
+        with patch("virginia_clemm_poe.api.DATA_FILE_PATH", mock_data_file):
+            stale = api.load_models()
+
+        results, read_count = self._load_concurrently(mock_data_file, force_reload=True)
+
+        assert read_count == 1
+        assert all(result is not stale for result in results)
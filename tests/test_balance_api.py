@@ -190,6 +190,40 @@ class TestFallbackChain:
             mock_api.assert_called_once()
 
 
+class TestTierMemory:
+    """Test that the last working balance method is remembered."""
+
+    @pytest.mark.asyncio
+    async def test_dead_tier_skipped_on_next_call(self, session_manager, mock_cookies):
+        """A failing GraphQL tier is skipped once the direct API has worked."""
+        session_manager.cookies = mock_cookies
+
+        with patch.object(session_manager, "_get_balance_via_graphql") as mock_graphql:
+            with patch.object(session_manager, "_get_balance_via_direct_api") as mock_direct:
+                mock_graphql.side_effect = APIError("GraphQL failed")
+                mock_direct.return_value = {"compute_points_available": 500}
+
+                await session_manager._get_balance_via_cookies()
+                await session_manager._get_balance_via_cookies()
+
+                assert session_manager.last_working_tier == "direct_api"
+                assert session_manager.is_tier_dead("graphql")
+                mock_graphql.assert_called_once()
+                assert mock_direct.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_working_tier_persisted_with_cache(self, tmp_path, mock_cookies):
+        """The working tier survives a reload through the balance cache file."""
+        manager = PoeSessionManager(cookies_dir=tmp_path)
+        manager.cookies = mock_cookies
+
+        with patch.object(manager, "_get_balance_via_graphql") as mock_graphql:
+            mock_graphql.return_value = {"compute_points_available": 42}
+            await manager.get_account_balance(force_refresh=True)
+
+        assert PoeSessionManager(cookies_dir=tmp_path).last_working_tier == "graphql"
+
+
 class TestBrowserDialogSuppression:
     """Test browser dialog suppression during balance scraping."""
 
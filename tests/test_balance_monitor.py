@@ -0,0 +1,120 @@
+# this_file: tests/test_balance_monitor.py
+"""Tests for the adaptive balance monitor."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from virginia_clemm_poe.balance_monitor import BalanceMonitor
+from virginia_clemm_poe.exceptions import AuthenticationError
+
+
+def _session_manager(*results: dict) -> MagicMock:
+    manager = MagicMock()
+    manager.get_account_balance = AsyncMock(side_effect=list(results))
+    manager.last_working_tier = "graphql"
+    return manager
+
+
+class TestBalanceMonitor:
+    """Test polling, publishing and interval adaptation."""
+
+    @pytest.mark.asyncio
+    async def test_publishes_only_changes(self) -> None:
+        """Subscribers are notified on the first value and on changes only."""
+        manager = _session_manager(
+            {"compute_points_available": 100},
+            {"compute_points_available": 100},
+            {"compute_points_available": 80},
+        )
+        monitor = BalanceMonitor(manager, initial_interval=0, min_interval=0, max_interval=0)
+        events: list[tuple[int, int | None]] = []
+
+        async def record(current: dict, previous: dict | None) -> None:
+            events.append((current["compute_points_available"], previous and previous["compute_points_available"]))
+
+        monitor.subscribe(record)
+        await monitor.run(max_polls=3)
+
+        assert events == [(100, None), (80, 100)]
+        assert monitor.latest == {"compute_points_available": 80}
+        manager.get_account_balance.assert_called_with(use_cache=False, force_refresh=True)
+
+    @pytest.mark.asyncio
+    async def test_interval_adapts(self) -> None:
+        """Idle polls back off, changes snap back to the minimum interval."""
+        manager = _session_manager(
+            {"compute_points_available": 100},
+            {"compute_points_available": 100},
+            {"compute_points_available": 90},
+        )
+        monitor = BalanceMonitor(manager, initial_interval=60, min_interval=30, max_interval=600)
+
+        await monitor.poll_once()
+        assert monitor.interval == 60
+        await monitor.poll_once()
+        assert monitor.interval > 60
+        await monitor.poll_once()
+        assert monitor.interval == 30
+
+    @pytest.mark.asyncio
+    async def test_failures_back_off_and_keep_last_value(self) -> None:
+        """Failed polls keep the hot value and lengthen the interval up to the cap."""
+        manager = _session_manager(
+            {"compute_points_available": 100},
+            {"compute_points_available": None, "error": "Failed to retrieve balance"},
+            RuntimeError("network down"),
+        )
+        monitor = BalanceMonitor(manager, initial_interval=60, min_interval=30, max_interval=200)
+
+        await monitor.poll_once()
+        assert await monitor.poll_once() is None
+        assert await monitor.poll_once() is None
+
+        assert monitor.consecutive_failures == 2
+        assert monitor.interval == 200
+        assert monitor.latest == {"compute_points_available": 100}
+
+    @pytest.mark.asyncio
+    async def test_get_balance_uses_hot_value(self) -> None:
+        """A fresh in-memory value is returned without polling."""
+        manager = _session_manager({"compute_points_available": 5})
+        monitor = BalanceMonitor(manager)
+
+        assert (await monitor.get_balance())["compute_points_available"] == 5
+        assert (await monitor.get_balance())["compute_points_available"] == 5
+        assert manager.get_account_balance.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_authentication_error_propagates(self) -> None:
+        """Missing sessions stop the monitor instead of retrying forever."""
+        manager = _session_manager(AuthenticationError("No authentication available"))
+        monitor = BalanceMonitor(manager)
+
+        with pytest.raises(AuthenticationError):
+            await monitor.run()
+
+    @pytest.mark.asyncio
+    async def test_background_task_stops_on_authentication_error(self) -> None:
+        """A background monitor logs the error and ends instead of dying silently."""
+        manager = _session_manager(AuthenticationError("Cookies expired"))
+        monitor = BalanceMonitor(manager)
+
+        await monitor.start()
+
+        assert not monitor.is_running
+        assert isinstance(monitor.stopped_by, AuthenticationError)
+        await monitor.stop()
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe(self) -> None:
+        """Unsubscribed callbacks are no longer called."""
+        manager = _session_manager({"compute_points_available": 1})
+        monitor = BalanceMonitor(manager)
+        callback = MagicMock()
+
+        unsubscribe = monitor.subscribe(callback)
+        unsubscribe()
+        await monitor.poll_once()
+
+        callback.assert_not_called()
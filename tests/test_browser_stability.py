@@ -1,6 +1,8 @@
 # this_file: tests/test_browser_stability.py
 """Integration tests for browser stability improvements."""
 
+import asyncio
+import os
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -33,7 +35,7 @@ class TestBrowserPoolStability:
 
     @pytest.mark.asyncio
     async def test_connection_close_with_context_cleanup(self):
-        """Test that browser connections close contexts properly."""
+        """Test that browser connections close the contexts they own properly."""
         mock_browser = MagicMock()
         mock_context = MagicMock()
         mock_manager = MagicMock()
@@ -51,7 +53,7 @@ class TestBrowserPoolStability:
         mock_context.pages = [mock_page1, mock_page2]
         mock_context.close = AsyncMock()
 
-        connection = BrowserConnection(mock_browser, mock_context, mock_manager)
+        connection = BrowserConnection(mock_browser, mock_context, mock_manager, owns_context=True)
 
         with patch("asyncio.sleep") as mock_sleep:
             await connection.close()
@@ -113,7 +115,7 @@ class TestBrowserPoolStability:
         mock_context.pages = [mock_page]
         mock_context.close = AsyncMock()
 
-        connection = BrowserConnection(mock_browser, mock_context, mock_manager)
+        connection = BrowserConnection(mock_browser, mock_context, mock_manager, owns_context=True)
 
         # Should not raise exception despite page error
         await connection.close()
@@ -231,7 +233,7 @@ class TestErrorRecovery:
         mock_context.pages = []
         mock_context.close = AsyncMock(side_effect=Exception("Context close error"))
 
-        connection = BrowserConnection(mock_browser, mock_context, mock_manager)
+        connection = BrowserConnection(mock_browser, mock_context, mock_manager, owns_context=True)
 
         # Should not raise exception
         await connection.close()
@@ -240,6 +242,138 @@ class TestErrorRecovery:
         mock_manager.close.assert_called_once()
         assert connection.is_healthy is False
 
+    @pytest.mark.asyncio
+    async def test_close_keeps_shared_context(self):
+        """Closing one connection to the default context leaves other connections' pages open."""
+        own_page = MagicMock()
+        own_page.is_closed = MagicMock(return_value=False)
+        own_page.wait_for_load_state = AsyncMock()
+        own_page.close = AsyncMock()
+        other_page = MagicMock()
+        other_page.close = AsyncMock()
+        context = MagicMock()
+        context.new_page = AsyncMock(return_value=own_page)
+        context.pages = [own_page, other_page]
+        context.close = AsyncMock()
+        manager = MagicMock()
+        manager.close = AsyncMock()
+
+        connection = BrowserConnection(MagicMock(spec=[]), context, manager)
+        await connection.get_page(reuse_session=False)
+        await connection.close()
+
+        own_page.close.assert_called_once()
+        other_page.close.assert_not_called()
+        context.close.assert_not_called()
+        manager.close.assert_called_once()
+
+
+class TestBrowserMemoryAccounting:
+    """Test per-connection browser memory measurement and recycling."""
+
+    @staticmethod
+    def _connection(process_ids: list[int]) -> BrowserConnection:
+        """Create a connection whose browser reports the given processes over CDP."""
+        session = MagicMock()
+        session.send = AsyncMock(return_value={"processInfo": [{"type": "browser", "id": pid} for pid in process_ids]})
+        session.detach = AsyncMock()
+        browser = MagicMock()
+        browser.new_browser_cdp_session = AsyncMock(return_value=session)
+        return BrowserConnection(browser, MagicMock(), MagicMock())
+
+    @pytest.mark.asyncio
+    async def test_measure_memory_over_cdp(self):
+        """Process IDs come from SystemInfo.getProcessInfo and RSS from psutil."""
+        connection = self._connection([os.getpid()])
+
+        memory_mb = await connection.measure_memory()
+
+        assert memory_mb is not None and memory_mb > 0
+        assert list(connection.memory_by_pid) == [os.getpid()]
+        assert connection.memory_mb == memory_mb
+        assert connection.peak_memory_mb == memory_mb
+        assert not connection.memory_check_due()
+
+    @pytest.mark.asyncio
+    async def test_measure_memory_falls_back_to_debug_port(self):
+        """Without CDP, the browser is found by its debugging port."""
+        browser = MagicMock()
+        browser.new_browser_cdp_session = AsyncMock(side_effect=Exception("Not a Chromium browser"))
+        manager = MagicMock()
+        manager.debug_port = 9333
+        connection = BrowserConnection(browser, MagicMock(), manager)
+
+        with patch("virginia_clemm_poe.browser_pool.find_browser_process_ids", return_value=[os.getpid()]) as find:
+            memory_mb = await connection.measure_memory()
+
+        find.assert_called_once_with(9333)
+        assert memory_mb is not None and memory_mb > 0
+
+    @pytest.mark.asyncio
+    async def test_connection_over_cap_is_recycled(self):
+        """A connection whose browser exceeds the cap is closed, not pooled."""
+        pool = BrowserPool(max_size=1, max_browser_memory_mb=100)
+        connection = self._connection([os.getpid()])
+        connection.close = AsyncMock()
+        pool._active_connections.add(connection)
+
+        with patch("virginia_clemm_poe.browser_pool.get_process_tree_rss_mb", return_value={1: 80.0, 2: 40.0}):
+            await pool._return_or_close_connection(connection)
+            await asyncio.sleep(0)
+
+        assert not pool._pool
+        connection.close.assert_called_once()
+        stats = await pool.get_stats()
+        assert stats["memory_recycles"] == 1
+        assert stats["max_browser_memory_mb"] == 100
+
+    @pytest.mark.asyncio
+    async def test_connection_under_cap_is_pooled(self):
+        """Measured memory is reported in the pool statistics."""
+        pool = BrowserPool(max_size=1, max_browser_memory_mb=100)
+        connection = self._connection([os.getpid()])
+        pool._active_connections.add(connection)
+
+        with patch("virginia_clemm_poe.browser_pool.get_process_tree_rss_mb", return_value={1: 30.0, 2: 20.0}):
+            await pool._return_or_close_connection(connection)
+
+        stats = await pool.get_stats()
+        assert list(pool._pool) == [connection]
+        assert stats["browser_memory_mb"] == 50.0
+        assert stats["browser_processes"] == 2
+        assert stats["pool_connections"][0]["memory_mb"] == 50.0
+        assert stats["memory_recycles"] == 0
+
+    @pytest.mark.asyncio
+    async def test_connections_sharing_a_browser_are_measured_once(self):
+        """Connections to one browser share a measurement and are recycled together, without thrashing."""
+        pool = BrowserPool(max_size=3, max_browser_memory_mb=100)
+        first = self._connection([os.getpid()])
+        second = self._connection([os.getpid()])
+        for connection in (first, second):
+            connection.close = AsyncMock()
+            pool._active_connections.add(connection)
+
+        with patch(
+            "virginia_clemm_poe.browser_pool.get_process_tree_rss_mb", return_value={1: 80.0, 2: 40.0}
+        ) as measure:
+            await pool._return_or_close_connection(first)
+            await pool._return_or_close_connection(second)
+
+            # A replacement created after the measurement is not judged until the next one
+            replacement = self._connection([os.getpid()])
+            replacement.created_at = first.browser_memory.recycle_before + 1
+            pool._active_connections.add(replacement)
+            await pool._return_or_close_connection(replacement)
+            await asyncio.sleep(0)
+
+        measure.assert_called_once()
+        assert first.browser_memory is second.browser_memory is replacement.browser_memory
+        first.close.assert_called_once()
+        second.close.assert_called_once()
+        assert list(pool._pool) == [replacement]
+        assert (await pool.get_stats())["memory_recycles"] == 1
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
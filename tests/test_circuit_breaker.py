@@ -0,0 +1,221 @@
+# this_file: tests/test_circuit_breaker.py
+"""Tests for the shared circuit breaker and jittered retry backoff."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from virginia_clemm_poe.exceptions import AuthenticationError, CircuitOpenError, RateLimitError
+from virginia_clemm_poe.utils.circuit_breaker import CircuitBreaker, CircuitState
+from virginia_clemm_poe.utils.crash_recovery import HTTP_FAILURE_CLASSES, CrashDetector, CrashRecovery, CrashType
+from virginia_clemm_poe.utils.timeout import decorrelated_jitter, with_retries
+
+
+def _open_circuit(breaker: CircuitBreaker, failure_class: str = "timeout_error") -> None:
+    """Record enough consecutive failures to open a circuit."""
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure(failure_class)
+
+
+class TestDecorrelatedJitter:
+    """Test retry delay selection."""
+
+    def test_delays_stay_within_bounds(self) -> None:
+        """Delays lie between the base and multiplier times the previous delay, capped."""
+        previous = 0.0
+        for _ in range(200):
+            delay = decorrelated_jitter(previous, 1.0, max_delay=20.0)
+            assert 1.0 <= delay <= min(20.0, max(previous, 1.0) * 3)
+            previous = delay
+
+    def test_delays_are_spread(self) -> None:
+        """Concurrent retries do not all wait the same time."""
+        assert len({decorrelated_jitter(4.0, 1.0) for _ in range(20)}) > 1
+
+
+class TestCircuitBreaker:
+    """Test circuit state transitions."""
+
+    def test_opens_after_consecutive_failures(self) -> None:
+        """Only the failing class's circuit opens, after the threshold is reached."""
+        breaker = CircuitBreaker(failure_threshold=3)
+
+        breaker.record_failure("timeout_error")
+        breaker.record_failure("timeout_error")
+        assert not breaker.is_open()
+
+        breaker.record_failure("timeout_error")
+        stats = breaker.get_stats()
+        assert stats["timeout_error"]["state"] == CircuitState.OPEN.value
+        assert stats["timeout_error"]["trips"] == 1
+        assert stats["timeout_error"]["retry_after_seconds"] > 0
+
+    def test_success_resets_failure_count(self) -> None:
+        """Failures separated by successes are not sustained."""
+        breaker = CircuitBreaker(failure_threshold=3)
+
+        for _ in range(5):
+            breaker.record_failure("network_error")
+            breaker.record_failure("network_error")
+            breaker.record_success()
+
+        assert not breaker.is_open()
+
+    @pytest.mark.asyncio
+    async def test_guard_pauses_then_probes(self) -> None:
+        """Callers wait out the cooldown; the first becomes the probe and success closes the circuit."""
+        breaker = CircuitBreaker(failure_threshold=1, base_cooldown=0.05, max_cooldown=0.05)
+        breaker.record_failure("connection_lost")
+
+        start = time.monotonic()
+        await breaker.guard("probe")
+        assert time.monotonic() - start >= 0.04
+        assert breaker.get_stats()["connection_lost"]["state"] == CircuitState.HALF_OPEN.value
+
+        waiter = asyncio.create_task(breaker.guard("waiter"))
+        await asyncio.sleep(0.02)
+        assert not waiter.done()
+
+        breaker.record_success()
+        await asyncio.wait_for(waiter, 1.0)
+        assert breaker.get_stats()["connection_lost"]["state"] == CircuitState.CLOSED.value
+
+    @pytest.mark.asyncio
+    async def test_failed_probe_reopens(self) -> None:
+        """A failing probe reopens the circuit and counts another trip."""
+        breaker = CircuitBreaker(failure_threshold=1, base_cooldown=0.01, max_cooldown=0.01)
+        breaker.record_failure("browser_crashed")
+
+        await breaker.guard("probe")
+        breaker.record_failure("browser_crashed")
+
+        stats = breaker.get_stats()["browser_crashed"]
+        assert stats["state"] == CircuitState.OPEN.value
+        assert stats["trips"] == 2
+
+    @pytest.mark.asyncio
+    async def test_fails_fast_after_max_trips(self) -> None:
+        """Once the circuit keeps tripping, callers are rejected instead of waiting."""
+        breaker = CircuitBreaker(failure_threshold=1, base_cooldown=60.0, max_trips=1)
+        breaker.record_failure("rate_limited")
+
+        with pytest.raises(CircuitOpenError) as exc_info:
+            await asyncio.wait_for(breaker.guard("scrape"), 1.0)
+
+        assert exc_info.value.failure_class == "rate_limited"
+        assert exc_info.value.retry_after > 0
+
+    @pytest.mark.asyncio
+    async def test_guard_ignores_unrelated_classes(self) -> None:
+        """Callers only wait on the circuits of the failure classes they name."""
+        breaker = CircuitBreaker(failure_threshold=1, base_cooldown=60.0, max_trips=1)
+        breaker.record_failure("browser_crashed")
+
+        await asyncio.wait_for(breaker.guard("balance", HTTP_FAILURE_CLASSES), 1.0)
+        assert not breaker.is_open(HTTP_FAILURE_CLASSES)
+        with pytest.raises(CircuitOpenError):
+            await asyncio.wait_for(breaker.guard("scrape"), 1.0)
+
+    @pytest.mark.asyncio
+    async def test_released_probe_lets_waiter_probe(self) -> None:
+        """A probe that ends without a verdict hands over to a waiting caller."""
+        breaker = CircuitBreaker(failure_threshold=1, base_cooldown=0.01, max_cooldown=0.01)
+        breaker.record_failure("connection_lost")
+        await breaker.guard("probe")
+
+        waiter = asyncio.create_task(breaker.guard("waiter"))
+        await asyncio.sleep(0.02)
+        assert not waiter.done()
+
+        breaker.release_probes()
+        await asyncio.wait_for(waiter, 1.0)
+        stats = breaker.get_stats()["connection_lost"]
+        assert stats["state"] == CircuitState.HALF_OPEN.value
+        assert stats["trips"] == 1
+
+
+class TestRetryIntegration:
+    """Test the breaker inside CrashRecovery and with_retries."""
+
+    def test_rate_limits_are_classified(self) -> None:
+        """RateLimitError and HTTP 429 responses are their own failure class."""
+        response_error = Exception("Too many requests")
+        response_error.response = type("Response", (), {"status_code": 429})()
+
+        assert CrashDetector.detect_crash_type(RateLimitError("slow down")) is CrashType.RATE_LIMITED
+        assert CrashDetector.detect_crash_type(response_error) is CrashType.RATE_LIMITED
+        assert CrashDetector.is_recoverable(CrashType.RATE_LIMITED)
+
+    @pytest.mark.asyncio
+    async def test_recovery_fails_fast_when_circuit_open(self) -> None:
+        """A degraded run rejects new operations without spending their retry budget."""
+        breaker = CircuitBreaker(failure_threshold=1, base_cooldown=60.0, max_trips=1)
+        breaker.record_failure("timeout_error")
+        recovery = CrashRecovery(circuit_breaker=breaker)
+        operation = AsyncMock(return_value="ok")
+
+        with pytest.raises(CircuitOpenError):
+            await recovery.recover_with_backoff(operation, "create_connection")
+
+        operation.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_recovery_feeds_breaker(self) -> None:
+        """Recoverable crashes count towards the breaker and open it for everyone."""
+        breaker = CircuitBreaker(failure_threshold=2, base_cooldown=60.0, max_trips=1)
+        recovery = CrashRecovery(max_retries=1, circuit_breaker=breaker)
+        operation = AsyncMock(side_effect=TimeoutError("wedged"))
+
+        with patch("asyncio.sleep", new=AsyncMock()), pytest.raises(TimeoutError):
+            await recovery.recover_with_backoff(operation, "scrape")
+
+        assert breaker.get_stats()["timeout_error"]["state"] == CircuitState.OPEN.value
+        assert recovery.get_crash_stats()["circuits"]["timeout_error"]["trips"] == 1
+
+    @pytest.mark.asyncio
+    async def test_with_retries_records_outcomes(self) -> None:
+        """with_retries reports failures and the final success to the breaker."""
+        breaker = CircuitBreaker(failure_threshold=3)
+        operation = AsyncMock(side_effect=[ConnectionError("reset"), "ok"])
+
+        with patch("asyncio.sleep", new=AsyncMock()):
+            result = await with_retries(operation, operation_name="balance", circuit_breaker=breaker)
+
+        assert result == "ok"
+        assert breaker.get_stats()["connection_lost"]["recent_failures"] == 0
+
+    def test_client_errors_are_not_recoverable(self) -> None:
+        """Rejected credentials and 4xx answers other than 429 never count towards a circuit."""
+        response_error = Exception("Client error '403 Forbidden' for url 'https://poe.com/api/connect'")
+        response_error.response = type("Response", (), {"status_code": 403})()
+
+        for error in (AuthenticationError("Cookies expired"), response_error):
+            assert not CrashDetector.is_recoverable(CrashDetector.detect_crash_type(error))
+
+    @pytest.mark.asyncio
+    async def test_with_retries_ignores_unrecoverable_failures(self) -> None:
+        """An expired cookie retried to exhaustion leaves every circuit closed."""
+        breaker = CircuitBreaker(failure_threshold=2)
+        operation = AsyncMock(side_effect=AuthenticationError("Cookies expired"))
+
+        with patch("asyncio.sleep", new=AsyncMock()), pytest.raises(AuthenticationError):
+            await with_retries(operation, max_retries=3, operation_name="balance", circuit_breaker=breaker)
+
+        assert operation.await_count == 4
+        assert breaker.get_stats() == {}
+
+    @pytest.mark.asyncio
+    async def test_unrecoverable_crash_releases_probe(self) -> None:
+        """A probe that fails with a non-recoverable error still lets the next caller probe."""
+        breaker = CircuitBreaker(failure_threshold=1, base_cooldown=0.01, max_cooldown=0.01)
+        breaker.record_failure("timeout_error")
+        recovery = CrashRecovery(circuit_breaker=breaker)
+        operation = AsyncMock(side_effect=ValueError("bad selector"))
+
+        with pytest.raises(ValueError):
+            await recovery.recover_with_backoff(operation, "scrape")
+
+        assert breaker.get_stats()["timeout_error"]["state"] == CircuitState.OPEN.value
+        await asyncio.wait_for(breaker.guard("next"), 1.0)
@@ -0,0 +1,155 @@
+# this_file: tests/test_concurrency.py
+"""Tests for adaptive scraping concurrency and throttle detection."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from virginia_clemm_poe.exceptions import RateLimitError
+from virginia_clemm_poe.models import PoeModel
+from virginia_clemm_poe.updater import ModelUpdater
+from virginia_clemm_poe.utils.concurrency import (
+    OUTCOME_SUCCESS,
+    OUTCOME_THROTTLED,
+    OUTCOME_TIMEOUT,
+    AdaptiveConcurrency,
+)
+
+
+async def _complete(
+    controller: AdaptiveConcurrency, count: int, latency: float = 1.0, outcome: str = OUTCOME_SUCCESS
+) -> None:
+    """Run ``count`` units of work through the controller one after another."""
+    for _ in range(count):
+        await controller.acquire()
+        await controller.release(latency, outcome)
+
+
+class TestAdaptiveConcurrency:
+    """Test the AIMD limit."""
+
+    @pytest.mark.asyncio
+    async def test_additive_increase(self) -> None:
+        """Each healthy round raises the limit by one, up to the maximum."""
+        controller = AdaptiveConcurrency(initial=2, maximum=4)
+
+        await _complete(controller, 2)
+        assert controller.limit == 3
+
+        await _complete(controller, 20)
+        assert controller.limit == 4
+
+    @pytest.mark.asyncio
+    async def test_throttling_halves_once_per_round(self) -> None:
+        """A burst of throttled responses from one round halves the limit once."""
+        controller = AdaptiveConcurrency(initial=8, maximum=8)
+
+        await _complete(controller, 3, outcome=OUTCOME_THROTTLED)
+
+        assert controller.limit == 4
+        assert controller.decreases == 1
+
+    @pytest.mark.asyncio
+    async def test_timeouts_and_latency_decrease(self) -> None:
+        """Rounds with too many timeouts or slow models lower the limit."""
+        controller = AdaptiveConcurrency(initial=4, latency_target=10.0, timeout_rate_limit=0.2)
+
+        await _complete(controller, 4, outcome=OUTCOME_TIMEOUT)
+        assert controller.limit == 2
+
+        await _complete(controller, 2, latency=30.0)
+        assert controller.limit == 1
+
+        await _complete(controller, 5, latency=30.0)
+        assert controller.limit == controller.minimum
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_a_free_slot(self) -> None:
+        """Workers beyond the limit wait until a slot is released."""
+        controller = AdaptiveConcurrency(initial=1, maximum=1)
+        await controller.acquire()
+
+        waiter = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await controller.release(1.0)
+        await asyncio.wait_for(waiter, 1.0)
+        assert controller.in_flight == 1
+
+
+class TestThrottleDetection:
+    """Test recognizing throttled page loads."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("status", "headers", "title"),
+        [
+            (429, {}, "Claude"),
+            (403, {"cf-mitigated": "challenge"}, "Claude"),
+            (200, {}, "Just a moment..."),
+        ],
+    )
+    async def test_throttled_responses(self, status: int, headers: dict[str, str], title: str) -> None:
+        """HTTP 429, Cloudflare challenge headers and challenge pages raise RateLimitError."""
+        response = MagicMock(status=status, headers=headers, url="https://poe.com/Claude")
+        page = MagicMock(url="https://poe.com/Claude")
+        page.title = AsyncMock(return_value=title)
+
+        with pytest.raises(RateLimitError):
+            await ModelUpdater._check_throttled(response, page)
+
+    @pytest.mark.asyncio
+    async def test_normal_page(self) -> None:
+        """A regular bot page passes."""
+        page = MagicMock()
+        page.title = AsyncMock(return_value="Claude-3-Opus - Poe")
+
+        await ModelUpdater._check_throttled(MagicMock(status=200, headers={}), page)
+
+
+class TestConcurrentUpdate:
+    """Test the worker loop that scrapes models concurrently."""
+
+    @pytest.mark.asyncio
+    async def test_workers_scrape_concurrently(self, sample_poe_model: PoeModel) -> None:
+        """Models are scraped by several workers and the pool follows the limit."""
+        models = [sample_poe_model.model_copy(update={"id": f"model-{i}"}) for i in range(12)]
+        running = 0
+        peak = 0
+        page_requests = []
+
+        @asynccontextmanager
+        async def acquire_page(reuse_session: bool | None = None) -> AsyncIterator[MagicMock]:
+            page_requests.append(reuse_session)
+            yield MagicMock()
+
+        pool = MagicMock(max_size=3)
+        pool.acquire_page = acquire_page
+        pool.resize = AsyncMock()
+        memory_monitor = MagicMock()
+        memory_monitor.cleanup_memory = AsyncMock()
+
+        async def update_model_data(model: PoeModel, *args: object) -> str | None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            if model.id == "model-5":
+                raise RateLimitError("HTTP 429")
+            return None
+
+        updater = ModelUpdater("test-key")
+        updater._update_model_data = update_model_data  # type: ignore[method-assign]
+
+        await updater._update_models_with_progress(models, True, True, memory_monitor, pool)
+
+        assert len(page_requests) == len(models)
+        assert set(page_requests) == {False}
+        assert peak > 1
+        assert memory_monitor.increment_operation_count.call_count == len(models)
+        assert pool.resize.await_count == len(models)
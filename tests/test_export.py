@@ -0,0 +1,154 @@
+# this_file: tests/test_export.py
+"""Tests for columnar model export."""
+
+import csv
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from virginia_clemm_poe import api
+from virginia_clemm_poe.export import (
+    COLUMN_NAMES,
+    COLUMNS,
+    export_models,
+    iter_models_from_file,
+    iter_rows,
+    model_row,
+)
+from virginia_clemm_poe.models import ModelCollection, PoeModel, PricingDetails
+
+
+@pytest.fixture
+def token_priced_model(sample_poe_model: PoeModel) -> PoeModel:
+    """Model priced per 1k tokens with an extra output rate label."""
+    details = PricingDetails(
+        **{"Input (text)": "10 points/1k tokens", "Output (text)": "40 points/1k tokens", "Per Message": "30 points"}
+    )
+    pricing = sample_poe_model.pricing.model_copy(update={"details": details})
+    return sample_poe_model.model_copy(update={"id": "token-model", "pricing": pricing})
+
+
+class TestModelRow:
+    """Test flattening models into rows."""
+
+    def test_row_matches_columns(self, sample_poe_model: PoeModel) -> None:
+        """Rows have one value per column, in column order."""
+        row = dict(zip(COLUMN_NAMES, model_row(sample_poe_model), strict=True))
+
+        assert len(COLUMNS) == len(COLUMN_NAMES)
+        assert row["id"] == "test-model-1"
+        assert row["input_modalities"] == ["text"]
+        assert row["has_pricing"] is True
+        assert row["pricing_input_text"] == "10 points/1k tokens"
+        assert row["bot_creator"] == "@testcreator"
+
+    def test_normalized_pricing(self, token_priced_model: PoeModel) -> None:
+        """Scraped pricing strings become numeric columns."""
+        row = dict(zip(COLUMN_NAMES, model_row(token_priced_model), strict=True))
+
+        assert row["primary_cost_points"] == 10.0
+        assert row["primary_cost_unit"] == "1k tokens"
+        assert row["input_points_per_1k"] == 10.0
+        assert row["output_points_per_1k"] == 40.0
+        assert row["message_points"] == 30.0
+        assert json.loads(row["pricing_extra"]) == {"Output (text)": "40 points/1k tokens"}
+
+    def test_model_without_pricing(self, sample_poe_model: PoeModel) -> None:
+        """Unpriced models have empty pricing columns."""
+        model = sample_poe_model.model_copy(update={"pricing": None, "bot_info": None})
+        row = dict(zip(COLUMN_NAMES, model_row(model), strict=True))
+
+        assert row["has_pricing"] is False
+        assert row["primary_cost_points"] is None
+        assert row["pricing_input_text"] is None
+        assert row["bot_creator"] is None
+
+
+class TestExportModels:
+    """Test writing exports."""
+
+    def test_csv(self, tmp_path: Path, sample_poe_model: PoeModel, token_priced_model: PoeModel) -> None:
+        """CSV has a header and one line per model."""
+        output = tmp_path / "models.csv"
+
+        assert export_models([sample_poe_model, token_priced_model], output, "csv") == 2
+
+        with open(output, newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert [row["id"] for row in rows] == ["test-model-1", "token-model"]
+        assert rows[1]["input_points_per_1k"] == "10.0"
+        assert rows[0]["pricing_checked_at"] == "2025-08-04T12:00:00"
+
+    def test_ndjson(self, tmp_path: Path, token_priced_model: PoeModel) -> None:
+        """NDJSON writes one JSON object per model."""
+        output = tmp_path / "models.ndjson"
+
+        export_models(iter([token_priced_model]), output, "ndjson")
+
+        lines = output.read_text().splitlines()
+        assert len(lines) == 1
+        record = json.loads(lines[0])
+        assert list(record) == list(COLUMN_NAMES)
+        assert record["output_points_per_1k"] == 40.0
+
+    def test_unknown_format(self, tmp_path: Path, sample_poe_model: PoeModel) -> None:
+        """Unknown formats are rejected before writing."""
+        with pytest.raises(ValueError, match="Unknown export format"):
+            export_models([sample_poe_model], tmp_path / "out.xlsx", "xlsx")
+
+    def test_rows_are_streamed(self, sample_poe_model: PoeModel) -> None:
+        """Rows are produced lazily from any iterable."""
+        consumed = []
+
+        def models():
+            for model in (sample_poe_model, sample_poe_model):
+                consumed.append(model.id)
+                yield model
+
+        rows = iter_rows(models())
+        next(rows)
+        assert consumed == ["test-model-1"]
+
+    def test_iter_models_from_file(self, mock_data_file: Path) -> None:
+        """Snapshot files are streamed as validated models."""
+        models = list(iter_models_from_file(mock_data_file))
+
+        assert [model.id for model in models] == ["test-model-1"]
+
+
+class TestArrowExport:
+    """Test Arrow-based exports (need the optional pyarrow package)."""
+
+    def test_parquet_roundtrip(self, tmp_path: Path, sample_poe_model: PoeModel, token_priced_model: PoeModel) -> None:
+        """Parquet output keeps column types across batches."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        output = tmp_path / "models.parquet"
+
+        assert export_models([sample_poe_model, token_priced_model], output, "parquet", batch_rows=1) == 2
+
+        table = pq.read_table(output)
+        assert table.column_names == list(COLUMN_NAMES)
+        assert str(table.schema.field("input_modalities").type) == "list<element: string>"
+        assert table.column("input_points_per_1k").to_pylist() == [10.0, 10.0]
+
+    def test_arrow_file(self, tmp_path: Path, sample_poe_model: PoeModel) -> None:
+        """Arrow IPC output can be read back."""
+        pa = pytest.importorskip("pyarrow")
+        output = tmp_path / "models.arrow"
+
+        export_models([sample_poe_model], output, "arrow")
+
+        assert pa.ipc.open_file(output).read_all().num_rows == 1
+
+    def test_api_to_table(self, mock_data_file: Path, sample_model_collection: ModelCollection) -> None:
+        """api.to_table() flattens the loaded models."""
+        pytest.importorskip("pyarrow")
+        api._collection = None
+        with patch("virginia_clemm_poe.api.DATA_FILE_PATH", mock_data_file):
+            table = api.to_table()
+        api._collection = None
+
+        assert table.num_rows == len(sample_model_collection.data)
+        assert table.column("id").to_pylist() == ["test-model-1"]
@@ -0,0 +1,117 @@
+# this_file: tests/test_file_watch.py
+"""Tests for the background file watcher and api auto-reload."""
+
+import json
+import os
+import time
+from collections.abc import Callable
+from pathlib import Path
+from unittest.mock import patch
+
+from virginia_clemm_poe import api
+from virginia_clemm_poe.models import ModelCollection
+from virginia_clemm_poe.utils.file_watch import FileWatcher
+
+
+def _wait_for(condition: Callable[[], bool], timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def _bump(path: Path, content: str) -> None:
+    """Rewrite a file and move its mtime forward so the change is always visible."""
+    path.write_text(content)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+class TestFileWatcher:
+    """Test change detection and retry behaviour."""
+
+    def test_check_runs_callback_once_per_change(self, tmp_path: Path) -> None:
+        """Unchanged files do not trigger the callback again."""
+        path = tmp_path / "data.json"
+        path.write_text("1")
+        calls: list[int] = []
+        watcher = FileWatcher(path, lambda: calls.append(1), use_native=False)
+
+        assert not watcher.check()
+        _bump(path, "22")
+        assert watcher.check()
+        assert not watcher.check()
+        assert calls == [1]
+
+    def test_failed_callback_is_retried(self, tmp_path: Path) -> None:
+        """A change whose handler fails is handled again on the next check."""
+        path = tmp_path / "data.json"
+        path.write_text("1")
+        attempts: list[int] = []
+
+        def handler() -> None:
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise ValueError("partial write")
+
+        watcher = FileWatcher(path, handler, use_native=False)
+        _bump(path, "22")
+
+        assert not watcher.check()
+        assert watcher.check()
+        assert watcher.change_count == 1
+
+    def test_polling_thread_detects_changes(self, tmp_path: Path) -> None:
+        """The polling backend notices a rewritten file."""
+        path = tmp_path / "data.json"
+        path.write_text("1")
+        calls: list[int] = []
+        watcher = FileWatcher(path, lambda: calls.append(1), poll_interval=0.01, use_native=False)
+        watcher.start()
+        try:
+            assert watcher.backend == "polling"
+            _bump(path, "22")
+            assert _wait_for(lambda: calls == [1])
+        finally:
+            watcher.stop()
+        assert not watcher.is_running
+
+
+class TestAutoReload:
+    """Test background reloads of the api collection."""
+
+    def setup_method(self) -> None:
+        """Clear global cache before each test."""
+        api._collection = None
+
+    def teardown_method(self) -> None:
+        """Stop any watcher and clear the cache."""
+        api.stop_auto_reload()
+        api._collection = None
+
+    def test_swaps_in_new_collection(self, mock_data_file: Path) -> None:
+        """A rewritten data file replaces the collection, indexes included."""
+        with patch("virginia_clemm_poe.api.DATA_FILE_PATH", mock_data_file):
+            api.start_auto_reload(poll_interval=0.01, use_native=False)
+            original = api.load_models()
+
+            collection = ModelCollection(**json.loads(mock_data_file.read_text()))
+            collection.data.append(collection.data[0].model_copy(update={"id": "new-model", "root": "new-model"}))
+            _bump(mock_data_file, collection.model_dump_json())
+
+            assert _wait_for(lambda: api.load_models() is not original)
+            assert api.get_model_by_id("new-model") is not None
+
+    def test_keeps_collection_on_bad_write(self, mock_data_file: Path) -> None:
+        """An unparseable data file leaves the current collection in place."""
+        with patch("virginia_clemm_poe.api.DATA_FILE_PATH", mock_data_file):
+            watcher = api.start_auto_reload(poll_interval=0.01, use_native=False)
+            original = api.load_models()
+
+            _bump(mock_data_file, "{not json")
+            time.sleep(0.1)
+
+            assert api.load_models() is original
+            assert watcher.change_count == 0
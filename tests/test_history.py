@@ -0,0 +1,191 @@
+# this_file: tests/test_history.py
+"""Tests for the pricing history store."""
+
+import json
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+
+from virginia_clemm_poe.history import (
+    PricingHistory,
+    compute_change_set,
+    tracked_fields,
+    write_change_set,
+)
+from virginia_clemm_poe.models import PoeModel, PricingDetails
+from virginia_clemm_poe.updater import ModelUpdater
+from virginia_clemm_poe.utils.http_cache import ValidatorStore
+
+T0 = datetime(2025, 8, 1, tzinfo=UTC)
+
+
+@pytest.fixture
+def history(tmp_path: Path) -> PricingHistory:
+    """History store in a temporary database."""
+    return PricingHistory(tmp_path / "history.sqlite3")
+
+
+def with_input_price(model: PoeModel, price: str) -> PoeModel:
+    """Copy a model with a different input price."""
+    details = model.pricing.details.model_copy(update={"input_text": price})
+    return model.model_copy(update={"pricing": model.pricing.model_copy(update={"details": details})})
+
+
+class TestTrackedFields:
+    """Test field extraction."""
+
+    def test_pricing_and_bot_info(self, sample_poe_model: PoeModel) -> None:
+        """Pricing details and bot info are flattened, timestamps are not."""
+        fields = tracked_fields(sample_poe_model)
+
+        assert fields["pricing.input_text"] == "10 points/1k tokens"
+        assert fields["bot_info.creator"] == "@testcreator"
+        assert not any("checked_at" in name for name in fields)
+
+    def test_extra_pricing_labels(self, sample_poe_model: PoeModel) -> None:
+        """Website labels without a dedicated field are tracked under their label."""
+        details = PricingDetails(**{"Output (text)": "40 points/1k tokens"})
+        pricing = sample_poe_model.pricing.model_copy(update={"details": details})
+        fields = tracked_fields(sample_poe_model.model_copy(update={"pricing": pricing}))
+
+        assert fields["pricing.Output (text)"] == "40 points/1k tokens"
+
+
+class TestPricingHistory:
+    """Test recording and querying runs."""
+
+    def test_records_only_changes(self, history: PricingHistory, sample_poe_model: PoeModel) -> None:
+        """The first run stores every field, later runs only what changed."""
+        first = history.record_snapshot([sample_poe_model], T0)
+        unchanged = history.record_snapshot([sample_poe_model], T0 + timedelta(days=1))
+        changed = history.record_snapshot(
+            [with_input_price(sample_poe_model, "12 points/1k tokens")], T0 + timedelta(days=2)
+        )
+
+        assert first == len(tracked_fields(sample_poe_model))
+        assert unchanged == 0
+        assert changed == 1
+        assert [run["change_count"] for run in history.runs()] == [1, 0, first]
+
+    def test_value_at(self, history: PricingHistory, sample_poe_model: PoeModel) -> None:
+        """Point-in-time lookups return the value in effect at that time."""
+        history.record_snapshot([sample_poe_model], T0)
+        history.record_snapshot([with_input_price(sample_poe_model, "12 points/1k tokens")], T0 + timedelta(days=2))
+
+        def price_at(days: float) -> str | None:
+            return history.value_at("test-model-1", "pricing.input_text", T0 + timedelta(days=days))
+
+        assert price_at(-1) is None
+        assert price_at(1) == "10 points/1k tokens"
+        assert price_at(2) == "12 points/1k tokens"
+        assert price_at(30) == "12 points/1k tokens"
+        assert history.fields_at("test-model-1", T0)["bot_info.creator"] == "@testcreator"
+
+    def test_removed_model(self, history: PricingHistory, sample_poe_model: PoeModel) -> None:
+        """Fields of a model missing from a snapshot are recorded as cleared."""
+        history.record_snapshot([sample_poe_model], T0)
+        cleared = history.record_snapshot([], T0 + timedelta(days=1))
+
+        assert cleared == len(tracked_fields(sample_poe_model))
+        assert history.fields_at("test-model-1", T0 + timedelta(days=1)) == {}
+        assert history.fields_at("test-model-1", T0) == tracked_fields(sample_poe_model)
+
+    def test_changes_since(self, history: PricingHistory, sample_poe_model: PoeModel) -> None:
+        """Changes can be filtered by time, model and field prefix."""
+        history.record_snapshot([sample_poe_model], T0)
+        history.record_snapshot([with_input_price(sample_poe_model, "12 points/1k tokens")], T0 + timedelta(days=2))
+
+        recent = history.changes_since(T0 + timedelta(days=1))
+        assert [(c["field"], c["previous"], c["value"]) for c in recent] == [
+            ("pricing.input_text", "10 points/1k tokens", "12 points/1k tokens")
+        ]
+        assert recent[0]["recorded_at"].startswith("2025-08-03T00:00:00")
+
+        pricing_changes = history.changes_since(model_id="test-model-1", field="pricing.")
+        assert pricing_changes and all(c["field"].startswith("pricing.") for c in pricing_changes)
+        assert history.changes_since(model_id="other-model") == []
+
+    def test_rejects_out_of_order_snapshot(self, history: PricingHistory, sample_poe_model: PoeModel) -> None:
+        """Snapshots must be recorded in chronological order."""
+        history.record_snapshot([sample_poe_model], T0)
+
+        with pytest.raises(ValueError, match="earlier than the latest"):
+            history.record_snapshot([sample_poe_model], T0 - timedelta(days=1))
+
+    def test_persists_across_instances(self, tmp_path: Path, sample_poe_model: PoeModel) -> None:
+        """A reopened store diffs against the previously recorded state."""
+        path = tmp_path / "history.sqlite3"
+        PricingHistory(path).record_snapshot([sample_poe_model], T0)
+
+        assert PricingHistory(path).record_snapshot([sample_poe_model], T0 + timedelta(hours=1)) == 0
+
+
+class TestChangeSet:
+    """Test change sets between two versions of the data."""
+
+    def test_added_removed_and_changed(self, sample_poe_model: PoeModel) -> None:
+        """Models are classified by one pass over the new data."""
+        gone = sample_poe_model.model_copy(update={"id": "gone-model"})
+        previous = {m.id: tracked_fields(m) for m in (sample_poe_model, gone)}
+        fresh = sample_poe_model.model_copy(update={"id": "new-model"})
+        repriced = with_input_price(sample_poe_model, "12 points/1k tokens")
+
+        change_set = compute_change_set(previous, [repriced, fresh], T0)
+
+        assert change_set["added"] == ["new-model"]
+        assert change_set["removed"] == ["gone-model"]
+        assert change_set["changed"] == {
+            "test-model-1": {"pricing.input_text": {"old": "10 points/1k tokens", "new": "12 points/1k tokens"}}
+        }
+        assert change_set["affected"] == ["gone-model", "new-model", "test-model-1"]
+        assert change_set["generated_at"].startswith("2025-08-01T00:00:00")
+
+    def test_unchanged_data(self, sample_poe_model: PoeModel) -> None:
+        """Identical data gives an empty change set."""
+        change_set = compute_change_set({sample_poe_model.id: tracked_fields(sample_poe_model)}, [sample_poe_model])
+
+        assert change_set["affected"] == []
+        assert change_set["changed"] == {}
+
+    def test_bot_info_change(self, sample_poe_model: PoeModel) -> None:
+        """Creator and description changes are reported."""
+        bot_info = sample_poe_model.bot_info.model_copy(update={"creator": "@someone"})
+        updated = sample_poe_model.model_copy(update={"bot_info": bot_info})
+
+        change_set = compute_change_set({sample_poe_model.id: tracked_fields(sample_poe_model)}, [updated])
+
+        assert change_set["changed"]["test-model-1"] == {"bot_info.creator": {"old": "@testcreator", "new": "@someone"}}
+
+    def test_write_change_set(self, tmp_path: Path, sample_poe_model: PoeModel) -> None:
+        """Change sets are written as JSON."""
+        change_set = compute_change_set({}, [sample_poe_model], T0)
+        path = tmp_path / "out" / "changes.json"
+
+        write_change_set(change_set, path)
+
+        assert json.loads(path.read_text()) == change_set
+
+    @pytest.mark.asyncio
+    async def test_sync_records_change_set(
+        self, tmp_path: Path, mock_data_file: Path, sample_api_response_data: dict[str, Any]
+    ) -> None:
+        """sync_models diffs against the data file even when forced."""
+        sample_api_response_data["data"][0]["id"] = "new-model"
+        body = json.dumps(sample_api_response_data).encode()
+        client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body)))
+        updater = ModelUpdater("test-api-key", session_manager=Mock())
+
+        with (
+            patch("virginia_clemm_poe.updater.DATA_FILE_PATH", mock_data_file),
+            patch("virginia_clemm_poe.updater.get_validator_store", return_value=ValidatorStore(tmp_path / "http")),
+            patch("virginia_clemm_poe.updater.get_async_client", return_value=client),
+        ):
+            await updater.sync_models(force=True, update_info=False, update_pricing=False)
+
+        assert updater.last_change_set is not None
+        assert updater.last_change_set["added"] == ["new-model"]
+        assert updater.last_change_set["removed"] == ["test-model-1"]
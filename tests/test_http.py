@@ -0,0 +1,71 @@
+# this_file: tests/test_http.py
+"""Tests for the shared HTTP client registry."""
+
+import httpx
+import pytest
+
+from virginia_clemm_poe.utils import http
+
+
+class TestConnectionStats:
+    """Test connection reuse accounting."""
+
+    def test_reuse_derived_from_new_connections(self) -> None:
+        """Requests without a new TCP connection count as reused."""
+        stats = http.ConnectionStats()
+        for _ in range(4):
+            stats.record_request("api.poe.com")
+        stats.record_new_connection("api.poe.com")
+
+        host_stats = stats.get_stats()["api.poe.com"]
+        assert host_stats["requests"] == 4
+        assert host_stats["new_connections"] == 1
+        assert host_stats["reused_connections"] == 3
+        assert host_stats["reuse_rate_percent"] == 75
+
+    def test_reset(self) -> None:
+        """Reset clears all hosts."""
+        stats = http.ConnectionStats()
+        stats.record_request("poe.com")
+        stats.reset()
+        assert stats.get_stats() == {}
+
+
+class TestSharedClients:
+    """Test shared client lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_async_client_reused_within_loop(self) -> None:
+        """The same client is returned while the event loop is unchanged."""
+        client = http.get_async_client()
+        try:
+            assert http.get_async_client() is client
+            assert isinstance(client, httpx.AsyncClient)
+        finally:
+            await http.close_http_clients()
+
+        assert http.get_async_client() is not client
+        await http.close_http_clients()
+
+    def test_sync_client_reused_until_closed(self) -> None:
+        """The sync client is shared until explicitly closed."""
+        client = http.get_sync_client()
+        assert http.get_sync_client() is client
+
+        http.close_sync_client()
+        assert client.is_closed
+        assert http.get_sync_client() is not client
+        http.close_sync_client()
+
+    def test_sync_request_hook_counts_requests(self) -> None:
+        """Requests through the shared client are recorded per host."""
+        http._connection_stats.reset()
+        request = httpx.Request("GET", "https://example.invalid/models")
+
+        http._sync_request_hook(request)
+        request.extensions["trace"]("connection.connect_tcp.complete", {})
+
+        stats = http.get_connection_stats()["example.invalid"]
+        assert stats["requests"] == 1
+        assert stats["new_connections"] == 1
+        http._connection_stats.reset()
@@ -0,0 +1,160 @@
+# this_file: tests/test_http_cache.py
+"""Tests for persisted HTTP validators and conditional model fetches."""
+
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+
+from virginia_clemm_poe.models import ModelCollection
+from virginia_clemm_poe.updater import ModelUpdater
+from virginia_clemm_poe.utils.http_cache import ValidatorStore, build_conditional_headers, compute_sha256
+
+
+class TestValidatorStore:
+    """Test the on-disk validator store."""
+
+    def test_staged_entry_not_visible_until_commit(self, tmp_path: Path) -> None:
+        """Staged validators are only readable after commit."""
+        store = ValidatorStore(tmp_path)
+        body = b'{"object": "list", "data": []}'
+        store.stage("https://example.invalid/models", '"abc"', None, compute_sha256(body), body)
+
+        assert store.load("https://example.invalid/models") is None
+        assert store.commit("https://example.invalid/models")
+
+        validators = store.load("https://example.invalid/models")
+        assert validators is not None
+        assert validators["etag"] == '"abc"'
+        assert validators["sha256"] == compute_sha256(body)
+        assert store.load_body("https://example.invalid/models") == body
+
+    def test_missing_body_invalidates_validators(self, tmp_path: Path) -> None:
+        """Validators without a stored body are ignored."""
+        store = ValidatorStore(tmp_path)
+        store.stage("https://example.invalid/models", '"abc"', None, "hash", b"{}")
+        store.commit("https://example.invalid/models")
+
+        next(tmp_path.glob("*.body")).unlink()
+        assert store.load("https://example.invalid/models") is None
+
+    def test_clear(self, tmp_path: Path) -> None:
+        """Clear removes stored and staged entries."""
+        store = ValidatorStore(tmp_path)
+        store.stage("https://example.invalid/a", None, None, "hash", b"{}")
+        store.commit("https://example.invalid/a")
+        store.stage("https://example.invalid/b", None, None, "hash", b"{}")
+
+        store.clear()
+        assert store.load("https://example.invalid/a") is None
+        assert not store.has_pending("https://example.invalid/b")
+
+    def test_build_conditional_headers(self) -> None:
+        """Only present validators become request headers."""
+        assert build_conditional_headers(None) == {}
+        headers = build_conditional_headers(
+            {"etag": '"v1"', "last_modified": "Wed, 01 Jan 2025 00:00:00 GMT", "sha256": "x"}
+        )
+        assert headers == {"If-None-Match": '"v1"', "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT"}
+
+
+class TestConditionalFetch:
+    """Test conditional requests in ModelUpdater."""
+
+    def _make_client(self, body: bytes, requests: list[httpx.Request]) -> httpx.AsyncClient:
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=body, headers={"ETag": '"v1"'})
+
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    @pytest.mark.asyncio
+    async def test_not_modified_served_from_store(
+        self, tmp_path: Path, sample_api_response_data: dict[str, Any]
+    ) -> None:
+        """A 304 answer returns the stored body and reports it unchanged."""
+        body = json.dumps(sample_api_response_data).encode()
+        requests: list[httpx.Request] = []
+        store = ValidatorStore(tmp_path)
+        updater = ModelUpdater("test-api-key", session_manager=Mock())
+
+        with (
+            patch("virginia_clemm_poe.updater.get_validator_store", return_value=store),
+            patch("virginia_clemm_poe.updater.get_async_client", return_value=self._make_client(body, requests)),
+        ):
+            first_path, first_unchanged = await updater._request_models_body()
+            assert not first_unchanged
+            assert first_path.read_bytes() == body
+            assert store.commit("https://api.poe.com/v1/models")
+
+            second_path, second_unchanged = await updater._request_models_body()
+
+        assert second_unchanged
+        assert second_path.read_bytes() == body
+        assert requests[1].headers["If-None-Match"] == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_fetch_models_leaves_nothing_staged(
+        self, tmp_path: Path, sample_api_response_data: dict[str, Any]
+    ) -> None:
+        """Fetching without saving the data file neither persists nor leaks validators."""
+        body = json.dumps(sample_api_response_data).encode()
+        store = ValidatorStore(tmp_path)
+        updater = ModelUpdater("test-api-key", session_manager=Mock())
+
+        with (
+            patch("virginia_clemm_poe.updater.get_validator_store", return_value=store),
+            patch("virginia_clemm_poe.updater.get_async_client", return_value=self._make_client(body, [])),
+        ):
+            response = await ModelUpdater.fetch_models_from_api.func(updater)
+
+        assert response["data"][0]["id"] == "test-model-1"
+        assert not store.has_pending("https://api.poe.com/v1/models")
+        assert store.load("https://api.poe.com/v1/models") is None
+        assert not list(tmp_path.glob("*.pending"))
+
+    @pytest.mark.asyncio
+    async def test_fetch_models_drops_invalid_records(
+        self, tmp_path: Path, sample_api_response_data: dict[str, Any]
+    ) -> None:
+        """The streamed public fetch returns only the records that validate."""
+        sample_api_response_data["data"].append({"id": "broken"})
+        body = json.dumps(sample_api_response_data).encode()
+        updater = ModelUpdater("test-api-key", session_manager=Mock())
+
+        with (
+            patch("virginia_clemm_poe.updater.get_validator_store", return_value=ValidatorStore(tmp_path)),
+            patch("virginia_clemm_poe.updater.get_async_client", return_value=self._make_client(body, [])),
+        ):
+            response = await ModelUpdater.fetch_models_from_api.func(updater)
+
+        assert response["object"] == "list"
+        assert [record["id"] for record in response["data"]] == ["test-model-1"]
+
+    @pytest.mark.asyncio
+    async def test_sync_skips_merge_when_unchanged(
+        self, tmp_path: Path, mock_data_file: Path, sample_api_response_data: dict[str, Any]
+    ) -> None:
+        """An unchanged model list reuses the existing collection without parsing."""
+        body = json.dumps(sample_api_response_data).encode()
+        store = ValidatorStore(tmp_path / "http")
+        store.stage("https://api.poe.com/v1/models", '"v1"', None, compute_sha256(body), body)
+        store.commit("https://api.poe.com/v1/models")
+        updater = ModelUpdater("test-api-key", session_manager=Mock())
+
+        with (
+            patch("virginia_clemm_poe.updater.DATA_FILE_PATH", mock_data_file),
+            patch("virginia_clemm_poe.updater.get_validator_store", return_value=store),
+            patch("virginia_clemm_poe.updater.get_async_client", return_value=self._make_client(body, [])),
+            patch.object(updater, "_merge_models") as mock_merge,
+        ):
+            collection = await updater.sync_models(update_info=False, update_pricing=False)
+
+        mock_merge.assert_not_called()
+        assert isinstance(collection, ModelCollection)
+        assert collection.data[0].id == "test-model-1"
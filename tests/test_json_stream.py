@@ -0,0 +1,61 @@
+# this_file: tests/test_json_stream.py
+"""Tests for incremental JSON array parsing."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from virginia_clemm_poe.utils.json_stream import JsonArrayStream
+
+
+def _chunked(text: str, size: int) -> list[bytes]:
+    raw = text.encode()
+    return [raw[i : i + size] for i in range(0, len(raw), size)]
+
+
+class TestJsonArrayStream:
+    """Test streaming of a top-level array member."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 64, 4096])
+    def test_matches_json_loads(self, chunk_size: int, sample_api_response_data: dict[str, Any]) -> None:
+        """Streaming yields the same elements regardless of chunk boundaries."""
+        document = dict(sample_api_response_data)
+        document["data"] = [dict(document["data"][0], id=f"model-{i}", created=10**i) for i in range(5)]
+        document["total"] = 12345
+        text = json.dumps(document, ensure_ascii=False) + "\n"
+
+        stream = JsonArrayStream(_chunked(text, chunk_size), "data")
+        items = list(stream)
+
+        assert items == document["data"]
+        assert stream.found_array
+        assert stream.meta == {"object": "list", "total": 12345}
+
+    def test_multibyte_characters_split_across_chunks(self) -> None:
+        """UTF-8 sequences split between chunks are decoded correctly."""
+        text = json.dumps({"data": [{"name": "Poe — ✨ 🤖"}]}, ensure_ascii=False)
+        assert list(JsonArrayStream(_chunked(text, 1), "data")) == [{"name": "Poe — ✨ 🤖"}]
+
+    def test_empty_array_and_missing_key(self) -> None:
+        """Empty arrays yield nothing; a missing array is reported."""
+        empty = JsonArrayStream([b'{"object": "list", "data": []}'], "data")
+        assert list(empty) == []
+        assert empty.found_array
+
+        missing = JsonArrayStream([b'{"object": "list"}'], "data")
+        assert list(missing) == []
+        assert not missing.found_array
+
+    def test_truncated_input_raises(self) -> None:
+        """Incomplete documents raise JSONDecodeError."""
+        stream = JsonArrayStream([b'{"data": [{"id": "a"}, {"id": '], "data")
+        with pytest.raises(json.JSONDecodeError):
+            list(stream)
+
+    def test_from_path(self, tmp_path: Path) -> None:
+        """Streams can read directly from a file."""
+        path = tmp_path / "models.json"
+        path.write_text(json.dumps({"object": "list", "data": [1, 2, 3]}))
+        assert list(JsonArrayStream.from_path(path, "data", chunk_size=2)) == [1, 2, 3]
@@ -0,0 +1,151 @@
+# this_file: tests/test_lite.py
+"""Tests for the compact lite model view."""
+
+import dataclasses
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from virginia_clemm_poe import api
+from virginia_clemm_poe.config import DATA_FILE_PATH
+from virginia_clemm_poe.lite import LiteCollection, LiteModel, primary_cost_from_details
+from virginia_clemm_poe.models import ModelCollection, PoeModel
+
+
+@pytest.fixture(autouse=True)
+def clear_api_cache() -> None:
+    """Reset the global collections around each test."""
+    api._collection = None
+    api._lite_collection = None
+    yield
+    api._collection = None
+    api._lite_collection = None
+
+
+class TestLiteModel:
+    """Test LiteModel construction and behaviour."""
+
+    def test_from_model_matches_full_model(self, sample_poe_model: PoeModel) -> None:
+        """Test that the lite view reports the same values as the full model."""
+        lite = LiteModel.from_model(sample_poe_model)
+
+        assert lite.id == sample_poe_model.id
+        assert lite.input_modalities == ("text",)
+        assert lite.get_primary_cost() == sample_poe_model.get_primary_cost()
+        assert lite.has_pricing() is sample_poe_model.has_pricing()
+        assert lite.needs_pricing_update() is sample_poe_model.needs_pricing_update()
+        assert lite.creator == "@testcreator"
+        assert lite.initial_points_cost == "100 points"
+
+    def test_from_dict_matches_from_model(self, sample_poe_model: PoeModel) -> None:
+        """Test that building from raw JSON and from Pydantic gives equal views."""
+        raw = json.loads(sample_poe_model.model_dump_json())
+
+        assert LiteModel.from_dict(raw) == LiteModel.from_model(sample_poe_model)
+        assert LiteModel.from_dict(raw).pricing_checked_at == sample_poe_model.pricing.checked_at.isoformat()
+
+    def test_model_without_pricing(self, sample_api_response_data: dict) -> None:
+        """Test a model that has not been scraped yet."""
+        lite = LiteModel.from_dict(sample_api_response_data["data"][0])
+
+        assert lite.primary_cost is None
+        assert not lite.has_pricing()
+        assert lite.needs_pricing_update()
+        assert lite.creator is None
+
+    def test_is_read_only_and_slotted(self, sample_poe_model: PoeModel) -> None:
+        """Test that lite models cannot be modified and carry no __dict__."""
+        lite = LiteModel.from_model(sample_poe_model)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            lite.id = "other"  # type: ignore[misc]
+        assert not hasattr(lite, "__dict__")
+
+    def test_primary_cost_uses_aliases_and_extra_keys(self) -> None:
+        """Test primary cost selection on raw details keyed by website labels."""
+        assert primary_cost_from_details({"Input (text)": "10 points/1k tokens"}) == "10 points/1k tokens"
+        assert primary_cost_from_details({"Output (text)": "50 points/1k tokens"}) == "50 points/1k tokens"
+        assert primary_cost_from_details({}) is None
+
+
+class TestLiteCollection:
+    """Test LiteCollection building and lookups."""
+
+    def test_shares_repeated_values(self, sample_api_response_data: dict) -> None:
+        """Test that modality tuples and owner strings are shared between models."""
+        record = sample_api_response_data["data"][0]
+        other = json.loads(json.dumps({**record, "id": "test-model-2", "root": "test-model-2"}))
+        lite = LiteCollection.from_json_data({"data": [record, other]})
+
+        first, second = lite.models
+        assert first.input_modalities is second.input_modalities
+        assert first.owned_by is second.owned_by
+
+    def test_lookup_and_search(self, sample_model_collection: ModelCollection) -> None:
+        """Test id lookup and substring search."""
+        lite = LiteCollection.from_json_data(json.loads(sample_model_collection.model_dump_json()))
+
+        assert len(lite) == 1
+        assert lite.get_by_id("test-model-1") is lite.models[0]
+        assert lite.get_by_id("missing") is None
+        assert [m.id for m in lite.search("TEST")] == ["test-model-1"]
+
+    @pytest.mark.skipif(not DATA_FILE_PATH.exists(), reason="Bundled data file not available")
+    def test_parity_with_bundled_data(self) -> None:
+        """Test that every model in the shipped data file has a faithful lite view."""
+        with DATA_FILE_PATH.open() as f:
+            data = json.load(f)
+        full = ModelCollection(**data)
+        lite = LiteCollection.from_json_data(data)
+
+        assert len(lite) == len(full.data)
+        for model, view in zip(full.data, lite, strict=True):
+            assert view.get_primary_cost() == model.get_primary_cost(), model.id
+            assert view.has_pricing() is model.has_pricing(), model.id
+            assert view.needs_pricing_update() is model.needs_pricing_update(), model.id
+
+
+class TestApiLiteMode:
+    """Test lite=True on the API functions."""
+
+    def test_api_functions_return_lite_models(self, mock_data_file: Path) -> None:
+        """Test that each lite-capable API function returns LiteModel objects."""
+        with patch("virginia_clemm_poe.api.DATA_FILE_PATH", mock_data_file):
+            assert all(isinstance(m, LiteModel) for m in api.get_all_models(lite=True))
+            assert isinstance(api.get_model_by_id("test-model-1", lite=True), LiteModel)
+            assert [m.id for m in api.search_models("test", lite=True)] == ["test-model-1"]
+            assert [m.id for m in api.get_models_with_pricing(lite=True)] == ["test-model-1"]
+
+        # The lite view is built without loading the full Pydantic collection
+        assert api._collection is None
+
+    def test_lite_view_is_cached(self, mock_data_file: Path) -> None:
+        """Test that repeated lite calls reuse one collection."""
+        with patch("virginia_clemm_poe.api.DATA_FILE_PATH", mock_data_file):
+            assert api.load_lite_models() is api.load_lite_models()
+
+    def test_reload_invalidates_lite_view(self, mock_data_file: Path) -> None:
+        """Test that publishing a new full collection drops the lite view."""
+        with patch("virginia_clemm_poe.api.DATA_FILE_PATH", mock_data_file):
+            before = api.load_lite_models()
+            api.reload_models()
+            assert api._lite_collection is None
+            assert api.load_lite_models() is not before
+
+    def test_lite_view_follows_published_snapshot(self, mock_data_file: Path) -> None:
+        """Test that the lite view describes the loaded collection, not a newer file."""
+        with patch("virginia_clemm_poe.api.DATA_FILE_PATH", mock_data_file):
+            collection = api.load_models()
+            data = json.loads(mock_data_file.read_text())
+            data["data"][0]["id"] = "renamed-model"
+            mock_data_file.write_text(json.dumps(data))
+
+            assert [m.id for m in api.get_all_models(lite=True)] == [m.id for m in collection.data]
+
+    def test_missing_file_returns_empty(self, tmp_path: Path) -> None:
+        """Test that a missing data file gives an empty lite collection."""
+        with patch("virginia_clemm_poe.api.DATA_FILE_PATH", tmp_path / "missing.json"):
+            assert api.get_all_models(lite=True) == []
+            assert api._lite_collection is None
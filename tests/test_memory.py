@@ -0,0 +1,157 @@
+# this_file: tests/test_memory.py
+"""Tests for adaptive garbage collection and allocation profiling."""
+
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Iterator
+from unittest.mock import patch
+
+import psutil
+import pytest
+
+from virginia_clemm_poe.utils import memory
+from virginia_clemm_poe.utils.memory import (
+    AllocationProfiler,
+    MemoryManagedOperation,
+    MemoryMonitor,
+    disable_allocation_profiling,
+    enable_allocation_profiling,
+    find_browser_process_ids,
+    get_allocation_profiler,
+    get_process_tree_rss_mb,
+)
+
+
+@pytest.fixture
+def profiling() -> Iterator[AllocationProfiler]:
+    """Enable allocation profiling for one test."""
+    if tracemalloc.is_tracing():
+        pytest.skip("tracemalloc is already tracing in this process")
+    profiler = enable_allocation_profiling()
+    try:
+        yield profiler
+    finally:
+        disable_allocation_profiling()
+
+
+class TestAdaptiveCollection:
+    """Test generation selection in cleanup_memory."""
+
+    @pytest.mark.asyncio
+    async def test_young_collection_below_growth_threshold(self) -> None:
+        """Routine cleanups only collect the young generations."""
+        monitor = MemoryMonitor()
+
+        with patch.object(monitor, "allocation_growth_mb", return_value=1.0), patch("gc.collect", return_value=0) as gc:
+            result = await monitor.cleanup_memory(force=True)
+
+        gc.assert_called_once_with(1)
+        assert result["generation"] == 1
+        assert monitor.young_collections == 1
+        assert monitor.full_collections == 0
+
+    @pytest.mark.asyncio
+    async def test_full_collection_after_growth(self) -> None:
+        """A full collection runs once growth reaches the threshold."""
+        monitor = MemoryMonitor()
+        growth = memory.FULL_GC_GROWTH_THRESHOLD_MB
+
+        with (
+            patch.object(monitor, "allocation_growth_mb", return_value=growth),
+            patch("gc.collect", return_value=5) as gc,
+        ):
+            result = await monitor.cleanup_memory(force=True)
+
+        gc.assert_called_once_with(2)
+        assert result["generation"] == 2
+        assert result["objects_collected"] == 5
+        assert monitor.full_collections == 1
+
+    def test_growth_baseline_restarts_with_tracing(self, profiling: AllocationProfiler) -> None:
+        """Switching between RSS and tracemalloc measurements restarts the baseline."""
+        monitor = MemoryMonitor()
+        monitor._growth_baseline = ("rss", 0)
+
+        assert monitor.allocation_growth_mb() == 0.0
+        assert monitor._growth_baseline[0] == "tracemalloc"
+
+
+class TestAllocationProfiling:
+    """Test tracemalloc snapshots around memory-managed operations."""
+
+    def test_enable_and_disable(self, profiling: AllocationProfiler) -> None:
+        """Enabling starts tracing; disabling stops it and returns the reports."""
+        assert get_allocation_profiler() is profiling
+        assert tracemalloc.is_tracing()
+
+        assert disable_allocation_profiling() == []
+        assert get_allocation_profiler() is None
+        assert not tracemalloc.is_tracing()
+
+    @pytest.mark.asyncio
+    async def test_operation_reports_growth_per_operation(self, profiling: AllocationProfiler) -> None:
+        """Growth is reported in total, per counted operation and by allocation site."""
+        retained = []
+        operation = MemoryManagedOperation("scrape", cleanup_on_exit=False)
+
+        async with operation as monitor:
+            for _ in range(4):
+                retained.append(bytearray(256 * 1024))
+                monitor.total_operations += 1
+
+        report = operation.allocation_report
+        assert report is not None
+        assert report is profiling.reports[-1]
+        assert report["operation"] == "scrape"
+        assert report["operations"] == 4
+        assert report["growth_bytes"] >= 1024 * 1024
+        assert report["growth_per_operation_bytes"] == report["growth_bytes"] / 4
+        assert report["top_sites"][0]["site"].startswith(__file__)
+        assert report["top_sites"][0]["size_diff_bytes"] >= 1024 * 1024
+
+    @pytest.mark.asyncio
+    async def test_no_snapshots_without_profiling(self) -> None:
+        """Operations do not snapshot while profiling is disabled."""
+        operation = MemoryManagedOperation("scrape", cleanup_on_exit=False)
+
+        with patch("tracemalloc.take_snapshot") as take_snapshot:
+            async with operation:
+                pass
+
+        take_snapshot.assert_not_called()
+        assert operation.allocation_report is None
+
+
+class TestBrowserProcessLookup:
+    """Test finding and measuring browser process trees."""
+
+    def test_find_browser_by_debug_port(self) -> None:
+        """The process started with the debugging port is found with its children."""
+        script = (
+            "import subprocess, sys, time; "
+            "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)']); time.sleep(30)"
+        )
+        process = subprocess.Popen([sys.executable, "-c", script, "--remote-debugging-port=65501"])
+        try:
+            deadline = time.time() + 10
+            pids: list[int] = []
+            while time.time() < deadline and len(pids) < 2:
+                pids = find_browser_process_ids(65501)
+                time.sleep(0.05)
+
+            assert pids[0] == process.pid
+            assert len(pids) == 2
+            assert set(get_process_tree_rss_mb(pids)) == set(pids)
+        finally:
+            for child in psutil.Process(process.pid).children(recursive=True):
+                child.kill()
+            process.kill()
+            process.wait()
+
+    def test_missing_processes_are_skipped(self) -> None:
+        """Processes that exited are left out of the measurement."""
+        assert find_browser_process_ids(65502) == []
+        assert list(get_process_tree_rss_mb([os.getpid(), 2**22 + 1])) == [os.getpid()]
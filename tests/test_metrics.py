@@ -0,0 +1,113 @@
+# this_file: tests/test_metrics.py
+"""Tests for the in-process metrics registry and scrape phase timing."""
+
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from virginia_clemm_poe.updater import ModelUpdater
+from virginia_clemm_poe.utils.metrics import Histogram, MetricsRegistry
+
+
+class TestHistogram:
+    """Test latency histogram statistics."""
+
+    def test_summary_percentiles(self) -> None:
+        """Percentiles use the nearest rank of all observations."""
+        histogram = Histogram()
+        for value in range(1, 101):
+            histogram.observe(value / 1000)
+
+        summary = histogram.summary()
+        assert summary["count"] == 100
+        assert summary["total"] == pytest.approx(5.05)
+        assert summary["min"] == 0.001
+        assert summary["max"] == 0.1
+        assert summary["p50"] == 0.05
+        assert summary["p95"] == 0.095
+        assert summary["p99"] == 0.099
+
+    def test_samples_are_bounded(self) -> None:
+        """Only max_samples values are kept, while totals stay exact."""
+        histogram = Histogram(max_samples=10)
+        for value in range(1000):
+            histogram.observe(float(value))
+
+        assert len(histogram._samples) == 10
+        assert histogram.count == 1000
+        assert histogram.max == 999.0
+        assert histogram.percentile(100) is not None
+
+    def test_empty(self) -> None:
+        """An empty histogram has no percentiles."""
+        assert Histogram().percentile(50) is None
+        assert Histogram().summary() == {"count": 0, "total": 0.0}
+
+
+class TestMetricsRegistry:
+    """Test counters, timers and the JSON report."""
+
+    def test_counters_and_timers(self) -> None:
+        """Counters add up and timed blocks land in their histogram."""
+        metrics = MetricsRegistry()
+        metrics.increment("selector.creator.fallback")
+        metrics.increment("selector.creator.fallback", 2)
+        with metrics.time("scrape.goto"):
+            pass
+
+        assert metrics.counter("selector.creator.fallback") == 3
+        assert metrics.counter("missing") == 0
+        assert metrics.histogram("scrape.goto").count == 1
+
+    def test_time_records_failures(self) -> None:
+        """A block that raises is still timed."""
+        metrics = MetricsRegistry()
+        with pytest.raises(RuntimeError), metrics.time("scrape.goto"):
+            raise RuntimeError("navigation failed")
+
+        assert metrics.histogram("scrape.goto").count == 1
+
+    def test_write_json_and_reset(self, tmp_path: Path) -> None:
+        """The snapshot is written as JSON and reset clears everything."""
+        metrics = MetricsRegistry()
+        metrics.observe("pool.page_close", 0.25)
+        metrics.increment("scrape.success")
+        output = tmp_path / "nested" / "metrics.json"
+
+        metrics.write_json(output)
+        report = json.loads(output.read_text())
+
+        assert report["counters"] == {"scrape.success": 1}
+        assert report["histograms"]["pool.page_close"]["p99"] == 0.25
+        metrics.reset()
+        assert metrics.is_empty()
+
+
+class TestScrapePhaseTiming:
+    """Test that scraping feeds per-phase metrics."""
+
+    @pytest.mark.asyncio
+    async def test_scrape_records_phases(self) -> None:
+        """Each scrape phase and the selector outcome is recorded."""
+        metrics = MetricsRegistry()
+        page = MagicMock()
+        page.goto = AsyncMock()
+        page.title = AsyncMock(return_value="test-model")
+        page.query_selector = AsyncMock(return_value=None)
+        updater = ModelUpdater("test-key")
+
+        with (
+            patch("virginia_clemm_poe.updater.get_metrics_registry", return_value=metrics),
+            patch("virginia_clemm_poe.updater.PAUSE_SECONDS", 0),
+            patch("virginia_clemm_poe.updater.asyncio.sleep", AsyncMock()),
+        ):
+            pricing, _, error = await updater._scrape_model_info_uncached("test-model", page)
+
+        assert pricing is None
+        assert error == "No action bar found on page"
+        for phase in ("scrape.total", "scrape.goto", "scrape.sleep", "scrape.bot_info", "scrape.rates_dialog"):
+            assert metrics.histogram(phase).count == 1, phase
+        assert metrics.counter("selector.creator.miss") == 1
+        assert metrics.counter("selector.initial_points_cost.miss") == 1
@@ -1,6 +1,7 @@
 # this_file: tests/test_models.py
 """Tests for Pydantic data models."""
 
+import json
 from datetime import datetime
 
 import pytest
@@ -190,3 +191,64 @@ class TestModelCollection:
         assert len(collection.data) == 0
         assert collection.get_by_id("any-id") is None
         assert len(collection.search("any-query")) == 0
+
+
+class TestModelCollectionIndexes:
+    """Test ModelCollection lookup indexes."""
+
+    def test_indexed_lookup_matches_scan(self, sample_poe_model: PoeModel) -> None:
+        """Indexed get_by_id returns the first model with the ID, like a scan."""
+        duplicate = sample_poe_model.model_copy(update={"owned_by": "someone-else"})
+        collection = ModelCollection(data=[sample_poe_model, duplicate])
+
+        scanned = collection.get_by_id("test-model-1")
+        collection.build_indexes()
+
+        assert collection.get_by_id("test-model-1") is scanned is sample_poe_model
+        assert collection.get_by_id("missing") is None
+
+
+class TestModelCollectionDeduplicate:
+    """Test ModelCollection value deduplication."""
+
+    def _parsed_collection(self, sample_model_collection: ModelCollection, count: int) -> ModelCollection:
+        """Parse JSON with ``count`` copies of the sample model so no values are shared yet."""
+        record = sample_model_collection.data[0].model_dump(mode="json")
+        records = [{**record, "id": f"model-{i}", "root": f"model-{i}"} for i in range(count)]
+        collection = ModelCollection(**json.loads(json.dumps({"data": records})))
+        assert collection.data[0].owned_by is not collection.data[1].owned_by
+        return collection
+
+    def test_shares_repeated_values(self, sample_model_collection: ModelCollection) -> None:
+        """Equal architectures become one instance and repeated strings one object."""
+        collection = self._parsed_collection(sample_model_collection, 3)
+
+        assert collection.deduplicate() is collection
+        first, second, third = collection.data
+        assert first.architecture is second.architecture is third.architecture
+        assert first.owned_by is second.owned_by
+        assert first.bot_info is not None and second.bot_info is not None
+        assert first.bot_info.creator is second.bot_info.creator
+        assert first.bot_info.description_extra is second.bot_info.description_extra
+
+    def test_preserves_data(self, sample_model_collection: ModelCollection) -> None:
+        """Deduplication does not change the serialized collection."""
+        collection = self._parsed_collection(sample_model_collection, 2)
+        before = collection.model_dump()
+
+        assert collection.deduplicate().model_dump() == before
+
+    def test_keeps_distinct_architectures(self, sample_poe_model: PoeModel) -> None:
+        """Models with different architectures keep their own instances."""
+        image_model = sample_poe_model.model_copy(
+            update={
+                "id": "image-model",
+                "architecture": Architecture(
+                    input_modalities=["text"], output_modalities=["image"], modality="text->image"
+                ),
+            }
+        )
+        collection = ModelCollection(data=[sample_poe_model, image_model]).deduplicate()
+
+        assert collection.data[0].architecture is not collection.data[1].architecture
+        assert collection.data[1].architecture.output_modalities == ["image"]
@@ -0,0 +1,122 @@
+# this_file: tests/test_openmetrics.py
+"""Tests for the OpenMetrics exporter."""
+
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from virginia_clemm_poe.openmetrics import CONTENT_TYPE, MetricFamily, MetricsExporter, render_metrics, write_textfile
+from virginia_clemm_poe.utils import cache as cache_module
+from virginia_clemm_poe.utils.cache import Cache
+from virginia_clemm_poe.utils.metrics import MetricsRegistry
+
+
+@pytest.fixture
+def scraping_cache() -> Iterator[Cache]:
+    """Install a fresh scraping cache with one hit and one miss recorded."""
+    cache = Cache()
+    cache._stats.update({"hits": 3, "misses": 1, "evictions": 2})
+    with (
+        patch.object(cache_module, "_scraping_cache", cache),
+        patch.object(cache_module, "_global_cache", None),
+        patch.object(cache_module, "_api_cache", None),
+    ):
+        yield cache
+
+
+@pytest.fixture
+def run_metrics() -> Iterator[MetricsRegistry]:
+    """Install a metrics registry with one timed phase."""
+    metrics = MetricsRegistry()
+    metrics.observe("scrape.goto", 1.5)
+    metrics.increment("selector.creator.fallback")
+    with patch("virginia_clemm_poe.openmetrics.get_metrics_registry", return_value=metrics):
+        yield metrics
+
+
+class TestRendering:
+    """Test the OpenMetrics text format."""
+
+    def test_family_render(self) -> None:
+        """Counters get a _total suffix and labels are escaped."""
+        family = MetricFamily("cache_requests", "counter", "Cache lookups")
+        family.add(3, {"cache": 'a"b'})
+
+        assert family.render().splitlines() == [
+            "# TYPE virginia_clemm_poe_cache_requests counter",
+            "# HELP virginia_clemm_poe_cache_requests Cache lookups",
+            'virginia_clemm_poe_cache_requests_total{cache="a\\"b"} 3',
+        ]
+
+    @pytest.mark.asyncio
+    async def test_render_metrics(self, scraping_cache: Cache, run_metrics: MetricsRegistry) -> None:
+        """Cache, memory, crash and phase metrics are exported."""
+        text = await render_metrics()
+        lines = text.splitlines()
+
+        assert lines[-1] == "# EOF"
+        assert 'virginia_clemm_poe_cache_requests_total{cache="scraping",result="hit"} 3' in lines
+        assert 'virginia_clemm_poe_cache_evictions_total{cache="scraping"} 2' in lines
+        assert 'virginia_clemm_poe_cache_hit_ratio{cache="scraping"} 0.75' in lines
+        assert 'virginia_clemm_poe_phase_duration_seconds{phase="scrape.goto",quantile="0.99"} 1.5' in lines
+        assert 'virginia_clemm_poe_phase_duration_seconds_count{phase="scrape.goto"} 1' in lines
+        assert 'virginia_clemm_poe_run_events_total{event="selector.creator.fallback"} 1' in lines
+        assert any(line.startswith("virginia_clemm_poe_process_resident_memory_bytes ") for line in lines)
+        # No browser pool is running in this process
+        assert "browser_pool" not in text
+
+    @pytest.mark.asyncio
+    async def test_pool_metrics(self, scraping_cache: Cache, run_metrics: MetricsRegistry) -> None:
+        """A running pool reports connections, creations and failures."""
+        from virginia_clemm_poe import browser_pool
+
+        pool = MagicMock()
+        pool.get_stats = AsyncMock(
+            return_value={
+                "pool_size": 2,
+                "active_connections": 1,
+                "max_size": 3,
+                "connections_created": 5,
+                "connection_failures": 1,
+                "browser_memory_mb": 512,
+                "memory_recycles": 2,
+            }
+        )
+        with patch.object(browser_pool, "get_running_pool", return_value=pool):
+            lines = (await render_metrics()).splitlines()
+
+        assert 'virginia_clemm_poe_browser_pool_connections{state="active"} 1' in lines
+        assert "virginia_clemm_poe_browser_pool_connections_created_total 5" in lines
+        assert "virginia_clemm_poe_browser_pool_connection_failures_total 1" in lines
+        assert "virginia_clemm_poe_browser_resident_memory_bytes 536870912" in lines
+        assert "virginia_clemm_poe_browser_pool_memory_recycles_total 2" in lines
+
+
+class TestPublishing:
+    """Test the HTTP endpoint and the textfile writer."""
+
+    @pytest.mark.asyncio
+    async def test_scrape_endpoint(self, scraping_cache: Cache, run_metrics: MetricsRegistry) -> None:
+        """The exporter serves the exposition at /metrics and 404s elsewhere."""
+        async with MetricsExporter(port=0) as exporter, httpx.AsyncClient() as client:
+            response = await client.get(exporter.url)
+            missing = await client.get(exporter.url.replace("/metrics", "/other"))
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == CONTENT_TYPE
+        assert response.text.endswith("# EOF\n")
+        assert "virginia_clemm_poe_cache_hit_ratio" in response.text
+        assert missing.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_write_textfile(self, tmp_path: Path, scraping_cache: Cache, run_metrics: MetricsRegistry) -> None:
+        """The textfile collector output is written atomically."""
+        output = tmp_path / "textfile" / "virginia_clemm_poe.prom"
+
+        await write_textfile(output)
+
+        assert output.read_text().endswith("# EOF\n")
+        assert [path.name for path in output.parent.iterdir()] == ["virginia_clemm_poe.prom"]
@@ -0,0 +1,134 @@
+# this_file: tests/test_points_ledger.py
+"""Tests for the local points ledger."""
+
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from virginia_clemm_poe.balance_monitor import BalanceMonitor
+from virginia_clemm_poe.models import PoeModel, PricingDetails
+from virginia_clemm_poe.points_ledger import PointsLedger, estimate_request_points, parse_points_cost
+
+
+class TestParsePointsCost:
+    """Test parsing of scraped pricing strings."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("200 points", (200.0, "request")),
+            ("7+ points", (7.0, "request")),
+            ("92 points/1k tokens", (92.0, "1k tokens")),
+            ("1,334 points / message", (1334.0, "message")),
+            ("1 point/second", (1.0, "second")),
+            ("Variable points", None),
+            (None, None),
+        ],
+    )
+    def test_formats(self, text: str | None, expected: tuple[float, str] | None) -> None:
+        """Known Poe.com pricing formats are parsed."""
+        assert parse_points_cost(text) == expected
+
+
+class TestEstimateRequestPoints:
+    """Test request cost estimation from PricingDetails."""
+
+    def test_token_rates(self) -> None:
+        """Token-priced models use input and output rates."""
+        details = PricingDetails(**{"Input": "100 points/1k tokens", "Output (text)": "400 points/1k tokens"})
+        assert estimate_request_points(details, input_tokens=2000, output_tokens=500) == pytest.approx(400)
+
+    def test_per_message(self) -> None:
+        """Flat-priced models use the per-message cost."""
+        details = PricingDetails(total_cost="200 points/message")
+        assert estimate_request_points(details, input_tokens=1000) == 200
+
+    def test_unknown(self) -> None:
+        """Uninterpretable pricing yields None."""
+        assert estimate_request_points(PricingDetails(initial_points_cost="Variable points")) is None
+
+
+class TestPointsLedger:
+    """Test balance estimation, persistence and reconciliation."""
+
+    def test_estimate_and_budget(self, tmp_path: Path) -> None:
+        """Recorded charges reduce the estimate; budget checks are local."""
+        ledger = PointsLedger(path=tmp_path / "ledger.json")
+        assert ledger.estimated_balance is None
+        assert ledger.can_afford(10**9)
+
+        ledger.set_balance(1000)
+        ledger.record(300, model_id="a")
+        ledger.record(200, model_id="a")
+
+        assert ledger.estimated_balance == 500
+        assert ledger.spent_by_model == {"a": 500}
+        assert ledger.can_afford(500)
+        assert not ledger.can_afford(501)
+
+    def test_persistence(self, tmp_path: Path) -> None:
+        """State survives a reload, including write-behind charges after flush."""
+        path = tmp_path / "ledger.json"
+        ledger = PointsLedger(path=path, save_every=100)
+        ledger.set_balance(5000)
+        ledger.record(123)
+        ledger.flush()
+
+        reloaded = PointsLedger(path=path)
+        assert reloaded.estimated_balance == 4877
+        assert reloaded.baseline_at == pytest.approx(ledger.baseline_at)
+
+    def test_needs_reconcile(self, tmp_path: Path) -> None:
+        """Reconciliation is due when stale or running low."""
+        ledger = PointsLedger(path=tmp_path / "ledger.json", reconcile_interval=60, low_balance_threshold=100)
+        assert ledger.needs_reconcile()
+
+        ledger.set_balance(1000)
+        assert not ledger.needs_reconcile()
+
+        ledger.record(950)
+        assert ledger.needs_reconcile()
+
+        ledger.set_balance(1000, fetched_at=time.time() - 120)
+        assert ledger.needs_reconcile()
+
+    @pytest.mark.asyncio
+    async def test_reconcile_fetches_only_when_due(self, tmp_path: Path) -> None:
+        """reconcile() hits the network only when the ledger needs it."""
+        manager = MagicMock()
+        manager.get_account_balance = AsyncMock(return_value={"compute_points_available": 2000})
+        ledger = PointsLedger(path=tmp_path / "ledger.json", session_manager=manager)
+
+        assert await ledger.reconcile() == 2000
+        assert await ledger.reconcile() == 2000
+        manager.get_account_balance.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_follows_balance_monitor(self, tmp_path: Path) -> None:
+        """Subscribed to a BalanceMonitor, the ledger resets to each published balance."""
+        manager = MagicMock()
+        manager.get_account_balance = AsyncMock(
+            side_effect=[{"compute_points_available": 1000}, {"compute_points_available": None}]
+        )
+        manager.last_working_tier = "graphql"
+        monitor = BalanceMonitor(manager, initial_interval=0, min_interval=0, max_interval=0)
+        ledger = PointsLedger(path=tmp_path / "ledger.json")
+        ledger.record(100)
+
+        monitor.subscribe(ledger.on_balance)
+        await monitor.run(max_polls=2)
+
+        assert ledger.baseline == 1000
+        assert ledger.estimated_balance == 1000
+
+    def test_record_usage_from_pricing(self, tmp_path: Path, sample_poe_model: PoeModel) -> None:
+        """Requests can be priced from the model's scraped pricing."""
+        ledger = PointsLedger(path=tmp_path / "ledger.json")
+        ledger.set_balance(1000)
+
+        points = ledger.record_usage(sample_poe_model, input_tokens=1000)
+
+        assert points is not None
+        assert ledger.estimated_balance == 1000 - points
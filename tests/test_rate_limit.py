@@ -0,0 +1,76 @@
+# this_file: tests/test_rate_limit.py
+"""Tests for the per-host token-bucket rate limiter."""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from virginia_clemm_poe.utils.rate_limit import RateLimiter, get_global_rate_limiter
+
+
+class TestRateLimiter:
+    """Test in-process rate limiting."""
+
+    @pytest.mark.asyncio
+    async def test_burst_then_rate(self) -> None:
+        """The burst passes immediately; later requests are spaced by the rate."""
+        limiter = RateLimiter(requests_per_second=20.0, burst=2)
+
+        assert await limiter.acquire("https://poe.com/a") == 0.0
+        assert await limiter.acquire("https://poe.com/b") == 0.0
+
+        start = time.monotonic()
+        wait = await limiter.acquire("https://poe.com/c")
+        assert 0.03 <= wait <= 0.05
+        assert time.monotonic() - start >= 0.03
+
+        stats = limiter.get_stats()["hosts"]["poe.com"]
+        assert stats["requests"] == 3
+        assert stats["delayed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_hosts_are_limited_separately(self) -> None:
+        """Each host has its own bucket and unlisted hosts are not limited."""
+        limiter = RateLimiter(requests_per_second=0.1, burst=1)
+
+        assert await limiter.acquire("https://poe.com/a") == 0.0
+        assert await limiter.acquire("https://api.poe.com/v1/models") == 0.0
+        assert await limiter.acquire("http://127.0.0.1:8000/a") == 0.0
+        assert await limiter.acquire("http://127.0.0.1:8000/b") == 0.0
+        assert "127.0.0.1" not in limiter.get_stats()["hosts"]
+
+    def test_invalid_settings(self) -> None:
+        """A rate limit that would never admit a request is rejected."""
+        with pytest.raises(ValueError):
+            RateLimiter(requests_per_second=0)
+
+    def test_global_limiter(self) -> None:
+        """The global limiter uses the configured defaults and is reused."""
+        assert get_global_rate_limiter() is get_global_rate_limiter()
+        assert not get_global_rate_limiter().get_stats()["shared"]
+
+
+class TestSharedRateLimiter:
+    """Test rate limits shared through state files."""
+
+    @pytest.mark.asyncio
+    async def test_limiters_share_budget(self, tmp_path: Path) -> None:
+        """Separate limiters on one state directory draw from the same bucket."""
+        first = RateLimiter(requests_per_second=20.0, burst=2, shared=True, state_dir=tmp_path)
+        second = RateLimiter(requests_per_second=20.0, burst=2, shared=True, state_dir=tmp_path)
+
+        assert await first.acquire("https://poe.com/a") == 0.0
+        assert await first.acquire("https://poe.com/b") == 0.0
+        assert await second.acquire("https://poe.com/c") > 0.0
+        assert (tmp_path / "poe.com.json").exists()
+        assert second.get_stats()["shared"]
+
+    @pytest.mark.asyncio
+    async def test_damaged_state_file(self, tmp_path: Path) -> None:
+        """An unreadable state file is replaced by a full bucket."""
+        (tmp_path / "poe.com.json").write_text("{not json")
+        limiter = RateLimiter(requests_per_second=20.0, burst=1, shared=True, state_dir=tmp_path)
+
+        assert await limiter.acquire("https://poe.com/a") == 0.0
+        assert await limiter.acquire("https://poe.com/b") > 0.0
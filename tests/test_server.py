@@ -0,0 +1,114 @@
+# this_file: tests/test_server.py
+"""Tests for the resident query server."""
+
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from virginia_clemm_poe import api
+from virginia_clemm_poe.models import ModelCollection
+from virginia_clemm_poe.server import ModelQueryServer, find_running_server, query_server
+
+
+@pytest.fixture
+def running_server(mock_data_file: Path, tmp_path: Path) -> Iterator[ModelQueryServer]:
+    """Serve the sample data on a free loopback port."""
+    api._collection = None
+    with (
+        patch("virginia_clemm_poe.api.DATA_FILE_PATH", mock_data_file),
+        patch("virginia_clemm_poe.server.get_server_state_path", return_value=tmp_path / "server.json"),
+    ):
+        server = ModelQueryServer("127.0.0.1", 0, reload_poll_interval=0.02)
+        thread = threading.Thread(target=server.serve, daemon=True)
+        thread.start()
+        deadline = time.monotonic() + 5
+        while not (tmp_path / "server.json").exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        try:
+            yield server
+        finally:
+            server.shutdown()
+            thread.join(timeout=5)
+    api._collection = None
+
+
+class TestEndpoints:
+    """Test JSON endpoints."""
+
+    def test_health(self, running_server: ModelQueryServer) -> None:
+        """Health reports model counts."""
+        health = query_server(running_server.url, "/health")
+        assert health["status"] == "ok"
+        assert health["models"] == 1
+        assert health["with_pricing"] == 1
+
+    def test_search_and_lookup(self, running_server: ModelQueryServer) -> None:
+        """Search and by-id lookups return serialized models."""
+        results = query_server(running_server.url, "/search", {"q": "TEST"})
+        assert [m["id"] for m in results["data"]] == ["test-model-1"]
+
+        model = query_server(running_server.url, "/models/test-model-1")
+        assert model["owned_by"] == "testorg"
+        assert query_server(running_server.url, "/models/missing") is None
+
+    def test_filter(self, running_server: ModelQueryServer) -> None:
+        """Query parameters are converted and passed to filter_models."""
+        matched = query_server(running_server.url, "/models", {"owned_by": "testorg", "has_pricing": "true"})
+        assert len(matched["data"]) == 1
+        unmatched = query_server(running_server.url, "/models", {"has_pricing": "false"})
+        assert unmatched["data"] == []
+
+    def test_cost(self, running_server: ModelQueryServer) -> None:
+        """Cost estimates use the model's scraped pricing."""
+        cost = query_server(running_server.url, "/cost", {"model": "test-model-1", "input_tokens": 2000})
+        assert cost["points"] == pytest.approx(20)
+
+    def test_ignores_proxy_settings(self, running_server: ModelQueryServer, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Loopback queries never go through a configured HTTP proxy."""
+        monkeypatch.setenv("HTTP_PROXY", "http://127.0.0.1:9")
+        monkeypatch.setenv("http_proxy", "http://127.0.0.1:9")
+        monkeypatch.setenv("NO_PROXY", "")
+        monkeypatch.setenv("no_proxy", "")
+
+        assert query_server(running_server.url, "/health")["status"] == "ok"
+
+
+class TestHotReload:
+    """Test reloading when the data file changes."""
+
+    def test_reload_on_change(self, running_server: ModelQueryServer, mock_data_file: Path) -> None:
+        """A rewritten data file is picked up by the background watcher."""
+        collection = ModelCollection(**json.loads(mock_data_file.read_text()))
+        second = collection.data[0].model_copy(update={"id": "test-model-2", "root": "test-model-2"})
+        collection.data.append(second)
+        mock_data_file.write_text(collection.model_dump_json())
+
+        deadline = time.monotonic() + 5
+        while query_server(running_server.url, "/health")["models"] != 2 and time.monotonic() < deadline:
+            time.sleep(0.02)
+
+        assert query_server(running_server.url, "/health")["models"] == 2
+
+
+class TestDiscovery:
+    """Test how CLI clients find a running server."""
+
+    def test_state_file_written_while_serving(self, running_server: ModelQueryServer, tmp_path: Path) -> None:
+        """The running server is discoverable through its state file."""
+        with patch("virginia_clemm_poe.server.get_server_state_path", return_value=tmp_path / "server.json"):
+            assert find_running_server() == running_server.url
+
+    def test_stale_state_file_removed(self, tmp_path: Path) -> None:
+        """A state file left by a dead process is ignored and cleaned up."""
+        state_file = tmp_path / "server.json"
+        state_file.write_text(json.dumps({"url": "http://127.0.0.1:1", "pid": 2**22 + os.getpid()}))
+
+        with patch("virginia_clemm_poe.server.get_server_state_path", return_value=state_file):
+            assert find_running_server() is None
+        assert not state_file.exists()
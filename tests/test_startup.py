@@ -0,0 +1,33 @@
+# this_file: tests/test_startup.py
+"""Tests for deferred imports that keep CLI startup fast."""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ["playwright", "playwrightauthor", "httpx", "bs4", "psutil"]
+
+
+def _loaded_after(statement: str) -> list[str]:
+    """Run a statement in a fresh interpreter and list heavy modules it loaded."""
+    code = f"import json, sys\n{statement}\nprint(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize("statement", ["import virginia_clemm_poe.__main__", "import virginia_clemm_poe.api"])
+def test_import_does_not_load_heavy_dependencies(statement: str) -> None:
+    """Importing the CLI or public API leaves browser and HTTP stacks unloaded."""
+    assert _loaded_after(statement) == []
+
+
+def test_lazy_cli_attributes_resolve_on_access() -> None:
+    """Deferred CLI collaborators are importable through the module."""
+    from virginia_clemm_poe import __main__ as cli
+    from virginia_clemm_poe.poe_session import PoeSessionManager
+
+    assert cli.PoeSessionManager is PoeSessionManager
+    with pytest.raises(AttributeError):
+        _ = cli.NotAThing
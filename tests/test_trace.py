@@ -0,0 +1,135 @@
+# this_file: tests/test_trace.py
+"""Tests for the scrape trace recorder."""
+
+import asyncio
+import json
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from virginia_clemm_poe.utils.logger import log_api_request, log_browser_operation
+from virginia_clemm_poe.utils.metrics import MetricsRegistry
+from virginia_clemm_poe.utils.trace import TraceRecorder, disable_tracing, enable_tracing, get_trace_recorder
+
+
+@pytest.fixture
+def recorder() -> Iterator[TraceRecorder]:
+    """Enable tracing for one test."""
+    recorder = enable_tracing()
+    try:
+        yield recorder
+    finally:
+        disable_tracing()
+
+
+class TestRecording:
+    """Test which spans are recorded."""
+
+    def test_disabled_by_default(self) -> None:
+        """Nothing is recorded unless tracing is enabled."""
+        assert get_trace_recorder() is None
+        with MetricsRegistry().time("scrape.goto"):
+            pass
+        assert get_trace_recorder() is None
+
+    def test_phases_are_attributed_to_models(self, recorder: TraceRecorder) -> None:
+        """Phases inside a browser operation carry its model ID and outcome."""
+        metrics = MetricsRegistry()
+
+        with log_browser_operation("scrape_model", "Claude-3-Opus") as ctx:
+            with metrics.time("scrape.goto"):
+                pass
+            with pytest.raises(TimeoutError), metrics.time("scrape.rates_dialog"):
+                raise TimeoutError
+            ctx["error_type"] = "timeout"
+        with metrics.time("pool.page_close"):
+            pass
+
+        events = recorder.events()
+        assert [(e["phase"], e["model_id"], e["outcome"]) for e in events] == [
+            ("scrape.goto", "Claude-3-Opus", "ok"),
+            ("scrape.rates_dialog", "Claude-3-Opus", "TimeoutError"),
+            ("browser.scrape_model", "Claude-3-Opus", "timeout"),
+            ("pool.page_close", None, "ok"),
+        ]
+        assert abs(events[0]["ts"] - time.time()) < 60
+
+    def test_api_requests_record_status(self, recorder: TraceRecorder) -> None:
+        """API spans use the response status code as their outcome."""
+        with log_api_request("GET", "https://api.poe.com/v1/models") as ctx:
+            ctx["status_code"] = 304
+
+        assert recorder.events()[0]["phase"] == "api.get"
+        assert recorder.events()[0]["outcome"] == "304"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_workers_get_lanes(self, recorder: TraceRecorder) -> None:
+        """Spans from different tasks land in different lanes."""
+
+        async def worker(model_id: str) -> None:
+            with log_browser_operation("scrape_model", model_id):
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(worker("a"), worker("b"))
+
+        lanes = {event["model_id"]: event["lane"] for event in recorder.events()}
+        assert lanes["a"] != lanes["b"]
+
+    def test_ring_buffer_drops_oldest(self) -> None:
+        """Only the newest spans are kept once the buffer is full."""
+        recorder = TraceRecorder(capacity=3)
+        for i in range(5):
+            recorder.record(f"phase.{i}", time.perf_counter(), 0.001)
+
+        assert [event["phase"] for event in recorder.events()] == ["phase.2", "phase.3", "phase.4"]
+        assert recorder.dropped == 2
+
+    def test_overhead_per_span(self, recorder: TraceRecorder) -> None:
+        """Recording adds microseconds per phase, far below 1% of a multi-second scrape."""
+        metrics = MetricsRegistry()
+        count = 20_000
+
+        start = time.perf_counter()
+        with log_browser_operation("scrape_model", "Claude-3-Opus"):
+            for _ in range(count):
+                with metrics.time("scrape.goto"):
+                    pass
+        per_span = (time.perf_counter() - start) / count
+
+        assert len(recorder) == count + 1
+        assert per_span < 50e-6
+
+
+class TestOutput:
+    """Test trace file formats."""
+
+    def test_ndjson(self, recorder: TraceRecorder, tmp_path: Path) -> None:
+        """NDJSON output has one event per line."""
+        with log_browser_operation("scrape_model", "GPT-4o"), MetricsRegistry().time("scrape.goto"):
+            pass
+
+        path = tmp_path / "trace.ndjson"
+        recorder.write(path)
+
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [line["phase"] for line in lines] == ["scrape.goto", "browser.scrape_model"]
+        assert set(lines[0]) == {"ts", "duration_ms", "phase", "model_id", "outcome", "lane"}
+
+    def test_chrome_trace(self, recorder: TraceRecorder, tmp_path: Path) -> None:
+        """Other suffixes produce complete events in Chrome trace format."""
+        with log_browser_operation("scrape_model", "GPT-4o"), MetricsRegistry().time("scrape.goto"):
+            time.sleep(0.002)
+
+        path = tmp_path / "trace.json"
+        recorder.write(path)
+
+        trace = json.loads(path.read_text())
+        goto = trace["traceEvents"][0]
+        assert goto["ph"] == "X"
+        assert goto["name"] == "scrape.goto"
+        assert goto["cat"] == "scrape"
+        assert goto["dur"] >= 2000
+        assert goto["args"] == {"model_id": "GPT-4o", "outcome": "ok"}
+        assert trace["otherData"]["dropped_events"] == 0
@@ -7,6 +7,7 @@ import pytest
 
 from virginia_clemm_poe.exceptions import APIError, ModelDataError
 from virginia_clemm_poe.type_guards import (
+    find_invalid_poe_api_models,
     is_model_filter_criteria,
     is_poe_api_model_data,
     is_poe_api_response,
@@ -234,6 +235,34 @@ class TestValidatePoeApiResponse:
         with pytest.raises(APIError, match="invalid model data at index 0"):
             validate_poe_api_response(invalid_model)
 
+    def test_validate_skips_invalid_models(self, sample_api_response_data: dict[str, Any]) -> None:
+        """Test that invalid models are dropped while valid ones are kept."""
+        valid_model = sample_api_response_data["data"][0]
+        mixed = {
+            "object": "list",
+            "data": [{"id": "broken"}, valid_model, dict(valid_model, created="yesterday")],
+        }
+        result = validate_poe_api_response(mixed)
+        assert result["data"] == [valid_model]
+
+
+class TestFindInvalidPoeApiModels:
+    """Test whole-list model validation."""
+
+    def test_reports_every_failing_index(self, sample_api_response_data: dict[str, Any]) -> None:
+        """Test that all invalid indices are reported with field errors."""
+        valid_model = sample_api_response_data["data"][0]
+        models = [valid_model, {"id": "broken"}, valid_model, dict(valid_model, created="1")]
+
+        invalid = find_invalid_poe_api_models(models)
+
+        assert sorted(invalid) == [1, 3]
+        assert any(error.startswith("created:") for error in invalid[3])
+
+    def test_all_valid(self, sample_api_response_data: dict[str, Any]) -> None:
+        """Test that a valid list yields no errors."""
+        assert find_invalid_poe_api_models(sample_api_response_data["data"] * 3) == {}
+
 
 class TestValidateModelFilterCriteria:
     """Test validate_model_filter_criteria function."""
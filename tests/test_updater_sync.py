@@ -0,0 +1,111 @@
+# this_file: tests/test_updater_sync.py
+"""Tests for syncing the model list in ModelUpdater."""
+
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+
+from virginia_clemm_poe.exceptions import APIError
+from virginia_clemm_poe.models import PoeModel
+from virginia_clemm_poe.updater import ModelUpdater
+from virginia_clemm_poe.utils.http_cache import ValidatorStore
+
+
+def _make_client(body: bytes) -> httpx.AsyncClient:
+    """Build a client that answers every request with the given model list."""
+    return httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body, headers={"ETag": '"v1"'}))
+    )
+
+
+class TestSyncModels:
+    """Test streaming, validating and merging a fresh model list.
+
+    Every test points DATA_FILE_PATH at a temporary file so the developer's
+    own poe_models.json never becomes the merge baseline.
+    """
+
+    @pytest.mark.asyncio
+    async def test_sync_streams_fresh_models(self, tmp_path: Path, sample_api_response_data: dict[str, Any]) -> None:
+        """A changed model list is streamed from disk into PoeModel instances."""
+        body = json.dumps(sample_api_response_data).encode()
+        store = ValidatorStore(tmp_path / "http")
+        updater = ModelUpdater("test-api-key", session_manager=Mock())
+
+        with (
+            patch("virginia_clemm_poe.updater.DATA_FILE_PATH", tmp_path / "poe_models.json"),
+            patch("virginia_clemm_poe.updater.get_validator_store", return_value=store),
+            patch("virginia_clemm_poe.updater.get_async_client", return_value=_make_client(body)),
+        ):
+            collection = await updater.sync_models(force=True, update_info=False, update_pricing=False)
+
+        assert collection.object == "list"
+        assert [model.id for model in collection.data] == ["test-model-1"]
+        assert collection.data[0].architecture.modality == "text->text"
+        assert store.has_pending("https://api.poe.com/v1/models")
+
+    @pytest.mark.asyncio
+    async def test_sync_skips_invalid_records(self, tmp_path: Path, sample_api_response_data: dict[str, Any]) -> None:
+        """Invalid streamed records are skipped instead of aborting the sync."""
+        sample_api_response_data["data"].append({"id": "broken"})
+        body = json.dumps(sample_api_response_data).encode()
+        updater = ModelUpdater("test-api-key", session_manager=Mock())
+
+        with (
+            patch("virginia_clemm_poe.updater.DATA_FILE_PATH", tmp_path / "poe_models.json"),
+            patch("virginia_clemm_poe.updater.get_validator_store", return_value=ValidatorStore(tmp_path / "http")),
+            patch("virginia_clemm_poe.updater.get_async_client", return_value=_make_client(body)),
+        ):
+            collection = await updater.sync_models(force=True, update_info=False, update_pricing=False)
+
+        assert [model.id for model in collection.data] == ["test-model-1"]
+
+    @pytest.mark.parametrize("force", [False, True])
+    @pytest.mark.asyncio
+    async def test_sync_keeps_known_model_with_invalid_record(
+        self,
+        tmp_path: Path,
+        mock_data_file: Path,
+        sample_poe_model: PoeModel,
+        sample_api_response_data: dict[str, Any],
+        force: bool,
+    ) -> None:
+        """A known model whose API record is malformed keeps its stored entry and is not reported removed."""
+        valid = sample_api_response_data["data"][0]
+        sample_api_response_data["data"] = [
+            {**valid, "id": "test-model-2", "root": "test-model-2"},
+            {key: value for key, value in valid.items() if key != "architecture"},
+        ]
+        body = json.dumps(sample_api_response_data).encode()
+        updater = ModelUpdater("test-api-key", session_manager=Mock())
+
+        with (
+            patch("virginia_clemm_poe.updater.DATA_FILE_PATH", mock_data_file),
+            patch("virginia_clemm_poe.updater.get_validator_store", return_value=ValidatorStore(tmp_path / "http")),
+            patch("virginia_clemm_poe.updater.get_async_client", return_value=_make_client(body)),
+        ):
+            collection = await updater.sync_models(force=force, update_info=False, update_pricing=False)
+
+        assert [model.id for model in collection.data] == ["test-model-1", "test-model-2"]
+        assert collection.data[0] == sample_poe_model
+        assert updater.last_change_set is not None
+        assert updater.last_change_set["removed"] == []
+        assert updater.last_change_set["added"] == ["test-model-2"]
+
+    @pytest.mark.asyncio
+    async def test_sync_rejects_all_invalid_records(self, tmp_path: Path) -> None:
+        """A response with only invalid records raises APIError with the first index."""
+        body = json.dumps({"object": "list", "data": [{"id": "broken"}, {"id": "also-broken"}]}).encode()
+        updater = ModelUpdater("test-api-key", session_manager=Mock())
+
+        with (
+            patch("virginia_clemm_poe.updater.DATA_FILE_PATH", tmp_path / "poe_models.json"),
+            patch("virginia_clemm_poe.updater.get_validator_store", return_value=ValidatorStore(tmp_path / "http")),
+            patch("virginia_clemm_poe.updater.get_async_client", return_value=_make_client(body)),
+            pytest.raises(APIError, match="index 0"),
+        ):
+            await updater.sync_models(force=True, update_info=False, update_pricing=False)